@@ -1,9 +1,22 @@
 import os
 import sys
+from typing import TYPE_CHECKING
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 
-from ark_sdk_python.ark_api import ArkAPI
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
 
-__all__ = ['ArkAPI']
+if TYPE_CHECKING:
+    from ark_sdk_python.ark_api import ArkAPI
+    from ark_sdk_python.ark_api_pool import ArkAPIPool
+
+__all__ = ['ArkAPI', 'ArkAPIPool']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.ark_api': ['ArkAPI'],
+        'ark_sdk_python.ark_api_pool': ['ArkAPIPool'],
+    },
+)
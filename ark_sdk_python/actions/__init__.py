@@ -1,9 +1,11 @@
 from ark_sdk_python.actions.ark_action import ArkAction
+from ark_sdk_python.actions.ark_agent_action import ArkAgentAction
 from ark_sdk_python.actions.ark_cache_action import ArkCacheAction
 from ark_sdk_python.actions.ark_configure_action import ArkConfigureAction
 from ark_sdk_python.actions.ark_exec_action import ArkExecAction
 from ark_sdk_python.actions.ark_login_action import ArkLoginAction
 from ark_sdk_python.actions.ark_profiles_action import ArkProfilesAction
+from ark_sdk_python.actions.ark_serve_action import ArkServeAction
 from ark_sdk_python.actions.ark_service_exec_action import ArkServiceExecAction
 
 __all__ = [
@@ -13,5 +15,7 @@ __all__ = [
     'ArkServiceExecAction',
     'ArkProfilesAction',
     'ArkCacheAction',
+    'ArkAgentAction',
+    'ArkServeAction',
     'ArkAction',
 ]
@@ -3,6 +3,7 @@ import os
 from abc import ABC, abstractmethod
 
 from ark_sdk_python.common import ArkSystemConfig, get_logger
+from ark_sdk_python.common.ark_logger import LOGGER_STYLE_DEFAULT, SUPPORTED_LOGGER_STYLES
 from ark_sdk_python.models import ArkProfileLoader
 
 
@@ -15,7 +16,9 @@ class ArkAction(ABC):
         parser.add_argument('-s', '--silent', action='store_true', help='Silent execution, no interactiveness')
         parser.add_argument('-ao', '--allow-output', action='store_true', help='Allow stdout / stderr even when silent and not interactive')
         parser.add_argument('-v', '--verbose', action='store_true', help='Whether to verbose log')
-        parser.add_argument('-ls', '--logger-style', choices=['default'], help='Which verbose logger style to use', default='default')
+        parser.add_argument(
+            '-ls', '--logger-style', choices=SUPPORTED_LOGGER_STYLES, help='Which verbose logger style to use', default=LOGGER_STYLE_DEFAULT
+        )
         parser.add_argument(
             '-ll',
             '--log-level',
@@ -0,0 +1,129 @@
+import argparse
+import os
+import sys
+
+from overrides import overrides
+
+from ark_sdk_python.actions.ark_action import ArkAction
+from ark_sdk_python.args import ArkArgsFormatter
+from ark_sdk_python.auth.ark_auth_agent import (
+    ARK_AUTH_AGENT_SOCKET_ENV_VAR,
+    DEFAULT_AGENT_REFRESH_GRACE_SECONDS,
+    DEFAULT_AGENT_REFRESH_INTERVAL_SECONDS,
+    ArkAuthAgent,
+    ArkAuthAgentClient,
+    default_agent_socket_path,
+)
+from ark_sdk_python.models import ArkException
+
+
+class ArkAgentAction(ArkAction):
+    @overrides
+    def define_action(self, subparsers: argparse._SubParsersAction) -> None:
+        """
+        Defines the CLI `agent` action, which manages the local auth agent holding tokens in memory.
+
+        Args:
+            subparsers (argparse._SubParsersAction): _description_
+        """
+        agent_parser: argparse.ArgumentParser = subparsers.add_parser('agent')
+        self._common_actions_configuration(agent_parser)
+        agent_cmd_subparsers = agent_parser.add_subparsers(dest="agent_cmd")
+        agent_cmd_subparsers.required = True
+        start_parser = agent_cmd_subparsers.add_parser('start', help='Starts the auth agent and prints its environment')
+        start_parser.add_argument('-sp', '--socket-path', help='Unix socket path for the agent to listen on')
+        start_parser.add_argument('-fg', '--foreground', action='store_true', help='Run the agent in the foreground')
+        start_parser.add_argument(
+            '-ri',
+            '--refresh-interval',
+            type=int,
+            default=DEFAULT_AGENT_REFRESH_INTERVAL_SECONDS,
+            help='Every how many seconds to check for tokens to refresh',
+        )
+        start_parser.add_argument(
+            '-rg',
+            '--refresh-grace',
+            type=int,
+            default=DEFAULT_AGENT_REFRESH_GRACE_SECONDS,
+            help='Refresh tokens which expire within the given amount of seconds',
+        )
+        for cmd, cmd_help in [
+            ('stop', 'Stops the auth agent'),
+            ('status', 'Shows the auth agent status'),
+            ('clear', 'Clears the agent tokens'),
+        ]:
+            cmd_parser = agent_cmd_subparsers.add_parser(cmd, help=cmd_help)
+            cmd_parser.add_argument('-sp', '--socket-path', help='Unix socket path of the agent, defaults to the environment one')
+
+    def __agent_client(self, args: argparse.Namespace) -> ArkAuthAgentClient:
+        socket_path = args.socket_path or os.environ.get(ARK_AUTH_AGENT_SOCKET_ENV_VAR, None) or default_agent_socket_path()
+        return ArkAuthAgentClient(socket_path)
+
+    def __run_start_action(self, args: argparse.Namespace) -> None:
+        agent = ArkAuthAgent(args.socket_path, args.refresh_interval, args.refresh_grace)
+        if not args.foreground:
+            if os.fork() != 0:
+                ArkArgsFormatter.print_normal(f'export {ARK_AUTH_AGENT_SOCKET_ENV_VAR}={agent.socket_path};')
+                return
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()]:
+                os.dup2(devnull, fd)
+        agent.serve_forever()
+
+    def __run_stop_action(self, args: argparse.Namespace) -> None:
+        if not self.__agent_client(args).stop():
+            raise ArkException('Auth agent is not running')
+        ArkArgsFormatter.print_success('Auth agent stopped')
+
+    def __run_status_action(self, args: argparse.Namespace) -> None:
+        client = self.__agent_client(args)
+        status = client.status()
+        if status is None:
+            ArkArgsFormatter.print_warning(f'Auth agent is not running on [{client.socket_path}]')
+            return
+        ArkArgsFormatter.print_success(
+            f'Auth agent is running on [{client.socket_path}] with pid [{status["pid"]}] holding [{status["tokens"]}] tokens'
+        )
+
+    def __run_clear_action(self, args: argparse.Namespace) -> None:
+        if not self.__agent_client(args).clear():
+            raise ArkException('Auth agent is not running')
+        ArkArgsFormatter.print_success('Auth agent tokens cleared')
+
+    @overrides
+    def run_action(self, args: argparse.Namespace) -> None:
+        """
+        Runs the agent action.
+
+        Args:
+            args (argparse.Namespace): _description_
+
+        Raises:
+            ArkException: _description_
+        """
+        self._common_actions_execution(args)
+        if args.agent_cmd == 'start':
+            self.__run_start_action(args)
+        elif args.agent_cmd == 'stop':
+            self.__run_stop_action(args)
+        elif args.agent_cmd == 'status':
+            self.__run_status_action(args)
+        elif args.agent_cmd == 'clear':
+            self.__run_clear_action(args)
+        else:
+            raise ArkException(f'Invalid command {args.agent_cmd} given')
+
+    @overrides
+    def can_run_action(self, action_name: str, args: argparse.Namespace) -> bool:
+        """
+        Asserts the action is `agent`.
+
+        Args:
+            action_name (str): _description_
+            args (argparse.Namespace): _description_
+
+        Returns:
+            bool: _description_
+        """
+        return action_name == 'agent'
@@ -5,7 +5,9 @@ from overrides import overrides
 
 from ark_sdk_python.actions.ark_action import ArkAction
 from ark_sdk_python.args import ArkArgsFormatter
+from ark_sdk_python.common.ark_disk_cache import ArkDiskCache
 from ark_sdk_python.common.ark_keyring import ARK_BASIC_KEYRING_FOLDER_ENV_VAR, DEFAULT_BASIC_KEYRING_FOLDER, ArkKeyring, BasicKeyring
+from ark_sdk_python.common.ark_sqlite_http_cache_store import ArkSQLiteHTTPCacheStore
 from ark_sdk_python.models import ArkException
 
 
@@ -25,6 +27,8 @@ class ArkCacheAction(ArkAction):
         cache_cmd_subparsers.add_parser('clear', help='Clears all profiles cache')
 
     def __run_clear_cache_action(self) -> None:
+        ArkDiskCache.clear_all()
+        ArkSQLiteHTTPCacheStore.clear_all()
         if isinstance(ArkKeyring.get_keyring(), BasicKeyring):
             cache_folder_path = os.path.join(os.path.expanduser('~'), DEFAULT_BASIC_KEYRING_FOLDER)
             if ARK_BASIC_KEYRING_FOLDER_ENV_VAR in os.environ:
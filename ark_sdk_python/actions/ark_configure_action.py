@@ -41,7 +41,9 @@ class ArkConfigureAction(ArkAction):
 
         # Add the profile settings to the arguments
         ArkPydanticArgparse.schema_to_argparse(
-            ArkProfile.model_json_schema(by_alias=False), conf_parser, ignore_keys=CONFIGURATION_IGNORED_DEFINITION_KEYS
+            ArkPydanticArgparse.model_json_schema(ArkProfile, by_alias=False),
+            conf_parser,
+            ignore_keys=CONFIGURATION_IGNORED_DEFINITION_KEYS,
         )
 
         # Add the supported authenticator settings and whether to work with them or not
@@ -61,7 +63,7 @@ class ArkConfigureAction(ArkAction):
                 )
             # Add the rest of the ark auth profile params
             ArkPydanticArgparse.schema_to_argparse(
-                ArkAuthProfile.model_json_schema(by_alias=False),
+                ArkPydanticArgparse.model_json_schema(ArkAuthProfile, by_alias=False),
                 conf_parser,
                 key_prefix=authenticator.authenticator_name().replace('_', '-'),
                 ignore_keys=CONFIGURATION_IGNORED_DEFINITION_KEYS,
@@ -71,7 +73,7 @@ class ArkConfigureAction(ArkAction):
             for auth_method in authenticator.supported_auth_methods():
                 auth_settings = ArkAuthMethodSettingsMap[auth_method]
                 ArkPydanticArgparse.schema_to_argparse(
-                    auth_settings.model_json_schema(by_alias=False),
+                    ArkPydanticArgparse.model_json_schema(auth_settings, by_alias=False),
                     conf_parser,
                     key_prefix=authenticator.authenticator_name().replace('_', '-'),
                     ignore_keys=CONFIGURATION_IGNORED_DEFINITION_KEYS
@@ -98,7 +100,7 @@ class ArkConfigureAction(ArkAction):
 
         # Fill the rest of the profile settings
         profile_vals = ArkPydanticArgparse.argparse_to_schema_interactive(
-            ArkProfile.model_json_schema(by_alias=False),
+            ArkPydanticArgparse.model_json_schema(ArkProfile, by_alias=False),
             args,
             ignored_keys=CONFIGURATION_IGNORED_INTERACTIVE_KEYS,
             existing_values=profile.model_dump(),
@@ -154,7 +156,7 @@ class ArkConfigureAction(ArkAction):
                 )
                 # Get the auth profile general settings
                 auth_profile_vals = ArkPydanticArgparse.argparse_to_schema_interactive(
-                    ArkAuthProfile.model_json_schema(by_alias=False),
+                    ArkPydanticArgparse.model_json_schema(ArkAuthProfile, by_alias=False),
                     args,
                     ignored_keys=ignored_keys,
                     existing_values=auth_profile.model_dump(),
@@ -175,7 +177,7 @@ class ArkConfigureAction(ArkAction):
                 else:
                     method_settings = ArkAuthMethodSettingsMap[auth_method].model_validate(auth_profile.auth_method_settings)
                 method_settings_vals = ArkPydanticArgparse.argparse_to_schema_interactive(
-                    method_settings.model_json_schema(by_alias=False),
+                    ArkPydanticArgparse.model_json_schema(type(method_settings), by_alias=False),
                     args,
                     existing_values=method_settings.model_dump(),
                     override_aliases=CONFIGURATION_OVERRIDE_ALIASES,
@@ -216,7 +218,7 @@ class ArkConfigureAction(ArkAction):
         profile = ArkPydanticArgparse.merge_by_model(
             ArkProfile,
             ArkProfileLoader.load_profile(args.profile_name) or ArkProfile(profile_name=args.profile_name),
-            ArkPydanticArgparse.argparse_to_schema(ArkProfile.model_json_schema(by_alias=False), args),
+            ArkPydanticArgparse.argparse_to_schema(ArkPydanticArgparse.model_json_schema(ArkProfile, by_alias=False), args),
         )
 
         # Load the authenticators
@@ -238,7 +240,9 @@ class ArkConfigureAction(ArkAction):
                     ArkAuthProfile,
                     auth_profile,
                     ArkPydanticArgparse.argparse_to_schema(
-                        ArkAuthProfile.model_json_schema(by_alias=False), args, key_prefix=authenticator.authenticator_name()
+                        ArkPydanticArgparse.model_json_schema(ArkAuthProfile, by_alias=False),
+                        args,
+                        key_prefix=authenticator.authenticator_name(),
                     ),
                     key_prefix=authenticator.authenticator_name(),
                 )
@@ -256,7 +260,9 @@ class ArkConfigureAction(ArkAction):
 
                 # Parse and merge the method settings from the cli
                 method_settings_vals = ArkPydanticArgparse.argparse_to_schema(
-                    method_settings.model_json_schema(by_alias=False), args, key_prefix=authenticator.authenticator_name()
+                    ArkPydanticArgparse.model_json_schema(type(method_settings), by_alias=False),
+                    args,
+                    key_prefix=authenticator.authenticator_name(),
                 )
 
                 # Remove the postfix
@@ -1,28 +1,91 @@
 import argparse
+import contextvars
+import importlib.metadata
 import itertools
 import json
 import os
+import sys
+import tempfile
 import traceback
 from abc import abstractmethod
 from collections import namedtuple
-from typing import Any, Dict, Generator, List, Optional, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Final, Generator, Iterable, List, Optional, Set, TextIO, Tuple, Type, Union
 
 from overrides import overrides
 
 from ark_sdk_python.actions.ark_action import ArkAction
-from ark_sdk_python.args import ArkArgsFormatter, ArkPydanticArgparse
+from ark_sdk_python.args import ArkArgsFormatter, ArkOutputWriter, ArkPydanticArgparse
+from ark_sdk_python.args.ark_output_writer import DEFAULT_OUTPUT_FORMAT, SUPPORTED_OUTPUT_FORMATS
+from ark_sdk_python.ark_api_pool import ArkAPIPool
 from ark_sdk_python.auth import SUPPORTED_AUTHENTICATORS
 from ark_sdk_python.auth.ark_auth import ArkAuth
 from ark_sdk_python.cli_services import ArkCLIAPI
 from ark_sdk_python.common import ArkAsyncRequest, ArkPollers, ArkSystemConfig
+from ark_sdk_python.common.ark_disk_cache import ArkDiskCache
+from ark_sdk_python.common.ark_profiler import PHASE_AUTH_LOAD, PHASE_SERIALIZATION, ArkProfiler
 from ark_sdk_python.common.ark_retry import ArkRetry
+from ark_sdk_python.common.ark_tracing import DEFAULT_TRACE_FORMAT, SUPPORTED_TRACE_FORMATS, ArkTracer
 from ark_sdk_python.models import ArkException, ArkModel
 from ark_sdk_python.models.ark_model import ArkPollableModel
-from ark_sdk_python.models.ark_profile import ArkProfileLoader
+from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
 from ark_sdk_python.services.ark_service import ArkService
 
+ARK_SDK_DISTRIBUTION_NAME: Final[str] = 'ark-sdk-python'
+CLI_SCHEMAS_CACHE_TTL_SECONDS: Final[int] = 30 * 24 * 60 * 60
+DEFAULT_BATCH_CONCURRENCY: Final[int] = 4
+
 
 class ArkExecAction(ArkAction):
+    __MODEL_SCHEMAS: Dict[str, Dict[str, Any]] = {}
+    __MODEL_SCHEMAS_LOADED: bool = False
+    __MODEL_SCHEMAS_MODIFIED: bool = False
+    __API_POOL: Optional[ArkAPIPool] = None
+
+    @staticmethod
+    def __model_schemas_cache() -> Optional[ArkDiskCache]:
+        # Schemas only change between releases, so they are cached per installed version, and not cached at all from a source checkout
+        try:
+            version = importlib.metadata.version(ARK_SDK_DISTRIBUTION_NAME)
+        except importlib.metadata.PackageNotFoundError:
+            return None
+        return ArkDiskCache(f'cli_schemas_{version}', CLI_SCHEMAS_CACHE_TTL_SECONDS)
+
+    def _model_json_schema(self, model_type: Type[ArkModel]) -> Dict[str, Any]:
+        """
+        Returns the JSON schema of the model, loading it from the versioned disk cache when possible.
+        Generating the schemas of all the exec models is most of the CLI start up time.
+
+        Args:
+            model_type (Type[ArkModel]): _description_
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        if not ArkExecAction.__MODEL_SCHEMAS_LOADED:
+            ArkExecAction.__MODEL_SCHEMAS_LOADED = True
+            cache = ArkExecAction.__model_schemas_cache()
+            if cache:
+                schemas, _ = cache.get('schemas')
+                ArkExecAction.__MODEL_SCHEMAS.update(schemas or {})
+        schema_key = f'{model_type.__module__}.{model_type.__qualname__}'
+        if schema_key not in ArkExecAction.__MODEL_SCHEMAS:
+            ArkExecAction.__MODEL_SCHEMAS[schema_key] = ArkPydanticArgparse.model_json_schema(model_type)
+            ArkExecAction.__MODEL_SCHEMAS_MODIFIED = True
+        return ArkExecAction.__MODEL_SCHEMAS[schema_key]
+
+    def _save_model_json_schemas(self) -> None:
+        """
+        Stores the JSON schemas generated by this run in the versioned disk cache.
+        """
+        if not ArkExecAction.__MODEL_SCHEMAS_MODIFIED:
+            return
+        ArkExecAction.__MODEL_SCHEMAS_MODIFIED = False
+        cache = ArkExecAction.__model_schemas_cache()
+        if cache:
+            cache.set('schemas', ArkExecAction.__MODEL_SCHEMAS)
+
+    @ArkProfiler.phased(PHASE_SERIALIZATION)
     def _serialize_output(self, output: Optional[Union[List, Dict, ArkModel, Generator, Tuple, Any]]) -> str:
         if output is None:
             return ''
@@ -30,41 +93,17 @@ class ArkExecAction(ArkAction):
             return self._serialize_output(list(itertools.chain.from_iterable([p.items for p in output])))
         if isinstance(output, list):
             return json.dumps(
-                [
-                    (
-                        json.loads(a.model_dump_json(by_alias=False, exclude={'poll_progress_callback'}))
-                        if issubclass(type(a), ArkModel)
-                        else a
-                    )
-                    for a in output
-                    if a is not None
-                ],
+                [ArkOutputWriter.to_jsonable(a) for a in output if a is not None],
                 indent=4,
             )
         elif isinstance(output, tuple):
             return json.dumps(
-                [
-                    (
-                        json.loads(a.model_dump_json(by_alias=False, exclude={'poll_progress_callback'}))
-                        if issubclass(type(a), ArkModel)
-                        else a
-                    )
-                    for a in output
-                    if a is not None
-                ],
+                [ArkOutputWriter.to_jsonable(a) for a in output if a is not None],
                 indent=4,
             )
         elif isinstance(output, dict):
             return json.dumps(
-                {
-                    k: (
-                        json.loads(v.model_dump_json(indent=4, by_alias=False, exclude={'poll_progress_callback'}))
-                        if issubclass(type(v), ArkModel)
-                        else v
-                    )
-                    for k, v in output.items()
-                    if k is not None and v is not None
-                },
+                {k: ArkOutputWriter.to_jsonable(v) for k, v in output.items() if k is not None and v is not None},
                 indent=4,
             )
         elif issubclass(type(output), ArkModel):
@@ -73,6 +112,175 @@ class ArkExecAction(ArkAction):
             return output.async_task.model_dump_json(indent=4, by_alias=False)
         return str(output)
 
+    def _stream_output(self, output: Union[List, Tuple, Generator, Any], args: argparse.Namespace) -> None:
+        pages: Iterable[Iterable[Any]] = [output if isinstance(output, (list, tuple)) else [output]]
+        if isinstance(output, Generator):
+            pages = (page.items for page in output)
+        output_file: Optional[TextIO] = None
+        output_path: Optional[str] = None
+        tmp_output_path: Optional[str] = None
+        streams: List[TextIO] = []
+        completed = False
+        try:
+            if args.output_path:
+                output_path = os.path.abspath(args.output_path)
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                # Written aside and renamed once complete, so a failure never leaves a truncated output file
+                fd, tmp_output_path = tempfile.mkstemp(
+                    dir=os.path.dirname(output_path), prefix=f'.{os.path.basename(output_path)}', suffix='.tmp'
+                )
+                output_file = os.fdopen(fd, 'w', encoding='utf-8')
+                streams.append(output_file)
+            # JSON keeps printing along the output file as it always did, the line formats go to a single destination
+            if (not output_file or args.output_format == DEFAULT_OUTPUT_FORMAT) and (
+                ArkSystemConfig.is_interactive() or ArkSystemConfig.is_allowing_output()
+            ):
+                streams.append(sys.stdout)
+            writer = ArkOutputWriter(args.output_format, streams)
+            for items in pages:
+                with ArkProfiler.phase(PHASE_SERIALIZATION):
+                    writer.write_items(item for item in items if item is not None)
+            writer.close()
+            completed = True
+        finally:
+            if output_file and tmp_output_path:
+                output_file.close()
+                if completed:
+                    os.replace(tmp_output_path, output_path)
+                elif os.path.exists(tmp_output_path):
+                    os.unlink(tmp_output_path)
+        if output_file:
+            ArkArgsFormatter.print_success(f'Wrote {writer.items_count} items to [{output_path}]')
+
+    def _batch_output(self, output: Optional[Union[List, Dict, ArkModel, Generator, Tuple, Any]]) -> Tuple[bool, Any]:
+        """
+        Converts the output of a batch request to its JSON compatible form, and checks whether any async task of it failed.
+
+        Args:
+            output (Optional[Union[List, Dict, ArkModel, Generator, Tuple, Any]]): _description_
+
+        Returns:
+            Tuple[bool, Any]: _description_
+        """
+        if isinstance(output, Generator):
+            output = list(itertools.chain.from_iterable([p.items for p in output]))
+        if isinstance(output, (list, tuple)):
+            results = [self._batch_output(a) for a in output if a is not None]
+            return all(succeeded for succeeded, _ in results), [result for _, result in results]
+        if isinstance(output, dict):
+            return True, {k: ArkOutputWriter.to_jsonable(v) for k, v in output.items() if k is not None and v is not None}
+        if issubclass(type(output), ArkAsyncRequest):
+            return not output.task_failed(), ArkOutputWriter.to_jsonable(output.async_task)
+        return True, ArkOutputWriter.to_jsonable(output)
+
+    def _run_batch_request(self, api: ArkCLIAPI, line_number: int, line: str, args: argparse.Namespace) -> Dict[str, Any]:
+        """
+        Runs a single line of a batch file, and returns its result line.
+        Failures are reported in the result line, so one failed request does not stop the rest of the batch.
+
+        Args:
+            api (ArkCLIAPI): _description_
+            line_number (int): _description_
+            line (str): _description_
+            args (argparse.Namespace): _description_
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        result: Dict[str, Any] = {'line': line_number}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict) or 'service' not in request or 'action' not in request:
+                raise ArkException('Batch request must be a JSON object with [service], [action] and optional [args] fields')
+            if 'id' in request:
+                result['id'] = request['id']
+            result['service'] = request['service']
+            result['action'] = request['action']
+            service_path = request['service'].split() if isinstance(request['service'], str) else request['service']
+            output = ArkRetry.retry_call(
+                self.run_exec_request,
+                fargs=[api, service_path, request['action'], request.get('args') or {}],
+                tries=args.retry_count,
+                delay=1,
+            )
+            succeeded, batch_output = self._batch_output(output)
+            result['status'] = 'succeeded' if succeeded else 'failed'
+            result['output'] = batch_output
+        except Exception as ex:
+            self._logger.debug(traceback.format_exc())
+            result['status'] = 'failed'
+            result['error'] = str(ex)
+        return result
+
+    def _run_batch(self, api: ArkCLIAPI, args: argparse.Namespace) -> None:
+        """
+        Runs every line of the batch file with the same API, so the profile, authenticators and services are loaded once.
+        The lines run concurrently up to the batch concurrency, and each result is written as an NDJSON line as soon as it finishes.
+
+        Args:
+            api (ArkCLIAPI): _description_
+            args (argparse.Namespace): _description_
+
+        Raises:
+            ArkException: _description_
+        """
+        if args.batch_concurrency < 1:
+            raise ArkException('Batch concurrency must be at least 1')
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            lines = [(line_number, line) for line_number, line in enumerate(f, start=1) if line.strip()]
+        output_file: Optional[TextIO] = None
+        streams: List[TextIO] = []
+        failed_count = 0
+        try:
+            if args.output_path:
+                output_path = os.path.abspath(args.output_path)
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                output_file = open(output_path, 'w', encoding='utf-8')  # pylint: disable=consider-using-with
+                streams.append(output_file)
+            else:
+                streams.append(sys.stdout)
+            writer = ArkOutputWriter('ndjson', streams)
+            with ThreadPoolExecutor(max_workers=args.batch_concurrency) as executor:
+                # Each request runs in a copy of the context, so its spans are part of the trace of the batch
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._run_batch_request, api, line_number, line, args)
+                    for line_number, line in lines
+                ]
+                # Results are written in completion order, the line field maps them back to the batch file
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result['status'] != 'succeeded':
+                        failed_count += 1
+                    writer.write_items([result])
+        finally:
+            if output_file:
+                output_file.close()
+        if output_file:
+            ArkArgsFormatter.print_success(f'Wrote {writer.items_count} results to [{output_file.name}]')
+        if failed_count:
+            raise ArkException(f'{failed_count} out of {len(lines)} batch requests failed')
+
+    def _call_service_action(self, service_action: Callable[[], Any], args: argparse.Namespace) -> Any:
+        """
+        Calls the service action with the retries the user asked for.
+        Only the call is retried, as paged outputs are written while their pages arrive, and retrying the writing would repeat them.
+
+        Args:
+            service_action (Callable[[], Any]): _description_
+            args (argparse.Namespace): _description_
+
+        Returns:
+            Any: _description_
+        """
+        return ArkRetry.retry_call(
+            service_action,
+            tries=args.retry_count,
+            delay=1,
+            logger=namedtuple("logger", ("warning"))(
+                warning=lambda _1, _2, delay: ArkArgsFormatter.print_failure(f"Retrying in {delay} seconds")
+            ),
+        )
+
     def _write_output_to_file(self, output_path: str, serialized_output: str) -> None:
         output_path = os.path.abspath(output_path)
         if not os.path.exists(os.path.dirname(output_path)):
@@ -86,10 +294,10 @@ class ArkExecAction(ArkAction):
         try:
             model_type: Type[ArkPollableModel] = schemas_map[action.replace('_', '-')]
             model: ArkPollableModel = model_type.model_validate(
-                ArkPydanticArgparse.argparse_to_schema(model_type.model_json_schema(), args)
+                ArkPydanticArgparse.argparse_to_schema(self._model_json_schema(model_type), args)
             )
             model.poll_progress_callback = ArkPollers.default_poller()
-            output = getattr(service, action.replace('-', '_'))(model)
+            output = self._call_service_action(lambda: getattr(service, action.replace('-', '_'))(model), args)
             async_req = None
             if issubclass(type(output), ArkAsyncRequest):
                 async_req = output
@@ -149,7 +357,7 @@ class ArkExecAction(ArkAction):
             elif output is not None:
                 ArkArgsFormatter.print_success(self._serialize_output(output))
         except Exception as ex:
-            self._logger.exception(f'Failed running async command {action}')
+            self._logger.exception('Failed running async command %s', action)
             ArkArgsFormatter.print_failure(f'Failed to execute async command, error:\n{str(ex)}')
             self._logger.debug(traceback.format_exc())
             raise ex
@@ -160,11 +368,16 @@ class ArkExecAction(ArkAction):
         try:
             model_type: Type[ArkPollableModel] = schemas_map[action.replace('_', '-')]
             if model_type:
-                model: ArkModel = model_type.model_validate(ArkPydanticArgparse.argparse_to_schema(model_type.model_json_schema(), args))
-                output = getattr(service, action.replace('-', '_'))(model)
+                model: ArkModel = model_type.model_validate(
+                    ArkPydanticArgparse.argparse_to_schema(self._model_json_schema(model_type), args)
+                )
+                output = self._call_service_action(lambda: getattr(service, action.replace('-', '_'))(model), args)
             else:
-                output = getattr(service, action.replace('-', '_'))()
-            if output is not None:
+                output = self._call_service_action(getattr(service, action.replace('-', '_')), args)
+            if output is not None and (isinstance(output, Generator) or args.output_format != DEFAULT_OUTPUT_FORMAT):
+                # Paged outputs and line formats are streamed as the pages arrive, instead of being serialized as a whole
+                self._stream_output(output, args)
+            elif output is not None:
                 serialized_output: str = self._serialize_output(output)
                 if args.output_path:
                     self._write_output_to_file(args.output_path, serialized_output)
@@ -172,7 +385,7 @@ class ArkExecAction(ArkAction):
             else:
                 ArkArgsFormatter.print_success(f'{action.replace("-", " ").title()} finished successfully')
         except Exception as ex:
-            self._logger.exception(f'Failed running command {action}')
+            self._logger.exception('Failed running command %s', action)
             ArkArgsFormatter.print_failure(f'Failed to execute command, error:\n{str(ex)}')
             self._logger.debug(traceback.format_exc())
             raise ex
@@ -182,12 +395,14 @@ class ArkExecAction(ArkAction):
         subparsers: argparse._SubParsersAction,
         schemas_map: Dict[str, Optional[Type[ArkModel]]],
         defaults_map: Optional[Dict[str, Dict[str, Any]]] = None,
+        selected_tokens: Optional[Set[str]] = None,
     ):
         for action, schema in schemas_map.items():
             parser = subparsers.add_parser(action)
-            if schema:
+            # Actions which are not part of the command line are only defined by name, so they are still listed in help and errors
+            if schema and (selected_tokens is None or action in selected_tokens):
                 ArkPydanticArgparse.schema_to_argparse(
-                    schema.model_json_schema(), parser, defaults=defaults_map.get(action, None) if defaults_map else None
+                    self._model_json_schema(schema), parser, defaults=defaults_map.get(action, None) if defaults_map else None
                 )
 
     @overrides
@@ -211,7 +426,37 @@ class ArkExecAction(ArkAction):
             self._common_actions_configuration(exec_parser)
             exec_parser.add_argument('-pn', '--profile-name', default=ArkProfileLoader.default_profile_name(), help='Profile name to load')
             exec_parser.add_argument('-op', '--output-path', help='Output file to write data to')
+            exec_parser.add_argument(
+                '-of',
+                '--output-format',
+                choices=SUPPORTED_OUTPUT_FORMATS,
+                default=DEFAULT_OUTPUT_FORMAT,
+                help='Format of the output, line formats and paged outputs are streamed as they arrive',
+            )
             exec_parser.add_argument('-rf', '--request-file', help='Request file containing the parameters for the exec action')
+            exec_parser.add_argument(
+                '-b', '--batch', help='JSON lines file of requests to run in a single session, each with [service], [action] and [args]'
+            )
+            exec_parser.add_argument(
+                '-bc',
+                '--batch-concurrency',
+                type=int,
+                default=DEFAULT_BATCH_CONCURRENCY,
+                help='Maximum number of batch requests to run at the same time',
+            )
+            exec_parser.add_argument('-tf', '--trace-file', help='Trace the execution and write its spans to this file')
+            exec_parser.add_argument(
+                '-tff',
+                '--trace-file-format',
+                choices=SUPPORTED_TRACE_FORMATS,
+                default=DEFAULT_TRACE_FORMAT,
+                help='Format of the trace file, OpenTelemetry JSON or Chrome trace events',
+            )
+            exec_parser.add_argument(
+                '-pr',
+                '--profile-run',
+                help='Profile the execution and write its hot functions, memory and phase breakdown to this file',
+            )
             exec_parser.add_argument('-rc', '--retry-count', type=int, help='Retry count for execution', default=1)
             exec_parser.add_argument(
                 '-ra',
@@ -220,8 +465,41 @@ class ArkExecAction(ArkAction):
                 help='If possible, will try to refresh the active authentication before running the actual command',
             )
             exec_subparsers = exec_parser.add_subparsers(dest="command")
-            exec_subparsers.required = True
+            # A batch names its commands in the batch file instead of the command line
+            exec_subparsers.required = not any(arg == '--batch' or arg.startswith('--batch=') or arg == '-b' for arg in sys.argv[1:])
         self.define_exec_action(exec_subparsers)
+        self._save_model_json_schemas()
+
+    @staticmethod
+    def use_api_pool(api_pool: Optional[ArkAPIPool]) -> None:
+        """
+        Sets the pool which exec reuses the API of each profile from, instead of loading it on every run.
+        Used by long running processes which run many commands, such as the warm CLI server.
+
+        Args:
+            api_pool (Optional[ArkAPIPool]): The pool to use, or None to load the API on every run
+        """
+        ArkExecAction.__API_POOL = api_pool
+
+    @ArkProfiler.phased(PHASE_AUTH_LOAD)
+    def __load_api(self, profile: ArkProfile, refresh_auth: bool) -> ArkCLIAPI:
+        # Load token from cache for each auth profile
+        authenticators: List[ArkAuth] = []
+        for authenticator_name in profile.auth_profiles.keys():
+            authenticator = SUPPORTED_AUTHENTICATORS[authenticator_name]()
+            if not authenticator.load_authentication(profile, refresh_auth):
+                continue
+            authenticators.append(authenticator)
+
+        if len(authenticators) == 0:
+            raise ArkException(
+                'Failed to load authenticators, tokens are either expired or authenticators are not logged in, please login first'
+            )
+        if len(authenticators) != len(profile.auth_profiles) and ArkSystemConfig.is_interactive():
+            ArkArgsFormatter.print_colored('Not all authenticators are logged in, some of the functionality will be disabled')
+
+        # Create the CLI API with the authenticators
+        return ArkCLIAPI(authenticators, profile)
 
     @overrides
     def run_action(self, args: argparse.Namespace) -> None:
@@ -230,6 +508,8 @@ class ArkExecAction(ArkAction):
         Loads the authenticators from the cache and connects to the API using the loaded authenticators.
         Each service is created from the API, based on the given authenticators, and then
         runs the exec action using the API.
+        With a trace file, the execution is traced and its spans are written to the file when it ends.
+        With a profile run file, the execution is profiled and its report is written to the file when it ends.
 
         Args:
             args (argparse.Namespace): _description_
@@ -239,39 +519,49 @@ class ArkExecAction(ArkAction):
             ArkException: _description_
         """
         self._common_actions_execution(args)
+        if args.profile_run:
+            # Already started when run from the command line, to profile the parsers build as well
+            ArkProfiler.start()
+        try:
+            self.__run_traced_exec(args)
+        finally:
+            if args.profile_run:
+                ArkProfiler.stop(args.profile_run)
+
+    def __run_traced_exec(self, args: argparse.Namespace) -> None:
+        if not args.trace_file:
+            self.__run_exec(args)
+            return
+        ArkTracer.enable()
+        try:
+            with ArkTracer.span(f'ark exec {args.command or "batch"}'):
+                self.__run_exec(args)
+        finally:
+            ArkTracer.disable()
+            ArkTracer.export(args.trace_file, args.trace_file_format)
+            ArkTracer.clear()
+
+    def __run_exec(self, args: argparse.Namespace) -> None:
         profile = ArkProfileLoader.load_profile(ArkProfileLoader.deduce_profile_name(args.profile_name))
         if not profile:
             raise ArkException('Please configure a profile and login before trying to exec')
 
-        # Load token from cache for each auth profile
-        authenticators: List[ArkAuth] = []
-        for authenticator_name in profile.auth_profiles.keys():
-            authenticator = SUPPORTED_AUTHENTICATORS[authenticator_name]()
-            if not authenticator.load_authentication(profile, args.refresh_auth):
-                continue
-            authenticators.append(authenticator)
+        api_pool = ArkExecAction.__API_POOL
+        if api_pool:
+            # A warm server keeps the API of each profile and environment, with its authenticators and services, across commands
+            api_key = f'{profile.profile_name}@{os.environ.get("DEPLOY_ENV", "prod")}'
+            if args.refresh_auth:
+                api_pool.evict(api_key)
+            api = api_pool.api(api_key, lambda: self.__load_api(profile, args.refresh_auth))
+        else:
+            api = self.__load_api(profile, args.refresh_auth)
 
-        if len(authenticators) == 0:
-            raise ArkException(
-                'Failed to load authenticators, tokens are either expired or authenticators are not logged in, please login first'
-            )
-        if len(authenticators) != len(profile.auth_profiles) and ArkSystemConfig.is_interactive():
-            ArkArgsFormatter.print_colored('Not all authenticators are logged in, some of the functionality will be disabled')
+        if args.batch:
+            self._run_batch(api, args)
+            return
 
-        # Create the CLI API with the authenticators
-        api = ArkCLIAPI(authenticators, profile)
-
-        # Run the actual exec fitting action with the api
-        # Run it with retries as per defined by user
-        ArkRetry.retry_call(
-            self.run_exec_action,
-            fargs=[api, args],
-            tries=args.retry_count,
-            delay=1,
-            logger=namedtuple("logger", ("warning"))(
-                warning=lambda _1, _2, delay: ArkArgsFormatter.print_failure(f"Retrying in {delay} seconds")
-            ),
-        )
+        # Run the actual exec fitting action with the api, whose service call is retried as per defined by user
+        self.run_exec_action(api, args)
 
     @overrides
     def can_run_action(self, action_name: str, args: argparse.Namespace) -> bool:
@@ -285,7 +575,7 @@ class ArkExecAction(ArkAction):
         Returns:
             bool: _description_
         """
-        return action_name == 'exec' and self.can_run_exec_action(args.command, args)
+        return action_name == 'exec' and (bool(args.batch) or self.can_run_exec_action(args.command, args))
 
     @abstractmethod
     def define_exec_action(self, exec_subparsers: argparse._SubParsersAction) -> None:
@@ -306,6 +596,22 @@ class ArkExecAction(ArkAction):
             args (argparse.Namespace): _description_
         """
 
+    @abstractmethod
+    def run_exec_request(self, api: ArkCLIAPI, service_path: List[str], action: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Runs a single service action by its command path and name, with the arguments given as the fields of the action model.
+        Used by batches, which are not parsed as command lines.
+
+        Args:
+            api (ArkCLIAPI): _description_
+            service_path (List[str]): _description_
+            action (str): _description_
+            arguments (Dict[str, Any]): _description_
+
+        Returns:
+            Any: _description_
+        """
+
     @abstractmethod
     def can_run_exec_action(self, command_name: str, args: argparse.Namespace) -> bool:
         """
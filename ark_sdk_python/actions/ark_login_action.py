@@ -101,7 +101,7 @@ class ArkLoginAction(ArkAction):
                     continue
                 except Exception as ex:
                     self._logger.info(
-                        f'{authenticator.authenticator_human_readable_name()} Failed to refresh token, performing normal login [{str(ex)}]'
+                        '%s Failed to refresh token, performing normal login [%s]', authenticator.authenticator_human_readable_name(), ex
                     )
             secret = (
                 ArkSecret(secret=args.__dict__[f'{authenticator_name}_secret']) if args.__dict__[f'{authenticator_name}_secret'] else None
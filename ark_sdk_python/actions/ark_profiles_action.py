@@ -4,11 +4,10 @@ import os
 from fnmatch import fnmatch
 from typing import List, Optional
 
-import inquirer
 from overrides import overrides
 
 from ark_sdk_python.actions.ark_action import ArkAction
-from ark_sdk_python.args import ArkArgsFormatter, ArkInquirerRender
+from ark_sdk_python.args import ArkArgsFormatter
 from ark_sdk_python.models import ArkException, ArkProfile, ArkProfileLoader
 
 
@@ -83,6 +82,10 @@ class ArkProfilesAction(ArkAction):
         ArkArgsFormatter.print_success(profile.model_dump_json(indent=4))
 
     def __run_delete_action(self, args: argparse.Namespace) -> None:
+        import inquirer
+
+        from ark_sdk_python.args import ArkInquirerRender
+
         profile: Optional[ArkProfile] = ArkProfileLoader.load_profile(args.profile_name)
         if not profile:
             ArkArgsFormatter.print_warning(
@@ -99,6 +102,10 @@ class ArkProfilesAction(ArkAction):
         ArkProfileLoader.delete_profile(args.profile_name)
 
     def __run_clear_action(self, args: argparse.Namespace) -> None:
+        import inquirer
+
+        from ark_sdk_python.args import ArkInquirerRender
+
         if not args.yes:
             answer = inquirer.prompt(
                 [inquirer.Confirm('answer', message='Are you sure you want to clear all profiles')], render=ArkInquirerRender()
@@ -108,6 +115,10 @@ class ArkProfilesAction(ArkAction):
         ArkProfileLoader.clear_all_profiles()
 
     def __run_clone_action(self, args: argparse.Namespace) -> None:
+        import inquirer
+
+        from ark_sdk_python.args import ArkInquirerRender
+
         profile: Optional[ArkProfile] = ArkProfileLoader.load_profile(args.profile_name)
         if not profile:
             ArkArgsFormatter.print_warning(
@@ -140,13 +151,17 @@ class ArkProfilesAction(ArkAction):
                 profile: ArkProfile = ArkProfile.model_validate_json(fh.read())
             ArkProfileLoader.save_profile(profile)
         except Exception as ex:
-            self._logger.exception(f'Failed to parser profile [{str(ex)}]')
+            self._logger.exception('Failed to parser profile [%s]', ex)
             ArkArgsFormatter.print_failure(
                 f'Profile path [{args.profile_path}] failed to be parsed, aborting',
             )
             return
 
     def __run_edit_action(self, args: argparse.Namespace) -> None:
+        import inquirer
+
+        from ark_sdk_python.args import ArkInquirerRender
+
         profile_name = args.profile_name or ArkProfileLoader.deduce_profile_name()
         profile: Optional[ArkProfile] = ArkProfileLoader.load_profile(profile_name)
         if not profile:
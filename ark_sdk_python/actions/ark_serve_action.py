@@ -0,0 +1,239 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from typing import Any, Dict, Final, Iterator, List, Optional
+
+from overrides import overrides
+
+from ark_sdk_python.actions.ark_action import ArkAction
+from ark_sdk_python.actions.ark_exec_action import ArkExecAction
+from ark_sdk_python.actions.ark_service_exec_action import ArkServiceExecAction
+from ark_sdk_python.args import ArkArgsFormatter
+from ark_sdk_python.ark_api_pool import ArkAPIPool
+from ark_sdk_python.auth.ark_auth_agent import ArkAuthAgent
+from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.common.ark_server_client import ARK_SERVER_FAILURE_EXIT_CODE, ArkServerClient, default_server_socket_path
+from ark_sdk_python.models import ArkNotSupportedException
+
+DEFAULT_SERVER_IDLE_TIMEOUT_SECONDS: Final[int] = 15 * 60
+DEFAULT_SERVER_MAX_PROFILES: Final[int] = 8
+SERVER_SUPPORTED_ACTIONS: Final[List[str]] = ['exec']
+
+
+class ArkServerStream(io.TextIOBase):
+    def __init__(self, connection: socket.socket, stream_name: str) -> None:
+        super().__init__()
+        self.__connection = connection
+        self.__stream_name = stream_name
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text:
+            self.__connection.sendall(ArkServerClient.encode_message({self.__stream_name: text}))
+        return len(text)
+
+
+class ArkServeRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        request_line = self.rfile.readline()
+        if not request_line:
+            # Probes checking whether the server is running connect without sending a command
+            return
+        request = json.loads(request_line)
+        stdout = ArkServerStream(self.connection, 'stdout')
+        stderr = ArkServerStream(self.connection, 'stderr')
+        exit_code = ArkServeAction.run_command(request['argv'], request.get('cwd'), stdout, stderr, request.get('env'))
+        self.connection.sendall(ArkServerClient.encode_message({'exit_code': exit_code}))
+
+
+class ArkServeServer(socketserver.UnixStreamServer):
+    def verify_request(self, request: socket.socket, client_address: Any) -> bool:
+        # The server runs commands with the user credentials, so only processes of the same user are served
+        uid = ArkAuthAgent.peer_uid(request)
+        if uid is not None and uid != os.getuid():
+            get_logger(self.__class__.__name__).warning('Rejected ark server connection from uid [%s]', uid)
+            return False
+        return True
+
+
+class ArkServeAction(ArkAction):
+    @staticmethod
+    @contextlib.contextmanager
+    def forwarded_environment(env: Optional[Dict[str, str]]) -> Iterator[None]:
+        """
+        Replaces the forwarded environment variables of the server with the ones of the client for the duration of the block,
+        so commands run with the profile, tenant and settings of the client rather than of the server.
+
+        Args:
+            env (Optional[Dict[str, str]]): The forwarded environment of the client
+
+        Yields:
+            Iterator[None]: _description_
+        """
+        original_env = ArkServerClient.forwarded_environment()
+
+        def apply(applied_env: Dict[str, str]) -> None:
+            for name in ArkServerClient.forwarded_environment():
+                del os.environ[name]
+            os.environ.update({name: value for name, value in applied_env.items() if ArkServerClient.is_forwarded_env_var(name)})
+
+        apply(env or {})
+        try:
+            yield
+        finally:
+            apply(original_env)
+
+    @staticmethod
+    def run_command(argv: List[str], cwd: str, stdout: io.TextIOBase, stderr: io.TextIOBase, env: Optional[Dict[str, str]] = None) -> int:
+        """
+        Runs a forwarded command line in the server process, with its output redirected to the given streams.
+        Commands run one at a time, as the system config, environment, working directory and standard streams are process wide.
+
+        Args:
+            argv (List[str]): The command line, without the program name
+            cwd (str): The working directory of the client, which relative paths are resolved from
+            stdout (io.TextIOBase): _description_
+            stderr (io.TextIOBase): _description_
+            env (Optional[Dict[str, str]], optional): The forwarded environment of the client. Defaults to None.
+
+        Returns:
+            int: The exit code of the command
+        """
+        if not argv or argv[0] not in SERVER_SUPPORTED_ACTIONS:
+            stderr.write(f'Only the {SERVER_SUPPORTED_ACTIONS} actions can run through the ark server\n')
+            return ARK_SERVER_FAILURE_EXIT_CODE
+        original_argv = sys.argv
+        original_cwd = os.getcwd()
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr), ArkServeAction.forwarded_environment(env):
+                try:
+                    # The exec parser only fully defines the actions named on the command line, which it reads from sys.argv
+                    sys.argv = ['ark'] + argv
+                    if cwd:
+                        os.chdir(cwd)
+                    parser = argparse.ArgumentParser(prog='ark')
+                    subparsers = parser.add_subparsers(dest='action')
+                    subparsers.required = True
+                    exec_action = ArkServiceExecAction()
+                    exec_action.define_action(subparsers)
+                    args = parser.parse_args(argv)
+                    if exec_action.can_run_action(args.action, args):
+                        exec_action.run_action(args)
+                except SystemExit as ex:
+                    # As for the interpreter, exiting without a code is a success and with a message is a failure
+                    if ex.code is None:
+                        return 0
+                    return ex.code if isinstance(ex.code, int) else ARK_SERVER_FAILURE_EXIT_CODE
+                except Exception:
+                    stderr.write(traceback.format_exc())
+                    return ARK_SERVER_FAILURE_EXIT_CODE
+        finally:
+            sys.argv = original_argv
+            os.chdir(original_cwd)
+        return 0
+
+    @staticmethod
+    def create_server(socket_path: str) -> socketserver.BaseServer:
+        """
+        Creates the server listening on the given unix socket, which is only accessible to the current user.
+        A left over socket of a server which is no longer running is replaced, while a running server is left serving.
+
+        Args:
+            socket_path (str): _description_
+
+        Raises:
+            ArkNotSupportedException: _description_
+
+        Returns:
+            socketserver.BaseServer: _description_
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ArkNotSupportedException('The ark server requires unix sockets, which are not supported on this platform')
+        os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+        if os.path.exists(socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe_socket:
+                try:
+                    probe_socket.connect(socket_path)
+                except OSError:
+                    # Nothing answers on the socket, so it was left over by a server which is no longer running
+                    os.remove(socket_path)
+                else:
+                    raise ArkNotSupportedException(f'An ark server is already running on [{socket_path}]')
+        # The server runs commands with the user credentials, so the socket is created private to the user
+        original_umask = os.umask(0o077)
+        try:
+            return ArkServeServer(socket_path, ArkServeRequestHandler)
+        finally:
+            os.umask(original_umask)
+
+    @overrides
+    def define_action(self, subparsers: argparse._SubParsersAction) -> None:
+        """
+        Defines the CLI `serve` action, which runs a warm local server for `ark --via-server` commands.
+
+        Args:
+            subparsers (argparse._SubParsersAction): _description_
+        """
+        serve_parser: argparse.ArgumentParser = subparsers.add_parser('serve')
+        self._common_actions_configuration(serve_parser)
+        serve_parser.add_argument('-sp', '--socket-path', default=default_server_socket_path(), help='Unix socket path to listen on')
+        serve_parser.add_argument(
+            '-it',
+            '--idle-timeout',
+            type=int,
+            default=DEFAULT_SERVER_IDLE_TIMEOUT_SECONDS,
+            help='Seconds after which the loaded api of an unused profile is released',
+        )
+        serve_parser.add_argument(
+            '-mp', '--max-profiles', type=int, default=DEFAULT_SERVER_MAX_PROFILES, help='Maximum number of profiles to keep loaded'
+        )
+
+    @overrides
+    def run_action(self, args: argparse.Namespace) -> None:
+        """
+        Runs the warm CLI server until interrupted.
+        The loaded profiles, authenticators and services are kept across the forwarded commands.
+
+        Args:
+            args (argparse.Namespace): _description_
+        """
+        self._common_actions_execution(args)
+        server = self.create_server(args.socket_path)
+        api_pool = ArkAPIPool(max_size=args.max_profiles, idle_timeout_seconds=args.idle_timeout)
+        ArkExecAction.use_api_pool(api_pool)
+        ArkArgsFormatter.print_success(f'Serving ark commands on [{args.socket_path}], run them with `ark --via-server exec ...`')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            ArkExecAction.use_api_pool(None)
+            api_pool.close()
+            if os.path.exists(args.socket_path):
+                os.remove(args.socket_path)
+
+    @overrides
+    def can_run_action(self, action_name: str, args: argparse.Namespace) -> bool:
+        """
+        Asserts the action is `serve`.
+
+        Args:
+            action_name (str): _description_
+            args (argparse.Namespace): _description_
+
+        Returns:
+            bool: _description_
+        """
+        return action_name == 'serve'
@@ -1,29 +1,42 @@
 import argparse
-from typing import List, Optional, Tuple
+import os
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from overrides import overrides
 
 from ark_sdk_python.actions.ark_exec_action import ArkExecAction
 from ark_sdk_python.cli_services import ArkCLIAPI
+from ark_sdk_python.models import ArkException
 from ark_sdk_python.models.actions.ark_service_action_definition import ArkServiceActionDefinition
 from ark_sdk_python.models.actions.services import SUPPORTED_SERVICE_ACTIONS
 
 
 class ArkServiceExecAction(ArkExecAction):
+    @staticmethod
+    def __selected_tokens() -> Optional[Set[str]]:
+        # Shell completion may complete any of the actions, so it gets the whole tree
+        if '_ARGCOMPLETE' in os.environ:
+            return None
+        return set(sys.argv[1:])
+
     def __define_service_exec_action(
         self,
         action_def: ArkServiceActionDefinition,
         subparsers: argparse._SubParsersAction,
         parent_actions_def: Optional[List[ArkServiceActionDefinition]] = None,
-    ) -> argparse._SubParsersAction:
+        selected_tokens: Optional[Set[str]] = None,
+    ) -> Optional[argparse._SubParsersAction]:
         action_parser = subparsers.add_parser(action_def.action_name)
+        if selected_tokens is not None and action_def.action_name not in selected_tokens:
+            return None
         action_dest = action_def.action_name
         if parent_actions_def:
             action_dest = '_'.join([p.action_name for p in parent_actions_def]) + f'_{action_def.action_name}'
         action_subparsers = action_parser.add_subparsers(dest=f"{action_dest}_action")
         action_subparsers.required = True
         if action_def.schemas:
-            self._define_actions_by_schemas(action_subparsers, action_def.schemas, action_def.defaults)
+            self._define_actions_by_schemas(action_subparsers, action_def.schemas, action_def.defaults, selected_tokens)
         return action_subparsers
 
     def __define_service_exec_actions(
@@ -31,12 +44,16 @@ class ArkServiceExecAction(ArkExecAction):
         action_def: ArkServiceActionDefinition,
         subparsers: argparse._SubParsersAction,
         parent_actions_def: Optional[List[ArkServiceActionDefinition]] = None,
+        selected_tokens: Optional[Set[str]] = None,
     ) -> None:
-        action_subparsers = self.__define_service_exec_action(action_def, subparsers, parent_actions_def)
-        if action_def.subactions:
+        action_subparsers = self.__define_service_exec_action(action_def, subparsers, parent_actions_def, selected_tokens)
+        if action_subparsers and action_def.subactions:
             for subaction in action_def.subactions:
                 self.__define_service_exec_actions(
-                    subaction, action_subparsers, parent_actions_def + [action_def] if parent_actions_def else [action_def]
+                    subaction,
+                    action_subparsers,
+                    parent_actions_def + [action_def] if parent_actions_def else [action_def],
+                    selected_tokens,
                 )
 
     def __deduce_action_def(
@@ -64,16 +81,26 @@ class ArkServiceExecAction(ArkExecAction):
                 # Find the fitting action
                 return self.__deduce_action_def(args, action_def)
 
+    def __deduce_service(self, api: ArkCLIAPI, action_dest: str) -> Any:
+        api_name = action_dest.replace('_action', '').replace('-', '_')
+        while '_' in api_name and not hasattr(api, api_name):
+            api_name = api_name.rsplit('_', 1)[0]
+        return getattr(api, api_name)
+
     @overrides
     def define_exec_action(self, exec_subparsers: argparse._SubParsersAction) -> None:
         """
         Defines all the supported service actions as CLI actions, with its associated arguments and schemas.
+        Only the actions named on the command line are fully defined, the rest are defined by name alone,
+        as building the arguments of every action is most of the CLI start up time.
+        Shell completion still defines the whole tree.
 
         Args:
             exec_subparsers (argparse._SubParsersAction): _description_
         """
+        selected_tokens = self.__selected_tokens()
         for actions in SUPPORTED_SERVICE_ACTIONS:
-            self.__define_service_exec_actions(actions, exec_subparsers)
+            self.__define_service_exec_actions(actions, exec_subparsers, selected_tokens=selected_tokens)
 
     @overrides
     def run_exec_action(self, api: ArkCLIAPI, args: argparse.Namespace) -> None:
@@ -87,15 +114,46 @@ class ArkServiceExecAction(ArkExecAction):
         """
         action_def, action_dest = self.__deduce_action_command_def(args.command, args)
         action_value = args.__dict__[action_dest]
-        api_name = action_dest.replace('_action', '').replace('-', '_')
-        while '_' in api_name and not hasattr(api, api_name):
-            api_name = api_name.rsplit('_', 1)[0]
-        service = getattr(api, api_name)
+        service = self.__deduce_service(api, action_dest)
         if action_def.async_actions and action_value in action_def.async_actions:
             self._run_async_action(service, action_def.schemas, action_value, args)
         else:
             self._run_sync_action(service, action_def.schemas, action_value, args)
 
+    @overrides
+    def run_exec_request(self, api: ArkCLIAPI, service_path: List[str], action: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Finds the service definition by its command path, e.g. `pcloud accounts`, and runs the action with the arguments validated as its model.
+        The defaults of the action are applied the same as on the command line, and async actions are not polled for progress.
+
+        Args:
+            api (ArkCLIAPI): _description_
+            service_path (List[str]): _description_
+            action (str): _description_
+            arguments (Dict[str, Any]): _description_
+
+        Raises:
+            ArkException: _description_
+
+        Returns:
+            Any: _description_
+        """
+        action_def: Optional[ArkServiceActionDefinition] = None
+        for action_name in service_path:
+            candidates = action_def.subactions if action_def else SUPPORTED_SERVICE_ACTIONS
+            action_def = next((d for d in candidates or [] if d.action_name == action_name), None)
+            if not action_def:
+                raise ArkException(f'Unknown service [{" ".join(service_path)}]')
+        action = action.replace('_', '-')
+        if not action_def or not action_def.schemas or action not in action_def.schemas:
+            raise ArkException(f'Unknown action [{action}] for service [{" ".join(service_path)}]')
+        service = self.__deduce_service(api, '_'.join(service_path))
+        model_type = action_def.schemas[action]
+        if not model_type:
+            return getattr(service, action.replace('-', '_'))()
+        defaults = (action_def.defaults or {}).get(action) or {}
+        return getattr(service, action.replace('-', '_'))(model_type.model_validate({**defaults, **arguments}))
+
     @overrides
     def can_run_exec_action(self, command_name: str, args: argparse.Namespace) -> bool:
         """
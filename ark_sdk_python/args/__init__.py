@@ -1,4 +1,25 @@
-from ark_sdk_python.args.ark_args_formatter import ARK_INQUIRER_THEME, ArkArgsFormatter, ArkInquirerRender
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.args.ark_args_formatter import ArkArgsFormatter
+from ark_sdk_python.args.ark_output_writer import SUPPORTED_OUTPUT_FORMATS, ArkOutputWriter
 from ark_sdk_python.args.ark_pydantic_argparse import ArkPydanticArgparse
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.args.ark_inquirer_render import ARK_INQUIRER_THEME, ArkInquirerRender
+
+__all__ = [
+    'ArkArgsFormatter',
+    'ArkPydanticArgparse',
+    'ArkInquirerRender',
+    'ARK_INQUIRER_THEME',
+    'ArkOutputWriter',
+    'SUPPORTED_OUTPUT_FORMATS',
+]
 
-__all__ = ['ArkArgsFormatter', 'ArkPydanticArgparse', 'ArkInquirerRender', 'ARK_INQUIRER_THEME']
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.args.ark_inquirer_render': ['ARK_INQUIRER_THEME', 'ArkInquirerRender'],
+    },
+)
@@ -7,84 +7,15 @@ if sys.platform != 'win32':
     except ImportError:
         pass
 from enum import Enum
-from typing import Dict, Final, List, Optional
+from typing import Dict, List, Optional
 
-import inquirer
-import inquirer.render.console._password
-import inquirer.render.console._path
-import inquirer.render.console._text
 from colorama import init
-from inquirer.render import ConsoleRender
-from inquirer.themes import Theme, load_theme_from_dict
 
 from ark_sdk_python.common.ark_system_config import ArkSystemConfig
 from ark_sdk_python.models import ArkException
 
 init()
 
-ARK_INQUIRER_THEME: Final[Theme] = load_theme_from_dict(
-    {
-        'Question': {'mark_color': 'bold_green', 'brackets_color': 'bold_white', 'default_color': 'bold_white'},
-        'Editor': {'opening_prompt_color': 'bright_black'},
-        'Checkbox': {
-            'selection_color': 'bold_black_on_bright_green',
-            'selection_icon': '❯',
-            'selected_icon': '◉',
-            'selected_color': 'bold_green',
-            'unselected_color': 'normal',
-            'unselected_icon': '◯',
-        },
-        'List': {'selection_color': 'bold_black_on_bright_green', 'selection_cursor': '❯', 'unselected_color': 'normal'},
-    }
-)
-
-
-class ArkInquirerRender(ConsoleRender):
-    # pylint: disable=keyword-arg-before-vararg,protected-access
-    def __init__(self, event_generator=None, *args, **kwargs):
-        super().__init__(event_generator=event_generator, theme=ARK_INQUIRER_THEME, *args, **kwargs)
-
-    def render(self, question, answers=None):
-        question.answers = answers or {}
-
-        if question.ignore:
-            return question.default
-
-        clazz = self.render_factory(question.kind)
-        render = clazz(question, terminal=self.terminal, theme=self._theme, show_default=question.show_default)
-        if isinstance(
-            render, (inquirer.render.console._text.Text, inquirer.render.console._password.Password, inquirer.render.console._path.Path)
-        ):
-            render.current = ''
-        self.clear_eos()
-
-        try:
-            a = self._event_loop(render)
-            if not a and question.default:
-                a = question.default
-            elif not a and question.name in answers:
-                a = answers[question.name]
-            return a
-        finally:
-            print('')
-
-    def _print_header(self, render):
-        base = render.get_header()
-
-        header = base[: self.width - 9] + '...' if len(base) > self.width - 6 else base
-        default_value = '{normal} ({default})'.format(default=render.question.default, normal=self.terminal.normal)
-        show_default = render.question.default and render.show_default
-        header += default_value if show_default else ''
-        msg_template = '{t.move_up}{t.clear_eol}{tq.brackets_color}{tq.mark_color}?{tq.brackets_color} {msg}{t.normal}'
-
-        escaped_current_value = str(render.get_current_value()).replace('{', '{{').replace('}', '}}')
-        self.print_str(
-            f'\n{msg_template} {escaped_current_value}',
-            msg=header,
-            lf=not render.title_inline,
-            tq=self._theme.Question,
-        )
-
 
 class ArkArgsFormatter:
     @staticmethod
@@ -145,8 +76,11 @@ class ArkArgsFormatter:
         prioritize_existing_val: bool = False,
         empty_value_allowed: bool = False,
     ) -> Optional[str]:
+        import inquirer
         from colorama import Fore, Style
 
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         val: str = ''
         if hasattr(args, key):
             while val == '':
@@ -192,6 +126,10 @@ class ArkArgsFormatter:
     def get_bool_arg(
         args: argparse.Namespace, key: str, prompt: str, existing_val: bool = None, prioritize_existing_val: bool = False
     ) -> Optional[bool]:
+        import inquirer
+
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         val = getattr(args, key)
         if prioritize_existing_val and existing_val != None:
             val = existing_val
@@ -209,6 +147,10 @@ class ArkArgsFormatter:
         existing_val: str = None,
         prioritize_existing_val: bool = False,
     ) -> Optional[str]:
+        import inquirer
+
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         val = getattr(args, key)
         if prioritize_existing_val and existing_val != None:
             val = existing_val
@@ -228,6 +170,10 @@ class ArkArgsFormatter:
         existing_vals: Dict[str, str] = None,
         prioritize_existing_val: bool = False,
     ) -> Optional[List[str]]:
+        import inquirer
+
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         vals = []
         for key in keys:
             val = getattr(args, key)
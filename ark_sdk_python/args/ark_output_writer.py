@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Final, Iterable, List, Optional, TextIO
+
+from pydantic import BaseModel
+
+from ark_sdk_python.models import ArkException
+
+SUPPORTED_OUTPUT_FORMATS: Final[List[str]] = ['json', 'ndjson', 'csv']
+DEFAULT_OUTPUT_FORMAT: Final[str] = 'json'
+OUTPUT_EXCLUDED_FIELDS: Final[set] = {'poll_progress_callback'}
+
+
+class ArkOutputWriter:
+    def __init__(self, output_format: str, streams: List[TextIO]) -> None:
+        if output_format not in SUPPORTED_OUTPUT_FORMATS:
+            raise ArkException(f'Unsupported output format [{output_format}], supported formats are {SUPPORTED_OUTPUT_FORMATS}')
+        self.__output_format = output_format
+        self.__streams = streams
+        self.__items_count = 0
+        self.__csv_columns: Optional[List[str]] = None
+
+    @property
+    def items_count(self) -> int:
+        return self.__items_count
+
+    @staticmethod
+    def to_jsonable(item: Any) -> Any:
+        """
+        Converts a model to its JSON compatible python form, other items are returned as is.
+
+        Args:
+            item (Any): _description_
+
+        Returns:
+            Any: _description_
+        """
+        if isinstance(item, BaseModel):
+            return item.model_dump(mode='json', by_alias=False, exclude=OUTPUT_EXCLUDED_FIELDS)
+        return item
+
+    @staticmethod
+    def __flatten(value: Any, prefix: str = '') -> Dict[str, Any]:
+        if isinstance(value, dict):
+            flattened: Dict[str, Any] = {}
+            for key, inner_value in value.items():
+                flattened.update(ArkOutputWriter.__flatten(inner_value, f'{prefix}{key}.'))
+            return flattened
+        if isinstance(value, list):
+            value = json.dumps(value)
+        return {prefix[:-1] or 'value': value}
+
+    def __write_json(self, items: Iterable[Any], chunk: io.StringIO) -> None:
+        for item in items:
+            chunk.write('[\n' if self.__items_count == 0 else ',\n')
+            # Indented the same as a whole list dumped with an indent of 4
+            chunk.write('\n'.join(f'    {line}' for line in json.dumps(self.to_jsonable(item), indent=4).splitlines()))
+            self.__items_count += 1
+
+    def __write_ndjson(self, items: Iterable[Any], chunk: io.StringIO) -> None:
+        for item in items:
+            if isinstance(item, BaseModel):
+                chunk.write(item.model_dump_json(by_alias=False, exclude=OUTPUT_EXCLUDED_FIELDS))
+            else:
+                chunk.write(json.dumps(item, default=str))
+            chunk.write('\n')
+            self.__items_count += 1
+
+    def __write_csv(self, items: Iterable[Any], chunk: io.StringIO) -> None:
+        rows = [self.__flatten(self.to_jsonable(item)) for item in items]
+        if not rows:
+            return
+        if self.__csv_columns is None:
+            # The columns are taken from the first written chunk, as the output is streamed and cannot be rewritten
+            self.__csv_columns = list(dict.fromkeys(column for row in rows for column in row))
+            csv.writer(chunk, lineterminator='\n').writerow(self.__csv_columns)
+        csv.DictWriter(chunk, fieldnames=self.__csv_columns, extrasaction='ignore', lineterminator='\n').writerows(rows)
+        self.__items_count += len(rows)
+
+    def __flush(self, text: str) -> None:
+        if not text:
+            return
+        for stream in self.__streams:
+            stream.write(text)
+            stream.flush()
+
+    def write_items(self, items: Iterable[Any]) -> None:
+        """
+        Serializes the given items once each, and writes and flushes them to all the streams as a single chunk.
+        Callers write every page of a paged output as it arrives, so no more than a page is held in memory.
+
+        Args:
+            items (Iterable[Any]): _description_
+        """
+        chunk = io.StringIO()
+        if self.__output_format == 'json':
+            self.__write_json(items, chunk)
+        elif self.__output_format == 'ndjson':
+            self.__write_ndjson(items, chunk)
+        else:
+            self.__write_csv(items, chunk)
+        self.__flush(chunk.getvalue())
+
+    def close(self) -> None:
+        """
+        Finishes the output, closing the JSON list when needed.
+        The streams themselves are not closed.
+        """
+        if self.__output_format == 'json':
+            self.__flush('[]\n' if self.__items_count == 0 else '\n]\n')
@@ -3,15 +3,86 @@ import csv
 import json
 import re
 import sys
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
 from ark_sdk_python.args.ark_args_formatter import ArkArgsFormatter
 
+MAX_COMPILED_SCHEMAS: Final[int] = 256
+
+
+class ArkCompiledSchema:
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.schema = schema
+        self.definitions: Optional[Dict[str, Any]] = schema.get('$defs', None)
+        self.arg_types: Dict[str, Optional[str]] = {}
+        self.arguments: Dict[str, List[Tuple]] = {}
+        self.aliases: Dict[str, Dict[str, str]] = {}
+
 
 class ArkPydanticArgparse:
+    __COMPILED_SCHEMAS: Final[Dict[int, ArkCompiledSchema]] = OrderedDict()
+    __COMPILED_SCHEMAS_LOCK: Final[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __snake_case(name: str) -> str:
+        return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def model_json_schema(model: Type[BaseModel], by_alias: bool = True) -> Dict[str, Any]:
+        """
+        Returns the JSON schema of the model, which is generated only once per model.
+        The returned schema is shared between callers and must not be modified.
+
+        Args:
+            model (Type[BaseModel]): _description_
+            by_alias (bool, optional): _description_. Defaults to True.
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        return model.model_json_schema(by_alias=by_alias)
+
+    @staticmethod
+    def compile_schema(schema: Dict[str, Any]) -> ArkCompiledSchema:
+        """
+        Returns the compiled form of the schema, holding its argument types, argparse arguments and aliases
+        once they are first resolved, so converting the same schema again does not walk it again.
+        Schemas are compiled by identity, so callers should pass the same schema object, as returned by model_json_schema.
+        The least recently used compiled schemas are evicted above MAX_COMPILED_SCHEMAS.
+
+        Args:
+            schema (Dict[str, Any]): _description_
+
+        Returns:
+            ArkCompiledSchema: _description_
+        """
+        with ArkPydanticArgparse.__COMPILED_SCHEMAS_LOCK:
+            compiled_schemas = ArkPydanticArgparse.__COMPILED_SCHEMAS
+            compiled = compiled_schemas.get(id(schema), None)
+            if compiled:
+                compiled_schemas.move_to_end(id(schema))
+                return compiled
+            # The compiled schema references the schema, so its id cannot be reused while it is cached
+            compiled = ArkCompiledSchema(schema)
+            compiled_schemas[id(schema)] = compiled
+            while len(compiled_schemas) > MAX_COMPILED_SCHEMAS:
+                compiled_schemas.popitem(last=False)
+            return compiled
+
+    @staticmethod
+    def __compiled_arg_type(compiled: ArkCompiledSchema, arg_key: str) -> Optional[str]:
+        if arg_key not in compiled.arg_types:
+            compiled.arg_types[arg_key] = ArkPydanticArgparse.__arg_in_schema(arg_key, compiled.schema, compiled.definitions)
+        return compiled.arg_types[arg_key]
+
     @staticmethod
     def __populate_type(
         prop_type: str,
@@ -97,14 +168,14 @@ class ArkPydanticArgparse:
         definitions: Optional[Dict[str, Any]],
         required: Optional[List[str]],
         prop_name: str,
-        parser: argparse.ArgumentParser,
+        arguments: List[Tuple],
         prefix: str = '',
         ignore_keys: Optional[List[str]] = None,
         key_prefix: str = '',
     ) -> None:
         if not definitions:
             return
-        snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('_', '-')
+        snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('_', '-')
         def_prop_name = schema['properties'][prop_name]['$ref'].split('/')[2]
         def_prop = definitions[def_prop_name]
         if 'type' not in def_prop.keys():
@@ -119,8 +190,8 @@ class ArkPydanticArgparse:
         elif defaults and prefix + snake_prop_name in defaults:
             default = defaults[snake_prop_name]
         if prop_type == 'object':
-            ArkPydanticArgparse.schema_to_argparse(
-                def_prop, parser, defaults, f'{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
+            ArkPydanticArgparse.__schema_to_arguments(
+                def_prop, arguments, defaults, f'{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
             )
         else:
             is_required = False
@@ -129,9 +200,7 @@ class ArkPydanticArgparse:
             enum = None
             if 'enum' in def_prop:
                 enum = def_prop['enum']
-            ArkPydanticArgparse.__populate_type(
-                prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-            )
+            arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
 
     @staticmethod
     def __schema_allof_to_argparse(
@@ -140,12 +209,12 @@ class ArkPydanticArgparse:
         definitions: Optional[Dict[str, Any]],
         required: Optional[List[str]],
         prop_name: str,
-        parser: argparse.ArgumentParser,
+        arguments: List[Tuple],
         prefix: str = '',
         ignore_keys: Optional[List[str]] = None,
         key_prefix: str = '',
     ) -> None:
-        snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('_', '-')
+        snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('_', '-')
         desc = ''
         default: Optional[str] = None
         if 'default' in schema['properties'][prop_name].keys():
@@ -164,14 +233,12 @@ class ArkPydanticArgparse:
                         if required and prop_name in required:
                             is_required = True
                         enum = def_prop['enum']
-                        ArkPydanticArgparse.__populate_type(
-                            'string', snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                        )
+                        arguments.append(('string', snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
                     continue
                 prop_type = def_prop['type']
                 if prop_type == 'object':
-                    ArkPydanticArgparse.schema_to_argparse(
-                        def_prop, parser, defaults, f'{prefix}{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
+                    ArkPydanticArgparse.__schema_to_arguments(
+                        def_prop, arguments, defaults, f'{prefix}{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
                     )
                 else:
                     is_required = False
@@ -180,9 +247,7 @@ class ArkPydanticArgparse:
                     enum = None
                     if 'enum' in def_prop:
                         enum = def_prop['enum']
-                    ArkPydanticArgparse.__populate_type(
-                        prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                    )
+                    arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
             else:
                 if 'type' not in item.keys():
                     continue
@@ -194,8 +259,8 @@ class ArkPydanticArgparse:
                 if 'description' in item.keys():
                     desc = item['description']
                 if prop_type == 'object':
-                    ArkPydanticArgparse.schema_to_argparse(
-                        item, parser, defaults, f'{prefix}{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
+                    ArkPydanticArgparse.__schema_to_arguments(
+                        item, arguments, defaults, f'{prefix}{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
                     )
                 else:
                     is_required = False
@@ -204,21 +269,19 @@ class ArkPydanticArgparse:
                     enum = None
                     if 'enum' in item:
                         enum = item['enum']
-                    ArkPydanticArgparse.__populate_type(
-                        prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                    )
+                    arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
 
     @staticmethod
     def __arg_in_schema(arg_key: str, schema: Dict[str, Any], definitions: Optional[Dict[str, Any]], prefix: str = '') -> Optional[str]:
         if 'properties' not in schema:
             prop_name = schema['title']
-            snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('-', '_')
+            snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('-', '_')
             if prefix + snake_prop_name == arg_key:
                 return schema['type']
             else:
                 return None
         for prop_name in schema['properties'].keys():
-            snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('-', '_')
+            snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('-', '_')
             if '$ref' in schema['properties'][prop_name].keys():
                 def_prop_name = schema['properties'][prop_name]['$ref'].split('/')[2]
                 def_prop = definitions[def_prop_name]
@@ -374,6 +437,7 @@ class ArkPydanticArgparse:
         Converts the given schema to argparse parameters.
         Recursively iterates over the JSON schema and adds parameters to the parser.
         The argparse parameters can then be parsed from the CLI and then converted back using argparse_to_schema function.
+        The parameters of a schema are resolved once per defaults, prefix and ignored keys, and reused by later calls.
         This function does not return anything, but updates the parser itself.
 
         Args:
@@ -386,6 +450,33 @@ class ArkPydanticArgparse:
             ignore_keys (Optional[List[str]], optional): _description_. Defaults to None.
             key_prefix (str, optional): _description_. Defaults to ''.
         """
+        arguments: List[Tuple] = []
+        if definitions or required:
+            ArkPydanticArgparse.__schema_to_arguments(schema, arguments, defaults, prefix, definitions, required, ignore_keys, key_prefix)
+        else:
+            compiled = ArkPydanticArgparse.compile_schema(schema)
+            arguments_key = json.dumps([defaults, prefix, ignore_keys, key_prefix], sort_keys=True, default=str)
+            if arguments_key not in compiled.arguments:
+                ArkPydanticArgparse.__schema_to_arguments(schema, arguments, defaults, prefix, None, None, ignore_keys, key_prefix)
+                compiled.arguments[arguments_key] = arguments
+            arguments = compiled.arguments[arguments_key]
+        # Arguments are added to the parser on every call, as their short names and requirement depend on the parser and command line
+        for prop_type, snake_prop_name, default, is_required, arg_prefix, desc, arg_ignore_keys, enum, arg_key_prefix in arguments:
+            ArkPydanticArgparse.__populate_type(
+                prop_type, snake_prop_name, default, is_required, parser, arg_prefix, desc, arg_ignore_keys, enum, arg_key_prefix
+            )
+
+    @staticmethod
+    def __schema_to_arguments(
+        schema: Dict[str, Any],
+        arguments: List[Tuple],
+        defaults: Optional[Dict[str, str]] = None,
+        prefix: str = '',
+        definitions: Optional[Dict[str, Any]] = None,
+        required: Optional[List[str]] = None,
+        ignore_keys: Optional[List[str]] = None,
+        key_prefix: str = '',
+    ) -> None:
         if not definitions and '$defs' in schema.keys():
             definitions = schema['$defs']
         elif not definitions:
@@ -396,7 +487,7 @@ class ArkPydanticArgparse:
             required = []
         if 'properties' not in schema.keys():
             prop_name = schema['title']
-            snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('_', '-')
+            snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('_', '-')
             is_required = False
             if prop_name in required:
                 is_required = True
@@ -409,22 +500,20 @@ class ArkPydanticArgparse:
             enum = None
             if 'enum' in schema:
                 enum = schema['enum']
-            ArkPydanticArgparse.__populate_type(
-                schema['type'], snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-            )
+            arguments.append((schema['type'], snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
             return
         for prop_name in schema['properties'].keys():
-            snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('_', '-')
+            snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('_', '-')
             if ignore_keys and snake_prop_name in ignore_keys:
                 continue
             if '$ref' in schema['properties'][prop_name].keys():
                 ArkPydanticArgparse.__schema_definition_to_argparse(
-                    schema, defaults, definitions, required, prop_name, parser, prefix, ignore_keys, key_prefix
+                    schema, defaults, definitions, required, prop_name, arguments, prefix, ignore_keys, key_prefix
                 )
                 continue
             elif 'allOf' in schema['properties'][prop_name].keys():
                 ArkPydanticArgparse.__schema_allof_to_argparse(
-                    schema, defaults, definitions, required, prop_name, parser, prefix, ignore_keys, key_prefix
+                    schema, defaults, definitions, required, prop_name, arguments, prefix, ignore_keys, key_prefix
                 )
                 continue
             elif (
@@ -432,7 +521,7 @@ class ArkPydanticArgparse:
                 and isinstance(schema['properties'][prop_name]['anyOf'], list)
                 and all('type' in t or '$ref' in t for t in schema['properties'][prop_name]['anyOf'])
             ):
-                snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('_', '-')
+                snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('_', '-')
                 if any('$ref' in t for t in schema['properties'][prop_name]['anyOf']):
                     item = [t for t in schema['properties'][prop_name]['anyOf'] if '$ref' in t][0]
                     def_prop_name = item['$ref'].split('/')[2]
@@ -443,14 +532,12 @@ class ArkPydanticArgparse:
                             if required and prop_name in required:
                                 is_required = True
                             enum = def_prop['enum']
-                            ArkPydanticArgparse.__populate_type(
-                                'string', snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                            )
+                            arguments.append(('string', snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
                         continue
                     prop_type = def_prop['type']
                     if prop_type == 'object':
-                        ArkPydanticArgparse.schema_to_argparse(
-                            def_prop, parser, defaults, f'{prefix}{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
+                        ArkPydanticArgparse.__schema_to_arguments(
+                            def_prop, arguments, defaults, f'{prefix}{snake_prop_name}.', definitions, required, ignore_keys, key_prefix
                         )
                     else:
                         is_required = False
@@ -465,9 +552,7 @@ class ArkPydanticArgparse:
                         enum = None
                         if 'enum' in def_prop:
                             enum = def_prop['enum']
-                        ArkPydanticArgparse.__populate_type(
-                            prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                        )
+                        arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
                 else:
                     is_required = False
                     if prop_name in required:
@@ -486,9 +571,7 @@ class ArkPydanticArgparse:
                         t['type'] != 'string' for t in schema['properties'][prop_name]['anyOf']
                     ):
                         prop_type = [t['type'] for t in schema['properties'][prop_name]['anyOf'] if t['type'] != 'null'][0]
-                    ArkPydanticArgparse.__populate_type(
-                        prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                    )
+                    arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
                     continue
             desc = ''
             if 'description' in schema['properties'][prop_name].keys():
@@ -504,9 +587,7 @@ class ArkPydanticArgparse:
                     if required and prop_name in required:
                         is_required = True
                     enum = schema['properties'][prop_name]['enum']
-                    ArkPydanticArgparse.__populate_type(
-                        'string', snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                    )
+                    arguments.append(('string', snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
                 continue
             prop_type = schema['properties'][prop_name]['type']
             if prop_type == 'object':
@@ -527,14 +608,12 @@ class ArkPydanticArgparse:
                     enum = None
                     if 'enum' in schema['properties'][prop_name]:
                         enum = schema['properties'][prop_name]['enum']
-                    ArkPydanticArgparse.__populate_type(
-                        prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                    )
+                    arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
                 else:
                     local_schema = schema['properties'][prop_name]
                     if 'properties' not in local_schema.keys():
                         prop_name = local_schema['title']
-                        snake_prop_name = re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('_', '-')
+                        snake_prop_name = ArkPydanticArgparse.__snake_case(prop_name).replace('_', '-')
                         is_required = False
                         if prop_name in required:
                             is_required = True
@@ -547,13 +626,13 @@ class ArkPydanticArgparse:
                         enum = None
                         if 'enum' in local_schema:
                             enum = local_schema['enum']
-                        ArkPydanticArgparse.__populate_type(
-                            local_schema['type'], snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
+                        arguments.append(
+                            (local_schema['type'], snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix)
                         )
                         continue
-                    ArkPydanticArgparse.schema_to_argparse(
+                    ArkPydanticArgparse.__schema_to_arguments(
                         schema['properties'][prop_name],
-                        parser,
+                        arguments,
                         defaults,
                         f'{prefix}{snake_prop_name}.',
                         definitions,
@@ -568,9 +647,7 @@ class ArkPydanticArgparse:
                 enum = None
                 if 'enum' in schema['properties'][prop_name]:
                     enum = schema['properties'][prop_name]['enum']
-                ArkPydanticArgparse.__populate_type(
-                    prop_type, snake_prop_name, default, is_required, parser, prefix, desc, ignore_keys, enum, key_prefix
-                )
+                arguments.append((prop_type, snake_prop_name, default, is_required, prefix, desc, ignore_keys, enum, key_prefix))
 
     @staticmethod
     def schema_to_aliases(
@@ -584,6 +661,7 @@ class ArkPydanticArgparse:
         """
         Converts a schema to only a dictionary containing its aliases (title).
         Returns a string to string dictionary with the aliases.
+        The aliases of a schema are resolved once per arguments, and reused by later calls.
 
         Args:
             schema (Dict[str, Any]): _description_
@@ -596,6 +674,25 @@ class ArkPydanticArgparse:
         Returns:
             Dict[str, str]: _description_
         """
+        if definitions:
+            return ArkPydanticArgparse.__schema_to_aliases(schema, override_aliases, ignore_keys, prefix, definitions, key_prefix)
+        compiled = ArkPydanticArgparse.compile_schema(schema)
+        aliases_key = json.dumps([override_aliases, ignore_keys, prefix, key_prefix], sort_keys=True, default=str)
+        if aliases_key not in compiled.aliases:
+            compiled.aliases[aliases_key] = ArkPydanticArgparse.__schema_to_aliases(
+                schema, override_aliases, ignore_keys, prefix, None, key_prefix
+            )
+        return dict(compiled.aliases[aliases_key])
+
+    @staticmethod
+    def __schema_to_aliases(
+        schema: Dict[str, Any],
+        override_aliases: Optional[Dict[str, str]] = None,
+        ignore_keys: Optional[List[str]] = None,
+        prefix: str = '',
+        definitions: Optional[Dict[str, Any]] = None,
+        key_prefix: str = '',
+    ) -> Dict[str, str]:
         if key_prefix:
             key_prefix = key_prefix + '_'
         if 'properties' not in schema:
@@ -608,7 +705,7 @@ class ArkPydanticArgparse:
             override_aliases = {}
         aliases_map: Dict[str, Any] = {}
         for prop_name in schema['properties']:
-            snake_prop_name = prefix + re.sub(r'(?<!^)(?=[A-Z])', '_', prop_name).lower().replace('-', '_')
+            snake_prop_name = prefix + ArkPydanticArgparse.__snake_case(prop_name).replace('-', '_')
             if 'title' not in schema['properties'][prop_name] and snake_prop_name not in override_aliases:
                 continue
             if ignore_keys and snake_prop_name in ignore_keys:
@@ -620,7 +717,7 @@ class ArkPydanticArgparse:
             if 'type' in schema['properties'][prop_name]:
                 if schema['properties'][prop_name]['type'] == 'object':
                     aliases_map.update(
-                        ArkPydanticArgparse.schema_to_aliases(
+                        ArkPydanticArgparse.__schema_to_aliases(
                             schema['properties'][prop_name], ignore_keys, f'{prefix}{snake_prop_name}.', key_prefix
                         )
                     )
@@ -652,7 +749,6 @@ class ArkPydanticArgparse:
         """
         file_args_map: Dict = {}
         args_map: Dict = {}
-        definitions: Optional[Dict] = None
         if 'request_file' in args.__dict__.keys() and args.__dict__['request_file']:
             request_file = args.__dict__['request_file']
             with open(request_file, 'r', encoding='utf-8') as f:
@@ -662,14 +758,13 @@ class ArkPydanticArgparse:
                     file_args_map[''.join([first.lower(), *map(str.title, others)])] = value
                     # Also add the snake case for models which are not camel based
                     file_args_map[key] = value
-        if '$defs' in schema.keys():
-            definitions = schema['$defs']
+        compiled = ArkPydanticArgparse.compile_schema(schema)
         for arg_key, arg_val in args.__dict__.items():
             if ignored_keys and arg_key in ignored_keys:
                 continue
             if key_prefix:
                 arg_key = arg_key.replace(f'{key_prefix}_', '')
-            arg_type = ArkPydanticArgparse.__arg_in_schema(arg_key, schema, definitions)
+            arg_type = ArkPydanticArgparse.__compiled_arg_type(compiled, arg_key)
             if not arg_type:
                 continue
             ArkPydanticArgparse.__arg_to_schema(arg_key, arg_val, args_map, arg_type, keep_empty_values, key_prefix)
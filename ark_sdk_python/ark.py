@@ -8,21 +8,62 @@ import sys
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 import argparse
-from typing import List
+from typing import TYPE_CHECKING, List, Tuple
 
-import argcomplete
-import urllib3
-
-from ark_sdk_python.actions import ArkAction, ArkCacheAction, ArkConfigureAction, ArkLoginAction, ArkProfilesAction, ArkServiceExecAction
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+if TYPE_CHECKING:
+    from ark_sdk_python.actions import ArkAction
 
 __version__ = '1.0.0'
+VIA_SERVER_ARG = '--via-server'
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == VIA_SERVER_ARG:
+        # The thin client only forwards the command line to `ark serve`, so it returns before the sdk is imported
+        from ark_sdk_python.common.ark_server_client import ArkServerClient
+
+        sys.exit(ArkServerClient().run_command(sys.argv[2:]))
+
+    from ark_sdk_python.common.ark_profiler import ARK_PROFILE_RUN_ENV_VAR, PHASE_PARSER_BUILD, ArkProfiler
+
+    # Profiling starts before the sdk is imported and the parsers are built, so both are part of the report
+    profile_path = os.environ.get(ARK_PROFILE_RUN_ENV_VAR)
+    if profile_path or any(arg in ('-pr', '--profile-run') or arg.startswith('--profile-run=') for arg in sys.argv[1:]):
+        ArkProfiler.start()
+    try:
+        with ArkProfiler.phase(PHASE_PARSER_BUILD):
+            actions, args = build_actions()
+        for action in actions:
+            if action.can_run_action(args.action, args):
+                action.run_action(args)
+    finally:
+        # The exec action writes the report of --profile-run itself, which leaves the report of ARK_PROFILE_RUN to write here
+        if profile_path and ArkProfiler.is_running():
+            ArkProfiler.stop(profile_path)
+
+
+def build_actions() -> Tuple[List['ArkAction'], argparse.Namespace]:
+    import argcomplete
+    import urllib3
+
+    from ark_sdk_python.actions import (
+        ArkAction,
+        ArkAgentAction,
+        ArkCacheAction,
+        ArkConfigureAction,
+        ArkLoginAction,
+        ArkProfilesAction,
+        ArkServeAction,
+        ArkServiceExecAction,
+    )
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
     parser: argparse.ArgumentParser = argparse.ArgumentParser()
     parser.add_argument('-v', '--version', action='version', version=__version__)
+    parser.add_argument(
+        VIA_SERVER_ARG, action='store_true', help='Run the command through the warm `ark serve` server, must be the first argument'
+    )
     subparsers = parser.add_subparsers(dest="action")
     subparsers.required = True
 
@@ -32,15 +73,15 @@ def main():
         ArkServiceExecAction(),
         ArkProfilesAction(),
         ArkCacheAction(),
+        ArkAgentAction(),
+        ArkServeAction(),
     ]
 
     for action in actions:
         action.define_action(subparsers)
     argcomplete.autocomplete(parser)
     args: argparse.Namespace = parser.parse_args()
-    for action in actions:
-        if action.can_run_action(args.action, args):
-            action.run_action(args)
+    return actions, args
 
 
 if __name__ == "__main__":
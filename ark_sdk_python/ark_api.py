@@ -1,20 +1,42 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type, cast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Type, Union, cast
 
 from ark_sdk_python.auth.ark_auth import ArkAuth
+from ark_sdk_python.common.ark_instrumentation import ArkInstrumentation
 from ark_sdk_python.models.ark_exceptions import ArkServiceException
 from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
 from ark_sdk_python.services.ark_service import ArkService
 
 
 class ArkAPI:
-    def __init__(self, authenticators: List[ArkAuth], profile: Optional[ArkProfile] = None) -> None:
+    def __init__(
+        self,
+        authenticators: List[ArkAuth],
+        profile: Optional[ArkProfile] = None,
+        instrumentations: Optional[List[ArkInstrumentation]] = None,
+    ) -> None:
         self.__authenticators = authenticators
+        self.__instrumentations = list(instrumentations or [])
         self.__lazy_loaded_services: Dict[str, ArkService] = {}
+        self.__lazy_load_locks: Dict[str, threading.Lock] = {}
+        self.__lazy_load_locks_lock = threading.Lock()
         self.__profile = profile or ArkProfileLoader.load_default_profile()
 
     def __lazy_load_service(self, service_type: Type[ArkService]) -> ArkService:
+        service_name = service_type.service_config().service_name
+        # Each service is built under its own lock, so concurrent callers share a single instance
+        # while different services can still be built in parallel
+        with self.__lazy_load_locks_lock:
+            service_lock = self.__lazy_load_locks.setdefault(service_name, threading.Lock())
+        with service_lock:
+            if service_name in self.__lazy_loaded_services:
+                return self.__lazy_loaded_services[service_name]
+            return self.__build_service(service_type)
+
+    def __build_service(self, service_type: Type[ArkService]) -> ArkService:
         service_name = service_type.service_config().service_name
         required_auth_names = service_type.service_config().required_authenticator_names
         required_autheneticators = [auth for auth in self.__authenticators if auth.authenticator_name() in required_auth_names]
@@ -25,7 +47,12 @@ class ArkAPI:
         ]
         if len(required_autheneticators) == len(required_auth_names):
             authenticators = {f'{a.authenticator_name()}_auth': a for a in required_autheneticators + optional_authenticators}
-            self.__lazy_loaded_services[service_name] = service_type(**authenticators)
+            service = service_type(**authenticators)
+            # The instrumentations of the api get the requests of its services, on top of the globally registered ones
+            for client in service.clients:
+                for instrumentation in self.__instrumentations:
+                    client.add_instrumentation(instrumentation)
+            self.__lazy_loaded_services[service_name] = service
         else:
             raise ArkServiceException(
                 f'{service_name.title()} is not supported or missing fitting authenticators, please make sure you are logged in'
@@ -70,6 +97,72 @@ class ArkAPI:
             return self.__lazy_loaded_services[service_name]
         return self.__lazy_load_service(service_type)
 
+    def prewarm(
+        self, services: List[Union[str, Type[ArkService]]], warm_connections: bool = True, max_workers: Optional[int] = None
+    ) -> List[ArkService]:
+        """
+        Builds the given services in parallel ahead of time, and optionally opens their connections,
+        so that the first actual request finds a ready service with a warm connection.
+        Services can be given either by type or by their API property name, for example `pcloud_accounts`.
+
+        Args:
+            services (List[Union[str, Type[ArkService]]]): _description_
+            warm_connections (bool, optional): _description_. Defaults to True.
+            max_workers (Optional[int], optional): _description_. Defaults to None.
+
+        Raises:
+            ArkServiceException: _description_
+
+        Returns:
+            List[ArkService]: _description_
+        """
+
+        def prewarm_service(service: Union[str, Type[ArkService]]) -> ArkService:
+            if isinstance(service, str):
+                if service.startswith('_') or not isinstance(getattr(type(self), service, None), property):
+                    raise ArkServiceException(f'Service {service} is not supported')
+                loaded_service = getattr(self, service)
+            else:
+                loaded_service = self.service(service)
+            if warm_connections:
+                for client in loaded_service.clients:
+                    client.warm_up()
+            return loaded_service
+
+        if not services:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or len(services)) as executor:
+            return list(executor.map(prewarm_service, services))
+
+    def close(self) -> None:
+        """
+        Closes the sessions and pooled connections of all the loaded services.
+        Services remain usable afterwards and reconnect on their next request.
+        """
+        for service in list(self.__lazy_loaded_services.values()):
+            for client in service.clients:
+                client.close()
+
+    @property
+    def instrumentations(self) -> List[ArkInstrumentation]:
+        """
+        Returns the instrumentations of the api, which are added to the clients of its services.
+
+        Returns:
+            List[ArkInstrumentation]: _description_
+        """
+        return list(self.__instrumentations)
+
+    @property
+    def authenticators(self) -> List[ArkAuth]:
+        """
+        Gets the API authenticators
+
+        Returns:
+            List[ArkAuth]: _description_
+        """
+        return self.__authenticators
+
     @property
     def profile(self) -> ArkProfile:
         """
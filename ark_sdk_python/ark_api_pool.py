@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Final, List, Optional, Tuple, Union
+
+from ark_sdk_python.ark_api import ArkAPI
+from ark_sdk_python.auth.ark_auth import ArkAuth
+from ark_sdk_python.common import get_logger
+from ark_sdk_python.models.ark_exceptions import ArkAuthException, ArkException
+from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
+
+DEFAULT_API_POOL_MAX_SIZE: Final[int] = 64
+
+
+class ArkAPIPool:
+    def __init__(
+        self,
+        max_size: int = DEFAULT_API_POOL_MAX_SIZE,
+        idle_timeout_seconds: Optional[float] = None,
+        refresh_auth: bool = False,
+    ) -> None:
+        if max_size < 1:
+            raise ArkException('API pool max size must be at least 1')
+        self.__max_size = max_size
+        self.__idle_timeout_seconds = idle_timeout_seconds
+        self.__refresh_auth = refresh_auth
+        self.__apis: OrderedDict[str, Tuple[ArkAPI, float]] = OrderedDict()
+        self.__apis_lock = threading.Lock()
+        self.__building_locks: Dict[str, threading.Lock] = {}
+        self.__logger = get_logger(self.__class__.__name__)
+
+    def __load_profile_api(self, profile: ArkProfile) -> ArkAPI:
+        from ark_sdk_python.auth import SUPPORTED_AUTHENTICATORS
+
+        authenticators: List[ArkAuth] = []
+        for authenticator_name in profile.auth_profiles.keys():
+            if authenticator_name not in SUPPORTED_AUTHENTICATORS:
+                continue
+            authenticator = SUPPORTED_AUTHENTICATORS[authenticator_name]()
+            if authenticator.load_authentication(profile, self.__refresh_auth):
+                authenticators.append(authenticator)
+        if not authenticators:
+            raise ArkAuthException(f'Failed to load authenticators for profile [{profile.profile_name}], please login first')
+        return ArkAPI(authenticators, profile)
+
+    def __pop_evictable(self) -> List[Tuple[str, ArkAPI]]:
+        evicted: List[Tuple[str, ArkAPI]] = []
+        if self.__idle_timeout_seconds is not None:
+            now = time.monotonic()
+            for key, (api, last_used) in list(self.__apis.items()):
+                if now - last_used > self.__idle_timeout_seconds:
+                    del self.__apis[key]
+                    evicted.append((key, api))
+        while len(self.__apis) > self.__max_size:
+            key, (api, _) = self.__apis.popitem(last=False)
+            evicted.append((key, api))
+        return evicted
+
+    def __close_evicted(self, evicted: List[Tuple[str, ArkAPI]]) -> None:
+        for key, api in evicted:
+            self.__logger.info('Evicting api [%s] from pool', key)
+            api.close()
+
+    def api(self, key: str, factory: Callable[[], ArkAPI]) -> ArkAPI:
+        """
+        Returns the pooled API of the given key, creating it with the factory when it is not pooled.
+        The least recently used APIs above the pool size, and APIs idle for longer than the idle timeout, are evicted and closed.
+
+        Args:
+            key (str): Pool key, for example the profile name or tenant
+            factory (Callable[[], ArkAPI]): Creates the API when it is not pooled
+
+        Returns:
+            ArkAPI: _description_
+        """
+        with self.__apis_lock:
+            if key in self.__apis:
+                api, _ = self.__apis[key]
+                self.__apis[key] = (api, time.monotonic())
+                self.__apis.move_to_end(key)
+                evicted = self.__pop_evictable()
+                build_lock = None
+            else:
+                api = None
+                evicted = []
+                build_lock = self.__building_locks.setdefault(key, threading.Lock())
+        self.__close_evicted(evicted)
+        if api:
+            return api
+        # Build outside the pool lock, so building one tenant does not block the others
+        with build_lock:
+            with self.__apis_lock:
+                if key in self.__apis:
+                    api, _ = self.__apis[key]
+                    self.__apis[key] = (api, time.monotonic())
+                    self.__apis.move_to_end(key)
+                    return api
+            try:
+                api = factory()
+            except Exception:
+                with self.__apis_lock:
+                    self.__building_locks.pop(key, None)
+                raise
+            with self.__apis_lock:
+                self.__apis[key] = (api, time.monotonic())
+                self.__building_locks.pop(key, None)
+                evicted = self.__pop_evictable()
+        self.__close_evicted(evicted)
+        return api
+
+    def api_for_authenticators(self, key: str, authenticators: List[ArkAuth], profile: Optional[ArkProfile] = None) -> ArkAPI:
+        """
+        Returns the pooled API of the given key, creating it with the given authenticators when it is not pooled.
+
+        Args:
+            key (str): _description_
+            authenticators (List[ArkAuth]): _description_
+            profile (Optional[ArkProfile], optional): _description_. Defaults to None.
+
+        Returns:
+            ArkAPI: _description_
+        """
+        return self.api(key, lambda: ArkAPI(authenticators, profile))
+
+    def api_for_profile(self, profile: Union[str, ArkProfile]) -> ArkAPI:
+        """
+        Returns the pooled API of the given profile, keyed by the profile name.
+        When not pooled, the profile authenticators are loaded from the cache, the same way the CLI does.
+
+        Args:
+            profile (Union[str, ArkProfile]): Profile or profile name
+
+        Raises:
+            ArkException: _description_
+
+        Returns:
+            ArkAPI: _description_
+        """
+        if isinstance(profile, str):
+            loaded_profile = ArkProfileLoader.load_profile(profile)
+            if not loaded_profile:
+                raise ArkException(f'Profile [{profile}] was not found')
+            profile = loaded_profile
+        return self.api(profile.profile_name, lambda: self.__load_profile_api(profile))
+
+    def evict(self, key: str) -> None:
+        """
+        Evicts and closes the API of the given key.
+
+        Args:
+            key (str): _description_
+        """
+        with self.__apis_lock:
+            entry = self.__apis.pop(key, None)
+        if entry:
+            self.__close_evicted([(key, entry[0])])
+
+    def evict_idle(self) -> None:
+        """
+        Evicts and closes the APIs which were idle for longer than the idle timeout.
+        """
+        with self.__apis_lock:
+            evicted = self.__pop_evictable()
+        self.__close_evicted(evicted)
+
+    def close(self) -> None:
+        """
+        Evicts and closes all the pooled APIs.
+        """
+        with self.__apis_lock:
+            evicted = [(key, api) for key, (api, _) in self.__apis.items()]
+            self.__apis.clear()
+        self.__close_evicted(evicted)
+
+    def keys(self) -> List[str]:
+        """
+        Returns the pooled keys, from the least to the most recently used.
+
+        Returns:
+            List[str]: _description_
+        """
+        with self.__apis_lock:
+            return list(self.__apis.keys())
+
+    def __len__(self) -> int:
+        with self.__apis_lock:
+            return len(self.__apis)
+
+    def __contains__(self, key: str) -> bool:
+        with self.__apis_lock:
+            return key in self.__apis
+
+    def __enter__(self) -> 'ArkAPIPool':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -1,12 +1,25 @@
-import itertools
-from typing import Dict, Final, List, Set, Type
+from typing import TYPE_CHECKING
 
-from ark_sdk_python.auth.ark_auth import ArkAuth
-from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
-from ark_sdk_python.models.auth.ark_auth_method import ArkAuthMethod
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
 
-SUPPORTED_AUTHENTICATORS_LIST: Final[List[Type[ArkAuth]]] = [ArkISPAuth]
-SUPPORTED_AUTHENTICATORS: Final[Dict[(str, Type[ArkAuth])]] = {auth.authenticator_name(): auth for auth in SUPPORTED_AUTHENTICATORS_LIST}
-SUPPORTED_AUTH_METHODS: Final[Set[ArkAuthMethod]] = set(
-    itertools.chain.from_iterable([auth.supported_auth_methods() for auth in SUPPORTED_AUTHENTICATORS_LIST])
+if TYPE_CHECKING:
+    from ark_sdk_python.auth.ark_auth import ArkAuth
+    from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
+    from ark_sdk_python.auth.ark_supported_authenticators import (
+        SUPPORTED_AUTH_METHODS,
+        SUPPORTED_AUTHENTICATORS,
+        SUPPORTED_AUTHENTICATORS_LIST,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.auth.ark_auth': ['ArkAuth'],
+        'ark_sdk_python.auth.ark_isp_auth': ['ArkISPAuth'],
+        'ark_sdk_python.auth.ark_supported_authenticators': [
+            'SUPPORTED_AUTHENTICATORS_LIST',
+            'SUPPORTED_AUTHENTICATORS',
+            'SUPPORTED_AUTH_METHODS',
+        ],
+    },
 )
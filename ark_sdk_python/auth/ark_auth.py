@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, cast
 from urllib.parse import urlparse
 
+from ark_sdk_python.auth.ark_auth_agent import ArkAuthAgentClient
 from ark_sdk_python.common import ArkKeyring, get_logger
 from ark_sdk_python.common.ark_keyring import DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS
 from ark_sdk_python.models import ArkAuthException, ArkProfile, ArkProfileLoader
@@ -45,6 +46,35 @@ class ArkAuth(ABC):
                 postfix = f'{postfix}_{urlparse(direct_method_settings.endpoint).netloc}'
         return postfix
 
+    def _agent_client(self) -> Optional[ArkAuthAgentClient]:
+        """
+        Returns the auth agent client when an agent is configured and caching is allowed
+
+        Returns:
+            Optional[ArkAuthAgentClient]: _description_
+        """
+        if not self._cache_authentication:
+            return None
+        return ArkAuthAgentClient.from_env()
+
+    def _save_token(self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken) -> None:
+        """
+        Saves the token to the keyring and hands it over to the auth agent, when those are available
+
+        Args:
+            profile (ArkProfile): _description_
+            auth_profile (ArkAuthProfile): _description_
+            token (ArkToken): _description_
+        """
+        if not self._cache_authentication:
+            return
+        postfix = self._resolve_cache_postfix(auth_profile)
+        if self._cache_keyring:
+            self._cache_keyring.save_token(profile, token, postfix)
+        agent_client = self._agent_client()
+        if agent_client:
+            agent_client.save_token(self.authenticator_name(), profile, token, postfix)
+
     @abstractmethod
     def _perform_authentication(
         self, profile: ArkProfile, auth_profile: ArkAuthProfile, secret: Optional[ArkSecret] = None, force: bool = False
@@ -137,20 +167,17 @@ class ArkAuth(ABC):
                     ark_token = None
         if not ark_token:
             ark_token = self._perform_authentication(profile, auth_profile, secret, force)
-            if self._cache_authentication and self._cache_keyring:
-                self._cache_keyring.save_token(profile, ark_token, self._resolve_cache_postfix(auth_profile))
+            self._save_token(profile, auth_profile, ark_token)
         elif refresh_auth and not token_refreshed:
             try:
                 ark_token = self._perform_refresh_authentication(profile, auth_profile, ark_token)
-                if self._cache_authentication and self._cache_keyring:
-                    self._cache_keyring.save_token(profile, ark_token, self._resolve_cache_postfix(auth_profile))
+                self._save_token(profile, auth_profile, ark_token)
             except Exception as ex:  # Fallback to normal authentication
                 self._logger.info(
-                    f'Refresh auth for [{self.authenticator_human_readable_name()}] failed, falling back to normal authentication [{str(ex)}]'
+                    'Refresh auth for [%s] failed, falling back to normal authentication [%s]', self.authenticator_human_readable_name(), ex
                 )
                 ark_token = self._perform_authentication(profile, auth_profile, secret, force)
-                if self._cache_authentication and self._cache_keyring:
-                    self._cache_keyring.save_token(profile, ark_token, self._resolve_cache_postfix(auth_profile))
+                self._save_token(profile, auth_profile, ark_token)
         self.__token = ark_token
         self._active_profile = profile
         self._active_auth_profile = auth_profile
@@ -167,7 +194,7 @@ class ArkAuth(ABC):
         Returns:
             bool: _description_
         """
-        self._logger.info(f'Checking if [{self.authenticator_name()}] is authenticated')
+        self._logger.info('Checking if [%s] is authenticated', self.authenticator_name())
         if self.__token:
             self._logger.info('Token is already loaded')
             return True
@@ -195,7 +222,7 @@ class ArkAuth(ABC):
         Returns:
             Optional[ArkToken]: _description_
         """
-        self._logger.info(f'Trying to load [{self.authenticator_name()}] authentication')
+        self._logger.info('Trying to load [%s] authentication', self.authenticator_name())
         if not profile:
             if self._active_profile:
                 profile = self._active_profile
@@ -206,10 +233,21 @@ class ArkAuth(ABC):
             auth_profile = profile.auth_profiles[self.authenticator_name()]
         if auth_profile:
             self._logger.info(
-                f'Loading authentication for profile [{profile.profile_name}] and auth profile [{self.authenticator_name()}] of type [{auth_profile.auth_method.value}]'
+                'Loading authentication for profile [%s] and auth profile [%s] of type [%s]',
+                profile.profile_name,
+                self.authenticator_name(),
+                auth_profile.auth_method.value,
             )
-            if self._cache_keyring:
-                self.__token = self._cache_keyring.load_token(profile, self._resolve_cache_postfix(auth_profile))
+            # Consult the auth agent first, it holds already decrypted tokens in memory
+            postfix = self._resolve_cache_postfix(auth_profile)
+            agent_client = self._agent_client()
+            agent_synced = False
+            self.__token = None
+            if agent_client:
+                self.__token = agent_client.load_token(self.authenticator_name(), profile, postfix)
+                agent_synced = self.__token is not None
+            if not self.__token and self._cache_keyring:
+                self.__token = self._cache_keyring.load_token(profile, postfix)
             if refresh_auth:
                 grace_seconds = grace_seconds if grace_seconds is not None else DEFAULT_EXPIRATION_GRACE_DELTA_SECONDS
                 if self.__token and self.__token.expires_in.replace(tzinfo=None) - timedelta(seconds=grace_seconds) > datetime.now():
@@ -219,10 +257,13 @@ class ArkAuth(ABC):
                     self.__token = self._perform_refresh_authentication(profile, auth_profile, self.__token)
                     if self.__token and self.__token.expires_in.replace(tzinfo=None) > datetime.now():
                         self._logger.info('Token refreshed')
-                    if self.__token and self._cache_authentication and self._cache_keyring:
-                        self._cache_keyring.save_token(profile, self.__token, self._resolve_cache_postfix(auth_profile))
+                    if self.__token:
+                        self._save_token(profile, auth_profile, self.__token)
+                        agent_synced = True
             if self.__token and self.__token.expires_in.replace(tzinfo=None) <= datetime.now():
                 self.__token = None
+            if self.__token and agent_client and not agent_synced:
+                agent_client.save_token(self.authenticator_name(), profile, self.__token, postfix)
             if self.__token:
                 self._active_profile = profile
                 self._active_auth_profile = auth_profile
@@ -0,0 +1,378 @@
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Final, Optional, Tuple
+
+from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.models import ArkNotSupportedException, ArkProfile, ArkProfileLoader
+from ark_sdk_python.models.auth import ArkToken
+
+ARK_AUTH_AGENT_SOCKET_ENV_VAR: Final[str] = 'ARK_AUTH_AGENT_SOCK'
+DEFAULT_AGENT_SOCKET_TIMEOUT_SECONDS: Final[float] = 2.0
+DEFAULT_AGENT_REFRESH_INTERVAL_SECONDS: Final[int] = 30
+DEFAULT_AGENT_REFRESH_GRACE_SECONDS: Final[int] = 300
+AGENT_MAX_MESSAGE_SIZE: Final[int] = 1024 * 1024
+
+
+def default_agent_socket_path() -> str:
+    """
+    Returns the default agent socket path, a per user folder under the system temporary folder.
+
+    Raises:
+        ArkNotSupportedException: _description_
+
+    Returns:
+        str: _description_
+    """
+    if not hasattr(socket, 'AF_UNIX') or not hasattr(os, 'getuid'):
+        raise ArkNotSupportedException('Auth agent is only supported on platforms with unix sockets')
+    return os.path.join(tempfile.gettempdir(), f'ark-agent-{os.getuid()}', 'agent.sock')
+
+
+class ArkAuthAgentClient:
+    def __init__(self, socket_path: str, timeout: float = DEFAULT_AGENT_SOCKET_TIMEOUT_SECONDS) -> None:
+        self.__socket_path = socket_path
+        self.__timeout = timeout
+        self.__logger = get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def from_env() -> Optional['ArkAuthAgentClient']:
+        """
+        Creates an agent client from the `ARK_AUTH_AGENT_SOCK` environment variable.
+        Returns `None` when no agent is configured or unix sockets are not supported.
+
+        Returns:
+            Optional[ArkAuthAgentClient]: _description_
+        """
+        socket_path = os.environ.get(ARK_AUTH_AGENT_SOCKET_ENV_VAR, None)
+        if not socket_path or not hasattr(socket, 'AF_UNIX'):
+            return None
+        return ArkAuthAgentClient(socket_path)
+
+    @property
+    def socket_path(self) -> str:
+        return self.__socket_path
+
+    def _request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.__timeout)
+                sock.connect(self.__socket_path)
+                with sock.makefile('rwb') as stream:
+                    stream.write(json.dumps(request).encode() + b'\n')
+                    stream.flush()
+                    line = stream.readline(AGENT_MAX_MESSAGE_SIZE)
+            if not line:
+                return None
+            response = json.loads(line)
+            if response.get('error'):
+                self.__logger.info('Auth agent returned an error [%s]', response["error"])
+                return None
+            return response
+        except (OSError, ValueError) as ex:
+            self.__logger.info('Failed to communicate with auth agent at [%s] [%s]', self.__socket_path, ex)
+            return None
+
+    def load_token(self, authenticator_name: str, profile: ArkProfile, postfix: str) -> Optional[ArkToken]:
+        """
+        Loads a token held by the agent for the authenticator, profile and postfix.
+
+        Args:
+            authenticator_name (str): _description_
+            profile (ArkProfile): _description_
+            postfix (str): _description_
+
+        Returns:
+            Optional[ArkToken]: _description_
+        """
+        response = self._request(
+            {'op': 'get', 'authenticator_name': authenticator_name, 'profile_name': profile.profile_name, 'postfix': postfix}
+        )
+        if not response or not response.get('token'):
+            return None
+        return ArkToken.model_validate_json(response['token'])
+
+    def save_token(self, authenticator_name: str, profile: ArkProfile, token: ArkToken, postfix: str) -> bool:
+        """
+        Hands over a token to the agent, the agent keeps it in memory and refreshes it ahead of expiry.
+
+        Args:
+            authenticator_name (str): _description_
+            profile (ArkProfile): _description_
+            token (ArkToken): _description_
+            postfix (str): _description_
+
+        Returns:
+            bool: _description_
+        """
+        response = self._request(
+            {
+                'op': 'put',
+                'authenticator_name': authenticator_name,
+                'profile_name': profile.profile_name,
+                'postfix': postfix,
+                'token': token.model_dump_json(),
+            }
+        )
+        return response is not None
+
+    def delete_token(self, authenticator_name: str, profile: ArkProfile, postfix: str) -> bool:
+        """
+        Removes a token from the agent.
+
+        Args:
+            authenticator_name (str): _description_
+            profile (ArkProfile): _description_
+            postfix (str): _description_
+
+        Returns:
+            bool: _description_
+        """
+        response = self._request(
+            {'op': 'delete', 'authenticator_name': authenticator_name, 'profile_name': profile.profile_name, 'postfix': postfix}
+        )
+        return response is not None
+
+    def status(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the agent status, or `None` if the agent is not reachable.
+
+        Returns:
+            Optional[Dict[str, Any]]: _description_
+        """
+        return self._request({'op': 'status'})
+
+    def clear(self) -> bool:
+        """
+        Removes all tokens held by the agent.
+
+        Returns:
+            bool: _description_
+        """
+        return self._request({'op': 'clear'}) is not None
+
+    def stop(self) -> bool:
+        """
+        Stops the agent.
+
+        Returns:
+            bool: _description_
+        """
+        return self._request({'op': 'stop'}) is not None
+
+
+class _ArkAuthAgentRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline(AGENT_MAX_MESSAGE_SIZE)
+        if not line:
+            return
+        try:
+            response = self.server.agent.handle_request(json.loads(line))
+        except Exception as ex:
+            response = {'error': str(ex)}
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+class _ArkAuthAgentServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, agent: 'ArkAuthAgent') -> None:
+        self.agent = agent
+        super().__init__(socket_path, _ArkAuthAgentRequestHandler)
+
+    def verify_request(self, request: socket.socket, client_address: Any) -> bool:
+        return self.agent.verify_peer(request)
+
+
+class ArkAuthAgent:
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        refresh_interval_seconds: int = DEFAULT_AGENT_REFRESH_INTERVAL_SECONDS,
+        refresh_grace_seconds: int = DEFAULT_AGENT_REFRESH_GRACE_SECONDS,
+    ) -> None:
+        if not hasattr(socket, 'AF_UNIX') or sys.platform == 'win32':
+            raise ArkNotSupportedException('Auth agent is only supported on platforms with unix sockets')
+        self.__socket_path = socket_path or default_agent_socket_path()
+        self.__refresh_interval_seconds = refresh_interval_seconds
+        self.__refresh_grace_seconds = refresh_grace_seconds
+        self.__logger = get_logger(self.__class__.__name__)
+        self.__tokens: Dict[Tuple[str, str, str], ArkToken] = {}
+        self.__tokens_lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__server: Optional[_ArkAuthAgentServer] = None
+
+    @property
+    def socket_path(self) -> str:
+        return self.__socket_path
+
+    @staticmethod
+    def peer_uid(conn: socket.socket) -> Optional[int]:
+        """
+        Returns the user id of the process connected on the other end of the unix socket, where peer credentials are available.
+
+        Args:
+            conn (socket.socket): _description_
+
+        Returns:
+            Optional[int]: _description_
+        """
+        if hasattr(socket, 'SO_PEERCRED'):
+            creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+            _, uid, _ = struct.unpack('3i', creds)
+            return uid
+        return None
+
+    def verify_peer(self, conn: socket.socket) -> bool:
+        """
+        Verifies the connecting peer runs as the same user as the agent.
+        Where peer credentials are unavailable, access is restricted by the socket folder permissions.
+
+        Args:
+            conn (socket.socket): _description_
+
+        Returns:
+            bool: _description_
+        """
+        uid = self.peer_uid(conn)
+        if uid is not None and uid != os.getuid():
+            self.__logger.warning('Rejected auth agent connection from uid [%s]', uid)
+            return False
+        return True
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handles a single agent protocol request.
+
+        Args:
+            request (Dict[str, Any]): _description_
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        op = request.get('op')
+        if op == 'status':
+            with self.__tokens_lock:
+                return {'pid': os.getpid(), 'tokens': len(self.__tokens)}
+        if op == 'stop':
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {}
+        if op == 'clear':
+            with self.__tokens_lock:
+                self.__tokens.clear()
+            return {}
+        key = (request['authenticator_name'], request['profile_name'], request['postfix'])
+        if op == 'get':
+            with self.__tokens_lock:
+                token = self.__tokens.get(key)
+            return {'token': token.model_dump_json() if token else None}
+        if op == 'put':
+            token = ArkToken.model_validate_json(request['token'])
+            with self.__tokens_lock:
+                self.__tokens[key] = token
+            return {}
+        if op == 'delete':
+            with self.__tokens_lock:
+                self.__tokens.pop(key, None)
+            return {}
+        return {'error': f'Unknown op [{op}]'}
+
+    def __refresh_token(self, key: Tuple[str, str, str], token: ArkToken) -> Optional[ArkToken]:
+        from ark_sdk_python.auth import SUPPORTED_AUTHENTICATORS
+
+        authenticator_name, profile_name, postfix = key
+        profile = ArkProfileLoader.load_profile(profile_name)
+        if not profile or authenticator_name not in profile.auth_profiles or authenticator_name not in SUPPORTED_AUTHENTICATORS:
+            return None
+        authenticator = SUPPORTED_AUTHENTICATORS[authenticator_name]()
+        refreshed_token = authenticator._perform_refresh_authentication(  # pylint: disable=protected-access
+            profile, profile.auth_profiles[authenticator_name], token
+        )
+        if refreshed_token and authenticator._cache_keyring:  # pylint: disable=protected-access
+            authenticator._cache_keyring.save_token(profile, refreshed_token, postfix)  # pylint: disable=protected-access
+        return refreshed_token
+
+    def refresh_tokens(self) -> None:
+        """
+        Refreshes all held tokens which are about to expire within the refresh grace.
+        Tokens which expired and cannot be refreshed are dropped.
+        """
+        with self.__tokens_lock:
+            tokens = list(self.__tokens.items())
+        for key, token in tokens:
+            if not token.expires_in:
+                continue
+            expires_in = token.expires_in.replace(tzinfo=None)
+            if expires_in - timedelta(seconds=self.__refresh_grace_seconds) > datetime.now():
+                continue
+            refreshed_token = None
+            if token.refresh_token:
+                try:
+                    self.__logger.info('Refreshing token [%s-%s] of profile [%s]', key[0], key[2], key[1])
+                    refreshed_token = self.__refresh_token(key, token)
+                except Exception as ex:
+                    self.__logger.warning('Failed to refresh token [%s-%s] of profile [%s] [%s]', key[0], key[2], key[1], ex)
+            with self.__tokens_lock:
+                if self.__tokens.get(key) is not token:
+                    continue
+                if refreshed_token:
+                    self.__tokens[key] = refreshed_token
+                elif expires_in <= datetime.now():
+                    del self.__tokens[key]
+
+    def __refresh_loop(self) -> None:
+        while not self.__stop_event.wait(self.__refresh_interval_seconds):
+            self.refresh_tokens()
+
+    def serve_forever(self) -> None:
+        """
+        Binds the agent socket and serves requests until stopped.
+        A missing socket folder is created with user only permissions, while an existing one is left as is,
+        as the socket itself is created private to the user and peers of other users are rejected.
+        The default folder is shared by name in the system temporary folder, so it must be owned by the user and private.
+
+        Raises:
+            ArkNotSupportedException: _description_
+        """
+        socket_folder = os.path.dirname(os.path.abspath(self.__socket_path))
+        if not os.path.isdir(socket_folder):
+            os.makedirs(socket_folder, mode=0o700)
+            # The mode of makedirs is masked by the umask
+            os.chmod(socket_folder, 0o700)
+        elif socket_folder == os.path.dirname(default_agent_socket_path()):
+            folder_stat = os.stat(socket_folder)
+            if folder_stat.st_uid != os.getuid() or folder_stat.st_mode & 0o077:
+                raise ArkNotSupportedException(f'Auth agent socket folder [{socket_folder}] is not private to the current user')
+        if os.path.exists(self.__socket_path):
+            if ArkAuthAgentClient(self.__socket_path).status() is not None:
+                raise ArkNotSupportedException(f'An auth agent is already running on [{self.__socket_path}]')
+            os.unlink(self.__socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            self.__server = _ArkAuthAgentServer(self.__socket_path, self)
+        finally:
+            os.umask(old_umask)
+        refresh_thread = threading.Thread(target=self.__refresh_loop, daemon=True)
+        refresh_thread.start()
+        self.__logger.info('Auth agent listening on [%s]', self.__socket_path)
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__stop_event.set()
+            self.__server.server_close()
+            if os.path.exists(self.__socket_path):
+                os.unlink(self.__socket_path)
+
+    def shutdown(self) -> None:
+        """
+        Stops serving and removes the agent socket.
+        """
+        self.__stop_event.set()
+        if self.__server:
+            self.__server.shutdown()
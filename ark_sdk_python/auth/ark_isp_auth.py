@@ -70,7 +70,7 @@ class ArkISPAuth(ArkAuth):
                 metadata={'env': env, 'cookies': codecs.encode(pickle.dumps(identity.session.cookies), 'base64').decode()},
             )
         except Exception as ex:
-            self._logger.exception(f'Failed to authenticate to identity security platform [{str(ex)}]')
+            self._logger.exception('Failed to authenticate to identity security platform [%s]', ex)
             raise ArkAuthException from ex
 
     def __perform_identity_refresh_authentication(self, profile: ArkProfile, auth_profile: ArkAuthProfile, token: ArkToken) -> ArkToken:
@@ -136,7 +136,7 @@ class ArkISPAuth(ArkAuth):
                 metadata={'env': env, 'cookies': codecs.encode(pickle.dumps(identity.session.cookies), 'base64').decode()},
             )
         except Exception as ex:
-            self._logger.exception(f'Failed to authenticate to identity security platform with service user [{str(ex)}]')
+            self._logger.exception('Failed to authenticate to identity security platform with service user [%s]', ex)
             raise ArkAuthException from ex
 
     @overrides
@@ -1,5 +1,19 @@
-from ark_sdk_python.auth.identity.ark_identity import ArkIdentity
-from ark_sdk_python.auth.identity.ark_identity_fqdn_resolver import ArkIdentityFQDNResolver
-from ark_sdk_python.auth.identity.ark_identity_service_user import ArkIdentityServiceUser
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.auth.identity.ark_identity import ArkIdentity
+    from ark_sdk_python.auth.identity.ark_identity_fqdn_resolver import ArkIdentityFQDNResolver
+    from ark_sdk_python.auth.identity.ark_identity_service_user import ArkIdentityServiceUser
 
 __all__ = ['ArkIdentityFQDNResolver', 'ArkIdentity', 'ArkIdentityServiceUser']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.auth.identity.ark_identity': ['ArkIdentity'],
+        'ark_sdk_python.auth.identity.ark_identity_fqdn_resolver': ['ArkIdentityFQDNResolver'],
+        'ark_sdk_python.auth.identity.ark_identity_service_user': ['ArkIdentityServiceUser'],
+    },
+)
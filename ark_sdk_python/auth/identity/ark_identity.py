@@ -12,13 +12,12 @@ from multiprocessing import Pipe, Process, get_context
 from multiprocessing.connection import Connection
 from typing import Dict, Final, List, Optional, Tuple, Union
 
-import inquirer
 from cachetools import LRUCache, cached
 from pydantic import ValidationError
 from requests import Session
 from requests.cookies import RequestsCookieJar
 
-from ark_sdk_python.args import ArkArgsFormatter, ArkInquirerRender
+from ark_sdk_python.args import ArkArgsFormatter
 from ark_sdk_python.auth.identity.ark_identity_fqdn_resolver import ArkIdentityFQDNResolver
 from ark_sdk_python.common import ArkKeyring, ArkSystemConfig, get_logger
 from ark_sdk_python.common.ark_jwt_utils import ArkJWTUtils
@@ -48,6 +47,10 @@ DEFAULT_TOKEN_LIFETIME_SECONDS: Final[int] = 3600
 
 
 def input_process(pipe_write: Connection, pipe_read: Connection, mechanism: Mechanism, oob_advance_resp: AdvanceAuthMidResponse) -> None:
+    import inquirer
+
+    from ark_sdk_python.args import ArkInquirerRender
+
     sys.stdin = open(0, encoding='utf-8')
     while True:
         if oob_advance_resp.result.generated_auth_value:
@@ -173,14 +176,14 @@ class ArkIdentity:
                     identity_tenant_subdomain, AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
                 )
             except Exception as ex:
-                self.__logger.warning(f'Failed to resolve url from tenant subdomain, falling back to user [{str(ex)}]')
+                self.__logger.warning('Failed to resolve url from tenant subdomain, falling back to user [%s]', ex)
         if identity_url:
             return identity_url
         tenant_suffix = self.__username[self.__username.index('@') :]
         return ArkIdentityFQDNResolver.resolve_tenant_fqdn_from_tenant_suffix(tenant_suffix=tenant_suffix)
 
     def __start_authentication(self) -> StartAuthResponse:
-        self.__logger.info(f'Starting authentication with user {self.__username} and fqdn {self.__identity_url}')
+        self.__logger.info('Starting authentication with user %s and fqdn %s', self.__username, self.__identity_url)
         response = self.__session.post(
             url=f'{self.__identity_url}/Security/StartAuthentication',
             json={'User': self.__username, 'Version': '1.0', 'PlatformTokenResponse': True, 'MfaRequestor': 'DeviceAgent'},
@@ -206,7 +209,7 @@ class ArkIdentity:
     def __advance_authentication(
         self, mechanism_id: str, session_id: str, answer: str, action: str
     ) -> Union[AdvanceAuthMidResponse, AdvanceAuthResponse]:
-        self.__logger.info(f'Advancing authentication with user {self.__username} and fqdn {self.__identity_url} and action {action}')
+        self.__logger.info('Advancing authentication with user %s and fqdn %s and action %s', self.__username, self.__identity_url, action)
         response = self.__session.post(
             url=f'{self.__identity_url}/Security/AdvanceAuthentication',
             json={'SessionId': session_id, 'MechanismId': mechanism_id, 'Action': action, 'Answer': answer},
@@ -220,7 +223,7 @@ class ArkIdentity:
         return parsed_res
 
     def __identity_idp_auth_status(self, session_id: str) -> IdpAuthStatusResponse:
-        self.__logger.info(f'Calling idp auth status for fqdn {self.__identity_url} and session id {session_id}')
+        self.__logger.info('Calling idp auth status for fqdn %s and session id %s', self.__identity_url, session_id)
         response = self.__session.post(
             url=f'{self.__identity_url}/Security/OobAuthStatus',
             json={'SessionId': session_id},
@@ -314,6 +317,10 @@ class ArkIdentity:
                 self.__stop_input_process()
 
     def __pick_mechanism(self, challenge: Challenge) -> Mechanism:
+        import inquirer
+
+        from ark_sdk_python.args import ArkInquirerRender
+
         factors = {
             'otp': '📲 Push / Code',
             'oath': '🔐 OATH Code',
@@ -387,6 +394,10 @@ class ArkIdentity:
         start_auth_response: StartAuthResponse,
         current_challenge_idx: int,
     ) -> Tuple[str, int]:
+        import inquirer
+
+        from ark_sdk_python.args import ArkInquirerRender
+
         current_challenge_idx += 1
         # Password, answer it
         if not self.__password:
@@ -6,6 +6,7 @@ from cachetools import LRUCache, cached
 from pydantic import ValidationError
 from requests import Session
 
+from ark_sdk_python.common.ark_disk_cache import ArkDiskCache
 from ark_sdk_python.common.env import IDENTITY_ENV_URLS, ROOT_DOMAIN, AwsEnv
 from ark_sdk_python.models import ArkException
 from ark_sdk_python.models.common.identity import TenantFqdnResponse
@@ -15,6 +16,7 @@ from ark_sdk_python.models.common.isp import IdentityEndpointResponse
 class ArkIdentityFQDNResolver:
     __DISCOVERY_SERVICE_DOMAIN_NAME: Final[str] = 'platform-discovery'
     __DISCOVERY_TIMEOUT: Final[int] = 30
+    __DISCOVERY_CACHE: Final[ArkDiskCache] = ArkDiskCache('tenant_discovery', ttl_seconds=24 * 60 * 60, stale_ttl_seconds=7 * 24 * 60 * 60)
 
     @staticmethod
     @cached(cache=LRUCache(maxsize=1024))
@@ -41,6 +43,7 @@ class ArkIdentityFQDNResolver:
         """
         Resolves the tenant's FQDN URL from its subdomain.
         The resolved URL is based on the current working environment, which is provided in the `tenant_subdomain` argument.
+        Resolved URLs are kept in a persistent cache, so new processes skip the platform discovery round trip.
 
         Args:
             tenant_subdomain (str): The tenant subdomain, for example: `mytenant`
@@ -52,6 +55,13 @@ class ArkIdentityFQDNResolver:
         Returns:
             str: The tenant's resolved FQDN
         """
+        return ArkIdentityFQDNResolver.__DISCOVERY_CACHE.get_or_compute(
+            f'identity-endpoint:{env.value}:{tenant_subdomain}',
+            lambda: ArkIdentityFQDNResolver.__discover_tenant_fqdn_from_tenant_subdomain(tenant_subdomain, env),
+        )
+
+    @staticmethod
+    def __discover_tenant_fqdn_from_tenant_subdomain(tenant_subdomain: str, env: AwsEnv) -> str:
         platform_discovery_url = f'https://{ArkIdentityFQDNResolver.__DISCOVERY_SERVICE_DOMAIN_NAME}.{ROOT_DOMAIN[env]}'
         session = Session()
         response = session.get(
@@ -87,6 +97,13 @@ class ArkIdentityFQDNResolver:
         identity_env_url = identity_env_url or (
             IDENTITY_ENV_URLS[AwsEnv(os.getenv('DEPLOY_ENV', None))] if os.getenv('DEPLOY_ENV', None) else IDENTITY_ENV_URLS[AwsEnv.PROD]
         )
+        return ArkIdentityFQDNResolver.__DISCOVERY_CACHE.get_or_compute(
+            f'pod-fqdn:{identity_env_url}:{tenant_suffix}',
+            lambda: ArkIdentityFQDNResolver.__discover_tenant_fqdn_from_tenant_suffix(tenant_suffix, identity_env_url),
+        )
+
+    @staticmethod
+    def __discover_tenant_fqdn_from_tenant_suffix(tenant_suffix: str, identity_env_url: str) -> str:
         session = Session()
         response = session.post(
             f'https://pod0.{identity_env_url}/Security/StartAuthentication',
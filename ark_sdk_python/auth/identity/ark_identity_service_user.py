@@ -97,7 +97,7 @@ class ArkIdentityServiceUser:
             ArkAuthException: _description_
         """
         # Login to identity with the service service user
-        self.__logger.info(f'Authenticating to service user via endpoint [{self.__identity_url}]')
+        self.__logger.info('Authenticating to service user via endpoint [%s]', self.__identity_url)
         if self.__cache_authentication and not force and self.__load_cache(profile):
             # Check if expired
             if self.__session_exp.replace(tzinfo=None) > datetime.now():
@@ -124,7 +124,7 @@ class ArkIdentityServiceUser:
             'scope': 'openid profile api',
             'redirect_uri': 'https://cyberark.cloud/redirect',
         }
-        self.__logger.info(f'Trying to request a platform authorization with params [{params}]')
+        self.__logger.info('Trying to request a platform authorization with params [%s]', params)
         authorize_response = self.__session.get(
             url=f'{self.__identity_url}/OAuth2/Authorize/{self.__app_name}',
             headers={'Authorization': f'Bearer {access_token}'},
@@ -144,7 +144,7 @@ class ArkIdentityServiceUser:
         self.__session.headers.update({'Authorization': f'Bearer {self.__session_token}', **ArkIdentityFQDNResolver.default_headers()})
         self.__session_exp = datetime.now() + timedelta(hours=4)
         self.__logger.info(
-            f'Created a service user session via endpoint [{self.__identity_url}] ' f'with user [{self.__username}] to platform'
+            'Created a service user session via endpoint [%s] with user [%s] to platform', self.__identity_url, self.__username
         )
         if self.__cache_authentication:
             self.__save_cache(profile)
@@ -8,7 +8,6 @@ from typing import Dict, Final, Generic, List, Optional, Tuple, TypeVar
 
 import inquirer
 
-from ark_sdk_python.args.ark_args_formatter import ArkInquirerRender
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
@@ -152,6 +151,8 @@ class ArkSIABasePoliciesEditorService(
         Returns:
             ArkSIALoadedPolicies: _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         policies = self._list_policies()
         policies_to_query: Dict[str, PolicyType] = []
         with ThreadPoolExecutor() as executor:
@@ -199,6 +200,8 @@ class ArkSIABasePoliciesEditorService(
         Raises:
             ArkServiceException: _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         workspace_policies = self.__load_existing_policies_from_workspace()
         workspace_policies.update(self.__load_generated_policies_from_workspace())
         if not workspace_policies:
@@ -240,8 +243,10 @@ class ArkSIABasePoliciesEditorService(
                         break
         except Exception as ex:
             self._logger.error(
-                f'An error occurred while trying to edit {self._policies_family} policies, '
-                f'you can edit the policies at [{self.__policies_cache_dir}] [{str(ex)}]'
+                'An error occurred while trying to edit %s policies, you can edit the policies at [%s] [%s]',
+                self._policies_family,
+                self.__policies_cache_dir,
+                ex,
             )
 
     def remove_policies(self, remove_policies: ArkSIARemovePolicies) -> None:
@@ -257,6 +262,8 @@ class ArkSIABasePoliciesEditorService(
         Raises:
             ArkServiceException: _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         workspace_policies = self.__load_existing_policies_from_workspace()
         workspace_policies.update(self.__load_generated_policies_from_workspace())
         if not workspace_policies:
@@ -309,6 +316,8 @@ class ArkSIABasePoliciesEditorService(
         Args:
             view_policies (ArkSIAViewPolicies): _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         workspace_policies = self.__load_existing_policies_from_workspace()
         workspace_policies.update(self.__load_generated_policies_from_workspace())
         policy_names = view_policies.names
@@ -352,8 +361,10 @@ class ArkSIABasePoliciesEditorService(
                 )
         except Exception as ex:
             self._logger.error(
-                f'An error occurred while trying to view the {self._policies_family} policies, '
-                f'you can view the policies at [{self.__policies_cache_dir}] [{str(ex)}]'
+                'An error occurred while trying to view the %s policies, you can view the policies at [%s] [%s]',
+                self._policies_family,
+                self.__policies_cache_dir,
+                ex,
             )
 
     def reset_policies(self, reset_policy: ArkSIAResetPolicies) -> None:
@@ -366,6 +377,8 @@ class ArkSIABasePoliciesEditorService(
         Args:
             reset_policy (ArkSIAResetPolicies): _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         if reset_policy.all:
             answers = inquirer.prompt(
                 [inquirer.Confirm('reset', message=f'Are you sure you want to reset all edited {self._policies_family} policies?')]
@@ -413,6 +426,8 @@ class ArkSIABasePoliciesEditorService(
         Args:
             generate_policy (GeneratePolicyType): _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         workspace_policies = self.__load_existing_policies_from_workspace()
         workspace_policies.update(self.__load_generated_policies_from_workspace())
         policy = self._generate_policy(generate_policy, workspace_policies)
@@ -435,8 +450,10 @@ class ArkSIABasePoliciesEditorService(
                 policy = self.__policy_type.model_validate_json(answers['policy_editor'])
             except Exception as ex:
                 self._logger.error(
-                    f'An error occurred while trying to edit the {self._policies_family} policy, '
-                    f'the policy will be saved to [{policy_path}] and can be edited manually [{str(ex)}]'
+                    'An error occurred while trying to edit the %s policy, the policy will be saved to [%s] and can be edited manually [%s]',
+                    self._policies_family,
+                    policy_path,
+                    ex,
                 )
         policy_path.write_text(policy.model_dump_json(indent=4))
 
@@ -448,6 +465,8 @@ class ArkSIABasePoliciesEditorService(
         Args:
             policies_diff (ArkSIAPoliciesDiff): _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         loaded_policies_diff = self.__load_policies_diff()
         removed_policies = self.__load_removed_policies_from_workspace()
         if not loaded_policies_diff and not removed_policies:
@@ -494,8 +513,10 @@ class ArkSIABasePoliciesEditorService(
                 )
         except Exception as ex:
             self._logger.error(
-                f'An error occurred while trying to show {self._policies_family} policies diff, '
-                f'you can view the policies at [{self.__policies_cache_dir}] [{str(ex)}]'
+                'An error occurred while trying to show %s policies diff, you can view the policies at [%s] [%s]',
+                self._policies_family,
+                self.__policies_cache_dir,
+                ex,
             )
 
     def policies_status(self, get_policies_status: ArkSIAGetPoliciesStatus) -> ArkSIAPoliciesStatus:
@@ -533,6 +554,8 @@ class ArkSIABasePoliciesEditorService(
         Args:
             commit_policies (ArkSIACommitPolicies): _description_
         """
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         loaded_policies_diff = self.__load_policies_diff()
         removed_policies = self.__load_removed_policies_from_workspace()
         generated_policies = self.__load_generated_policies_from_workspace()
@@ -4,7 +4,6 @@ from typing import Dict, Final, List, Optional
 import inquirer
 from overrides import overrides
 
-from ark_sdk_python.args.ark_args_formatter import ArkInquirerRender
 from ark_sdk_python.auth.ark_isp_auth import ArkISPAuth
 from ark_sdk_python.cli_services.sia.common.ark_sia_base_policies_editor_service import ArkSIABasePoliciesEditorService
 from ark_sdk_python.models.ark_profile import ArkProfile
@@ -126,6 +125,8 @@ class ArkSIAVMPoliciesEditorService(
 
     @overrides
     def _generate_policy(self, generate_policy: ArkSIAVMGeneratePolicy, workspace_policies: List[ArkSIAVMPolicy]) -> ArkSIAVMPolicy:
+        from ark_sdk_python.args.ark_inquirer_render import ArkInquirerRender
+
         inquires = []
         if not generate_policy.name:
             inquires.append(inquirer.Text('name', 'Please supply a policy name'))
@@ -1,22 +1,85 @@
-from ark_sdk_python.common.ark_async_client import ArkAsyncClient
-from ark_sdk_python.common.ark_async_request import ArkAsyncRequest
-from ark_sdk_python.common.ark_client import ArkClient
-from ark_sdk_python.common.ark_keyring import ArkKeyring
-from ark_sdk_python.common.ark_logger import ArkLogger, get_logger
-from ark_sdk_python.common.ark_page import ArkPage
-from ark_sdk_python.common.ark_pollers import ArkPollers
-from ark_sdk_python.common.ark_random_utils import ArkRandomUtils
-from ark_sdk_python.common.ark_system_config import ArkSystemConfig
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.common.ark_async_client import ArkAsyncClient
+    from ark_sdk_python.common.ark_async_poll_scheduler import ArkAsyncPollScheduler
+    from ark_sdk_python.common.ark_async_request import ArkAsyncRequest
+    from ark_sdk_python.common.ark_client import ArkClient
+    from ark_sdk_python.common.ark_deadline import ArkDeadline
+    from ark_sdk_python.common.ark_http_cache import ArkHTTPCache
+    from ark_sdk_python.common.ark_http_cassette import ArkCassetteRecordingAdapter, ArkCassetteReplayAdapter, ArkHTTPCassette
+    from ark_sdk_python.common.ark_http_compression import ArkHTTPCompression
+    from ark_sdk_python.common.ark_instrumentation import (
+        ArkHistogram,
+        ArkInstrumentation,
+        ArkInstrumentations,
+        ArkMetricsCollector,
+        prometheus_text,
+    )
+    from ark_sdk_python.common.ark_keyring import ArkKeyring
+    from ark_sdk_python.common.ark_logger import ArkLogger, get_logger
+    from ark_sdk_python.common.ark_page import ArkPage
+    from ark_sdk_python.common.ark_pollers import ArkPollers
+    from ark_sdk_python.common.ark_random_utils import ArkRandomUtils
+    from ark_sdk_python.common.ark_request_hedger import ArkRequestHedger
+    from ark_sdk_python.common.ark_system_config import ArkSystemConfig
+    from ark_sdk_python.common.ark_tracing import ArkSpan, ArkTracer
 
 __all__ = [
     'ArkClient',
     'ArkAsyncRequest',
     'ArkKeyring',
     'ArkAsyncClient',
+    'ArkAsyncPollScheduler',
     'ArkPage',
     'ArkRandomUtils',
     'ArkPollers',
     'ArkSystemConfig',
     'ArkLogger',
     'get_logger',
+    'ArkInstrumentation',
+    'ArkInstrumentations',
+    'ArkHistogram',
+    'ArkMetricsCollector',
+    'prometheus_text',
+    'ArkSpan',
+    'ArkTracer',
+    'ArkHTTPCache',
+    'ArkHTTPCassette',
+    'ArkCassetteRecordingAdapter',
+    'ArkCassetteReplayAdapter',
+    'ArkDeadline',
+    'ArkRequestHedger',
+    'ArkHTTPCompression',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.common.ark_async_client': ['ArkAsyncClient'],
+        'ark_sdk_python.common.ark_async_poll_scheduler': ['ArkAsyncPollScheduler'],
+        'ark_sdk_python.common.ark_async_request': ['ArkAsyncRequest'],
+        'ark_sdk_python.common.ark_client': ['ArkClient'],
+        'ark_sdk_python.common.ark_deadline': ['ArkDeadline'],
+        'ark_sdk_python.common.ark_http_cache': ['ArkHTTPCache'],
+        'ark_sdk_python.common.ark_http_compression': ['ArkHTTPCompression'],
+        'ark_sdk_python.common.ark_http_cassette': ['ArkHTTPCassette', 'ArkCassetteRecordingAdapter', 'ArkCassetteReplayAdapter'],
+        'ark_sdk_python.common.ark_instrumentation': [
+            'ArkInstrumentation',
+            'ArkInstrumentations',
+            'ArkHistogram',
+            'ArkMetricsCollector',
+            'prometheus_text',
+        ],
+        'ark_sdk_python.common.ark_keyring': ['ArkKeyring'],
+        'ark_sdk_python.common.ark_logger': ['ArkLogger', 'get_logger'],
+        'ark_sdk_python.common.ark_page': ['ArkPage'],
+        'ark_sdk_python.common.ark_pollers': ['ArkPollers'],
+        'ark_sdk_python.common.ark_random_utils': ['ArkRandomUtils'],
+        'ark_sdk_python.common.ark_request_hedger': ['ArkRequestHedger'],
+        'ark_sdk_python.common.ark_system_config': ['ArkSystemConfig'],
+        'ark_sdk_python.common.ark_tracing': ['ArkSpan', 'ArkTracer'],
+    },
+)
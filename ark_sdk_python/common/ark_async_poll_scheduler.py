@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import time
+from typing import Final, Iterator, List, Optional, Sequence, Tuple
+
+from ark_sdk_python.common.ark_async_request import ArkAsyncRequest
+from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.models import ArkNotSupportedException, ArkPollCallback
+from ark_sdk_python.models.common import ArkAsyncStatus
+
+DEFAULT_MAX_POLL_INTERVAL_SECONDS: Final[float] = 30.0
+DEFAULT_POLL_BACKOFF: Final[float] = 1.5
+MIN_POLL_INTERVAL_SECONDS: Final[float] = 0.1
+
+
+class _ArkScheduledPoll:
+    def __init__(self, async_request: ArkAsyncRequest, timeout_seconds: int, progress_callback: Optional[ArkPollCallback]) -> None:
+        settings = async_request._async_request_settings  # pylint: disable=protected-access
+        self.async_request = async_request
+        self.progress_callback = progress_callback
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + timeout_seconds
+        self.interval = max(float(settings.poll_sleep_time or 0), MIN_POLL_INTERVAL_SECONDS)
+        self.progress_tick_seconds = float(settings.progress_tick_count or 0)
+        self.last_progress_tick = self.started_at
+
+    def time_left_seconds(self, now: float) -> int:
+        return max(int(self.deadline - now), 0)
+
+    def notify(self, now: float, async_status: ArkAsyncStatus) -> None:
+        if self.progress_callback:
+            self.progress_callback(self.async_request.async_task, self.time_left_seconds(now), async_status)
+
+
+class ArkAsyncPollScheduler:
+    def __init__(self, max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS, backoff: float = DEFAULT_POLL_BACKOFF) -> None:
+        self.__max_poll_interval_seconds = max_poll_interval_seconds
+        self.__backoff = backoff
+        self.__counter = itertools.count()
+        self.__queue: List[Tuple[float, int, _ArkScheduledPoll]] = []
+        self.__logger = get_logger(self.__class__.__name__)
+
+    def add(self, async_request: ArkAsyncRequest, timeout_seconds: int, progress_callback: Optional[ArkPollCallback] = None) -> None:
+        """
+        Schedules an async request to be polled until it finishes, fails or passes its deadline.
+
+        Args:
+            async_request (ArkAsyncRequest): _description_
+            timeout_seconds (int): _description_
+            progress_callback (Optional[ArkPollCallback], optional): _description_. Defaults to None.
+
+        Raises:
+            ArkNotSupportedException: _description_
+        """
+        if type(async_request).poll_once is ArkAsyncRequest.poll_once:
+            raise ArkNotSupportedException(f'{type(async_request).__name__} does not implement poll_once, so it cannot be scheduled')
+        scheduled = _ArkScheduledPoll(async_request, timeout_seconds, progress_callback)
+        scheduled.notify(scheduled.started_at, ArkAsyncStatus.StartedPolling)
+        heapq.heappush(self.__queue, (scheduled.started_at, next(self.__counter), scheduled))
+
+    def __poll(self, scheduled: _ArkScheduledPoll) -> Optional[ArkAsyncStatus]:
+        try:
+            finished = scheduled.async_request.poll_once()
+        except Exception as ex:
+            self.__logger.warning('Polling async task [%s] failed [%s]', scheduled.async_request.async_task.task_id, ex)
+            return ArkAsyncStatus.Failed
+        if finished:
+            return ArkAsyncStatus.Failed if scheduled.async_request.task_failed() else ArkAsyncStatus.Successful
+        if time.monotonic() >= scheduled.deadline:
+            return ArkAsyncStatus.Timeout
+        return None
+
+    def as_completed(self) -> Iterator[Tuple[ArkAsyncRequest, ArkAsyncStatus]]:
+        """
+        Polls all scheduled async requests in a single loop, and yields each request with its final status as soon as it ends.
+        Every request is polled with its own backoff, starting from its poll sleep time, and bounded by its own deadline.
+
+        Yields:
+            Iterator[Tuple[ArkAsyncRequest, ArkAsyncStatus]]: _description_
+        """
+        while self.__queue:
+            next_poll_at, _, scheduled = heapq.heappop(self.__queue)
+            wait_seconds = next_poll_at - time.monotonic()
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+            async_status = self.__poll(scheduled)
+            now = time.monotonic()
+            if async_status is not None:
+                scheduled.notify(now, async_status)
+                yield scheduled.async_request, async_status
+                continue
+            if now - scheduled.last_progress_tick >= scheduled.progress_tick_seconds:
+                scheduled.last_progress_tick = now
+                scheduled.notify(now, ArkAsyncStatus.StillPolling)
+            next_poll_at = min(now + scheduled.interval, scheduled.deadline)
+            scheduled.interval = min(scheduled.interval * self.__backoff, self.__max_poll_interval_seconds)
+            heapq.heappush(self.__queue, (next_poll_at, next(self.__counter), scheduled))
+
+    def poll_all(self) -> List[Tuple[ArkAsyncRequest, ArkAsyncStatus]]:
+        """
+        Polls all scheduled async requests until they end, the total wait is bounded by the slowest request.
+
+        Returns:
+            List[Tuple[ArkAsyncRequest, ArkAsyncStatus]]: Requests and their final status, by order of completion
+        """
+        return list(self.as_completed())
+
+    @staticmethod
+    def poll_requests(
+        async_requests: Sequence[ArkAsyncRequest], timeout_seconds: int, progress_callback: Optional[ArkPollCallback] = None
+    ) -> List[ArkAsyncStatus]:
+        """
+        Polls the given async requests together with the same timeout and progress callback.
+
+        Args:
+            async_requests (Sequence[ArkAsyncRequest]): _description_
+            timeout_seconds (int): _description_
+            progress_callback (Optional[ArkPollCallback], optional): _description_. Defaults to None.
+
+        Returns:
+            List[ArkAsyncStatus]: The final status of each request, by the order of the given requests
+        """
+        scheduler = ArkAsyncPollScheduler()
+        for async_request in async_requests:
+            scheduler.add(async_request, timeout_seconds, progress_callback)
+        statuses = {id(async_request): async_status for async_request, async_status in scheduler.as_completed()}
+        return [statuses[id(async_request)] for async_request in async_requests]
@@ -3,6 +3,7 @@ from typing import Callable
 
 from ark_sdk_python.common.ark_client import ArkClient
 from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.models.ark_exceptions import ArkNotSupportedException
 from ark_sdk_python.models.common import ArkAsyncRequestSettings, ArkAsyncStatus, ArkAsyncTask
 
 
@@ -54,6 +55,19 @@ class ArkAsyncRequest(ABC):
             bool: _description_
         """
 
+    def poll_once(self) -> bool:
+        """
+        Fetches the current status of the async request once, without waiting, and returns whether it has finished.
+        Used by the poll scheduler to poll many async requests together, so only requests implementing it can be scheduled.
+
+        Raises:
+            ArkNotSupportedException: _description_
+
+        Returns:
+            bool: _description_
+        """
+        raise ArkNotSupportedException(f'{self.__class__.__name__} does not support polling once')
+
     @property
     def async_task(self) -> ArkAsyncTask:
         return self._async_task
@@ -1,13 +1,39 @@
+import copy
+import hashlib
+import json
+import logging
+import re
 import socket
+import time
 from base64 import b64decode
 from http import HTTPStatus
-from typing import Callable, Dict, Final, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Final, List, Optional, Pattern, Tuple, Union
+from urllib.parse import urlparse
 
 import requests.packages.urllib3.util.connection as urllib3_cn  # pylint: disable=import-error
-from requests import Response, Session
+from requests import Request, Response, Session
 from requests.cookies import RequestsCookieJar
-
+from requests.exceptions import RequestException, Timeout
+from requests.structures import CaseInsensitiveDict
+
+from ark_sdk_python.common.ark_deadline import ArkDeadline
+from ark_sdk_python.common.ark_http_cache import ArkHTTPCache, ArkHTTPCacheStore
+from ark_sdk_python.common.ark_http_cassette import ArkHTTPCassette
+from ark_sdk_python.common.ark_http_compression import ArkHTTPCompression
+from ark_sdk_python.common.ark_instrumentation import ArkInstrumentation, ArkInstrumentations
+from ark_sdk_python.common.ark_jwt_utils import ArkJWTUtils
+from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.common.ark_profiler import PHASE_NETWORK, ArkProfiler
+from ark_sdk_python.common.ark_request_hedger import ArkRequestHedger
+from ark_sdk_python.common.ark_single_flight import ArkSingleFlight
 from ark_sdk_python.common.ark_system_config import ArkSystemConfig
+from ark_sdk_python.common.ark_tracing import SPAN_KIND_CLIENT, ArkTracer
+from ark_sdk_python.models.ark_exceptions import ArkDeadlineExceededException
+
+# Path segments which identify a resource rather than a route, such as uuids, numeric ids and vault ids like 12_34
+ROUTE_ID_SEGMENT_PATTERN: Final[Pattern] = re.compile(
+    r'^([0-9]+|[0-9]+_[0-9]+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$'
+)
 
 
 def allowed_gai_family():
@@ -33,9 +59,36 @@ class ArkClient:
         refresh_connection_callback: Optional[Callable[['ArkClient'], None]] = None,
         origin_verify: Optional[str] = None,
         origin_verify_header_name: str = 'x-origin-verify',
+        service_name: Optional[str] = None,
+        tenant: Optional[str] = None,
+        http_cache: Optional[ArkHTTPCache] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        request_hedger: Optional[ArkRequestHedger] = None,
+        request_compression: Optional[ArkHTTPCompression] = None,
+        http2: Optional[bool] = None,
     ) -> None:
         from fake_useragent import UserAgent
 
+        self.__logger = get_logger(self.__class__.__name__)
+        self.__service_name = service_name
+        self.__tenant = tenant
+        self.__instrumentations: List[ArkInstrumentation] = []
+        if http_cache is None and ArkSystemConfig.is_http_cache_enabled():
+            http_cache = ArkHTTPCache(ArkSystemConfig.http_cache_route_ttls(), store=self.__persistent_http_cache_store())
+        self.__http_cache = http_cache
+        default_connect_timeout, default_read_timeout = ArkSystemConfig.http_timeouts()
+        self.__timeout = (
+            default_connect_timeout if connect_timeout is None else connect_timeout,
+            default_read_timeout if read_timeout is None else read_timeout,
+        )
+        if request_hedger is None and ArkSystemConfig.is_hedging_requests():
+            request_hedger = ArkRequestHedger.shared()
+        self.__request_hedger = request_hedger
+        if request_compression is None and ArkSystemConfig.is_compressing_requests():
+            request_compression = ArkHTTPCompression(ArkSystemConfig.compressed_request_routes())
+        self.__request_compression = request_compression
+        self.__single_flight = ArkSingleFlight() if ArkSystemConfig.is_coalescing_requests() else None
         self.__session = Session()
         self.__base_url = base_url
         self.__token = token
@@ -55,8 +108,17 @@ class ArkClient:
                 verify = ArkSystemConfig.is_verifiying_certificates()
         self.__session.verify = verify
         self.__session.headers['User-Agent'] = UserAgent(browsers=['chrome']).googlechrome
+        self.__session.headers['Accept-Encoding'] = ArkHTTPCompression.accept_encoding()
         if origin_verify is not None and len(origin_verify) > 0:
             self.__session.headers[origin_verify_header_name] = origin_verify
+        if http2 is None:
+            http2 = ArkSystemConfig.is_using_http2()
+        if http2:
+            from ark_sdk_python.common.ark_http2_adapter import ArkHTTP2Adapter
+
+            # Below the session, so refresh, retries, caching and hedging work the same over both protocols
+            self.__session.mount('https://', ArkHTTP2Adapter())
+        ArkHTTPCassette.mount_from_env(self.__session)
 
     @property
     def base_url(self) -> Optional[str]:
@@ -70,6 +132,77 @@ class ArkClient:
     def session_token(self) -> Optional[str]:
         return self.__token
 
+    @property
+    def service_name(self) -> Optional[str]:
+        return self.__service_name
+
+    @property
+    def tenant(self) -> Optional[str]:
+        return self.__tenant
+
+    @staticmethod
+    def __persistent_http_cache_store() -> Optional[ArkHTTPCacheStore]:
+        from ark_sdk_python.common.ark_disk_cache import ArkDiskCache
+
+        if not ArkSystemConfig.is_http_cache_persistent() or not ArkDiskCache.is_enabled():
+            return None
+        from ark_sdk_python.common.ark_sqlite_http_cache_store import ArkSQLiteHTTPCacheStore
+
+        return ArkSQLiteHTTPCacheStore()
+
+    def __http_cache_identity(self) -> str:
+        # Cached responses are kept per user, and the subject of a token outlives its refreshes, unlike the token itself
+        if not self.__token:
+            return ''
+        try:
+            claims = ArkJWTUtils.get_unverified_claims(self.__token)
+            return str(claims.get('sub') or claims.get('unique_name') or '') or hashlib.sha256(self.__token.encode()).hexdigest()
+        except Exception:
+            return hashlib.sha256(self.__token.encode()).hexdigest()
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        return self.__timeout
+
+    @property
+    def http_cache(self) -> Optional[ArkHTTPCache]:
+        return self.__http_cache
+
+    @property
+    def request_hedger(self) -> Optional[ArkRequestHedger]:
+        return self.__request_hedger
+
+    @property
+    def request_compression(self) -> Optional[ArkHTTPCompression]:
+        return self.__request_compression
+
+    @property
+    def single_flight(self) -> Optional[ArkSingleFlight]:
+        return self.__single_flight
+
+    @property
+    def instrumentations(self) -> List[ArkInstrumentation]:
+        return list(self.__instrumentations)
+
+    def add_instrumentation(self, instrumentation: ArkInstrumentation) -> None:
+        """
+        Adds an instrumentation for the requests of this client, in addition to the globally registered ones.
+
+        Args:
+            instrumentation (ArkInstrumentation): _description_
+        """
+        if instrumentation not in self.__instrumentations:
+            self.__instrumentations.append(instrumentation)
+
+    def remove_instrumentation(self, instrumentation: ArkInstrumentation) -> None:
+        """
+        Removes an instrumentation added to this client.
+
+        Args:
+            instrumentation (ArkInstrumentation): _description_
+        """
+        self.__instrumentations = [i for i in self.__instrumentations if i is not instrumentation]
+
     @property
     def refresh_connection_callback(self) -> Optional[Callable[['ArkClient'], None]]:
         return self.__refresh_connection_callback
@@ -83,7 +216,32 @@ class ArkClient:
     def add_cookie(self, key: str, value: str) -> None:
         self.__session.cookies[key] = value
 
-    def __generic_http_method_request_with_retry(self, method: str, route: str, refresh_retry_count: int, **kwargs) -> Response:
+    def warm_up(self, timeout: float = 5.0) -> bool:
+        """
+        Opens a connection to the client's base URL ahead of time, so it is kept in the session's connection pool.
+        The response itself is ignored.
+
+        Args:
+            timeout (float, optional): _description_. Defaults to 5.0.
+
+        Returns:
+            bool: Whether a connection was established
+        """
+        if not self.__base_url:
+            return False
+        try:
+            self.__session.head(self.__base_url, timeout=timeout, allow_redirects=False)
+            return True
+        except RequestException:
+            return False
+
+    def close(self) -> None:
+        """
+        Closes the session and its pooled connections.
+        """
+        self.__session.close()
+
+    def __url(self, route: str) -> str:
         url = route
         if self.__base_url:
             url = f'{self.__base_url}'
@@ -97,14 +255,196 @@ class ArkClient:
                         url = f'{self.__base_url}{route[1:]}'
                     else:
                         url = f'{self.__base_url}/{route}'
+        return url
+
+    def __generic_http_method_request_with_retry(self, method: str, route: str, refresh_retry_count: int, **kwargs) -> Response:
+        url = self.__url(route)
         http_method = getattr(self.__session, method)
-        response: Response = http_method(url, **kwargs)
+        retry_count = ArkClient.__DEFAULT_REFRESH_RETRY_COUNT - refresh_retry_count
+        # Checked before each attempt, so refresh retries and further pages stop once the deadline passed
+        ArkDeadline.check(f'{method.upper()} {self.route_template(url)}')
+        request_kwargs = {**kwargs, 'timeout': ArkDeadline.bounded_timeout(kwargs.get('timeout', self.__timeout))}
+        compressed_kwargs = None
+        if self.__request_compression:
+            compressed_kwargs = self.__request_compression.compress(method, self.route_template(url), request_kwargs)
+            request_kwargs = compressed_kwargs or request_kwargs
+        instrumentations = ArkInstrumentations.active(self.__instrumentations)
+        route_template = self.route_template(url) if instrumentations else ''
+        ArkInstrumentations.emit(instrumentations, 'on_request_start', self.__service_name, method.upper(), route_template)
+        span = None
+        if ArkTracer.is_enabled():
+            span_attributes = {'http.method': method.upper(), 'http.route': self.route_template(url)}
+            if self.__service_name:
+                span_attributes['ark.service'] = self.__service_name
+            span = ArkTracer.start_span(f'{method.upper()} {span_attributes["http.route"]}', SPAN_KIND_CLIENT, **span_attributes)
+        start_time = time.perf_counter()
+        try:
+            with ArkProfiler.phase(PHASE_NETWORK):
+                if self.__request_hedger and method.lower() == 'get' and not kwargs.get('stream'):
+                    # Reads are idempotent, so a slow one may be sent again, and the first response taken
+                    response: Response = self.__request_hedger.request(
+                        f'{urlparse(url).netloc}{self.route_template(url)}', lambda: http_method(url, **request_kwargs)
+                    )
+                else:
+                    response = http_method(url, **request_kwargs)
+        except Exception as ex:
+            if span:
+                span.end(ex)
+            ArkInstrumentations.emit(
+                instrumentations,
+                'on_request_end',
+                self.__service_name,
+                method.upper(),
+                route_template,
+                None,
+                time.perf_counter() - start_time,
+                ex,
+            )
+            self.__log_request(method, url, start_time, retry_count, None, kwargs.get('stream', False), ex)
+            if isinstance(ex, Timeout) and ArkDeadline.is_exceeded():
+                raise ArkDeadlineExceededException(f'{method.upper()} {self.route_template(url)} exceeded its deadline') from ex
+            raise
+        ArkInstrumentations.emit(
+            instrumentations,
+            'on_request_end',
+            self.__service_name,
+            method.upper(),
+            route_template,
+            response.status_code,
+            time.perf_counter() - start_time,
+        )
+        if span:
+            span.set_attribute('http.status_code', response.status_code)
+            span.end()
+        self.__log_request(method, url, start_time, retry_count, response, kwargs.get('stream', False))
+        if compressed_kwargs and ArkHTTPCompression.is_refusal(response):
+            # The server could not read the compressed body, so it is sent again as is, and the route is no longer compressed
+            self.__request_compression.refuse(method, self.route_template(url))
+            return self.__generic_http_method_request_with_retry(method, route, refresh_retry_count, **kwargs)
         if response.status_code == HTTPStatus.UNAUTHORIZED and self.__refresh_connection_callback and refresh_retry_count > 0:
+            ArkInstrumentations.emit(instrumentations, 'on_refresh', self.__service_name, route_template)
             self.__refresh_connection_callback(self)
+            ArkInstrumentations.emit(instrumentations, 'on_retry', f'{method.upper()} {route_template}', retry_count + 1, None)
             return self.__generic_http_method_request_with_retry(method, route, refresh_retry_count - 1, **kwargs)
         return response
 
+    @staticmethod
+    def route_template(url: str) -> str:
+        """
+        Returns the route of the url with its resource ids replaced by `{id}`, so requests to the same endpoint share a route.
+
+        Args:
+            url (str): _description_
+
+        Returns:
+            str: _description_
+        """
+        return '/'.join('{id}' if ROUTE_ID_SEGMENT_PATTERN.match(segment) else segment for segment in urlparse(url).path.split('/'))
+
+    def __log_request(
+        self,
+        method: str,
+        url: str,
+        start_time: float,
+        retry_count: int,
+        response: Optional[Response],
+        stream: bool,
+        error: Optional[Exception] = None,
+    ) -> None:
+        # Checked first, so requests pay nothing for the record while the level is disabled
+        if not self.__logger.isEnabledFor(logging.INFO):
+            return
+        latency_ms = round((time.perf_counter() - start_time) * 1000, 3)
+        request_record: Dict[str, Any] = {
+            'service': self.__service_name,
+            'tenant': self.__tenant,
+            'method': method.upper(),
+            'route': self.route_template(url),
+            'status': None,
+            'latency_ms': latency_ms,
+            'request_bytes': 0,
+            'response_bytes': None,
+            'retry_count': retry_count,
+        }
+        if response is not None:
+            request_body = response.request.body if response.request is not None else None
+            request_record['status'] = response.status_code
+            if isinstance(request_body, str):
+                request_body = request_body.encode('utf-8')
+            request_record['request_bytes'] = len(request_body) if isinstance(request_body, bytes) else 0
+            # Streamed bodies are not read here, so only their declared length is known
+            content_length = response.headers.get('Content-Length')
+            if not stream:
+                request_record['response_bytes'] = len(response.content)
+            elif content_length and content_length.isdigit():
+                request_record['response_bytes'] = int(content_length)
+        if error is not None:
+            request_record['error'] = str(error)
+        trace_id = ArkTracer.current_trace_id()
+        if trace_id:
+            request_record['trace_id'] = trace_id
+        self.__logger.info(
+            'HTTP %s %s [%s] in %sms',
+            request_record['method'],
+            request_record['route'],
+            request_record['status'],
+            latency_ms,
+            extra=request_record,
+        )
+
     def generic_http_method_request(self, method: str, route: str, **kwargs) -> Response:
+        if self.__single_flight and method.lower() == 'get' and not kwargs.get('stream'):
+            # Identical GETs in flight at the same time, such as from the workers of a fan out, share a single request
+            try:
+                response, shared = self.__single_flight.do(
+                    self.__single_flight_key(route, kwargs),
+                    lambda: self.__cached_http_method_request(method, route, **kwargs),
+                    wait_timeout=ArkDeadline.remaining_seconds(),
+                )
+            except TimeoutError as ex:
+                raise ArkDeadlineExceededException(f'GET {self.route_template(self.__url(route))} exceeded its deadline') from ex
+            if shared:
+                self.__logger.debug('Coalesced GET %s with an identical request in flight', self.route_template(self.__url(route)))
+                return self.__copy_response(response)
+            return response
+        return self.__cached_http_method_request(method, route, **kwargs)
+
+    def __single_flight_key(self, route: str, kwargs: Dict[str, Any]) -> str:
+        request = Request(
+            'GET',
+            self.__url(route),
+            params=kwargs.get('params'),
+            headers=kwargs.get('headers'),
+            data=kwargs.get('data'),
+            json=kwargs.get('json'),
+        ).prepare()
+        body = request.body.decode('latin-1') if isinstance(request.body, bytes) else request.body
+        # The session headers, with the authorization of this client, are the same for all its requests
+        return json.dumps([request.url, sorted(request.headers.items()), body, kwargs.get('timeout'), kwargs.get('allow_redirects', True)])
+
+    @staticmethod
+    def __copy_response(response: Response) -> Response:
+        # The content is already read, so each waiter gets its own response of it, with headers it can change freely
+        copied = copy.copy(response)
+        copied.headers = CaseInsensitiveDict(response.headers)
+        return copied
+
+    def __cached_http_method_request(self, method: str, route: str, **kwargs) -> Response:
+        if self.__http_cache:
+            url = self.__url(route)
+            return self.__http_cache.request(
+                method,
+                url,
+                self.route_template(url),
+                lambda **send_kwargs: self.__generic_http_method_request_with_retry(
+                    method=method,
+                    route=route,
+                    refresh_retry_count=ArkClient.__DEFAULT_REFRESH_RETRY_COUNT,
+                    **send_kwargs,
+                ),
+                identity=self.__http_cache_identity(),
+                **kwargs,
+            )
         return self.__generic_http_method_request_with_retry(
             method=method,
             route=route,
@@ -0,0 +1,124 @@
+import contextlib
+import contextvars
+import functools
+import time
+from typing import Any, Callable, Final, Iterator, Optional, Tuple, Union
+
+from ark_sdk_python.models.ark_exceptions import ArkDeadlineExceededException
+
+ArkTimeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+
+class ArkDeadline:
+    # The monotonic time the operations of the context must end by, if any
+    __DEADLINE: Final[contextvars.ContextVar] = contextvars.ContextVar('ark_deadline', default=None)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def within(seconds: float) -> Iterator[float]:
+        """
+        Bounds all the requests sent within the block, refresh retries and further pages included, to end in the given seconds.
+        A deadline nested in another one never extends it, the earlier of the two applies.
+        Requests past the deadline raise ArkDeadlineExceededException instead of being sent.
+        Pages are fetched lazily, so only the pages iterated within the block are bounded by it.
+
+        Args:
+            seconds (float): _description_
+
+        Returns:
+            Iterator[float]: The monotonic time of the deadline
+        """
+        deadline = time.monotonic() + seconds
+        outer_deadline = ArkDeadline.__DEADLINE.get()
+        if outer_deadline is not None:
+            deadline = min(deadline, outer_deadline)
+        token = ArkDeadline.__DEADLINE.set(deadline)
+        try:
+            yield deadline
+        finally:
+            ArkDeadline.__DEADLINE.reset(token)
+
+    @staticmethod
+    def deadline() -> Optional[float]:
+        return ArkDeadline.__DEADLINE.get()
+
+    @staticmethod
+    def remaining_seconds() -> Optional[float]:
+        """
+        Returns the seconds left until the deadline of the context, or None when there is no deadline.
+
+        Returns:
+            Optional[float]: _description_
+        """
+        deadline = ArkDeadline.__DEADLINE.get()
+        if deadline is None:
+            return None
+        return max(deadline - time.monotonic(), 0.0)
+
+    @staticmethod
+    def is_exceeded() -> bool:
+        remaining_seconds = ArkDeadline.remaining_seconds()
+        return remaining_seconds is not None and remaining_seconds <= 0
+
+    @staticmethod
+    def check(operation: str = 'Operation') -> None:
+        """
+        Raises when the deadline of the context has passed.
+
+        Args:
+            operation (str, optional): _description_. Defaults to 'Operation'.
+
+        Raises:
+            ArkDeadlineExceededException: _description_
+        """
+        if ArkDeadline.is_exceeded():
+            raise ArkDeadlineExceededException(f'{operation} exceeded its deadline')
+
+    @staticmethod
+    def bounded_timeout(timeout: ArkTimeout) -> ArkTimeout:
+        """
+        Returns the requests timeout clipped to the seconds left until the deadline of the context.
+        Both the connect and the read timeouts are clipped, as each of them alone may otherwise outlast the deadline.
+
+        Args:
+            timeout (ArkTimeout): A timeout as requests accepts it, seconds or a (connect, read) tuple
+
+        Returns:
+            ArkTimeout: _description_
+        """
+        remaining_seconds = ArkDeadline.remaining_seconds()
+        if remaining_seconds is None:
+            return timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return (
+                remaining_seconds if connect_timeout is None else min(connect_timeout, remaining_seconds),
+                remaining_seconds if read_timeout is None else min(read_timeout, remaining_seconds),
+            )
+        return remaining_seconds if timeout is None else min(timeout, remaining_seconds)
+
+    @staticmethod
+    def bind(func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Returns the function bound to the deadline of the calling context, so it applies when the function runs in another thread,
+        such as in an executor, whose threads do not share the context of their caller.
+
+        Args:
+            func (Callable[..., Any]): _description_
+
+        Returns:
+            Callable[..., Any]: _description_
+        """
+        deadline = ArkDeadline.__DEADLINE.get()
+        if deadline is None:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = ArkDeadline.__DEADLINE.set(deadline)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                ArkDeadline.__DEADLINE.reset(token)
+
+        return wrapper
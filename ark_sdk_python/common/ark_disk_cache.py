@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Final, Optional, Tuple
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+DEFAULT_ARK_CACHE_FOLDER: Final[str] = '.ark_cache'
+ARK_CACHE_FOLDER_ENV_VAR: Final[str] = 'ARK_CACHE_FOLDER'
+ARK_DISABLE_DISK_CACHE_ENV_VAR: Final[str] = 'ARK_DISABLE_DISK_CACHE'
+DISK_CACHE_FILE_SUFFIX: Final[str] = '.cache.json'
+
+
+def ark_cache_folder() -> str:
+    """
+    Returns the ark cache folder, from the `ARK_CACHE_FOLDER` environment variable when set, or `$HOME/.ark_cache` otherwise.
+
+    Returns:
+        str: _description_
+    """
+    return os.environ.get(ARK_CACHE_FOLDER_ENV_VAR, os.path.join(os.path.expanduser('~'), DEFAULT_ARK_CACHE_FOLDER))
+
+
+class ArkDiskCache:
+    __LOCKS: Dict[str, threading.Lock] = {}
+    __LOCKS_LOCK: Final[threading.Lock] = threading.Lock()
+
+    def __init__(self, namespace: str, ttl_seconds: int, stale_ttl_seconds: int = 0) -> None:
+        self.__namespace = namespace
+        self.__ttl_seconds = ttl_seconds
+        self.__stale_ttl_seconds = stale_ttl_seconds
+        self.__logger = get_logger(self.__class__.__name__)
+        with ArkDiskCache.__LOCKS_LOCK:
+            self.__lock = ArkDiskCache.__LOCKS.setdefault(namespace, threading.Lock())
+
+    @property
+    def cache_file_path(self) -> str:
+        return os.path.join(ark_cache_folder(), f'{self.__namespace}{DISK_CACHE_FILE_SUFFIX}')
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return ARK_DISABLE_DISK_CACHE_ENV_VAR not in os.environ
+
+    def __read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        folder = os.path.dirname(self.cache_file_path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f'.{self.__namespace}', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_file_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Returns the cached value of the key and whether it is still fresh.
+        Values past their stale time are not returned.
+
+        Args:
+            key (str): _description_
+
+        Returns:
+            Tuple[Optional[Any], bool]: _description_
+        """
+        if not self.is_enabled():
+            return None, False
+        entry = self.__read().get(key)
+        if not entry:
+            return None, False
+        age = time.time() - entry.get('stored_at', 0)
+        if age > self.__ttl_seconds + self.__stale_ttl_seconds:
+            return None, False
+        return entry.get('value'), age <= self.__ttl_seconds
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores the value for the key, pruning entries which are past their stale time.
+
+        Args:
+            key (str): _description_
+            value (Any): _description_
+        """
+        if not self.is_enabled():
+            return
+        with self.__lock:
+            try:
+                now = time.time()
+                data = {
+                    k: v for k, v in self.__read().items() if now - v.get('stored_at', 0) <= self.__ttl_seconds + self.__stale_ttl_seconds
+                }
+                data[key] = {'value': value, 'stored_at': now}
+                self.__write(data)
+            except OSError as ex:
+                self.__logger.info('Failed to write disk cache [%s] [%s]', self.__namespace, ex)
+
+    def delete(self, key: str) -> None:
+        """
+        Removes the key from the cache.
+
+        Args:
+            key (str): _description_
+        """
+        with self.__lock:
+            data = self.__read()
+            if key in data:
+                del data[key]
+                try:
+                    self.__write(data)
+                except OSError as ex:
+                    self.__logger.info('Failed to write disk cache [%s] [%s]', self.__namespace, ex)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value of the key, computing and storing it when missing, stale or past its stale time.
+        A stale value is refreshed before it is returned, and is only returned as is when refreshing it fails,
+        as a background refresh would be killed with short lived processes such as the CLI, and never stored.
+
+        Args:
+            key (str): _description_
+            compute (Callable[[], Any]): _description_
+
+        Returns:
+            Any: _description_
+        """
+        value, fresh = self.get(key)
+        if value is not None and fresh:
+            return value
+        if value is None:
+            value = compute()
+            self.set(key, value)
+            return value
+        try:
+            refreshed_value = compute()
+        except Exception as ex:
+            self.__logger.info('Failed to refresh disk cache key [%s], using its stale value [%s]', key, ex)
+            return value
+        self.set(key, refreshed_value)
+        return refreshed_value
+
+    @staticmethod
+    def clear_all() -> None:
+        """
+        Removes all the disk cache files from the ark cache folder.
+        """
+        folder = ark_cache_folder()
+        if not os.path.isdir(folder):
+            return
+        for file_name in os.listdir(folder):
+            if file_name.endswith(DISK_CACHE_FILE_SUFFIX):
+                os.unlink(os.path.join(folder, file_name))
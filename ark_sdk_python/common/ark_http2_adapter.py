@@ -0,0 +1,228 @@
+import http.client
+import os
+import ssl
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from types import SimpleNamespace
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple, Union
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout, ReadTimeout, RequestException
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ark_sdk_python.common.ark_logger import get_logger
+from ark_sdk_python.models.ark_exceptions import ArkNotSupportedException
+
+DEFAULT_HTTP2_MAX_CONNECTIONS: Final[int] = 100
+DEFAULT_HTTP2_KEEPALIVE_EXPIRY_SECONDS: Final[float] = 60.0
+# Connection specific headers, which HTTP/2 forbids
+HOP_BY_HOP_HEADERS: Final[List[str]] = ['connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade']
+
+
+class ArkHTTP2RawResponse:
+    def __init__(self, response: Any, message: http.client.HTTPMessage) -> None:
+        self.__response = response
+        # Read by requests for the cookies of the response, as it reads them from urllib3 responses
+        self._original_response = SimpleNamespace(msg=message)
+        self.__chunks: Optional[Iterator[bytes]] = None
+        self.__buffer = b''
+
+    def read(self, amt: Optional[int] = None, **_: Any) -> bytes:
+        """
+        Reads the decoded body, as requests reads the raw response of a streamed request.
+
+        Args:
+            amt (Optional[int], optional): _description_. Defaults to None.
+
+        Returns:
+            bytes: _description_
+        """
+        if self.__chunks is None:
+            self.__chunks = self.__response.iter_bytes()
+        while amt is None or len(self.__buffer) < amt:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                break
+            self.__buffer += chunk
+        if amt is None:
+            data, self.__buffer = self.__buffer, b''
+        else:
+            data, self.__buffer = self.__buffer[:amt], self.__buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        self.__response.close()
+
+    def release_conn(self) -> None:
+        self.__response.close()
+
+
+class ArkHTTP2Adapter(BaseAdapter):
+    # Clients of the process by their tls settings, each multiplexing all its requests to a host over a single connection
+    __CLIENTS: Dict[Tuple[Any, Any], Any] = {}
+    __CLIENTS_LOCK: Final[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        super().__init__()
+        try:
+            import h2  # pylint: disable=unused-import
+            import httpx  # pylint: disable=unused-import
+        except ImportError as ex:
+            raise ArkNotSupportedException(
+                'HTTP/2 requires the httpx and h2 packages, install them with `pip install "ark-sdk-python[http2]"`'
+            ) from ex
+        self.__logger = get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def __ssl_context(verify: Union[bool, str], cert: Optional[Union[str, Tuple[str, str]]]) -> ssl.SSLContext:
+        import certifi
+
+        if isinstance(verify, str):
+            if os.path.isdir(verify):
+                context = ssl.create_default_context(capath=verify)
+            else:
+                context = ssl.create_default_context(cafile=verify)
+        else:
+            context = ssl.create_default_context(cafile=certifi.where())
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+        if cert:
+            if isinstance(cert, str):
+                context.load_cert_chain(cert)
+            else:
+                context.load_cert_chain(*cert)
+        return context
+
+    @staticmethod
+    def __client(verify: Union[bool, str], cert: Optional[Union[str, Tuple[str, str]]]) -> Any:
+        import httpx
+
+        key = (verify, cert)
+        with ArkHTTP2Adapter.__CLIENTS_LOCK:
+            if key not in ArkHTTP2Adapter.__CLIENTS:
+                ArkHTTP2Adapter.__CLIENTS[key] = httpx.Client(
+                    http2=True,
+                    verify=ArkHTTP2Adapter.__ssl_context(verify, cert),
+                    limits=httpx.Limits(
+                        max_connections=DEFAULT_HTTP2_MAX_CONNECTIONS,
+                        keepalive_expiry=DEFAULT_HTTP2_KEEPALIVE_EXPIRY_SECONDS,
+                    ),
+                    # The session keeps the cookies, so the shared client never keeps, nor sends, any of its own
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                    follow_redirects=False,
+                )
+            return ArkHTTP2Adapter.__CLIENTS[key]
+
+    @staticmethod
+    def __timeout(timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]) -> Any:
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout)
+        return httpx.Timeout(timeout)
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Sends the request over HTTP/2, and returns its response as requests would, so the session handles it as any other.
+        Proxies are taken from the environment by httpx, rather than from the session.
+
+        Args:
+            request (PreparedRequest): _description_
+            stream (bool, optional): _description_. Defaults to False.
+            timeout (Union[None, float, Tuple[Optional[float], Optional[float]]], optional): _description_. Defaults to None.
+            verify (Union[bool, str], optional): _description_. Defaults to True.
+            cert (Optional[Union[str, Tuple[str, str]]], optional): _description_. Defaults to None.
+            proxies (Optional[Dict[str, str]], optional): _description_. Defaults to None.
+
+        Raises:
+            ConnectTimeout: _description_
+            ReadTimeout: _description_
+            RequestsConnectionError: _description_
+            RequestException: _description_
+
+        Returns:
+            Response: _description_
+        """
+        import httpx
+
+        client = ArkHTTP2Adapter.__client(verify, cert)
+        http2_request = httpx.Request(
+            request.method,
+            request.url,
+            headers=[(name, value) for name, value in request.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS],
+            content=request.body,
+            extensions={'timeout': ArkHTTP2Adapter.__timeout(timeout).as_dict()},
+        )
+        try:
+            http2_response = client.send(http2_request, stream=stream)
+            if not stream:
+                http2_response.read()
+        except (httpx.ConnectTimeout, httpx.PoolTimeout) as ex:
+            raise ConnectTimeout(ex, request=request) from ex
+        except httpx.TimeoutException as ex:
+            raise ReadTimeout(ex, request=request) from ex
+        except httpx.TransportError as ex:
+            raise RequestsConnectionError(ex, request=request) from ex
+        except httpx.HTTPError as ex:
+            raise RequestException(ex, request=request) from ex
+        return self.build_response(request, http2_response, stream)
+
+    def build_response(self, request: PreparedRequest, http2_response: Any, stream: bool) -> Response:
+        """
+        Returns the requests response of the httpx one, whose cookies the session adds to its jar as for any other response.
+
+        Args:
+            request (PreparedRequest): _description_
+            http2_response (Any): _description_
+            stream (bool): _description_
+
+        Returns:
+            Response: _description_
+        """
+        response = Response()
+        response.status_code = http2_response.status_code
+        response.reason = http2_response.reason_phrase
+        # Repeated headers are joined as requests joins them, while cookies are read from each of their headers below
+        response.headers = CaseInsensitiveDict(http2_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        message = http.client.HTTPMessage()
+        for name, value in http2_response.headers.multi_items():
+            message[name] = value
+        response.raw = ArkHTTP2RawResponse(http2_response, message)
+        if not stream:
+            response._content = http2_response.content  # pylint: disable=protected-access
+            response._content_consumed = True  # pylint: disable=protected-access
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        self.__logger.debug('%s %s over %s', request.method, request.url, http2_response.http_version)
+        return response
+
+    def close(self) -> None:
+        # The clients are shared by the sessions of the process, so closing a session keeps them for the others
+        pass
+
+    @staticmethod
+    def close_all() -> None:
+        """
+        Closes the connections of all the HTTP/2 clients of the process.
+        """
+        with ArkHTTP2Adapter.__CLIENTS_LOCK:
+            for client in ArkHTTP2Adapter.__CLIENTS.values():
+                client.close()
+            ArkHTTP2Adapter.__CLIENTS.clear()
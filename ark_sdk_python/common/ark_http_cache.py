@@ -0,0 +1,299 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Final, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Request, Response
+from requests.structures import CaseInsensitiveDict
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+DEFAULT_HTTP_CACHE_MAX_ENTRIES: Final[int] = 1000
+# Seconds a response of a matching `<METHOD> <route template>` pattern is served without asking the server.
+# After that, or for routes without a rule, responses with validators are revalidated with a conditional request.
+# Identity lookups are queries sent as POST, so the read only ones are listed explicitly to be cached at all.
+DEFAULT_HTTP_CACHE_ROUTE_TTLS: Final[Dict[str, float]] = {
+    'GET */platforms': 300,
+    'GET */platforms/*': 300,
+    'GET */api/certificates': 300,
+    'GET */api/certificates/*': 300,
+    'GET */api/access-policies': 60,
+    'GET */api/access-policies/*': 60,
+    'GET */api/adb/access-policies': 60,
+    'GET */api/adb/access-policies/*': 60,
+    'POST */Core/GetDirectoryServices': 300,
+    'POST */Core/GetCdsAliasesForTenant': 300,
+}
+READ_METHODS: Final[Tuple[str, ...]] = ('GET', 'HEAD', 'OPTIONS')
+CACHE_CONTROL_MAX_AGE_PATTERN: Final[Pattern] = re.compile(r'max-age=(\d+)')
+
+
+class ArkHTTPCacheEntry:
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        encoding: Optional[str],
+        expires_at: float,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.encoding = encoding
+        self.etag: Optional[str] = self.headers.get('ETag')
+        self.last_modified: Optional[str] = self.headers.get('Last-Modified')
+        self.expires_at = expires_at
+
+    @staticmethod
+    def from_response(response: Response, fresh_seconds: float) -> 'ArkHTTPCacheEntry':
+        return ArkHTTPCacheEntry(
+            response.status_code, dict(response.headers), response.content, response.encoding, time.time() + fresh_seconds
+        )
+
+    def to_response(self, request: PreparedRequest) -> Response:
+        """
+        Returns a new response of the cached one, so callers never share its state.
+
+        Args:
+            request (PreparedRequest): _description_
+
+        Returns:
+            Response: _description_
+        """
+        response = Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content  # pylint: disable=protected-access
+        response.encoding = self.encoding
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class ArkHTTPCacheStore(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[ArkHTTPCacheEntry]:
+        """
+        Returns the cached entry of the key, if any, whether fresh or not.
+
+        Args:
+            key (str): _description_
+
+        Returns:
+            Optional[ArkHTTPCacheEntry]: _description_
+        """
+
+    @abstractmethod
+    def set(self, key: str, scope: str, entry: ArkHTTPCacheEntry) -> None:
+        """
+        Stores the entry of the key, as part of the scope which invalidates it.
+
+        Args:
+            key (str): _description_
+            scope (str): _description_
+            entry (ArkHTTPCacheEntry): _description_
+        """
+
+    @abstractmethod
+    def invalidate(self, scope: str) -> None:
+        """
+        Drops all the entries of the scope.
+
+        Args:
+            scope (str): _description_
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Drops all the entries.
+        """
+
+
+class ArkMemoryHTTPCacheStore(ArkHTTPCacheStore):
+    def __init__(self, max_entries: int = DEFAULT_HTTP_CACHE_MAX_ENTRIES) -> None:
+        self.__max_entries = max_entries
+        self.__entries: 'OrderedDict[str, Tuple[str, ArkHTTPCacheEntry]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> Optional[ArkHTTPCacheEntry]:
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+            self.__entries.move_to_end(key)
+            return self.__entries[key][1]
+
+    def set(self, key: str, scope: str, entry: ArkHTTPCacheEntry) -> None:
+        with self.__lock:
+            self.__entries[key] = (scope, entry)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, scope: str) -> None:
+        with self.__lock:
+            for key in [key for key, (entry_scope, _) in self.__entries.items() if entry_scope == scope]:
+                del self.__entries[key]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+
+class ArkHTTPCache:
+    def __init__(
+        self,
+        route_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_HTTP_CACHE_MAX_ENTRIES,
+        store: Optional[ArkHTTPCacheStore] = None,
+    ) -> None:
+        self.__route_ttls = dict(DEFAULT_HTTP_CACHE_ROUTE_TTLS if route_ttls is None else route_ttls)
+        self.__store = store or ArkMemoryHTTPCacheStore(max_entries)
+        self.__route_ttl_matches: Dict[str, Optional[float]] = {}
+        self.__counts_lock = threading.Lock()
+        self.__hits_count = 0
+        self.__revalidations_count = 0
+        self.__misses_count = 0
+        self.__logger = get_logger(self.__class__.__name__)
+
+    @property
+    def route_ttls(self) -> Dict[str, float]:
+        return dict(self.__route_ttls)
+
+    @property
+    def store(self) -> ArkHTTPCacheStore:
+        return self.__store
+
+    @property
+    def hits_count(self) -> int:
+        return self.__hits_count
+
+    @property
+    def revalidations_count(self) -> int:
+        return self.__revalidations_count
+
+    @property
+    def misses_count(self) -> int:
+        return self.__misses_count
+
+    def clear(self) -> None:
+        """
+        Drops all the cached responses.
+        """
+        self.__store.clear()
+
+    def route_ttl(self, method: str, route_template: str) -> Optional[float]:
+        """
+        Returns the seconds responses of the route are fresh for, from the first matching rule, or None when no rule matches.
+
+        Args:
+            method (str): _description_
+            route_template (str): _description_
+
+        Returns:
+            Optional[float]: _description_
+        """
+        route = f'{method.upper()} {route_template}'
+        if route not in self.__route_ttl_matches:
+            self.__route_ttl_matches[route] = next(
+                (ttl for pattern, ttl in self.__route_ttls.items() if fnmatchcase(route, pattern)),
+                None,
+            )
+        return self.__route_ttl_matches[route]
+
+    def request(
+        self, method: str, url: str, route_template: str, send: Callable[..., Response], identity: str = '', **kwargs: Any
+    ) -> Response:
+        """
+        Sends the request through the cache.
+        A fresh cached response is returned without a request, a stale one with validators is revalidated with a conditional request,
+        and a 304 answer returns the cached response. Mutations invalidate the cached responses of the same host,
+        as they may change any of its resources.
+
+        Args:
+            method (str): _description_
+            url (str): _description_
+            route_template (str): _description_
+            send (Callable[..., Response]): Sends the request with the given keyword arguments
+            identity (str, optional): Who the request is sent as, so cached responses are never shared between identities. Defaults to ''.
+
+        Returns:
+            Response: _description_
+        """
+        method = method.upper()
+        route_ttl = self.route_ttl(method, route_template)
+        scope = urlparse(url).netloc
+        if kwargs.get('stream') or (method != 'GET' and route_ttl is None):
+            if method not in READ_METHODS and route_ttl is None:
+                self.__store.invalidate(scope)
+            return send(**kwargs)
+        request = Request(method, url, params=kwargs.get('params'), data=kwargs.get('data'), json=kwargs.get('json')).prepare()
+        key = self.__cache_key(request, identity)
+        entry = self.__store.get(key)
+        if entry and entry.expires_at > time.time():
+            self.__count('hits')
+            self.__logger.debug('HTTP cache hit for %s %s', method, route_template)
+            return entry.to_response(request)
+        if entry and (entry.etag or entry.last_modified):
+            conditional_headers = dict(kwargs.get('headers') or {})
+            if entry.etag:
+                conditional_headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                conditional_headers['If-Modified-Since'] = entry.last_modified
+            kwargs['headers'] = conditional_headers
+        response = send(**kwargs)
+        if response.status_code == 304 and entry:
+            self.__count('revalidations')
+            self.__logger.debug('HTTP cache revalidated %s %s', method, route_template)
+            entry.expires_at = time.time() + self.__fresh_seconds(response, route_ttl)
+            entry.etag = response.headers.get('ETag', entry.etag)
+            entry.last_modified = response.headers.get('Last-Modified', entry.last_modified)
+            self.__store.set(key, scope, entry)
+            return entry.to_response(request)
+        self.__count('misses')
+        if response.status_code == 200:
+            self.__store_response(key, scope, response, route_ttl)
+        return response
+
+    def __count(self, name: str) -> None:
+        with self.__counts_lock:
+            if name == 'hits':
+                self.__hits_count += 1
+            elif name == 'revalidations':
+                self.__revalidations_count += 1
+            else:
+                self.__misses_count += 1
+
+    def __store_response(self, key: str, scope: str, response: Response, route_ttl: Optional[float]) -> None:
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        fresh_seconds = self.__fresh_seconds(response, route_ttl)
+        if fresh_seconds <= 0 and not response.headers.get('ETag') and not response.headers.get('Last-Modified'):
+            return
+        self.__store.set(key, scope, ArkHTTPCacheEntry.from_response(response, fresh_seconds))
+
+    @staticmethod
+    def __fresh_seconds(response: Response, route_ttl: Optional[float]) -> float:
+        # The route rules override the server, which rarely sends cache directives for these APIs
+        if route_ttl is not None:
+            return route_ttl
+        cache_control = response.headers.get('Cache-Control', '')
+        if 'no-cache' in cache_control:
+            return 0.0
+        max_age = CACHE_CONTROL_MAX_AGE_PATTERN.search(cache_control)
+        return float(max_age.group(1)) if max_age else 0.0
+
+    @staticmethod
+    def __cache_key(request: PreparedRequest, identity: str) -> str:
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body or b''
+        return hashlib.sha256(json.dumps([identity, request.method, request.url, hashlib.sha256(body).hexdigest()]).encode()).hexdigest()
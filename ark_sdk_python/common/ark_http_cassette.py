@@ -0,0 +1,307 @@
+import base64
+import gzip
+import io
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Final, List, Optional, Pattern, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+ARK_HTTP_CASSETTE_RECORD_ENV_VAR: Final[str] = 'ARK_HTTP_CASSETTE_RECORD'
+ARK_HTTP_CASSETTE_REPLAY_ENV_VAR: Final[str] = 'ARK_HTTP_CASSETTE_REPLAY'
+ARK_HTTP_CASSETTE_REPLAY_SPEED_ENV_VAR: Final[str] = 'ARK_HTTP_CASSETTE_REPLAY_SPEED'
+REDACTED_VALUE: Final[str] = '<REDACTED>'
+REDACTED_HEADERS: Final[List[str]] = ['authorization', 'cookie', 'set-cookie', 'x-idap-native-client', 'x-origin-verify', 'location']
+# Headers describing the body as it was sent over the wire, which the decoded recorded body no longer matches
+RECORDED_BODY_HEADERS: Final[List[str]] = ['content-encoding', 'transfer-encoding', 'content-length']
+# Names of fields holding secrets, while fields only describing a secret, such as secretType, are kept for the replayed models
+REDACTED_FIELD_PATTERN: Final[Pattern] = re.compile(
+    r'^(password|(new|old|current)_?password|secret|client_?secret|(access|id|refresh|session)?_?token|answer|private_?key|passphrase|api_?key)$',
+    re.IGNORECASE,
+)
+REDACTED_QUERY_PATTERN: Final[Pattern] = REDACTED_FIELD_PATTERN
+JWT_PATTERN: Final[Pattern] = re.compile(r'eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*')
+# Routes whose responses are the secret values themselves, rather than JSON with secret fields
+REDACTED_RESPONSE_ROUTE_PATTERN: Final[Pattern] = re.compile(r'/(password|secret)/retrieve/?$|/secret/generate/?$', re.IGNORECASE)
+
+
+class ArkHTTPCassette:
+    __REPLAY_ADAPTERS: Dict[Tuple[str, float], 'ArkCassetteReplayAdapter'] = {}
+    __REPLAY_ADAPTERS_LOCK: Final[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def interaction_key(method: str, url: str) -> Tuple[str, str]:
+        """
+        Returns the key replayed responses are matched by, which is the method, path and sorted query of the request.
+        The host is left out, so a cassette replays against any tenant.
+
+        Args:
+            method (str): _description_
+            url (str): _description_
+
+        Returns:
+            Tuple[str, str]: _description_
+        """
+        parsed_url = urlparse(url)
+        query = urlencode(sorted(ArkHTTPCassette.__redact_query(parse_qsl(parsed_url.query, keep_blank_values=True))))
+        return method.upper(), f'{parsed_url.path}?{query}' if query else parsed_url.path
+
+    @staticmethod
+    def __redact_query(query: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        return [(key, REDACTED_VALUE if REDACTED_QUERY_PATTERN.search(key) else value) for key, value in query]
+
+    @staticmethod
+    def redact_value(value: Any) -> Any:
+        """
+        Redacts the string fields of a JSON value whose names are of secrets, and any JWT found in its strings.
+
+        Args:
+            value (Any): _description_
+
+        Returns:
+            Any: _description_
+        """
+        if isinstance(value, dict):
+            return {
+                key: (
+                    REDACTED_VALUE
+                    if isinstance(item, str) and REDACTED_FIELD_PATTERN.search(str(key))
+                    else ArkHTTPCassette.redact_value(item)
+                )
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [ArkHTTPCassette.redact_value(item) for item in value]
+        if isinstance(value, str):
+            return JWT_PATTERN.sub(REDACTED_VALUE, value)
+        return value
+
+    @staticmethod
+    def redact_body(body: Optional[bytes], content_type: str) -> Tuple[Optional[str], str]:
+        """
+        Returns the body as recorded in a cassette, with its secrets redacted, and the encoding it was recorded with.
+        JSON and form bodies are redacted by field, text bodies by JWT, and binary bodies are kept as base64.
+
+        Args:
+            body (Optional[bytes]): _description_
+            content_type (str): _description_
+
+        Returns:
+            Tuple[Optional[str], str]: _description_
+        """
+        if not body:
+            return None, 'utf-8'
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            return base64.b64encode(body).decode('ascii'), 'base64'
+        if 'application/x-www-form-urlencoded' in content_type:
+            return urlencode(ArkHTTPCassette.__redact_query(parse_qsl(text, keep_blank_values=True))), 'utf-8'
+        try:
+            return json.dumps(ArkHTTPCassette.redact_value(json.loads(text))), 'utf-8'
+        except ValueError:
+            return JWT_PATTERN.sub(REDACTED_VALUE, text), 'utf-8'
+
+    @staticmethod
+    def redact_headers(headers: Any) -> Dict[str, str]:
+        """
+        Returns the headers as recorded in a cassette, without credentials and wire encoding details.
+
+        Args:
+            headers (Any): _description_
+
+        Returns:
+            Dict[str, str]: _description_
+        """
+        return {
+            name: REDACTED_VALUE if name.lower() in REDACTED_HEADERS else value
+            for name, value in headers.items()
+            if name.lower() not in RECORDED_BODY_HEADERS
+        }
+
+    @staticmethod
+    def load(path: str) -> List[Dict[str, Any]]:
+        """
+        Loads the interactions of a cassette, which is a JSON lines file of request and response pairs.
+
+        Args:
+            path (str): _description_
+
+        Returns:
+            List[Dict[str, Any]]: _description_
+        """
+        with open(path, 'r', encoding='utf-8') as cassette_file:
+            return [json.loads(line) for line in cassette_file if line.strip()]
+
+    @staticmethod
+    def mount_from_env(session: Session) -> None:
+        """
+        Mounts the recording or replaying adapter on the session, when a cassette is configured in the environment.
+        Used by every `ArkClient`, so the traffic of a whole CLI run can be recorded or replayed.
+        Recording sends through the adapter which was mounted before, so custom transports are recorded as well.
+
+        Args:
+            session (Session): _description_
+        """
+        record_path = os.environ.get(ARK_HTTP_CASSETTE_RECORD_ENV_VAR, '')
+        replay_path = os.environ.get(ARK_HTTP_CASSETTE_REPLAY_ENV_VAR, '')
+        for prefix in ['https://', 'http://']:
+            if replay_path:
+                session.mount(prefix, ArkHTTPCassette.__env_replay_adapter(replay_path))
+            elif record_path:
+                session.mount(prefix, ArkCassetteRecordingAdapter(record_path, adapter=session.get_adapter(prefix)))
+
+    @staticmethod
+    def __env_replay_adapter(replay_path: str) -> 'ArkCassetteReplayAdapter':
+        replay_speed = float(os.environ.get(ARK_HTTP_CASSETTE_REPLAY_SPEED_ENV_VAR, '0'))
+        # A single adapter per cassette, so all the clients of the process share the replay positions
+        with ArkHTTPCassette.__REPLAY_ADAPTERS_LOCK:
+            if (replay_path, replay_speed) not in ArkHTTPCassette.__REPLAY_ADAPTERS:
+                ArkHTTPCassette.__REPLAY_ADAPTERS[(replay_path, replay_speed)] = ArkCassetteReplayAdapter(replay_path, replay_speed)
+            return ArkHTTPCassette.__REPLAY_ADAPTERS[(replay_path, replay_speed)]
+
+
+class ArkCassetteRecordingAdapter(HTTPAdapter):
+    # Shared by all the recording adapters, as the clients of a process record to the same cassette
+    __WRITE_LOCK: Final[threading.Lock] = threading.Lock()
+
+    def __init__(self, cassette_path: str, adapter: Optional[BaseAdapter] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.__cassette_path = cassette_path
+        self.__adapter = adapter
+        self.__logger = get_logger(self.__class__.__name__)
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Sends the request, through the wrapped adapter if any, and appends it with its response to the cassette, with their secrets redacted.
+        Each interaction is written as it completes, so an interrupted run keeps what it recorded.
+
+        Args:
+            request (PreparedRequest): _description_
+            stream (bool, optional): _description_. Defaults to False.
+            timeout (Union[None, float, Tuple[Optional[float], Optional[float]]], optional): _description_. Defaults to None.
+            verify (Union[bool, str], optional): _description_. Defaults to True.
+            cert (Optional[Union[str, Tuple[str, str]]], optional): _description_. Defaults to None.
+            proxies (Optional[Dict[str, str]], optional): _description_. Defaults to None.
+
+        Returns:
+            Response: _description_
+        """
+        start_time = time.perf_counter()
+        sender = self.__adapter.send if self.__adapter else super().send
+        response = sender(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        # Reading the content keeps it on the response, so streamed responses are still readable by the caller
+        content = response.content
+        elapsed_seconds = time.perf_counter() - start_time
+        request_body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        if request_body and request.headers.get('Content-Encoding') == 'gzip':
+            # Compressed bodies are recorded decoded, so their secrets are redacted like any other body
+            request_body = gzip.decompress(request_body)
+        method, route = ArkHTTPCassette.interaction_key(request.method, request.url)
+        if REDACTED_RESPONSE_ROUTE_PATTERN.search(urlparse(request.url).path):
+            response_body, response_body_encoding = REDACTED_VALUE, 'utf-8'
+        else:
+            response_body, response_body_encoding = ArkHTTPCassette.redact_body(content, response.headers.get('Content-Type', ''))
+        request_body_text, request_body_encoding = ArkHTTPCassette.redact_body(
+            request_body if isinstance(request_body, bytes) else None, request.headers.get('Content-Type', '')
+        )
+        interaction = {
+            'method': method,
+            'route': route,
+            'request_headers': ArkHTTPCassette.redact_headers(request.headers),
+            'request_body': request_body_text,
+            'request_body_encoding': request_body_encoding,
+            'status': response.status_code,
+            'reason': response.reason,
+            'response_headers': ArkHTTPCassette.redact_headers(response.headers),
+            'response_body': response_body,
+            'response_body_encoding': response_body_encoding,
+            'elapsed_seconds': round(elapsed_seconds, 6),
+        }
+        with ArkCassetteRecordingAdapter.__WRITE_LOCK:
+            with open(self.__cassette_path, 'a', encoding='utf-8') as cassette_file:
+                cassette_file.write(json.dumps(interaction) + '\n')
+        self.__logger.debug('Recorded %s %s [%s] to cassette', method, route, response.status_code)
+        return response
+
+
+class ArkCassetteReplayAdapter(HTTPAdapter):
+    def __init__(self, cassette_path: str, speed: float = 0.0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.__speed = speed
+        self.__lock = threading.Lock()
+        self.__interactions: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        self.__positions: Dict[Tuple[str, str], int] = defaultdict(int)
+        for interaction in ArkHTTPCassette.load(cassette_path):
+            self.__interactions[(interaction['method'], interaction['route'])].append(interaction)
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Answers the request with the recorded response of the same method, path and query, without any network access.
+        Repeated requests get the recorded responses in order, starting over once all of them were replayed.
+        With a speed, the recorded latency is waited for, divided by the speed, so 1 replays in real time and 0 does not wait.
+
+        Args:
+            request (PreparedRequest): _description_
+            stream (bool, optional): _description_. Defaults to False.
+            timeout (Union[None, float, Tuple[Optional[float], Optional[float]]], optional): _description_. Defaults to None.
+            verify (Union[bool, str], optional): _description_. Defaults to True.
+            cert (Optional[Union[str, Tuple[str, str]]], optional): _description_. Defaults to None.
+            proxies (Optional[Dict[str, str]], optional): _description_. Defaults to None.
+
+        Raises:
+            ArkException: _description_
+
+        Returns:
+            Response: _description_
+        """
+        from ark_sdk_python.models import ArkException
+
+        key = ArkHTTPCassette.interaction_key(request.method, request.url)
+        with self.__lock:
+            interactions = self.__interactions.get(key)
+            if not interactions:
+                raise ArkException(f'No recorded response in the cassette for [{key[0]} {key[1]}]')
+            interaction = interactions[self.__positions[key] % len(interactions)]
+            self.__positions[key] += 1
+        if self.__speed > 0:
+            time.sleep(interaction['elapsed_seconds'] / self.__speed)
+        body = interaction['response_body'] or ''
+        content = base64.b64decode(body) if interaction['response_body_encoding'] == 'base64' else body.encode('utf-8')
+        response = Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction['response_headers'])
+        response.headers['Content-Length'] = str(len(content))
+        response.raw = io.BytesIO(content)
+        response._content = content  # pylint: disable=protected-access
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
@@ -0,0 +1,151 @@
+import gzip
+import json
+import threading
+from fnmatch import fnmatchcase
+from http import HTTPStatus
+from typing import Any, Dict, Final, List, Optional, Set
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+DEFAULT_REQUEST_COMPRESSION_MIN_BYTES: Final[int] = 16 * 1024
+DEFAULT_REQUEST_COMPRESSION_LEVEL: Final[int] = 6
+# `<METHOD> <route template>` patterns of the bulk endpoints, whose bodies may be megabytes of JSON or base64 zips
+DEFAULT_COMPRESSED_REQUEST_ROUTES: Final[List[str]] = [
+    'POST */platforms/import',
+    'POST */api/targetsets/bulk',
+    'DELETE */api/targetsets/bulk',
+    'POST */api/pool-service/pools/*/identifiers-bulk',
+    'DELETE */api/pool-service/pools/*/identifiers-bulk',
+]
+GZIP_CONTENT_ENCODING: Final[str] = 'gzip'
+# Words a 400 response body mentions when the server could not decode a compressed request body
+REFUSED_ENCODING_HINTS: Final[List[str]] = ['content-encoding', 'content encoding', 'gzip', 'compress']
+
+
+class ArkHTTPCompression:
+    def __init__(
+        self,
+        routes: Optional[List[str]] = None,
+        min_bytes: int = DEFAULT_REQUEST_COMPRESSION_MIN_BYTES,
+        level: int = DEFAULT_REQUEST_COMPRESSION_LEVEL,
+    ) -> None:
+        self.__routes = list(DEFAULT_COMPRESSED_REQUEST_ROUTES if routes is None else routes)
+        self.__min_bytes = min_bytes
+        self.__level = level
+        self.__route_matches: Dict[str, bool] = {}
+        self.__refused_routes: Set[str] = set()
+        self.__lock = threading.Lock()
+        self.__compressed_count = 0
+        self.__saved_bytes = 0
+        self.__logger = get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def accept_encoding() -> str:
+        """
+        Returns the content encodings responses may be compressed with, which are the ones urllib3 can decode here,
+        so brotli and zstd are asked for only when their packages are installed.
+
+        Returns:
+            str: _description_
+        """
+        return ', '.join(encoding.strip() for encoding in ACCEPT_ENCODING.split(','))
+
+    @property
+    def routes(self) -> List[str]:
+        return list(self.__routes)
+
+    @property
+    def compressed_count(self) -> int:
+        return self.__compressed_count
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.__saved_bytes
+
+    def is_compressing(self, method: str, route_template: str) -> bool:
+        """
+        Returns whether request bodies of the route are compressed, which is when a pattern matches it and the server did not refuse them.
+
+        Args:
+            method (str): _description_
+            route_template (str): _description_
+
+        Returns:
+            bool: _description_
+        """
+        route = f'{method.upper()} {route_template}'
+        if route in self.__refused_routes:
+            return False
+        if route not in self.__route_matches:
+            self.__route_matches[route] = any(fnmatchcase(route, pattern) for pattern in self.__routes)
+        return self.__route_matches[route]
+
+    @staticmethod
+    def is_refusal(response: Response) -> bool:
+        """
+        Returns whether the response rejects the compressed body of its request, which is a 415, or a 400 mentioning the content encoding.
+        Any other 400 rejects what the body holds, which sending it again uncompressed would not change.
+
+        Args:
+            response (Response): _description_
+
+        Returns:
+            bool: _description_
+        """
+        if response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE:
+            return True
+        if response.status_code != HTTPStatus.BAD_REQUEST:
+            return False
+        response_text = response.text.lower()
+        return any(hint in response_text for hint in REFUSED_ENCODING_HINTS)
+
+    def refuse(self, method: str, route_template: str) -> None:
+        """
+        Stops compressing request bodies of the route, once its server rejected a compressed one.
+
+        Args:
+            method (str): _description_
+            route_template (str): _description_
+        """
+        self.__logger.info('Server of %s %s does not accept compressed requests, sending them uncompressed', method.upper(), route_template)
+        with self.__lock:
+            self.__refused_routes.add(f'{method.upper()} {route_template}')
+
+    def compress(self, method: str, route_template: str, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the request keyword arguments with their body gzipped, or None when the body is not to be compressed.
+        Only JSON and raw bodies of at least the minimal size are compressed, as smaller ones gain less than gzip costs.
+
+        Args:
+            method (str): _description_
+            route_template (str): _description_
+            kwargs (Dict[str, Any]): The keyword arguments of the request, as requests accepts them
+
+        Returns:
+            Optional[Dict[str, Any]]: _description_
+        """
+        if kwargs.get('files') or not self.is_compressing(method, route_template):
+            return None
+        headers = CaseInsensitiveDict(kwargs.get('headers') or {})
+        if kwargs.get('json') is not None:
+            # Serialized the same way requests does, with the content type it would set
+            body = json.dumps(kwargs['json'], allow_nan=False).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        elif isinstance(kwargs.get('data'), (str, bytes)):
+            body = kwargs['data'].encode('utf-8') if isinstance(kwargs['data'], str) else kwargs['data']
+        else:
+            return None
+        if len(body) < self.__min_bytes:
+            return None
+        compressed_body = gzip.compress(body, compresslevel=self.__level)
+        headers['Content-Encoding'] = GZIP_CONTENT_ENCODING
+        with self.__lock:
+            self.__compressed_count += 1
+            self.__saved_bytes += len(body) - len(compressed_body)
+        compressed_kwargs = {name: value for name, value in kwargs.items() if name != 'json'}
+        compressed_kwargs.update(data=compressed_body, headers=headers)
+        return compressed_kwargs
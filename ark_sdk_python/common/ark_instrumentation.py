@@ -0,0 +1,388 @@
+import bisect
+import threading
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+MetricLabels = Tuple[Tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS: Final[Tuple[float, ...]] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_VALIDATION_BUCKETS: Final[Tuple[float, ...]] = (0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class ArkInstrumentation:
+    def on_request_start(self, service: Optional[str], method: str, route: str) -> None:
+        """
+        Called before an HTTP request is sent.
+
+        Args:
+            service (Optional[str]): The service of the client, when known
+            method (str): _description_
+            route (str): The route template, with resource ids replaced by `{id}`
+        """
+
+    def on_request_end(
+        self,
+        service: Optional[str],
+        method: str,
+        route: str,
+        status: Optional[int],
+        latency_seconds: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Called after an HTTP request returned, or failed without a response, in which case the status is None.
+
+        Args:
+            service (Optional[str]): _description_
+            method (str): _description_
+            route (str): _description_
+            status (Optional[int]): _description_
+            latency_seconds (float): _description_
+            error (Optional[BaseException], optional): _description_. Defaults to None.
+        """
+
+    def on_refresh(self, service: Optional[str], route: str) -> None:
+        """
+        Called when an unauthorized response makes the client refresh its authentication.
+
+        Args:
+            service (Optional[str]): _description_
+            route (str): _description_
+        """
+
+    def on_retry(self, operation: str, attempt: int, error: Optional[BaseException] = None) -> None:
+        """
+        Called before an operation is retried, either a request after a refresh, or a call retried by `ArkRetry`.
+
+        Args:
+            operation (str): _description_
+            attempt (int): The number of the attempt which is about to run, starting from 1 for the first retry
+            error (Optional[BaseException], optional): _description_. Defaults to None.
+        """
+
+    def on_page(self, item_type: str, items_count: int) -> None:
+        """
+        Called when a page of a paginated result is created.
+
+        Args:
+            item_type (str): _description_
+            items_count (int): _description_
+        """
+
+    def on_validation(self, model: str, seconds: float) -> None:
+        """
+        Called after a model was validated with `model_validate` or `model_validate_json`.
+
+        Args:
+            model (str): _description_
+            seconds (float): _description_
+        """
+
+
+class ArkInstrumentations:
+    # Replaced rather than mutated, so emitting never needs the lock
+    __REGISTERED: Tuple[ArkInstrumentation, ...] = ()
+    __REGISTERED_LOCK: Final[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def register(instrumentation: ArkInstrumentation) -> None:
+        """
+        Registers an instrumentation for the events of all the clients, pages and models in the process.
+
+        Args:
+            instrumentation (ArkInstrumentation): _description_
+        """
+        with ArkInstrumentations.__REGISTERED_LOCK:
+            if instrumentation not in ArkInstrumentations.__REGISTERED:
+                ArkInstrumentations.__REGISTERED = ArkInstrumentations.__REGISTERED + (instrumentation,)
+
+    @staticmethod
+    def unregister(instrumentation: ArkInstrumentation) -> None:
+        """
+        Unregisters a globally registered instrumentation.
+
+        Args:
+            instrumentation (ArkInstrumentation): _description_
+        """
+        with ArkInstrumentations.__REGISTERED_LOCK:
+            ArkInstrumentations.__REGISTERED = tuple(i for i in ArkInstrumentations.__REGISTERED if i is not instrumentation)
+
+    @staticmethod
+    def registered() -> Tuple[ArkInstrumentation, ...]:
+        """
+        Returns the globally registered instrumentations.
+
+        Returns:
+            Tuple[ArkInstrumentation, ...]: _description_
+        """
+        return ArkInstrumentations.__REGISTERED
+
+    @staticmethod
+    def active(local_instrumentations: Sequence[ArkInstrumentation] = ()) -> Sequence[ArkInstrumentation]:
+        """
+        Returns the given local instrumentations, such as those of a client, followed by the globally registered ones.
+
+        Args:
+            local_instrumentations (Sequence[ArkInstrumentation], optional): _description_. Defaults to ().
+
+        Returns:
+            Sequence[ArkInstrumentation]: _description_
+        """
+        if not local_instrumentations:
+            return ArkInstrumentations.__REGISTERED
+        return tuple(local_instrumentations) + ArkInstrumentations.__REGISTERED
+
+    @staticmethod
+    def emit(instrumentations: Sequence[ArkInstrumentation], event: str, *args: Any) -> None:
+        """
+        Calls the event callback of each of the instrumentations.
+        A failing instrumentation is logged and skipped, so it never fails the instrumented operation.
+
+        Args:
+            instrumentations (Sequence[ArkInstrumentation]): _description_
+            event (str): The callback name, such as `on_request_end`
+        """
+        for instrumentation in instrumentations:
+            try:
+                getattr(instrumentation, event)(*args)
+            except Exception as ex:
+                get_logger(ArkInstrumentations.__name__).warning('Instrumentation [%s] failed on [%s] [%s]', instrumentation, event, ex)
+
+
+class ArkHistogram:
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        bucket_counts: Optional[Sequence[int]] = None,
+        count: int = 0,
+        sum: float = 0.0,  # pylint: disable=redefined-builtin
+    ) -> None:
+        self.__buckets = tuple(sorted(buckets))
+        # Counts given are of the sorted buckets, followed by the count of the `+Inf` one
+        self.__bucket_counts = list(bucket_counts) if bucket_counts is not None else [0] * (len(self.__buckets) + 1)
+        self.__count = count
+        self.__sum = sum
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        return self.__buckets
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def sum(self) -> float:
+        return self.__sum
+
+    def copy(self) -> 'ArkHistogram':
+        """
+        Returns a copy of the histogram, which is not changed by later observations.
+
+        Returns:
+            ArkHistogram: _description_
+        """
+        return ArkHistogram(self.__buckets, self.__bucket_counts, self.__count, self.__sum)
+
+    def observe(self, value: float) -> None:
+        """
+        Adds a value to the bucket of the smallest upper bound which is greater than or equal to it.
+
+        Args:
+            value (float): _description_
+        """
+        self.__bucket_counts[bisect.bisect_left(self.__buckets, value)] += 1
+        self.__count += 1
+        self.__sum += value
+
+    def cumulative_counts(self) -> List[int]:
+        """
+        Returns the number of values less than or equal to each bucket upper bound, ending with the total count for `+Inf`.
+
+        Returns:
+            List[int]: _description_
+        """
+        counts, total = [], 0
+        for bucket_count in self.__bucket_counts:
+            total += bucket_count
+            counts.append(total)
+        return counts
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the quantile by linear interpolation within its bucket, the same as Prometheus `histogram_quantile`.
+        Values in the `+Inf` bucket are estimated as the largest bucket upper bound.
+
+        Args:
+            q (float): The quantile, between 0 and 1
+
+        Returns:
+            Optional[float]: The estimate, or None when nothing was observed
+        """
+        if not self.__count:
+            return None
+        rank = q * self.__count
+        previous_bound, previous_count = 0.0, 0
+        for bound, count in zip(self.__buckets, self.cumulative_counts()):
+            if count >= rank:
+                bucket_count = count - previous_count
+                if not bucket_count:
+                    return bound
+                return previous_bound + (bound - previous_bound) * (rank - previous_count) / bucket_count
+            previous_bound, previous_count = bound, count
+        return self.__buckets[-1]
+
+
+class ArkMetricsCollector(ArkInstrumentation):
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        validation_buckets: Sequence[float] = DEFAULT_VALIDATION_BUCKETS,
+    ) -> None:
+        self.__latency_buckets = latency_buckets
+        self.__validation_buckets = validation_buckets
+        self.__histograms: Dict[str, Dict[MetricLabels, ArkHistogram]] = {}
+        self.__counters: Dict[str, Dict[MetricLabels, float]] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __labels(**labels: Optional[object]) -> MetricLabels:
+        return tuple((name, '' if value is None else str(value)) for name, value in labels.items())
+
+    def __observe(self, name: str, buckets: Sequence[float], value: float, **labels: Optional[object]) -> None:
+        key = self.__labels(**labels)
+        with self.__lock:
+            metric = self.__histograms.setdefault(name, {})
+            if key not in metric:
+                metric[key] = ArkHistogram(buckets)
+            metric[key].observe(value)
+
+    def __increment(self, name: str, amount: float = 1, **labels: Optional[object]) -> None:
+        key = self.__labels(**labels)
+        with self.__lock:
+            metric = self.__counters.setdefault(name, {})
+            metric[key] = metric.get(key, 0) + amount
+
+    def on_request_end(
+        self,
+        service: Optional[str],
+        method: str,
+        route: str,
+        status: Optional[int],
+        latency_seconds: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.__observe(
+            'ark_http_request_duration_seconds', self.__latency_buckets, latency_seconds, service=service, method=method, route=route
+        )
+        self.__increment('ark_http_requests_total', service=service, method=method, route=route, status=status if status else 'error')
+
+    def on_refresh(self, service: Optional[str], route: str) -> None:
+        self.__increment('ark_http_refreshes_total', service=service, route=route)
+
+    def on_retry(self, operation: str, attempt: int, error: Optional[BaseException] = None) -> None:
+        self.__increment('ark_retries_total', operation=operation)
+
+    def on_page(self, item_type: str, items_count: int) -> None:
+        self.__increment('ark_pages_total', item_type=item_type)
+        self.__increment('ark_page_items_total', items_count, item_type=item_type)
+
+    def on_validation(self, model: str, seconds: float) -> None:
+        self.__observe('ark_model_validation_duration_seconds', self.__validation_buckets, seconds, model=model)
+
+    def histogram(self, name: str, **labels: Optional[object]) -> Optional[ArkHistogram]:
+        """
+        Returns the histogram of the metric with the given labels, for example
+        `histogram('ark_http_request_duration_seconds', service='pcloud', method='GET', route='/api/accounts')`.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            Optional[ArkHistogram]: _description_
+        """
+        with self.__lock:
+            return self.__histograms.get(name, {}).get(self.__labels(**labels))
+
+    def counter(self, name: str, **labels: Optional[object]) -> float:
+        """
+        Returns the value of the counter with the given labels.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            float: _description_
+        """
+        with self.__lock:
+            return self.__counters.get(name, {}).get(self.__labels(**labels), 0)
+
+    def reset(self) -> None:
+        """
+        Clears all the collected metrics.
+        """
+        with self.__lock:
+            self.__histograms.clear()
+            self.__counters.clear()
+
+    def snapshot(self) -> Tuple[Dict[str, Dict[MetricLabels, ArkHistogram]], Dict[str, Dict[MetricLabels, float]]]:
+        """
+        Returns a copy of the collected histograms and counters, keyed by metric name and then by labels.
+
+        Returns:
+            Tuple[Dict[str, Dict[MetricLabels, ArkHistogram]], Dict[str, Dict[MetricLabels, float]]]: _description_
+        """
+        with self.__lock:
+            histograms = {name: {labels: h.copy() for labels, h in metric.items()} for name, metric in self.__histograms.items()}
+            counters = {name: dict(metric) for name, metric in self.__counters.items()}
+        return histograms, counters
+
+    def to_prometheus_text(self) -> str:
+        """
+        Returns the collected metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: _description_
+        """
+        return prometheus_text(self)
+
+
+def _prometheus_labels(labels: MetricLabels, extra_label: Optional[Tuple[str, str]] = None) -> str:
+    labels = labels + (extra_label,) if extra_label else labels
+    if not labels:
+        return ''
+    escaped = [(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for name, value in labels]
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _prometheus_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def prometheus_text(collector: ArkMetricsCollector) -> str:
+    """
+    Renders the metrics of the collector in the Prometheus text exposition format (version 0.0.4),
+    to serve from a metrics endpoint or to write for the node exporter textfile collector.
+
+    Args:
+        collector (ArkMetricsCollector): _description_
+
+    Returns:
+        str: _description_
+    """
+    histograms, counters = collector.snapshot()
+    lines: List[str] = []
+    for name in sorted(counters):
+        lines.append(f'# TYPE {name} counter')
+        for labels, value in sorted(counters[name].items()):
+            lines.append(f'{name}{_prometheus_labels(labels)} {_prometheus_number(value)}')
+    for name in sorted(histograms):
+        lines.append(f'# TYPE {name} histogram')
+        for labels, histogram in sorted(histograms[name].items()):
+            bounds = [_prometheus_number(b) for b in histogram.buckets] + ['+Inf']
+            for bound, count in zip(bounds, histogram.cumulative_counts()):
+                lines.append(f'{name}_bucket{_prometheus_labels(labels, ("le", bound))} {count}')
+            lines.append(f'{name}_sum{_prometheus_labels(labels)} {_prometheus_number(histogram.sum)}')
+            lines.append(f'{name}_count{_prometheus_labels(labels)} {histogram.count}')
+    return '\n'.join(lines) + '\n' if lines else ''
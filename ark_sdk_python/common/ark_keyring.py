@@ -173,16 +173,16 @@ class ArkKeyring:
             enforce_basic_keyring (bool): _description_
         """
         try:
-            self.__logger.info(f'Trying to save token [{self.__service_name}-{postfix}] of profile [{profile.profile_name}]')
+            self.__logger.info('Trying to save token [%s-%s] of profile [%s]', self.__service_name, postfix, profile.profile_name)
             kr = self.get_keyring(enforce_basic_keyring)
             kr.set_password(f'{self.__service_name}-{postfix}', profile.profile_name, token.model_dump_json())
             self.__logger.info('Saved token successfully')
         except Exception as ex:
             # Last resort fallback to basic keyring
             if not isinstance(kr, BasicKeyring) or not enforce_basic_keyring:
-                self.__logger.warning(f'Falling back to basic keyring as we failed to save token with keyring [{str(kr)}]')
+                self.__logger.warning('Falling back to basic keyring as we failed to save token with keyring [%s]', kr)
                 return self.save_token(profile, token, postfix, True)
-            self.__logger.warning(f'Failed to save token [{str(ex)}]')
+            self.__logger.warning('Failed to save token [%s]', ex)
 
     def load_token(self, profile: ArkProfile, postfix: str, enforce_basic_keyring: bool = False) -> Optional[ArkToken]:
         """
@@ -201,7 +201,7 @@ class ArkKeyring:
         """
         try:
             kr = self.get_keyring(enforce_basic_keyring)
-            self.__logger.info(f'Trying to load token [{self.__service_name}-{postfix}] of profile [{profile.profile_name}]')
+            self.__logger.info('Trying to load token [%s-%s] of profile [%s]', self.__service_name, postfix, profile.profile_name)
             token_val = kr.get_password(f'{self.__service_name}-{postfix}', profile.profile_name)
             if not token_val:
                 self.__logger.info('No token found')
@@ -228,11 +228,39 @@ class ArkKeyring:
         except Exception as ex:
             # Last resort fallback to basic keyring
             if not isinstance(kr, BasicKeyring) or not enforce_basic_keyring:
-                self.__logger.warning(f'Falling back to basic keyring as we failed to load token with keyring [{str(kr)}]')
+                self.__logger.warning('Falling back to basic keyring as we failed to load token with keyring [%s]', kr)
                 return self.load_token(profile, postfix, True)
-            self.__logger.warning(f'Failed to load cached token [{str(ex)}]')
+            self.__logger.warning('Failed to load cached token [%s]', ex)
             try:
                 kr.delete_password(f'{self.__service_name}-{postfix}', profile.profile_name)
             except Exception as ex_deletion:
-                self.__logger.warning(f'Failed to delete failed loaded cached token [{str(ex_deletion)}]')
+                self.__logger.warning('Failed to delete failed loaded cached token [%s]', ex_deletion)
+            return None
+
+    def secret_key(self, postfix: str, enforce_basic_keyring: bool = False) -> Optional[bytes]:
+        """
+        Loads a random 256 bit key from the keyring, creating it on first use.
+        Used to encrypt data kept outside the keyring, such as cached responses, with key material only the keyring holds.
+
+        Args:
+            postfix (str): _description_
+            enforce_basic_keyring (bool): _description_
+
+        Returns:
+            Optional[bytes]: The key, or None when the keyring cannot keep one
+        """
+        kr = None
+        try:
+            kr = self.get_keyring(enforce_basic_keyring)
+            key_val = kr.get_password(f'{self.__service_name}-{postfix}', 'key')
+            if not key_val:
+                key_val = base64.b64encode(os.urandom(BLOCK_SIZE)).decode('utf-8')
+                kr.set_password(f'{self.__service_name}-{postfix}', 'key', key_val)
+            return base64.b64decode(key_val)
+        except Exception as ex:
+            # Last resort fallback to basic keyring
+            if not isinstance(kr, BasicKeyring) or not enforce_basic_keyring:
+                self.__logger.warning('Falling back to basic keyring as we failed to load secret key with keyring [%s]', kr)
+                return self.secret_key(postfix, True)
+            self.__logger.warning('Failed to load secret key [%s]', ex)
             return None
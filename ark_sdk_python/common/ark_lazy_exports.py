@@ -0,0 +1,30 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package_name: str, exports: Dict[str, List[str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Creates the module level `__getattr__` and `__dir__` (PEP 562) of a package, so its exports are only imported on first access.
+    The exports map each module to the names it exports, and an accessed name is stored on the package so it is only resolved once.
+
+    Args:
+        package_name (str): _description_
+        exports (Dict[str, List[str]]): _description_
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: _description_
+    """
+    export_modules = {name: module_name for module_name, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        if name not in export_modules:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(export_modules[name]), name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(export_modules))
+
+    return __getattr__, __dir__
@@ -1,12 +1,40 @@
+import json
 import logging
 import os
 import sys
-from typing import Final, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Final, List, Optional
 
 LOGGER_STYLE: Final[str] = 'LOGGER_STYLE'
 LOG_LEVEL: Final[str] = 'LOG_LEVEL'
 
 LOGGER_STYLE_DEFAULT: Final[str] = 'default'
+LOGGER_STYLE_JSON: Final[str] = 'json'
+SUPPORTED_LOGGER_STYLES: Final[List[str]] = [LOGGER_STYLE_DEFAULT, LOGGER_STYLE_JSON]
+LOG_RECORD_ATTRIBUTES: Final[frozenset] = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+class ArkJsonLogFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats the record as a single JSON line, with the fields given as `extra` to the log call at the top level.
+
+        Args:
+            record (logging.LogRecord): _description_
+
+        Returns:
+            str: _description_
+        """
+        log_record: Dict[str, Any] = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        log_record.update({key: value for key, value in vars(record).items() if key not in LOG_RECORD_ATTRIBUTES})
+        if record.exc_info:
+            log_record['exception'] = self.formatException(record.exc_info)
+        return json.dumps(log_record, default=str)
 
 
 class ArkLogger(logging.Logger):
@@ -22,56 +50,86 @@ class ArkLogger(logging.Logger):
     def verbose(self, value: bool):
         self.__verbose = value
 
-    def notice(self, msg, *args, **kwargs):
-        from colorama import Fore, Style
+    def __is_logging(self, level: int) -> bool:
+        # Checked before the colors are imported and the message is built, so disabled levels cost no formatting
+        return self.__verbose and self.isEnabledFor(level)
 
-        if not self.__verbose:
+    @staticmethod
+    def __is_coloring() -> bool:
+        # Structured records are parsed by log pipelines, so their messages are kept free of color codes
+        return os.getenv(LOGGER_STYLE, LOGGER_STYLE_DEFAULT) != LOGGER_STYLE_JSON
+
+    def notice(self, msg, *args, **kwargs):
+        if not self.__is_logging(logging.INFO):
             return
-        color_msg = f"{Fore.GREEN}{Style.BRIGHT}" f"{msg}{Style.RESET_ALL}{Fore.RESET}"
-        return super().info(f"{color_msg}", *args, **kwargs)
+        if self.__is_coloring():
+            from colorama import Fore, Style
 
-    def info(self, msg, *args, **kwargs):
-        from colorama import Fore
+            msg = f"{Fore.GREEN}{Style.BRIGHT}" f"{msg}{Style.RESET_ALL}{Fore.RESET}"
+        return super().info(msg, *args, **kwargs)
 
-        if not self.__verbose:
+    def info(self, msg, *args, **kwargs):
+        if not self.__is_logging(logging.INFO):
             return
-        color_msg = f"{Fore.GREEN}" f"{msg}{Fore.RESET}"
-        return super().info(f"{color_msg}", *args, **kwargs)
+        if self.__is_coloring():
+            from colorama import Fore
 
-    def warning(self, msg, *args, **kwargs):
-        from colorama import Fore
+            msg = f"{Fore.GREEN}" f"{msg}{Fore.RESET}"
+        return super().info(msg, *args, **kwargs)
 
-        if not self.__verbose:
+    def warning(self, msg, *args, **kwargs):
+        if not self.__is_logging(logging.WARNING):
             return
-        color_msg = f"{Fore.YELLOW}" f"{msg}{Fore.RESET}"
-        return super().warning(f"{color_msg}", *args, **kwargs)
+        if self.__is_coloring():
+            from colorama import Fore
 
-    def error(self, msg, *args, **kwargs):
-        from colorama import Fore
+            msg = f"{Fore.YELLOW}" f"{msg}{Fore.RESET}"
+        return super().warning(msg, *args, **kwargs)
 
-        if not self.__verbose:
+    def error(self, msg, *args, **kwargs):
+        if not self.__is_logging(logging.ERROR):
             return
-        color_msg = f"{Fore.RED}" f"{msg}{Fore.RESET}"
-        return super().error(f"{color_msg}", *args, **kwargs)
+        if self.__is_coloring():
+            from colorama import Fore
 
-    def fatal(self, msg, *args, **kwargs):
-        from colorama import Fore, Style
+            msg = f"{Fore.RED}" f"{msg}{Fore.RESET}"
+        return super().error(msg, *args, **kwargs)
 
+    def fatal(self, msg, *args, **kwargs):
         if not self.__verbose:
             return
-        color_msg = f"{Fore.RED}{Style.BRIGHT}" f"{msg}{Style.RESET_ALL}{Fore.RESET}"
-        super().fatal(f"{color_msg}", *args, **kwargs)
+        if self.isEnabledFor(logging.CRITICAL):
+            if self.__is_coloring():
+                from colorama import Fore, Style
+
+                msg = f"{Fore.RED}{Style.BRIGHT}" f"{msg}{Style.RESET_ALL}{Fore.RESET}"
+            super().fatal(msg, *args, **kwargs)
         sys.exit(-1)
 
 
+def _is_json_configured() -> bool:
+    root_handlers = logging.getLogger().handlers
+    return bool(root_handlers) and all(isinstance(h.formatter, ArkJsonLogFormatter) for h in root_handlers)
+
+
 def get_logger(app: Optional[str] = None, log_level: Optional[int] = None):
     if not log_level:
         log_level = logging.getLevelName(os.getenv(LOG_LEVEL, 'CRITICAL'))
     logger_style = os.getenv(LOGGER_STYLE, 'default')
+    if logger_style == LOGGER_STYLE_JSON:
+        logging.setLoggerClass(ArkLogger)
+        if not _is_json_configured():
+            # The root handlers are replaced once, when switching from the default style
+            handler = logging.StreamHandler()
+            handler.setFormatter(ArkJsonLogFormatter())
+            logging.basicConfig(handlers=[handler], level=log_level, force=True)
+        logger = logging.getLogger(app)
+        logger.setLevel(log_level)
+        return logger
     if logger_style == 'default':
         log_format = '%(levelname)-8s | %(asctime)s | %(message)s'
         logging.setLoggerClass(ArkLogger)
-        logging.basicConfig(format=format(log_format), datefmt="%H:%M:%S %d/%m/%Y", level=log_level)
+        logging.basicConfig(format=format(log_format), datefmt="%H:%M:%S %d/%m/%Y", level=log_level, force=_is_json_configured())
         logger = logging.getLogger(app)
         logger.setLevel(log_level)
         return logger
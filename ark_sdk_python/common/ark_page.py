@@ -1,11 +1,16 @@
 from typing import Generic, List, TypeVar
 
+from ark_sdk_python.common.ark_instrumentation import ArkInstrumentations
+
 PageItem = TypeVar('PageItem')
 
 
 class ArkPage(Generic[PageItem]):
     def __init__(self, items: List[PageItem]) -> None:
         self.__items = items
+        instrumentations = ArkInstrumentations.registered()
+        if instrumentations:
+            ArkInstrumentations.emit(instrumentations, 'on_page', type(items[0]).__name__ if items else '', len(items))
 
     @property
     def items(self) -> List[PageItem]:
@@ -0,0 +1,206 @@
+import contextlib
+import contextvars
+import functools
+import io
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Final, Iterator, List, Optional
+
+ARK_PROFILE_RUN_ENV_VAR: Final[str] = 'ARK_PROFILE_RUN'
+PHASE_PARSER_BUILD: Final[str] = 'parser build'
+PHASE_AUTH_LOAD: Final[str] = 'auth load'
+PHASE_SERVICE_INIT: Final[str] = 'service init'
+PHASE_NETWORK: Final[str] = 'network'
+PHASE_SERIALIZATION: Final[str] = 'serialization'
+PHASES: Final[List[str]] = [PHASE_PARSER_BUILD, PHASE_AUTH_LOAD, PHASE_SERVICE_INIT, PHASE_NETWORK, PHASE_SERIALIZATION]
+DEFAULT_HOT_FUNCTIONS_COUNT: Final[int] = 40
+DEFAULT_ALLOCATION_SITES_COUNT: Final[int] = 15
+
+
+class ArkProfiler:
+    __RUNNING: bool = False
+    __PROFILER: Optional[Any] = None
+    __STARTED_TRACEMALLOC: bool = False
+    __START_TIME: float = 0.0
+    __PHASE_SECONDS: Dict[str, float] = {}
+    __PHASE_CALLS: Dict[str, int] = {}
+    __PHASES_LOCK: Final[threading.Lock] = threading.Lock()
+    # The open phase of the context, as its name and the time it was last resumed at
+    __CURRENT_PHASE: Final[contextvars.ContextVar] = contextvars.ContextVar('ark_current_phase', default=None)
+
+    @staticmethod
+    def start() -> bool:
+        """
+        Starts profiling the calling thread with cProfile, tracing the python memory allocations with tracemalloc,
+        and timing the phases of the run.
+        Does nothing when already profiling.
+
+        Returns:
+            bool: Whether profiling was started by this call
+        """
+        if ArkProfiler.__RUNNING:
+            return False
+        import cProfile
+        import tracemalloc
+
+        ArkProfiler.__PHASE_SECONDS = {}
+        ArkProfiler.__PHASE_CALLS = {}
+        ArkProfiler.__STARTED_TRACEMALLOC = not tracemalloc.is_tracing()
+        if ArkProfiler.__STARTED_TRACEMALLOC:
+            tracemalloc.start()
+        ArkProfiler.__PROFILER = cProfile.Profile()
+        ArkProfiler.__START_TIME = time.perf_counter()
+        ArkProfiler.__RUNNING = True
+        ArkProfiler.__PROFILER.enable()
+        return True
+
+    @staticmethod
+    def is_running() -> bool:
+        return ArkProfiler.__RUNNING
+
+    @staticmethod
+    def stop(report_path: Optional[str] = None) -> str:
+        """
+        Stops profiling, and returns the report of the run, which is also written to the given path if any.
+        The report has the wall time of each phase, the peak memory with its top allocation sites, and the hot functions.
+
+        Args:
+            report_path (Optional[str], optional): _description_. Defaults to None.
+
+        Raises:
+            ArkException: _description_
+
+        Returns:
+            str: _description_
+        """
+        import tracemalloc
+
+        from ark_sdk_python.models import ArkException
+
+        if not ArkProfiler.__RUNNING:
+            raise ArkException('Profiling was not started')
+        ArkProfiler.__PROFILER.disable()
+        ArkProfiler.__RUNNING = False
+        total_seconds = time.perf_counter() - ArkProfiler.__START_TIME
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        if ArkProfiler.__STARTED_TRACEMALLOC:
+            tracemalloc.stop()
+        report = ArkProfiler.__report(total_seconds, peak_bytes, snapshot)
+        ArkProfiler.__PROFILER = None
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as report_file:
+                report_file.write(report)
+        return report
+
+    @staticmethod
+    def phase_seconds() -> Dict[str, float]:
+        """
+        Returns the wall seconds spent in each phase so far, excluding the nested phases.
+
+        Returns:
+            Dict[str, float]: _description_
+        """
+        with ArkProfiler.__PHASES_LOCK:
+            return dict(ArkProfiler.__PHASE_SECONDS)
+
+    @staticmethod
+    def phase(name: str) -> ContextManager[None]:
+        """
+        Times the block as part of the given phase while profiling, and does nothing otherwise.
+        Phases are exclusive, a phase nested in another one pauses it, so network time within a service init is network time only.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            ContextManager[None]: _description_
+        """
+        if not ArkProfiler.__RUNNING:
+            return contextlib.nullcontext()
+        return ArkProfiler.__phase(name)
+
+    @staticmethod
+    def phased(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorates a function to be timed as part of the given phase while profiling.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            Callable[[Callable[..., Any]], Callable[..., Any]]: _description_
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not ArkProfiler.__RUNNING:
+                    return func(*args, **kwargs)
+                with ArkProfiler.__phase(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    @contextlib.contextmanager
+    def __phase(name: str) -> Iterator[None]:
+        parent = ArkProfiler.__CURRENT_PHASE.get()
+        now = time.perf_counter()
+        if parent:
+            ArkProfiler.__add_phase_seconds(parent[0], now - parent[1], 0)
+        current = [name, now]
+        token = ArkProfiler.__CURRENT_PHASE.set(current)
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            ArkProfiler.__add_phase_seconds(name, now - current[1], 1)
+            ArkProfiler.__CURRENT_PHASE.reset(token)
+            if parent:
+                parent[1] = now
+
+    @staticmethod
+    def __add_phase_seconds(name: str, seconds: float, calls: int) -> None:
+        with ArkProfiler.__PHASES_LOCK:
+            ArkProfiler.__PHASE_SECONDS[name] = ArkProfiler.__PHASE_SECONDS.get(name, 0.0) + seconds
+            ArkProfiler.__PHASE_CALLS[name] = ArkProfiler.__PHASE_CALLS.get(name, 0) + calls
+
+    @staticmethod
+    def __report(total_seconds: float, peak_bytes: int, snapshot: Optional[Any]) -> str:
+        import pstats
+
+        report = io.StringIO()
+        report.write('Ark profile report\n')
+        report.write(f'Command: {" ".join(sys.argv)}\n')
+        report.write(f'Process: {os.getpid()}\n')
+        report.write(f'Total wall seconds: {total_seconds:.6f}\n\n')
+
+        report.write('Phases, in exclusive wall seconds of all the threads\n')
+        report.write(f'{"phase":<16} {"seconds":>12} {"percent":>8} {"calls":>8}\n')
+        with ArkProfiler.__PHASES_LOCK:
+            phase_seconds = dict(ArkProfiler.__PHASE_SECONDS)
+            phase_calls = dict(ArkProfiler.__PHASE_CALLS)
+        for name in PHASES + sorted(set(phase_seconds) - set(PHASES)):
+            seconds = phase_seconds.get(name, 0.0)
+            report.write(f'{name:<16} {seconds:>12.6f} {100 * seconds / total_seconds:>7.1f}% {phase_calls.get(name, 0):>8}\n')
+        other_seconds = max(total_seconds - sum(phase_seconds.values()), 0.0)
+        report.write(f'{"other":<16} {other_seconds:>12.6f} {100 * other_seconds / total_seconds:>7.1f}%\n\n')
+
+        report.write(f'Peak traced memory: {peak_bytes} bytes\n')
+        if snapshot:
+            report.write(f'Top {DEFAULT_ALLOCATION_SITES_COUNT} allocation sites still allocated at the end\n')
+            for statistic in snapshot.statistics('lineno')[:DEFAULT_ALLOCATION_SITES_COUNT]:
+                report.write(f'    {statistic}\n')
+        report.write('\n')
+
+        stats = pstats.Stats(ArkProfiler.__PROFILER, stream=report)
+        report.write(f'Hot functions of the main thread, by cumulative time, top {DEFAULT_HOT_FUNCTIONS_COUNT}\n')
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(DEFAULT_HOT_FUNCTIONS_COUNT)
+        report.write(f'Hot functions of the main thread, by own time, top {DEFAULT_HOT_FUNCTIONS_COUNT}\n')
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(DEFAULT_HOT_FUNCTIONS_COUNT)
+        return report.getvalue()
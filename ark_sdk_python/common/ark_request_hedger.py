@@ -0,0 +1,179 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from typing import Callable, Deque, Dict, Final, Optional
+
+from requests import Response
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+DEFAULT_HEDGE_PERCENTILE: Final[float] = 0.95
+DEFAULT_MIN_HEDGE_DELAY_SECONDS: Final[float] = 0.05
+DEFAULT_MAX_HEDGE_DELAY_SECONDS: Final[float] = 2.0
+# Hedges may add at most this ratio of requests, with a burst of a few hedges allowed at once
+DEFAULT_HEDGE_BUDGET_RATIO: Final[float] = 0.05
+DEFAULT_HEDGE_BUDGET_BURST: Final[float] = 10.0
+DEFAULT_HEDGE_MAX_WORKERS: Final[int] = 32
+DEFAULT_LATENCY_WINDOW_SIZE: Final[int] = 200
+# Routes are not hedged until enough of their latencies are known to tell their tail
+DEFAULT_MIN_LATENCY_SAMPLES: Final[int] = 20
+
+
+class ArkRequestHedger:
+    __SHARED: Optional['ArkRequestHedger'] = None
+    __SHARED_LOCK: Final[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        min_delay: float = DEFAULT_MIN_HEDGE_DELAY_SECONDS,
+        max_delay: float = DEFAULT_MAX_HEDGE_DELAY_SECONDS,
+        budget_ratio: float = DEFAULT_HEDGE_BUDGET_RATIO,
+        budget_burst: float = DEFAULT_HEDGE_BUDGET_BURST,
+        max_workers: int = DEFAULT_HEDGE_MAX_WORKERS,
+        window_size: int = DEFAULT_LATENCY_WINDOW_SIZE,
+        min_samples: int = DEFAULT_MIN_LATENCY_SAMPLES,
+    ) -> None:
+        self.__percentile = percentile
+        self.__min_delay = min_delay
+        self.__max_delay = max_delay
+        self.__budget_ratio = budget_ratio
+        self.__budget_burst = budget_burst
+        self.__budget = budget_burst
+        self.__max_workers = max_workers
+        self.__window_size = window_size
+        self.__min_samples = min_samples
+        self.__latencies: Dict[str, Deque[float]] = {}
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__lock = threading.Lock()
+        self.__hedged_count = 0
+        self.__hedge_wins_count = 0
+        self.__logger = get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def shared() -> 'ArkRequestHedger':
+        """
+        Returns the hedger shared by all the clients of the process, so the hedge budget is global.
+
+        Returns:
+            ArkRequestHedger: _description_
+        """
+        with ArkRequestHedger.__SHARED_LOCK:
+            if ArkRequestHedger.__SHARED is None:
+                ArkRequestHedger.__SHARED = ArkRequestHedger()
+            return ArkRequestHedger.__SHARED
+
+    @property
+    def hedged_count(self) -> int:
+        return self.__hedged_count
+
+    @property
+    def hedge_wins_count(self) -> int:
+        return self.__hedge_wins_count
+
+    @property
+    def budget(self) -> float:
+        return self.__budget
+
+    def delay(self, key: str) -> Optional[float]:
+        """
+        Returns the seconds to wait for a response of the key before hedging it, which is the observed percentile of its latencies,
+        or None while too few of them are known.
+
+        Args:
+            key (str): _description_
+
+        Returns:
+            Optional[float]: _description_
+        """
+        with self.__lock:
+            latencies = self.__latencies.get(key)
+            if not latencies or len(latencies) < self.__min_samples:
+                return None
+            sorted_latencies = sorted(latencies)
+        latency = sorted_latencies[min(int(len(sorted_latencies) * self.__percentile), len(sorted_latencies) - 1)]
+        return min(max(latency, self.__min_delay), self.__max_delay)
+
+    def request(self, key: str, send: Callable[[], Response]) -> Response:
+        """
+        Sends the request, and when no response arrived within the delay of its key, sends it again, as long as the budget allows.
+        The first successful response of the two is returned, and the other one is closed once it arrives.
+        Only idempotent requests may be hedged, as the server may handle both of them.
+
+        Args:
+            key (str): The requests sharing a key share their latencies, such as the method and route of the request
+            send (Callable[[], Response]): Sends the request, and may be called twice at once
+
+        Returns:
+            Response: _description_
+        """
+        delay = self.delay(key)
+        with self.__lock:
+            self.__budget = min(self.__budget + self.__budget_ratio, self.__budget_burst)
+        if delay is None:
+            start_time = time.perf_counter()
+            response = send()
+            self.__record(key, time.perf_counter() - start_time)
+            return response
+        primary = self.__submit(key, send)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not self.__take_budget():
+            return primary.result()
+        self.__logger.debug('Hedging %s after %.3fs', key, delay)
+        hedge = self.__submit(key, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.add_done_callback(ArkRequestHedger.__discard)
+                    if future is hedge:
+                        with self.__lock:
+                            self.__hedge_wins_count += 1
+                    return future.result()
+        # Both failed, the error of the original request is the one to surface
+        return primary.result()
+
+    def __take_budget(self) -> bool:
+        with self.__lock:
+            if self.__budget < 1:
+                return False
+            self.__budget -= 1
+            self.__hedged_count += 1
+            return True
+
+    def __submit(self, key: str, send: Callable[[], Response]) -> 'Future[Response]':
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='ark-hedge')
+            executor = self.__executor
+        start_time = time.perf_counter()
+        # Each attempt runs in a copy of the context of the caller, with its deadline and span
+        future = executor.submit(contextvars.copy_context().run, send)
+
+        def record(done_future: 'Future[Response]') -> None:
+            if done_future.exception() is None:
+                self.__record(key, time.perf_counter() - start_time)
+
+        future.add_done_callback(record)
+        return future
+
+    def __record(self, key: str, latency: float) -> None:
+        with self.__lock:
+            if key not in self.__latencies:
+                self.__latencies[key] = deque(maxlen=self.__window_size)
+            self.__latencies[key].append(latency)
+
+    @staticmethod
+    def __discard(future: 'Future[Response]') -> None:
+        # Responses built without a connection, such as replayed ones, have nothing to release
+        if future.exception() is None and future.result().raw is not None:
+            future.result().close()
@@ -3,6 +3,8 @@ import time
 from functools import partial
 from typing import Any, Callable, Optional, Tuple, Type
 
+from ark_sdk_python.common.ark_instrumentation import ArkInstrumentations
+
 
 class ArkRetry:
     @staticmethod
@@ -17,14 +19,20 @@ class ArkRetry:
         logger: Optional[Any] = None,
     ) -> Any:
         _tries, _delay = tries, delay
+        attempt = 0
         while _tries:
             try:
                 return f()
             except exceptions as e:
                 _tries -= 1
+                attempt += 1
                 if not _tries:
                     raise
 
+                ArkInstrumentations.emit(
+                    ArkInstrumentations.registered(), 'on_retry', getattr(getattr(f, 'func', f), '__name__', str(f)), attempt, e
+                )
+
                 if logger is not None:
                     logger.warning('%s, retrying in %s seconds...', e, _delay)
 
@@ -0,0 +1,102 @@
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, Final, List, Optional, TextIO
+
+from ark_sdk_python.common.ark_disk_cache import ark_cache_folder
+
+ARK_SERVER_SOCKET_ENV_VAR: Final[str] = 'ARK_SERVER_SOCKET'
+DEFAULT_ARK_SERVER_SOCKET_NAME: Final[str] = 'ark_server.sock'
+ARK_SERVER_FAILURE_EXIT_CODE: Final[int] = 1
+# Environment variables selecting the profile, tenant and settings of a command, which the server runs the command with
+FORWARDED_ENV_VAR_PREFIX: Final[str] = 'ARK_'
+FORWARDED_ENV_VARS: Final[List[str]] = ['DEPLOY_ENV', 'LOG_LEVEL', 'LOGGER_STYLE', 'AWS_REGION', 'AWS_DEFAULT_REGION']
+
+
+def default_server_socket_path() -> str:
+    """
+    Returns the socket path of the warm CLI server, from the `ARK_SERVER_SOCKET` environment variable when set,
+    or a socket in the ark cache folder otherwise.
+
+    Returns:
+        str: _description_
+    """
+    return os.environ.get(ARK_SERVER_SOCKET_ENV_VAR, os.path.join(ark_cache_folder(), DEFAULT_ARK_SERVER_SOCKET_NAME))
+
+
+class ArkServerClient:
+    def __init__(self, socket_path: Optional[str] = None) -> None:
+        self.__socket_path = socket_path or default_server_socket_path()
+
+    @staticmethod
+    def encode_message(message: Dict[str, Any]) -> bytes:
+        """
+        Encodes a protocol message, which is a single JSON line.
+
+        Args:
+            message (Dict[str, Any]): _description_
+
+        Returns:
+            bytes: _description_
+        """
+        return (json.dumps(message) + '\n').encode('utf-8')
+
+    @staticmethod
+    def is_forwarded_env_var(name: str) -> bool:
+        """
+        Returns whether the environment variable is forwarded to the server with the commands.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            bool: _description_
+        """
+        return name.startswith(FORWARDED_ENV_VAR_PREFIX) or name in FORWARDED_ENV_VARS
+
+    @staticmethod
+    def forwarded_environment() -> Dict[str, str]:
+        """
+        Returns the environment variables of the client which are forwarded to the server with the commands.
+
+        Returns:
+            Dict[str, str]: _description_
+        """
+        return {name: value for name, value in os.environ.items() if ArkServerClient.is_forwarded_env_var(name)}
+
+    def run_command(self, argv: List[str], stdout: Optional[TextIO] = None, stderr: Optional[TextIO] = None) -> int:
+        """
+        Forwards the command line to the warm CLI server, with the working directory and forwarded environment it runs with,
+        and writes the output it streams back as it arrives.
+        Only the sdk free standard library is imported here, so forwarding a command does not pay for the sdk imports.
+
+        Args:
+            argv (List[str]): The command line, without the program name
+            stdout (Optional[TextIO], optional): _description_. Defaults to None.
+            stderr (Optional[TextIO], optional): _description_. Defaults to None.
+
+        Returns:
+            int: The exit code of the command
+        """
+        streams = {'stdout': stdout or sys.stdout, 'stderr': stderr or sys.stderr}
+        if not hasattr(socket, 'AF_UNIX'):
+            streams['stderr'].write('The ark server is not supported on this platform\n')
+            return ARK_SERVER_FAILURE_EXIT_CODE
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+                client_socket.connect(self.__socket_path)
+                client_socket.sendall(self.encode_message({'argv': argv, 'cwd': os.getcwd(), 'env': self.forwarded_environment()}))
+                with client_socket.makefile('r', encoding='utf-8') as server_messages:
+                    for line in server_messages:
+                        message = json.loads(line)
+                        if 'exit_code' in message:
+                            return message['exit_code']
+                        for stream_name, text in message.items():
+                            streams[stream_name].write(text)
+                            streams[stream_name].flush()
+        except OSError as ex:
+            streams['stderr'].write(f'Failed to reach the ark server at [{self.__socket_path}], start it with `ark serve`: {str(ex)}\n')
+            return ARK_SERVER_FAILURE_EXIT_CODE
+        streams['stderr'].write('The ark server closed the connection before the command finished\n')
+        return ARK_SERVER_FAILURE_EXIT_CODE
@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, Dict, Final, Optional, Tuple
+
+
+class ArkSingleFlightCall:
+    def __init__(self) -> None:
+        self.done: Final[threading.Event] = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters_count = 0
+
+
+class ArkSingleFlight:
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[str, ArkSingleFlightCall] = {}
+        self.__coalesced_count = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        return self.__coalesced_count
+
+    @property
+    def in_flight_count(self) -> int:
+        return len(self.__calls)
+
+    def do(self, key: str, func: Callable[[], Any], wait_timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        Runs the function once for all the concurrent callers of the same key.
+        The first caller runs it, and the callers arriving while it runs wait for its result, or its error, instead of running it again.
+        A caller arriving after it ended runs it anew, so results are never reused past the call which produced them.
+
+        Args:
+            key (str): _description_
+            func (Callable[[], Any]): _description_
+            wait_timeout (Optional[float], optional): Seconds a waiter waits for the result of another caller. Defaults to None.
+
+        Raises:
+            TimeoutError: _description_
+
+        Returns:
+            Tuple[Any, bool]: The result, and whether it was produced by the call of another caller
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = ArkSingleFlightCall()
+                self.__calls[key] = call
+            else:
+                call.waiters_count += 1
+                self.__coalesced_count += 1
+        if not is_leader:
+            if not call.done.wait(wait_timeout):
+                raise TimeoutError(f'Timed out waiting for the call in flight of {key}')
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = func()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+        return call.result, False
@@ -0,0 +1,188 @@
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Final, Iterator, Optional
+
+from ark_sdk_python.common.ark_disk_cache import ark_cache_folder
+from ark_sdk_python.common.ark_http_cache import ArkHTTPCacheEntry, ArkHTTPCacheStore
+from ark_sdk_python.common.ark_logger import get_logger
+
+HTTP_CACHE_DB_FILE_NAME: Final[str] = 'http_cache.sqlite'
+HTTP_CACHE_KEYRING_SERVICE_NAME: Final[str] = 'ark_http_cache'
+DEFAULT_HTTP_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+NONCE_SIZE: Final[int] = 12
+TAG_SIZE: Final[int] = 16
+SQLITE_TIMEOUT_SECONDS: Final[float] = 5.0
+CREATE_RESPONSES_TABLE: Final[str] = '''
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+)
+'''
+CREATE_SCOPE_INDEX: Final[str] = 'CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)'
+CREATE_ACCESSED_AT_INDEX: Final[str] = 'CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)'
+
+
+class ArkSQLiteHTTPCacheStore(ArkHTTPCacheStore):
+    __KEY: Optional[bytes] = None
+    __KEY_LOCK: Final[threading.Lock] = threading.Lock()
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES, key: Optional[bytes] = None) -> None:
+        self.__db_path = db_path or os.path.join(ark_cache_folder(), HTTP_CACHE_DB_FILE_NAME)
+        self.__max_bytes = max_bytes
+        self.__key = key
+        self.__initialized = False
+        self.__lock = threading.Lock()
+        self.__logger = get_logger(self.__class__.__name__)
+
+    @property
+    def db_path(self) -> str:
+        return self.__db_path
+
+    @staticmethod
+    def keyring_key() -> Optional[bytes]:
+        """
+        Returns the key the cached bodies are encrypted with, which is kept in the keyring and loaded once per process.
+
+        Returns:
+            Optional[bytes]: _description_
+        """
+        with ArkSQLiteHTTPCacheStore.__KEY_LOCK:
+            if ArkSQLiteHTTPCacheStore.__KEY is None:
+                from ark_sdk_python.common.ark_keyring import ArkKeyring
+
+                ArkSQLiteHTTPCacheStore.__KEY = ArkKeyring(HTTP_CACHE_KEYRING_SERVICE_NAME).secret_key('key')
+            return ArkSQLiteHTTPCacheStore.__KEY
+
+    @contextlib.contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        if not self.__initialized:
+            os.makedirs(os.path.dirname(self.__db_path), exist_ok=True)
+        # A connection per operation, closed right after, as the database is shared by all the processes
+        with contextlib.closing(sqlite3.connect(self.__db_path, timeout=SQLITE_TIMEOUT_SECONDS)) as connection:
+            if not self.__initialized:
+                with self.__lock:
+                    # Write ahead logging lets concurrent CLI processes read while one of them writes
+                    connection.execute('PRAGMA journal_mode=WAL')
+                    connection.execute(CREATE_RESPONSES_TABLE)
+                    connection.execute(CREATE_SCOPE_INDEX)
+                    connection.execute(CREATE_ACCESSED_AT_INDEX)
+                    connection.commit()
+                    self.__initialized = True
+            with connection:
+                yield connection
+
+    def __encryption_key(self) -> Optional[bytes]:
+        if self.__key is None:
+            self.__key = ArkSQLiteHTTPCacheStore.keyring_key()
+        return self.__key
+
+    def __encrypt(self, data: bytes) -> Optional[bytes]:
+        from Crypto.Cipher import AES
+
+        key = self.__encryption_key()
+        if not key:
+            return None
+        cipher = AES.new(key, AES.MODE_GCM, nonce=os.urandom(NONCE_SIZE))
+        ciphertext, tag = cipher.encrypt_and_digest(data)
+        return cipher.nonce + tag + ciphertext
+
+    def __decrypt(self, payload: bytes) -> Optional[bytes]:
+        from Crypto.Cipher import AES
+
+        key = self.__encryption_key()
+        if not key:
+            return None
+        nonce, tag, ciphertext = payload[:NONCE_SIZE], payload[NONCE_SIZE : NONCE_SIZE + TAG_SIZE], payload[NONCE_SIZE + TAG_SIZE :]
+        try:
+            return AES.new(key, AES.MODE_GCM, nonce=nonce).decrypt_and_verify(ciphertext, tag)
+        except ValueError:
+            # Encrypted with another key, such as before the keyring was reset
+            return None
+
+    def get(self, key: str) -> Optional[ArkHTTPCacheEntry]:
+        try:
+            with self.__connect() as connection:
+                row = connection.execute('SELECT payload FROM responses WHERE key = ?', (key,)).fetchone()
+                if not row:
+                    return None
+                connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            data = self.__decrypt(row[0])
+            if data is None:
+                return None
+            stored = json.loads(data)
+            return ArkHTTPCacheEntry(
+                stored['status_code'],
+                stored['headers'],
+                stored['content'].encode('latin-1'),
+                stored['encoding'],
+                stored['expires_at'],
+            )
+        except (sqlite3.Error, OSError, ValueError, KeyError) as ex:
+            self.__logger.info('Failed to read http cache [%s]', ex)
+            return None
+
+    def set(self, key: str, scope: str, entry: ArkHTTPCacheEntry) -> None:
+        stored = {
+            'status_code': entry.status_code,
+            'headers': {**entry.headers, **{'ETag': entry.etag, 'Last-Modified': entry.last_modified}},
+            # Latin-1 maps each byte to a single character, so any body survives the JSON round trip
+            'content': entry.content.decode('latin-1'),
+            'encoding': entry.encoding,
+            'expires_at': entry.expires_at,
+        }
+        stored['headers'] = {name: value for name, value in stored['headers'].items() if value is not None}
+        payload = self.__encrypt(json.dumps(stored).encode('utf-8'))
+        if payload is None:
+            return
+        try:
+            with self.__connect() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO responses (key, scope, expires_at, accessed_at, size, payload) VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, scope, entry.expires_at, time.time(), len(payload), payload),
+                )
+                self.__evict(connection)
+        except (sqlite3.Error, OSError) as ex:
+            self.__logger.info('Failed to write http cache [%s]', ex)
+
+    def __evict(self, connection: sqlite3.Connection) -> None:
+        total_bytes = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total_bytes <= self.__max_bytes:
+            return
+        # Least recently used first, until the cache is back under its size
+        for key, size in connection.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+            connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total_bytes -= size
+            if total_bytes <= self.__max_bytes:
+                break
+
+    def invalidate(self, scope: str) -> None:
+        try:
+            with self.__connect() as connection:
+                connection.execute('DELETE FROM responses WHERE scope = ?', (scope,))
+        except (sqlite3.Error, OSError) as ex:
+            self.__logger.info('Failed to invalidate http cache [%s]', ex)
+
+    def clear(self) -> None:
+        try:
+            with self.__connect() as connection:
+                connection.execute('DELETE FROM responses')
+        except (sqlite3.Error, OSError) as ex:
+            self.__logger.info('Failed to clear http cache [%s]', ex)
+
+    @staticmethod
+    def clear_all() -> None:
+        """
+        Removes the http cache database from the ark cache folder.
+        """
+        db_path = os.path.join(ark_cache_folder(), HTTP_CACHE_DB_FILE_NAME)
+        for path in [db_path, f'{db_path}-wal', f'{db_path}-shm']:
+            if os.path.exists(path):
+                os.unlink(path)
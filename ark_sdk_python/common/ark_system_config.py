@@ -1,9 +1,20 @@
 import os
-from typing import Final, Optional
+from typing import Dict, Final, List, Optional, Tuple
 
-from ark_sdk_python.common.ark_logger import LOG_LEVEL, LOGGER_STYLE
+from ark_sdk_python.common.ark_logger import LOG_LEVEL, LOGGER_STYLE, SUPPORTED_LOGGER_STYLES
 
 ARK_DISABLE_CERTIFICATE_VERIFICATION_ENV_VAR: Final[str] = 'ARK_DISABLE_CERTIFICATE_VERIFICATION'
+ARK_HTTP_CACHE_ENV_VAR: Final[str] = 'ARK_HTTP_CACHE'
+ARK_COALESCE_REQUESTS_ENV_VAR: Final[str] = 'ARK_COALESCE_REQUESTS'
+ARK_DISABLE_REQUEST_COALESCING_ENV_VAR: Final[str] = 'ARK_DISABLE_REQUEST_COALESCING'
+ARK_HTTP_CACHE_PERSISTENT_VALUE: Final[str] = 'disk'
+ARK_HTTP_COMPRESS_REQUESTS_ENV_VAR: Final[str] = 'ARK_HTTP_COMPRESS_REQUESTS'
+ARK_HTTP2_ENV_VAR: Final[str] = 'ARK_HTTP2'
+ARK_HEDGE_REQUESTS_ENV_VAR: Final[str] = 'ARK_HEDGE_REQUESTS'
+ARK_HTTP_CONNECT_TIMEOUT_ENV_VAR: Final[str] = 'ARK_HTTP_CONNECT_TIMEOUT'
+ARK_HTTP_READ_TIMEOUT_ENV_VAR: Final[str] = 'ARK_HTTP_READ_TIMEOUT'
+DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS: Final[float] = 10.0
+DEFAULT_HTTP_READ_TIMEOUT_SECONDS: Final[float] = 120.0
 
 
 class ArkSystemConfig:
@@ -12,6 +23,16 @@ class ArkSystemConfig:
     _IS_CERTIFICATE_VERIFICATION = True
     _IS_ALLOWING_OUTPUT = False
     _TRUSTED_CERT = None
+    _IS_HTTP_CACHE = False
+    _HTTP_CACHE_ROUTE_TTLS: Optional[Dict[str, float]] = None
+    _IS_HTTP_CACHE_PERSISTENT = False
+    _IS_COALESCING_REQUESTS = False
+    _IS_HEDGING_REQUESTS = False
+    _IS_HTTP2 = False
+    _IS_COMPRESSING_REQUESTS = False
+    _COMPRESSED_REQUEST_ROUTES: Optional[List[str]] = None
+    _HTTP_CONNECT_TIMEOUT: Optional[float] = DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS
+    _HTTP_READ_TIMEOUT: Optional[float] = DEFAULT_HTTP_READ_TIMEOUT_SECONDS
 
     @staticmethod
     def disable_color():
@@ -60,7 +81,7 @@ class ArkSystemConfig:
 
     @staticmethod
     def set_logger_style(logger_style: str) -> None:
-        if logger_style in ['default']:
+        if logger_style in SUPPORTED_LOGGER_STYLES:
             os.environ[LOGGER_STYLE] = logger_style
         else:
             os.environ[LOGGER_STYLE] = 'default'
@@ -86,3 +107,110 @@ class ArkSystemConfig:
     @staticmethod
     def trusted_certificate() -> str:
         return ArkSystemConfig._TRUSTED_CERT
+
+    @staticmethod
+    def enable_http_cache(route_ttls: Optional[Dict[str, float]] = None, persistent: bool = False) -> None:
+        ArkSystemConfig._IS_HTTP_CACHE = True
+        ArkSystemConfig._HTTP_CACHE_ROUTE_TTLS = route_ttls
+        ArkSystemConfig._IS_HTTP_CACHE_PERSISTENT = persistent
+
+    @staticmethod
+    def disable_http_cache() -> None:
+        ArkSystemConfig._IS_HTTP_CACHE = False
+
+    @staticmethod
+    def is_http_cache_enabled() -> bool:
+        if os.environ.get(ARK_HTTP_CACHE_ENV_VAR, '').lower() in ('1', 'true', ARK_HTTP_CACHE_PERSISTENT_VALUE):
+            return True
+        return ArkSystemConfig._IS_HTTP_CACHE
+
+    @staticmethod
+    def is_http_cache_persistent() -> bool:
+        if os.environ.get(ARK_HTTP_CACHE_ENV_VAR, '').lower() == ARK_HTTP_CACHE_PERSISTENT_VALUE:
+            return True
+        return ArkSystemConfig._IS_HTTP_CACHE_PERSISTENT
+
+    @staticmethod
+    def http_cache_route_ttls() -> Optional[Dict[str, float]]:
+        return ArkSystemConfig._HTTP_CACHE_ROUTE_TTLS
+
+    @staticmethod
+    def enable_request_coalescing() -> None:
+        ArkSystemConfig._IS_COALESCING_REQUESTS = True
+
+    @staticmethod
+    def disable_request_coalescing() -> None:
+        ArkSystemConfig._IS_COALESCING_REQUESTS = False
+
+    @staticmethod
+    def is_coalescing_requests() -> bool:
+        if ARK_DISABLE_REQUEST_COALESCING_ENV_VAR in os.environ:
+            return False
+        if os.environ.get(ARK_COALESCE_REQUESTS_ENV_VAR, '').lower() in ('1', 'true'):
+            return True
+        return ArkSystemConfig._IS_COALESCING_REQUESTS
+
+    @staticmethod
+    def enable_request_hedging() -> None:
+        ArkSystemConfig._IS_HEDGING_REQUESTS = True
+
+    @staticmethod
+    def disable_request_hedging() -> None:
+        ArkSystemConfig._IS_HEDGING_REQUESTS = False
+
+    @staticmethod
+    def is_hedging_requests() -> bool:
+        if os.environ.get(ARK_HEDGE_REQUESTS_ENV_VAR, '').lower() in ('1', 'true'):
+            return True
+        return ArkSystemConfig._IS_HEDGING_REQUESTS
+
+    @staticmethod
+    def enable_request_compression(routes: Optional[List[str]] = None) -> None:
+        ArkSystemConfig._IS_COMPRESSING_REQUESTS = True
+        ArkSystemConfig._COMPRESSED_REQUEST_ROUTES = routes
+
+    @staticmethod
+    def disable_request_compression() -> None:
+        ArkSystemConfig._IS_COMPRESSING_REQUESTS = False
+
+    @staticmethod
+    def is_compressing_requests() -> bool:
+        if os.environ.get(ARK_HTTP_COMPRESS_REQUESTS_ENV_VAR, '').lower() in ('1', 'true'):
+            return True
+        return ArkSystemConfig._IS_COMPRESSING_REQUESTS
+
+    @staticmethod
+    def compressed_request_routes() -> Optional[List[str]]:
+        return ArkSystemConfig._COMPRESSED_REQUEST_ROUTES
+
+    @staticmethod
+    def enable_http2() -> None:
+        ArkSystemConfig._IS_HTTP2 = True
+
+    @staticmethod
+    def disable_http2() -> None:
+        ArkSystemConfig._IS_HTTP2 = False
+
+    @staticmethod
+    def is_using_http2() -> bool:
+        if os.environ.get(ARK_HTTP2_ENV_VAR, '').lower() in ('1', 'true'):
+            return True
+        return ArkSystemConfig._IS_HTTP2
+
+    @staticmethod
+    def set_http_timeouts(
+        connect_timeout: Optional[float] = DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: Optional[float] = DEFAULT_HTTP_READ_TIMEOUT_SECONDS,
+    ) -> None:
+        ArkSystemConfig._HTTP_CONNECT_TIMEOUT = connect_timeout
+        ArkSystemConfig._HTTP_READ_TIMEOUT = read_timeout
+
+    @staticmethod
+    def http_timeouts() -> Tuple[Optional[float], Optional[float]]:
+        connect_timeout = ArkSystemConfig._HTTP_CONNECT_TIMEOUT
+        read_timeout = ArkSystemConfig._HTTP_READ_TIMEOUT
+        if os.environ.get(ARK_HTTP_CONNECT_TIMEOUT_ENV_VAR):
+            connect_timeout = float(os.environ[ARK_HTTP_CONNECT_TIMEOUT_ENV_VAR])
+        if os.environ.get(ARK_HTTP_READ_TIMEOUT_ENV_VAR):
+            read_timeout = float(os.environ[ARK_HTTP_READ_TIMEOUT_ENV_VAR])
+        return connect_timeout, read_timeout
@@ -0,0 +1,461 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Final, Iterator, List, Optional, Union
+
+from ark_sdk_python.common.ark_logger import get_logger
+
+TRACE_FORMAT_OTEL: Final[str] = 'otel'
+TRACE_FORMAT_CHROME: Final[str] = 'chrome'
+SUPPORTED_TRACE_FORMATS: Final[List[str]] = [TRACE_FORMAT_OTEL, TRACE_FORMAT_CHROME]
+DEFAULT_TRACE_FORMAT: Final[str] = TRACE_FORMAT_OTEL
+DEFAULT_MAX_FINISHED_SPANS: Final[int] = 100000
+SPAN_KIND_INTERNAL: Final[str] = 'internal'
+SPAN_KIND_CLIENT: Final[str] = 'client'
+OTEL_SPAN_KINDS: Final[Dict[str, int]] = {SPAN_KIND_INTERNAL: 1, SPAN_KIND_CLIENT: 3}
+OTEL_STATUS_CODE_OK: Final[int] = 1
+OTEL_STATUS_CODE_ERROR: Final[int] = 2
+TRACE_SERVICE_NAME: Final[str] = 'ark-sdk-python'
+
+SpanAttribute = Union[str, int, float, bool]
+
+
+class ArkSpan:
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str] = None,
+        kind: str = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, SpanAttribute]] = None,
+    ) -> None:
+        self.__name = name
+        self.__trace_id = trace_id
+        self.__span_id = os.urandom(8).hex()
+        self.__parent_span_id = parent_span_id
+        self.__kind = kind
+        self.__attributes: Dict[str, SpanAttribute] = dict(attributes or {})
+        self.__thread_id = threading.get_ident()
+        self.__start_time_ns = time.time_ns()
+        self.__end_time_ns: Optional[int] = None
+        self.__error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def trace_id(self) -> str:
+        return self.__trace_id
+
+    @property
+    def span_id(self) -> str:
+        return self.__span_id
+
+    @property
+    def parent_span_id(self) -> Optional[str]:
+        return self.__parent_span_id
+
+    @property
+    def kind(self) -> str:
+        return self.__kind
+
+    @property
+    def attributes(self) -> Dict[str, SpanAttribute]:
+        return dict(self.__attributes)
+
+    @property
+    def thread_id(self) -> int:
+        return self.__thread_id
+
+    @property
+    def start_time_ns(self) -> int:
+        return self.__start_time_ns
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        return self.__end_time_ns
+
+    @property
+    def error(self) -> Optional[str]:
+        return self.__error
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.__end_time_ns or time.time_ns()) - self.__start_time_ns
+
+    def set_attribute(self, key: str, value: SpanAttribute) -> None:
+        """
+        Sets an attribute of the span, such as the status of an HTTP request.
+
+        Args:
+            key (str): _description_
+            value (SpanAttribute): _description_
+        """
+        self.__attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """
+        Ends the span, marking it as failed when an error is given, and hands it to the tracer.
+        Ending an already ended span does nothing.
+
+        Args:
+            error (Optional[BaseException], optional): _description_. Defaults to None.
+        """
+        if self.__end_time_ns is not None:
+            return
+        self.__end_time_ns = time.time_ns()
+        if error is not None:
+            self.__error = f'{type(error).__name__}: {error}'
+        ArkTracer.record(self)
+
+
+class ArkTracer:
+    __ENABLED: bool = False
+    __MAX_FINISHED_SPANS: int = DEFAULT_MAX_FINISHED_SPANS
+    __FINISHED_SPANS: List[ArkSpan] = []
+    __DROPPED_SPANS: int = 0
+    __FINISHED_SPANS_LOCK: Final[threading.Lock] = threading.Lock()
+    __CURRENT_SPAN: Final[contextvars.ContextVar] = contextvars.ContextVar('ark_current_span', default=None)
+
+    @staticmethod
+    def enable(max_finished_spans: int = DEFAULT_MAX_FINISHED_SPANS) -> None:
+        """
+        Enables tracing, after which spans are recorded in memory until exported or cleared.
+        Spans past the maximum are dropped and counted, so a long run cannot exhaust the memory.
+
+        Args:
+            max_finished_spans (int, optional): _description_. Defaults to DEFAULT_MAX_FINISHED_SPANS.
+        """
+        ArkTracer.__MAX_FINISHED_SPANS = max_finished_spans
+        ArkTracer.__ENABLED = True
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Disables tracing, the spans recorded so far are kept.
+        """
+        ArkTracer.__ENABLED = False
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return ArkTracer.__ENABLED
+
+    @staticmethod
+    def current_span() -> Optional[ArkSpan]:
+        """
+        Returns the innermost open span of the current context, if any.
+
+        Returns:
+            Optional[ArkSpan]: _description_
+        """
+        return ArkTracer.__CURRENT_SPAN.get()
+
+    @staticmethod
+    def current_trace_id() -> Optional[str]:
+        """
+        Returns the trace id of the current context, which is propagated to all the spans opened within it.
+
+        Returns:
+            Optional[str]: _description_
+        """
+        span = ArkTracer.__CURRENT_SPAN.get()
+        return span.trace_id if span else None
+
+    @staticmethod
+    def start_span(
+        name: str, kind: str = SPAN_KIND_INTERNAL, parent: Optional[ArkSpan] = None, **attributes: SpanAttribute
+    ) -> Optional[ArkSpan]:
+        """
+        Starts a span as a child of the given parent, or of the current span, without making it the current span.
+        A span with no parent starts a new trace. The caller ends the span.
+
+        Args:
+            name (str): _description_
+            kind (str, optional): _description_. Defaults to SPAN_KIND_INTERNAL.
+            parent (Optional[ArkSpan], optional): _description_. Defaults to None.
+
+        Returns:
+            Optional[ArkSpan]: The started span, or None when tracing is disabled
+        """
+        if not ArkTracer.__ENABLED:
+            return None
+        parent = parent or ArkTracer.__CURRENT_SPAN.get()
+        if parent:
+            return ArkSpan(name, parent.trace_id, parent.span_id, kind, attributes)
+        return ArkSpan(name, os.urandom(16).hex(), None, kind, attributes)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def use_span(span: Optional[ArkSpan]) -> Iterator[Optional[ArkSpan]]:
+        """
+        Makes the given span the current span of the context for the duration of the block, without ending it.
+
+        Args:
+            span (Optional[ArkSpan]): _description_
+
+        Yields:
+            Iterator[Optional[ArkSpan]]: _description_
+        """
+        token = ArkTracer.__CURRENT_SPAN.set(span)
+        try:
+            yield span
+        finally:
+            ArkTracer.__CURRENT_SPAN.reset(token)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def __span(name: str, kind: str, attributes: Dict[str, SpanAttribute]) -> Iterator[Optional[ArkSpan]]:
+        span = ArkTracer.start_span(name, kind, **attributes)
+        token = ArkTracer.__CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as ex:
+            if span:
+                span.end(ex)
+            raise
+        finally:
+            ArkTracer.__CURRENT_SPAN.reset(token)
+            if span:
+                span.end()
+
+    @staticmethod
+    def span(name: str, kind: str = SPAN_KIND_INTERNAL, **attributes: SpanAttribute) -> ContextManager[Optional[ArkSpan]]:
+        """
+        Opens a span as the current span for the duration of the block, as a child of the enclosing span.
+        The span is failed when the block raises. When tracing is disabled, nothing is recorded and None is yielded.
+
+        Args:
+            name (str): _description_
+            kind (str, optional): _description_. Defaults to SPAN_KIND_INTERNAL.
+
+        Returns:
+            ContextManager[Optional[ArkSpan]]: _description_
+        """
+        if not ArkTracer.__ENABLED:
+            return contextlib.nullcontext()
+        return ArkTracer.__span(name, kind, attributes)
+
+    @staticmethod
+    def trace_iterator(iterator: Iterator[Any], parent: ArkSpan, page_name: str) -> Iterator[Any]:
+        """
+        Wraps a lazily paged result, so the work done to produce each page is traced as a child span of the parent.
+        The parent, such as the span of the service method which returned the iterator, ends with the iteration.
+
+        Args:
+            iterator (Iterator[Any]): _description_
+            parent (ArkSpan): _description_
+            page_name (str): _description_
+
+        Yields:
+            Iterator[Any]: _description_
+        """
+        page_number = 0
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                page_number += 1
+                page_span = ArkTracer.start_span(page_name, parent=parent, page=page_number)
+                try:
+                    with ArkTracer.use_span(page_span):
+                        item = next(iterator)
+                except StopIteration:
+                    if page_span:
+                        page_span.end()
+                    return
+                except BaseException as ex:
+                    if page_span:
+                        page_span.end(ex)
+                    raise
+                if page_span:
+                    items = getattr(item, 'items', None)
+                    if isinstance(items, list):
+                        page_span.set_attribute('items_count', len(items))
+                    page_span.end()
+                yield item
+        except BaseException as ex:
+            error = ex
+            raise
+        finally:
+            parent.set_attribute('pages_count', page_number - 1)
+            parent.end(error if not isinstance(error, GeneratorExit) else None)
+
+    @staticmethod
+    def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorates a function to run in a span of the given name when tracing is enabled.
+        A returned generator is traced page by page, with the span ending when the generator does.
+
+        Args:
+            name (str): _description_
+
+        Returns:
+            Callable[[Callable[..., Any]], Callable[..., Any]]: _description_
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not ArkTracer.__ENABLED:
+                    return func(*args, **kwargs)
+                span = ArkTracer.start_span(name)
+                try:
+                    with ArkTracer.use_span(span):
+                        result = func(*args, **kwargs)
+                except BaseException as ex:
+                    span.end(ex)
+                    raise
+                if inspect.isgenerator(result):
+                    return ArkTracer.trace_iterator(result, span, f'{name} page')
+                span.end()
+                return result
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def record(span: ArkSpan) -> None:
+        """
+        Keeps an ended span for the export.
+
+        Args:
+            span (ArkSpan): _description_
+        """
+        with ArkTracer.__FINISHED_SPANS_LOCK:
+            if len(ArkTracer.__FINISHED_SPANS) >= ArkTracer.__MAX_FINISHED_SPANS:
+                ArkTracer.__DROPPED_SPANS += 1
+                return
+            ArkTracer.__FINISHED_SPANS.append(span)
+
+    @staticmethod
+    def finished_spans() -> List[ArkSpan]:
+        """
+        Returns the ended spans, in the order they ended.
+
+        Returns:
+            List[ArkSpan]: _description_
+        """
+        with ArkTracer.__FINISHED_SPANS_LOCK:
+            return list(ArkTracer.__FINISHED_SPANS)
+
+    @staticmethod
+    def dropped_spans_count() -> int:
+        return ArkTracer.__DROPPED_SPANS
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Forgets the ended spans.
+        """
+        with ArkTracer.__FINISHED_SPANS_LOCK:
+            ArkTracer.__FINISHED_SPANS = []
+            ArkTracer.__DROPPED_SPANS = 0
+
+    @staticmethod
+    def __otel_attribute_value(value: SpanAttribute) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            return {'boolValue': value}
+        if isinstance(value, int):
+            # OTLP JSON encodes 64 bit integers as strings
+            return {'intValue': str(value)}
+        if isinstance(value, float):
+            return {'doubleValue': value}
+        return {'stringValue': str(value)}
+
+    @staticmethod
+    def to_otel_json(spans: Optional[List[ArkSpan]] = None) -> Dict[str, Any]:
+        """
+        Returns the spans in the OpenTelemetry protocol JSON format, which OpenTelemetry collectors and most tracing backends import.
+
+        Args:
+            spans (Optional[List[ArkSpan]], optional): The spans to export, the ended spans by default. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        otel_spans: List[Dict[str, Any]] = []
+        for span in ArkTracer.finished_spans() if spans is None else spans:
+            otel_span: Dict[str, Any] = {
+                'traceId': span.trace_id,
+                'spanId': span.span_id,
+                'name': span.name,
+                'kind': OTEL_SPAN_KINDS.get(span.kind, OTEL_SPAN_KINDS[SPAN_KIND_INTERNAL]),
+                'startTimeUnixNano': str(span.start_time_ns),
+                'endTimeUnixNano': str(span.end_time_ns or span.start_time_ns),
+                'attributes': [{'key': key, 'value': ArkTracer.__otel_attribute_value(value)} for key, value in span.attributes.items()],
+                'status': {'code': OTEL_STATUS_CODE_ERROR, 'message': span.error} if span.error else {'code': OTEL_STATUS_CODE_OK},
+            }
+            if span.parent_span_id:
+                otel_span['parentSpanId'] = span.parent_span_id
+            otel_spans.append(otel_span)
+        return {
+            'resourceSpans': [
+                {
+                    'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': TRACE_SERVICE_NAME}}]},
+                    'scopeSpans': [{'scope': {'name': 'ark_sdk_python'}, 'spans': otel_spans}],
+                }
+            ]
+        }
+
+    @staticmethod
+    def to_chrome_trace(spans: Optional[List[ArkSpan]] = None) -> Dict[str, Any]:
+        """
+        Returns the spans in the Chrome trace event format, which chrome://tracing and Perfetto open as a timeline per thread.
+
+        Args:
+            spans (Optional[List[ArkSpan]], optional): The spans to export, the ended spans by default. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        process_id = os.getpid()
+        events: List[Dict[str, Any]] = []
+        for span in ArkTracer.finished_spans() if spans is None else spans:
+            event_args: Dict[str, Any] = {'trace_id': span.trace_id, 'span_id': span.span_id, **span.attributes}
+            if span.parent_span_id:
+                event_args['parent_span_id'] = span.parent_span_id
+            if span.error:
+                event_args['error'] = span.error
+            events.append(
+                {
+                    'name': span.name,
+                    'cat': span.kind,
+                    'ph': 'X',
+                    'ts': span.start_time_ns / 1000,
+                    'dur': span.duration_ns / 1000,
+                    'pid': process_id,
+                    'tid': span.thread_id,
+                    'args': event_args,
+                }
+            )
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    @staticmethod
+    def export(path: str, trace_format: str = DEFAULT_TRACE_FORMAT) -> None:
+        """
+        Writes the ended spans to the given file, in the OpenTelemetry JSON or Chrome trace format.
+
+        Args:
+            path (str): _description_
+            trace_format (str, optional): _description_. Defaults to DEFAULT_TRACE_FORMAT.
+
+        Raises:
+            ArkException: _description_
+        """
+        from ark_sdk_python.models import ArkException
+
+        if trace_format not in SUPPORTED_TRACE_FORMATS:
+            raise ArkException(f'Unsupported trace format [{trace_format}], supported formats are {SUPPORTED_TRACE_FORMATS}')
+        trace = ArkTracer.to_otel_json() if trace_format == TRACE_FORMAT_OTEL else ArkTracer.to_chrome_trace()
+        with open(path, 'w', encoding='utf-8') as trace_file:
+            json.dump(trace, trace_file)
+        if ArkTracer.__DROPPED_SPANS:
+            get_logger(ArkTracer.__name__).warning(
+                'Dropped %s spans past the maximum of %s finished spans', ArkTracer.__DROPPED_SPANS, ArkTracer.__MAX_FINISHED_SPANS
+            )
@@ -1,3 +1,15 @@
-from ark_sdk_python.common.connections.ark_connection import ArkConnection
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.common.connections.ark_connection import ArkConnection
 
 __all__ = ['ArkConnection']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.common.connections.ark_connection': ['ArkConnection'],
+    },
+)
@@ -1,4 +1,17 @@
-from ark_sdk_python.common.connections.ssh.ark_pty_ssh_connection import ArkPTYSSHConnection
-from ark_sdk_python.common.connections.ssh.ark_ssh_connection import SSH_PORT, ArkSSHConnection
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.common.connections.ssh.ark_pty_ssh_connection import ArkPTYSSHConnection
+    from ark_sdk_python.common.connections.ssh.ark_ssh_connection import SSH_PORT, ArkSSHConnection
 
 __all__ = ['ArkSSHConnection', 'ArkPTYSSHConnection', 'SSH_PORT']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.common.connections.ssh.ark_pty_ssh_connection': ['ArkPTYSSHConnection'],
+        'ark_sdk_python.common.connections.ssh.ark_ssh_connection': ['SSH_PORT', 'ArkSSHConnection'],
+    },
+)
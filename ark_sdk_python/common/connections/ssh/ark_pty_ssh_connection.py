@@ -128,7 +128,7 @@ class ArkPTYSSHConnection(ArkConnection):
         """
         if not self.__is_connected or self.__is_suspended:
             raise ArkException('Cannot run command while not being connected')
-        self._logger.debug(f'Running command [{command.command}]')
+        self._logger.debug('Running command [%s]', command.command)
         self.__ssh_client.sendline(command.command)
         self.__ssh_client.prompt()
         stdout = self.__ssh_client.before.decode()
@@ -139,6 +139,6 @@ class ArkPTYSSHConnection(ArkConnection):
         rc = int(exit_code_output.strip().splitlines()[-1])
         if rc != command.expected_rc and command.raise_on_error:
             raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stdout}]')
-        self._logger.debug(f'Command rc: [{rc}]')
-        self._logger.debug(f'Command stdout: [{stdout}]')
+        self._logger.debug('Command rc: [%s]', rc)
+        self._logger.debug('Command stdout: [%s]', stdout)
         return ArkConnectionResult(stdout=stdout, rc=rc)
@@ -201,7 +201,7 @@ class ArkPTYSSHWinConnection(ArkConnection):
         if not self.__is_connected or self.__is_suspended:
             raise ArkException('Cannot run command while not connected or suspended')
 
-        self._logger.debug(f'Running command [{command.command}]')
+        self._logger.debug('Running command [%s]', command.command)
 
         self.__reset_buffer()
         self.__pty.write(command.command + "\n")
@@ -230,6 +230,6 @@ class ArkPTYSSHWinConnection(ArkConnection):
             raise ArkException(f"Failed to parse exit code from output - [{self.__buffer}]")
         if rc != command.expected_rc and command.raise_on_error:
             raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stdout}]')
-        self._logger.debug(f'Command rc: [{rc}]')
-        self._logger.debug(f'Command stdout: [{stdout}]')
+        self._logger.debug('Command rc: [%s]', rc)
+        self._logger.debug('Command stdout: [%s]', stdout)
         return ArkConnectionResult(stdout=stdout, rc=rc)
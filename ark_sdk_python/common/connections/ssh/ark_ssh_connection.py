@@ -131,14 +131,14 @@ class ArkSSHConnection(ArkConnection):
         """
         if not self.__is_connected or self.__is_suspended:
             raise ArkException('Cannot run command while not being connected')
-        self._logger.debug(f'Running command [{command.command}]')
+        self._logger.debug('Running command [%s]', command.command)
         _, stdout_stream, stderr_stream = self.__ssh_client.exec_command(command=command.command)
         rc = stdout_stream.channel.recv_exit_status()
         stdout = ''.join(stdout_stream.readlines())
         stderr = ''.join(stderr_stream.readlines())
         if rc != command.expected_rc and command.raise_on_error:
             raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stderr}]')
-        self._logger.debug(f'Command rc: [{rc}]')
-        self._logger.debug(f'Command stdout: [{stdout}]')
-        self._logger.debug(f'Command stderr: [{stderr}]')
+        self._logger.debug('Command rc: [%s]', rc)
+        self._logger.debug('Command stdout: [%s]', stdout)
+        self._logger.debug('Command stderr: [%s]', stderr)
         return ArkConnectionResult(stdout=stdout, stderr=stderr, rc=rc)
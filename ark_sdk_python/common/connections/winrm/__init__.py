@@ -1,3 +1,15 @@
-from ark_sdk_python.common.connections.winrm.ark_winrm_connection import WINRM_HTTPS_PORT, ArkWinRMConnection
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.common.connections.winrm.ark_winrm_connection import WINRM_HTTPS_PORT, ArkWinRMConnection
 
 __all__ = ['ArkWinRMConnection', 'WINRM_HTTPS_PORT']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.common.connections.winrm.ark_winrm_connection': ['WINRM_HTTPS_PORT', 'ArkWinRMConnection'],
+    },
+)
@@ -127,7 +127,7 @@ class ArkWinRMConnection(ArkConnection):
         """
         if not self.__is_connected or self.__is_suspended:
             raise ArkException('Cannot run command while not being connected')
-        self._logger.debug(f'Running powershell command [{command.command}] of length [{len(command.command)}]')
+        self._logger.debug('Running powershell command [%s] of length [%s]', command.command, len(command.command))
         if len(command.command) > 2000 or (command.extra_command_data and command.extra_command_data.get('force_command_split', False)):
             encoded_command = command.command.encode('utf_16_le')
             max_size = 4000
@@ -162,7 +162,7 @@ class ArkWinRMConnection(ArkConnection):
         self.__winrm_protocol.cleanup_command(self.__winrm_shell_id, command_id)
         if command.expected_rc != rc and command.raise_on_error:
             raise ArkException(f'Failed to execute command [{command.command}] - [{rc}] - [{stderr}]')
-        self._logger.debug(f'Command rc: [{rc}]')
-        self._logger.debug(f'Command stdout: [{stdout}]')
-        self._logger.debug(f'Command stderr: [{stderr}]')
+        self._logger.debug('Command rc: [%s]', rc)
+        self._logger.debug('Command stdout: [%s]', stdout)
+        self._logger.debug('Command stderr: [%s]', stderr)
         return ArkConnectionResult(stdout=stdout, stderr=stderr, rc=rc)
@@ -1,16 +1,21 @@
-from ark_sdk_python.common.env.ark_env_mapping import (
-    DEPLOY_ENV,
-    EVEREST_IDENTITY_TENANT_NAME,
-    IDENTITY_ENV_URLS,
-    IDENTITY_GENERATED_SUFFIX_PATTERN,
-    IDENTITY_TENANT_NAME,
-    ROOT_DOMAIN,
-    SHELL_DOMAIN,
-    AwsEnv,
-    check_if_identity_generated_suffix,
-    get_deploy_env,
-    is_gov_cloud,
-)
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.common.env.ark_env_mapping import (
+        DEPLOY_ENV,
+        EVEREST_IDENTITY_TENANT_NAME,
+        IDENTITY_ENV_URLS,
+        IDENTITY_GENERATED_SUFFIX_PATTERN,
+        IDENTITY_TENANT_NAME,
+        ROOT_DOMAIN,
+        SHELL_DOMAIN,
+        AwsEnv,
+        check_if_identity_generated_suffix,
+        get_deploy_env,
+        is_gov_cloud,
+    )
 
 __all__ = [
     'AwsEnv',
@@ -25,3 +30,22 @@ __all__ = [
     'ROOT_DOMAIN',
     'is_gov_cloud',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.common.env.ark_env_mapping': [
+            'DEPLOY_ENV',
+            'EVEREST_IDENTITY_TENANT_NAME',
+            'IDENTITY_ENV_URLS',
+            'IDENTITY_GENERATED_SUFFIX_PATTERN',
+            'IDENTITY_TENANT_NAME',
+            'ROOT_DOMAIN',
+            'SHELL_DOMAIN',
+            'AwsEnv',
+            'check_if_identity_generated_suffix',
+            'get_deploy_env',
+            'is_gov_cloud',
+        ],
+    },
+)
@@ -1,3 +1,15 @@
-from ark_sdk_python.common.isp.ark_isp_service_client import ArkISPServiceClient
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.common.isp.ark_isp_service_client import ArkISPServiceClient
 
 __all__ = ['ArkISPServiceClient']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.common.isp.ark_isp_service_client': ['ArkISPServiceClient'],
+    },
+)
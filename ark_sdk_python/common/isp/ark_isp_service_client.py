@@ -30,6 +30,10 @@ class ArkISPServiceClient(ArkClient):
     ) -> None:
         self.__tenant_env = tenant_env or AwsEnv(os.environ.get('DEPLOY_ENV', AwsEnv.PROD.value))
         service_url = ArkISPServiceClient.service_url(service_name, tenant_subdomain, base_tenant_url, tenant_env, token, seperator)
+        # The service url starts with the chosen tenant subdomain, followed by the separator and service name
+        tenant = urlparse(service_url).netloc.split('.', 1)[0]
+        if service_name and seperator != '.' and tenant.endswith(f'{seperator}{service_name}'):
+            tenant = tenant[: -len(f'{seperator}{service_name}')]
         if base_path:
             service_url = f'{service_url}/{base_path}'
         super().__init__(
@@ -38,6 +42,8 @@ class ArkISPServiceClient(ArkClient):
             auth_header_name=auth_header_name,
             cookie_jar=cookie_jar,
             refresh_connection_callback=refresh_connection_callback,
+            service_name=service_name,
+            tenant=tenant,
         )
         self.add_header('Origin', service_url)
         self.add_header('Referer', service_url)
@@ -1,26 +1,32 @@
-from ark_sdk_python.models.ark_exceptions import (
-    ArkAuthException,
-    ArkException,
-    ArkInterruptedException,
-    ArkNonInteractiveException,
-    ArkNotFoundException,
-    ArkNotSupportedException,
-    ArkServiceException,
-    ArkValidationException,
-)
-from ark_sdk_python.models.ark_model import (
-    ArkCamelizedModel,
-    ArkGenericModel,
-    ArkHttpUrlString,
-    ArkModel,
-    ArkPollableModel,
-    ArkPollCallback,
-    ArkPresentableModel,
-    ArkSecretBytes,
-    ArkSecretStr,
-    ArkTitleizedModel,
-)
-from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.ark_exceptions import (
+        ArkAuthException,
+        ArkDeadlineExceededException,
+        ArkException,
+        ArkInterruptedException,
+        ArkNonInteractiveException,
+        ArkNotFoundException,
+        ArkNotSupportedException,
+        ArkServiceException,
+        ArkValidationException,
+    )
+    from ark_sdk_python.models.ark_model import (
+        ArkCamelizedModel,
+        ArkGenericModel,
+        ArkHttpUrlString,
+        ArkModel,
+        ArkPollableModel,
+        ArkPollCallback,
+        ArkPresentableModel,
+        ArkSecretBytes,
+        ArkSecretStr,
+        ArkTitleizedModel,
+    )
+    from ark_sdk_python.models.ark_profile import ArkProfile, ArkProfileLoader
 
 __all__ = [
     'ArkException',
@@ -31,6 +37,7 @@ __all__ = [
     'ArkNotSupportedException',
     'ArkServiceException',
     'ArkInterruptedException',
+    'ArkDeadlineExceededException',
     'ArkProfile',
     'ArkProfileLoader',
     'ArkModel',
@@ -43,3 +50,33 @@ __all__ = [
     'ArkSecretBytes',
     'ArkHttpUrlString',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.ark_exceptions': [
+            'ArkAuthException',
+            'ArkDeadlineExceededException',
+            'ArkException',
+            'ArkInterruptedException',
+            'ArkNonInteractiveException',
+            'ArkNotFoundException',
+            'ArkNotSupportedException',
+            'ArkServiceException',
+            'ArkValidationException',
+        ],
+        'ark_sdk_python.models.ark_model': [
+            'ArkCamelizedModel',
+            'ArkGenericModel',
+            'ArkHttpUrlString',
+            'ArkModel',
+            'ArkPollableModel',
+            'ArkPollCallback',
+            'ArkPresentableModel',
+            'ArkSecretBytes',
+            'ArkSecretStr',
+            'ArkTitleizedModel',
+        ],
+        'ark_sdk_python.models.ark_profile': ['ArkProfile', 'ArkProfileLoader'],
+    },
+)
@@ -1,12 +1,17 @@
-from ark_sdk_python.models.actions.ark_configure_action_consts import (
-    CONFIGURATION_ALLOWED_EMPTY_VALUES,
-    CONFIGURATION_AUTHENTICATOR_IGNORED_DEFNITION_KEYS,
-    CONFIGURATION_AUTHENTICATOR_IGNORED_INTERACTIVE_KEYS,
-    CONFIGURATION_AUTHENTICATORS_DEFAULTS,
-    CONFIGURATION_IGNORED_DEFINITION_KEYS,
-    CONFIGURATION_IGNORED_INTERACTIVE_KEYS,
-    CONFIGURATION_OVERRIDE_ALIASES,
-)
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.actions.ark_configure_action_consts import (
+        CONFIGURATION_ALLOWED_EMPTY_VALUES,
+        CONFIGURATION_AUTHENTICATOR_IGNORED_DEFNITION_KEYS,
+        CONFIGURATION_AUTHENTICATOR_IGNORED_INTERACTIVE_KEYS,
+        CONFIGURATION_AUTHENTICATORS_DEFAULTS,
+        CONFIGURATION_IGNORED_DEFINITION_KEYS,
+        CONFIGURATION_IGNORED_INTERACTIVE_KEYS,
+        CONFIGURATION_OVERRIDE_ALIASES,
+    )
 
 __all__ = [
     'CONFIGURATION_IGNORED_DEFINITION_KEYS',
@@ -17,3 +22,18 @@ __all__ = [
     'CONFIGURATION_AUTHENTICATORS_DEFAULTS',
     'CONFIGURATION_OVERRIDE_ALIASES',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.actions.ark_configure_action_consts': [
+            'CONFIGURATION_ALLOWED_EMPTY_VALUES',
+            'CONFIGURATION_AUTHENTICATOR_IGNORED_DEFNITION_KEYS',
+            'CONFIGURATION_AUTHENTICATOR_IGNORED_INTERACTIVE_KEYS',
+            'CONFIGURATION_AUTHENTICATORS_DEFAULTS',
+            'CONFIGURATION_IGNORED_DEFINITION_KEYS',
+            'CONFIGURATION_IGNORED_INTERACTIVE_KEYS',
+            'CONFIGURATION_OVERRIDE_ALIASES',
+        ],
+    },
+)
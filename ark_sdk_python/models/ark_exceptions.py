@@ -29,6 +29,10 @@ class ArkNotSupportedException(ArkException):
     pass
 
 
+class ArkDeadlineExceededException(ArkException):
+    pass
+
+
 class ArkServiceException(ArkException):
     def __init__(self, error: Any, *args: object) -> None:
         self.error = error
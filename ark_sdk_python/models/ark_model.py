@@ -1,5 +1,6 @@
 import base64
 import json
+import time
 from typing import Any, Callable, Dict, Optional, Union
 
 from humps.main import camelize
@@ -17,12 +18,41 @@ from pydantic import (
 )
 from typing_extensions import Annotated
 
+from ark_sdk_python.common.ark_instrumentation import ArkInstrumentations
+from ark_sdk_python.common.ark_profiler import PHASE_SERIALIZATION, ArkProfiler
+from ark_sdk_python.common.ark_tracing import ArkTracer
 from ark_sdk_python.models import ArkException
 
 
 class ArkModel(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
+    @classmethod
+    def model_validate(cls, obj: Any, *args: Any, **kwargs: Any) -> Any:
+        instrumentations = ArkInstrumentations.registered()
+        if not instrumentations and not ArkTracer.is_enabled() and not ArkProfiler.is_running():
+            return super().model_validate(obj, *args, **kwargs)
+        start_time = time.perf_counter()
+        try:
+            with ArkTracer.span(f'validate {cls.__name__}'), ArkProfiler.phase(PHASE_SERIALIZATION):
+                return super().model_validate(obj, *args, **kwargs)
+        finally:
+            if instrumentations:
+                ArkInstrumentations.emit(instrumentations, 'on_validation', cls.__name__, time.perf_counter() - start_time)
+
+    @classmethod
+    def model_validate_json(cls, json_data: Union[str, bytes, bytearray], *args: Any, **kwargs: Any) -> Any:
+        instrumentations = ArkInstrumentations.registered()
+        if not instrumentations and not ArkTracer.is_enabled() and not ArkProfiler.is_running():
+            return super().model_validate_json(json_data, *args, **kwargs)
+        start_time = time.perf_counter()
+        try:
+            with ArkTracer.span(f'validate {cls.__name__}'), ArkProfiler.phase(PHASE_SERIALIZATION):
+                return super().model_validate_json(json_data, *args, **kwargs)
+        finally:
+            if instrumentations:
+                ArkInstrumentations.emit(instrumentations, 'on_validation', cls.__name__, time.perf_counter() - start_time)
+
 
 class ArkGenericModel(ArkModel, BaseModel):
     pass
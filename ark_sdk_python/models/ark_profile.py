@@ -141,7 +141,7 @@ class ArkProfileLoader:
                 with open(os.path.join(folder, profile_name), 'r', encoding='utf-8') as fh:
                     profiles.append(ArkProfile.model_validate_json(fh.read()))
             except Exception as ex:
-                logger.warning(f'Profile {profile_name} failed to be loaded successfully [{str(ex)}]')
+                logger.warning('Profile %s failed to be loaded successfully [%s]', profile_name, ex)
                 continue
         return profiles
 
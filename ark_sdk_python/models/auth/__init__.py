@@ -1,18 +1,23 @@
-from ark_sdk_python.models.auth.ark_auth_method import (
-    ArkAuthMethod,
-    ArkAuthMethodsDescriptionMap,
-    ArkAuthMethodSettings,
-    ArkAuthMethodSettingsMap,
-    ArkAuthMethodSettingsTypes,
-    ArkAuthMethodSharableCredentials,
-    ArkAuthMethodsRequireCredentials,
-    DirectArkAuthMethodSettings,
-    IdentityArkAuthMethodSettings,
-    IdentityServiceUserArkAuthMethodSettings,
-)
-from ark_sdk_python.models.auth.ark_auth_profile import ArkAuthProfile
-from ark_sdk_python.models.auth.ark_secret import ArkSecret
-from ark_sdk_python.models.auth.ark_token import ArkToken, ArkTokenType
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.auth.ark_auth_method import (
+        ArkAuthMethod,
+        ArkAuthMethodsDescriptionMap,
+        ArkAuthMethodSettings,
+        ArkAuthMethodSettingsMap,
+        ArkAuthMethodSettingsTypes,
+        ArkAuthMethodSharableCredentials,
+        ArkAuthMethodsRequireCredentials,
+        DirectArkAuthMethodSettings,
+        IdentityArkAuthMethodSettings,
+        IdentityServiceUserArkAuthMethodSettings,
+    )
+    from ark_sdk_python.models.auth.ark_auth_profile import ArkAuthProfile
+    from ark_sdk_python.models.auth.ark_secret import ArkSecret
+    from ark_sdk_python.models.auth.ark_token import ArkToken, ArkTokenType
 
 __all__ = [
     'ArkAuthMethod',
@@ -31,3 +36,24 @@ __all__ = [
     'ArkTokenType',
     'ArkSecret',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.auth.ark_auth_method': [
+            'ArkAuthMethod',
+            'ArkAuthMethodsDescriptionMap',
+            'ArkAuthMethodSettings',
+            'ArkAuthMethodSettingsMap',
+            'ArkAuthMethodSettingsTypes',
+            'ArkAuthMethodSharableCredentials',
+            'ArkAuthMethodsRequireCredentials',
+            'DirectArkAuthMethodSettings',
+            'IdentityArkAuthMethodSettings',
+            'IdentityServiceUserArkAuthMethodSettings',
+        ],
+        'ark_sdk_python.models.auth.ark_auth_profile': ['ArkAuthProfile'],
+        'ark_sdk_python.models.auth.ark_secret': ['ArkSecret'],
+        'ark_sdk_python.models.auth.ark_token': ['ArkToken', 'ArkTokenType'],
+    },
+)
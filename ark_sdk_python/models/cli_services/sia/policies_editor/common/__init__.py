@@ -1,14 +1,19 @@
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_base_generate_policy import ArkSIABaseGeneratePolicy
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_commit_policies import ArkSIACommitPolicies
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_edit_policies import ArkSIAEditPolicies
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_get_policies_status import ArkSIAGetPoliciesStatus
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_load_policies import ArkSIALoadPolicies
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_loaded_policies import ArkSIALoadedPolicies
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_policies_diff import ArkSIAPoliciesDiff
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_policies_status import ArkSIAPoliciesStatus
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_remove_policies import ArkSIARemovePolicies
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_reset_policies import ArkSIAResetPolicies
-from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_view_policies import ArkSIAViewPolicies
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_base_generate_policy import ArkSIABaseGeneratePolicy
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_commit_policies import ArkSIACommitPolicies
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_edit_policies import ArkSIAEditPolicies
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_get_policies_status import ArkSIAGetPoliciesStatus
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_load_policies import ArkSIALoadPolicies
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_loaded_policies import ArkSIALoadedPolicies
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_policies_diff import ArkSIAPoliciesDiff
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_policies_status import ArkSIAPoliciesStatus
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_remove_policies import ArkSIARemovePolicies
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_reset_policies import ArkSIAResetPolicies
+    from ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_view_policies import ArkSIAViewPolicies
 
 __all__ = [
     'ArkSIABaseGeneratePolicy',
@@ -23,3 +28,20 @@ __all__ = [
     'ArkSIAGetPoliciesStatus',
     'ArkSIAPoliciesStatus',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_base_generate_policy': ['ArkSIABaseGeneratePolicy'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_commit_policies': ['ArkSIACommitPolicies'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_edit_policies': ['ArkSIAEditPolicies'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_get_policies_status': ['ArkSIAGetPoliciesStatus'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_load_policies': ['ArkSIALoadPolicies'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_loaded_policies': ['ArkSIALoadedPolicies'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_policies_diff': ['ArkSIAPoliciesDiff'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_policies_status': ['ArkSIAPoliciesStatus'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_remove_policies': ['ArkSIARemovePolicies'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_reset_policies': ['ArkSIAResetPolicies'],
+        'ark_sdk_python.models.cli_services.sia.policies_editor.common.ark_sia_view_policies': ['ArkSIAViewPolicies'],
+    },
+)
@@ -1,3 +1,15 @@
-from ark_sdk_python.models.cli_services.sia.policies_editor.db.ark_sia_db_generate_policy import ArkSIADBGeneratePolicy
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.cli_services.sia.policies_editor.db.ark_sia_db_generate_policy import ArkSIADBGeneratePolicy
 
 __all__ = ['ArkSIADBGeneratePolicy']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.cli_services.sia.policies_editor.db.ark_sia_db_generate_policy': ['ArkSIADBGeneratePolicy'],
+    },
+)
@@ -1,3 +1,15 @@
-from ark_sdk_python.models.cli_services.sia.policies_editor.vm.ark_sia_vm_generate_policy import ArkSIAVMGeneratePolicy
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.cli_services.sia.policies_editor.vm.ark_sia_vm_generate_policy import ArkSIAVMGeneratePolicy
 
 __all__ = ['ArkSIAVMGeneratePolicy']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.cli_services.sia.policies_editor.vm.ark_sia_vm_generate_policy': ['ArkSIAVMGeneratePolicy'],
+    },
+)
@@ -1,19 +1,24 @@
-from ark_sdk_python.models.common.ark_access_method import ArkAccessMethod
-from ark_sdk_python.models.common.ark_application_code import ArkApplicationCode
-from ark_sdk_python.models.common.ark_async_request_settings import ArkAsyncRequestSettings
-from ark_sdk_python.models.common.ark_async_status import ArkAsyncStatus
-from ark_sdk_python.models.common.ark_async_task import ArkAsyncTask
-from ark_sdk_python.models.common.ark_connection_method import ArkConnectionMethod
-from ark_sdk_python.models.common.ark_connector_type import ArkConnectorType
-from ark_sdk_python.models.common.ark_counted_values import ArkCountedValues
-from ark_sdk_python.models.common.ark_network_entity_type import ArkNetworkEntityType
-from ark_sdk_python.models.common.ark_os_type import ArkOsType, running_os
-from ark_sdk_python.models.common.ark_protocol_type import ArkProtocolType
-from ark_sdk_python.models.common.ark_region import ArkRegion, platform_region_dict, region_to_platform_region, regions_full_names
-from ark_sdk_python.models.common.ark_status import ArkStatus
-from ark_sdk_python.models.common.ark_status_stats import ArkStatusStats
-from ark_sdk_python.models.common.ark_validations import VALID_DATE_REGEX, VALID_LOGIN_MAX_LENGTH, VALID_LOGIN_NAME_REGEX
-from ark_sdk_python.models.common.ark_workspace_type import ArkWorkspaceType
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.common.ark_access_method import ArkAccessMethod
+    from ark_sdk_python.models.common.ark_application_code import ArkApplicationCode
+    from ark_sdk_python.models.common.ark_async_request_settings import ArkAsyncRequestSettings
+    from ark_sdk_python.models.common.ark_async_status import ArkAsyncStatus
+    from ark_sdk_python.models.common.ark_async_task import ArkAsyncTask
+    from ark_sdk_python.models.common.ark_connection_method import ArkConnectionMethod
+    from ark_sdk_python.models.common.ark_connector_type import ArkConnectorType
+    from ark_sdk_python.models.common.ark_counted_values import ArkCountedValues
+    from ark_sdk_python.models.common.ark_network_entity_type import ArkNetworkEntityType
+    from ark_sdk_python.models.common.ark_os_type import ArkOsType, running_os
+    from ark_sdk_python.models.common.ark_protocol_type import ArkProtocolType
+    from ark_sdk_python.models.common.ark_region import ArkRegion, platform_region_dict, region_to_platform_region, regions_full_names
+    from ark_sdk_python.models.common.ark_status import ArkStatus
+    from ark_sdk_python.models.common.ark_status_stats import ArkStatusStats
+    from ark_sdk_python.models.common.ark_validations import VALID_DATE_REGEX, VALID_LOGIN_MAX_LENGTH, VALID_LOGIN_NAME_REGEX
+    from ark_sdk_python.models.common.ark_workspace_type import ArkWorkspaceType
 
 __all__ = [
     'ArkAsyncRequestSettings',
@@ -39,3 +44,25 @@ __all__ = [
     'ArkConnectionMethod',
     'ArkAccessMethod',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.common.ark_access_method': ['ArkAccessMethod'],
+        'ark_sdk_python.models.common.ark_application_code': ['ArkApplicationCode'],
+        'ark_sdk_python.models.common.ark_async_request_settings': ['ArkAsyncRequestSettings'],
+        'ark_sdk_python.models.common.ark_async_status': ['ArkAsyncStatus'],
+        'ark_sdk_python.models.common.ark_async_task': ['ArkAsyncTask'],
+        'ark_sdk_python.models.common.ark_connection_method': ['ArkConnectionMethod'],
+        'ark_sdk_python.models.common.ark_connector_type': ['ArkConnectorType'],
+        'ark_sdk_python.models.common.ark_counted_values': ['ArkCountedValues'],
+        'ark_sdk_python.models.common.ark_network_entity_type': ['ArkNetworkEntityType'],
+        'ark_sdk_python.models.common.ark_os_type': ['ArkOsType', 'running_os'],
+        'ark_sdk_python.models.common.ark_protocol_type': ['ArkProtocolType'],
+        'ark_sdk_python.models.common.ark_region': ['ArkRegion', 'platform_region_dict', 'region_to_platform_region', 'regions_full_names'],
+        'ark_sdk_python.models.common.ark_status': ['ArkStatus'],
+        'ark_sdk_python.models.common.ark_status_stats': ['ArkStatusStats'],
+        'ark_sdk_python.models.common.ark_validations': ['VALID_DATE_REGEX', 'VALID_LOGIN_MAX_LENGTH', 'VALID_LOGIN_NAME_REGEX'],
+        'ark_sdk_python.models.common.ark_workspace_type': ['ArkWorkspaceType'],
+    },
+)
@@ -1,3 +1,15 @@
-from ark_sdk_python.models.common.aws.ark_cfn_async_task import ArkCFNAsyncTask
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.common.aws.ark_cfn_async_task import ArkCFNAsyncTask
 
 __all__ = ['ArkCFNAsyncTask']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.common.aws.ark_cfn_async_task': ['ArkCFNAsyncTask'],
+    },
+)
@@ -1,6 +1,21 @@
-from ark_sdk_python.models.common.connections.ark_connection_command import ArkConnectionCommand
-from ark_sdk_python.models.common.connections.ark_connection_credentials import ArkConnectionCredentials
-from ark_sdk_python.models.common.connections.ark_connection_details import ArkConnectionDetails, ArkConnectionType
-from ark_sdk_python.models.common.connections.ark_connection_result import ArkConnectionResult
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.common.connections.ark_connection_command import ArkConnectionCommand
+    from ark_sdk_python.models.common.connections.ark_connection_credentials import ArkConnectionCredentials
+    from ark_sdk_python.models.common.connections.ark_connection_details import ArkConnectionDetails, ArkConnectionType
+    from ark_sdk_python.models.common.connections.ark_connection_result import ArkConnectionResult
 
 __all__ = ['ArkConnectionCredentials', 'ArkConnectionDetails', 'ArkConnectionType', 'ArkConnectionCommand', 'ArkConnectionResult']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.common.connections.ark_connection_command': ['ArkConnectionCommand'],
+        'ark_sdk_python.models.common.connections.ark_connection_credentials': ['ArkConnectionCredentials'],
+        'ark_sdk_python.models.common.connections.ark_connection_details': ['ArkConnectionDetails', 'ArkConnectionType'],
+        'ark_sdk_python.models.common.connections.ark_connection_result': ['ArkConnectionResult'],
+    },
+)
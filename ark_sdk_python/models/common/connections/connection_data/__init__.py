@@ -1,4 +1,17 @@
-from ark_sdk_python.models.common.connections.connection_data.ark_ssh_connection_data import ArkSSHConnectionData
-from ark_sdk_python.models.common.connections.connection_data.ark_winrm_connection_data import ArkWinRMConnectionData
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.common.connections.connection_data.ark_ssh_connection_data import ArkSSHConnectionData
+    from ark_sdk_python.models.common.connections.connection_data.ark_winrm_connection_data import ArkWinRMConnectionData
 
 __all__ = ['ArkSSHConnectionData', 'ArkWinRMConnectionData']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.common.connections.connection_data.ark_ssh_connection_data': ['ArkSSHConnectionData'],
+        'ark_sdk_python.models.common.connections.connection_data.ark_winrm_connection_data': ['ArkWinRMConnectionData'],
+    },
+)
@@ -1,42 +1,47 @@
-from ark_sdk_python.models.common.identity.ark_identity_auth_schemas import (
-    AdvanceAuthMidResponse,
-    AdvanceAuthMidResult,
-    AdvanceAuthResponse,
-    AdvanceAuthResult,
-    Challenge,
-    GetTenantSuffixResult,
-    IdpAuthStatusResponse,
-    IdpAuthStatusResult,
-    Mechanism,
-    PodFqdnResult,
-    StartAuthResponse,
-    StartAuthResult,
-    TenantFqdnResponse,
-)
-from ark_sdk_python.models.common.identity.ark_identity_common_schemas import IdentityApiResponse
-from ark_sdk_python.models.common.identity.ark_identity_directory_schemas import (
-    DirectorySearchArgs,
-    DirectorySearchEncoder,
-    DirectoryService,
-    DirectoryServiceMetadata,
-    DirectoryServiceQueryRequest,
-    DirectoryServiceQueryResponse,
-    DirectoryServiceQuerySpecificRoleRequest,
-    DirectoryServiceRow,
-    GetDirectoryServicesResponse,
-    GetDirectorySevicesResult,
-    GroupResult,
-    GroupRow,
-    GroupsResult,
-    QueryResult,
-    RoleAdminRight,
-    RoleResult,
-    RoleRow,
-    RolesResult,
-    UserResult,
-    UserRow,
-    UsersResult,
-)
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.common.identity.ark_identity_auth_schemas import (
+        AdvanceAuthMidResponse,
+        AdvanceAuthMidResult,
+        AdvanceAuthResponse,
+        AdvanceAuthResult,
+        Challenge,
+        GetTenantSuffixResult,
+        IdpAuthStatusResponse,
+        IdpAuthStatusResult,
+        Mechanism,
+        PodFqdnResult,
+        StartAuthResponse,
+        StartAuthResult,
+        TenantFqdnResponse,
+    )
+    from ark_sdk_python.models.common.identity.ark_identity_common_schemas import IdentityApiResponse
+    from ark_sdk_python.models.common.identity.ark_identity_directory_schemas import (
+        DirectorySearchArgs,
+        DirectorySearchEncoder,
+        DirectoryService,
+        DirectoryServiceMetadata,
+        DirectoryServiceQueryRequest,
+        DirectoryServiceQueryResponse,
+        DirectoryServiceQuerySpecificRoleRequest,
+        DirectoryServiceRow,
+        GetDirectoryServicesResponse,
+        GetDirectorySevicesResult,
+        GroupResult,
+        GroupRow,
+        GroupsResult,
+        QueryResult,
+        RoleAdminRight,
+        RoleResult,
+        RoleRow,
+        RolesResult,
+        UserResult,
+        UserRow,
+        UsersResult,
+    )
 
 __all__ = [
     'IdentityApiResponse',
@@ -75,3 +80,48 @@ __all__ = [
     'DirectoryServiceQueryResponse',
     'QueryResult',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.common.identity.ark_identity_auth_schemas': [
+            'AdvanceAuthMidResponse',
+            'AdvanceAuthMidResult',
+            'AdvanceAuthResponse',
+            'AdvanceAuthResult',
+            'Challenge',
+            'GetTenantSuffixResult',
+            'IdpAuthStatusResponse',
+            'IdpAuthStatusResult',
+            'Mechanism',
+            'PodFqdnResult',
+            'StartAuthResponse',
+            'StartAuthResult',
+            'TenantFqdnResponse',
+        ],
+        'ark_sdk_python.models.common.identity.ark_identity_common_schemas': ['IdentityApiResponse'],
+        'ark_sdk_python.models.common.identity.ark_identity_directory_schemas': [
+            'DirectorySearchArgs',
+            'DirectorySearchEncoder',
+            'DirectoryService',
+            'DirectoryServiceMetadata',
+            'DirectoryServiceQueryRequest',
+            'DirectoryServiceQueryResponse',
+            'DirectoryServiceQuerySpecificRoleRequest',
+            'DirectoryServiceRow',
+            'GetDirectoryServicesResponse',
+            'GetDirectorySevicesResult',
+            'GroupResult',
+            'GroupRow',
+            'GroupsResult',
+            'QueryResult',
+            'RoleAdminRight',
+            'RoleResult',
+            'RoleRow',
+            'RolesResult',
+            'UserResult',
+            'UserRow',
+            'UsersResult',
+        ],
+    },
+)
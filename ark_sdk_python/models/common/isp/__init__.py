@@ -1,3 +1,15 @@
-from ark_sdk_python.models.common.isp.ark_platform_discovery_schemas import IdentityEndpointResponse
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.common.isp.ark_platform_discovery_schemas import IdentityEndpointResponse
 
 __all__ = ['IdentityEndpointResponse']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.common.isp.ark_platform_discovery_schemas': ['IdentityEndpointResponse'],
+    },
+)
@@ -1,3 +1,15 @@
-from ark_sdk_python.models.services.ark_service_config import ArkServiceConfig
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.ark_service_config import ArkServiceConfig
 
 __all__ = ['ArkServiceConfig']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.ark_service_config': ['ArkServiceConfig'],
+    },
+)
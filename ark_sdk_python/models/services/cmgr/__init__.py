@@ -1,38 +1,43 @@
-from ark_sdk_python.models.services.cmgr.ark_cmgr_add_network import ArkCmgrAddNetwork
-from ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool import ArkCmgrAddPool
-from ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool_identifiers import (
-    ArkCmgrAddPoolBulkIdentifier,
-    ArkCmgrAddPoolIdentifier,
-    ArkCmgrAddPoolSingleIdentifier,
-)
-from ark_sdk_python.models.services.cmgr.ark_cmgr_delete_network import ArkCmgrDeleteNetwork
-from ark_sdk_python.models.services.cmgr.ark_cmgr_delete_pool import ArkCmgrDeletePool
-from ark_sdk_python.models.services.cmgr.ark_cmgr_delete_pool_identifiers import (
-    ArkCmgrDeletePoolBulkIdentifier,
-    ArkCmgrDeletePoolIdentifier,
-    ArkCmgrDeletePoolSingleIdentifier,
-)
-from ark_sdk_python.models.services.cmgr.ark_cmgr_get_network import ArkCmgrGetNetwork
-from ark_sdk_python.models.services.cmgr.ark_cmgr_get_pool import ArkCmgrGetPool
-from ark_sdk_python.models.services.cmgr.ark_cmgr_get_pool_component import ArkCmgrGetPoolComponent
-from ark_sdk_python.models.services.cmgr.ark_cmgr_list_pool_identifiers import ArkCmgrListPoolIdentifiers
-from ark_sdk_python.models.services.cmgr.ark_cmgr_network import ArkCmgrNetwork, ArkCmgrNetworkPool
-from ark_sdk_python.models.services.cmgr.ark_cmgr_networks_filter import ArkCmgrNetworksFilter
-from ark_sdk_python.models.services.cmgr.ark_cmgr_networks_stats import ArkCmgrNetworksStats
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pool import ArkCmgrPool, ArkCmgrPoolType
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_component import ArkCmgrPoolComponent, ArkCmgrPoolComponentType
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_components_filter import ArkCmgrPoolComponentsFilter
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers import (
-    ArkCmgrPoolIdentifier,
-    ArkCmgrPoolIdentifiers,
-    ArkCmgrPoolIdentifierType,
-)
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers_filter import ArkCmgrPoolIdentifiersFilter
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_common_filter import ArkCmgrPoolsCommonFilter
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_filter import ArkCmgrPoolsFilter
-from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_stats import ArkCmgrPoolsStats
-from ark_sdk_python.models.services.cmgr.ark_cmgr_update_network import ArkCmgrUpdateNetwork
-from ark_sdk_python.models.services.cmgr.ark_cmgr_update_pool import ArkCmgrUpdatePool
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_add_network import ArkCmgrAddNetwork
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool import ArkCmgrAddPool
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool_identifiers import (
+        ArkCmgrAddPoolBulkIdentifier,
+        ArkCmgrAddPoolIdentifier,
+        ArkCmgrAddPoolSingleIdentifier,
+    )
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_delete_network import ArkCmgrDeleteNetwork
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_delete_pool import ArkCmgrDeletePool
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_delete_pool_identifiers import (
+        ArkCmgrDeletePoolBulkIdentifier,
+        ArkCmgrDeletePoolIdentifier,
+        ArkCmgrDeletePoolSingleIdentifier,
+    )
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_get_network import ArkCmgrGetNetwork
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_get_pool import ArkCmgrGetPool
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_get_pool_component import ArkCmgrGetPoolComponent
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_list_pool_identifiers import ArkCmgrListPoolIdentifiers
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_network import ArkCmgrNetwork, ArkCmgrNetworkPool
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_networks_filter import ArkCmgrNetworksFilter
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_networks_stats import ArkCmgrNetworksStats
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pool import ArkCmgrPool, ArkCmgrPoolType
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_component import ArkCmgrPoolComponent, ArkCmgrPoolComponentType
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_components_filter import ArkCmgrPoolComponentsFilter
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers import (
+        ArkCmgrPoolIdentifier,
+        ArkCmgrPoolIdentifiers,
+        ArkCmgrPoolIdentifierType,
+    )
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers_filter import ArkCmgrPoolIdentifiersFilter
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_common_filter import ArkCmgrPoolsCommonFilter
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_filter import ArkCmgrPoolsFilter
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_pools_stats import ArkCmgrPoolsStats
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_update_network import ArkCmgrUpdateNetwork
+    from ark_sdk_python.models.services.cmgr.ark_cmgr_update_pool import ArkCmgrUpdatePool
 
 __all__ = [
     'ArkCmgrAddNetwork',
@@ -68,3 +73,44 @@ __all__ = [
     'ArkCmgrUpdateNetwork',
     'ArkCmgrUpdatePool',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_add_network': ['ArkCmgrAddNetwork'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool': ['ArkCmgrAddPool'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_add_pool_identifiers': [
+            'ArkCmgrAddPoolBulkIdentifier',
+            'ArkCmgrAddPoolIdentifier',
+            'ArkCmgrAddPoolSingleIdentifier',
+        ],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_delete_network': ['ArkCmgrDeleteNetwork'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_delete_pool': ['ArkCmgrDeletePool'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_delete_pool_identifiers': [
+            'ArkCmgrDeletePoolBulkIdentifier',
+            'ArkCmgrDeletePoolIdentifier',
+            'ArkCmgrDeletePoolSingleIdentifier',
+        ],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_get_network': ['ArkCmgrGetNetwork'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_get_pool': ['ArkCmgrGetPool'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_get_pool_component': ['ArkCmgrGetPoolComponent'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_list_pool_identifiers': ['ArkCmgrListPoolIdentifiers'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_network': ['ArkCmgrNetwork', 'ArkCmgrNetworkPool'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_networks_filter': ['ArkCmgrNetworksFilter'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_networks_stats': ['ArkCmgrNetworksStats'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pool': ['ArkCmgrPool', 'ArkCmgrPoolType'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pool_component': ['ArkCmgrPoolComponent', 'ArkCmgrPoolComponentType'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pool_components_filter': ['ArkCmgrPoolComponentsFilter'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers': [
+            'ArkCmgrPoolIdentifier',
+            'ArkCmgrPoolIdentifiers',
+            'ArkCmgrPoolIdentifierType',
+        ],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pool_identifiers_filter': ['ArkCmgrPoolIdentifiersFilter'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pools_common_filter': ['ArkCmgrPoolsCommonFilter'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pools_filter': ['ArkCmgrPoolsFilter'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_pools_stats': ['ArkCmgrPoolsStats'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_update_network': ['ArkCmgrUpdateNetwork'],
+        'ark_sdk_python.models.services.cmgr.ark_cmgr_update_pool': ['ArkCmgrUpdatePool'],
+    },
+)
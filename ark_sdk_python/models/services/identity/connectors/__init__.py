@@ -1,9 +1,23 @@
-from ark_sdk_python.models.services.identity.connectors.ark_identity_connector_info import ArkIdentityConnectorInfo
-from ark_sdk_python.models.services.identity.connectors.ark_identity_connectors_filter import ArkIdentityConnectorsFilter
-from ark_sdk_python.models.services.identity.connectors.ark_identity_get_connector import ArkIdentityGetConnector
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.identity.connectors.ark_identity_connector_info import ArkIdentityConnectorInfo
+    from ark_sdk_python.models.services.identity.connectors.ark_identity_connectors_filter import ArkIdentityConnectorsFilter
+    from ark_sdk_python.models.services.identity.connectors.ark_identity_get_connector import ArkIdentityGetConnector
 
 __all__ = [
     'ArkIdentityConnectorInfo',
     'ArkIdentityConnectorsFilter',
     'ArkIdentityGetConnector',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.identity.connectors.ark_identity_connector_info': ['ArkIdentityConnectorInfo'],
+        'ark_sdk_python.models.services.identity.connectors.ark_identity_connectors_filter': ['ArkIdentityConnectorsFilter'],
+        'ark_sdk_python.models.services.identity.connectors.ark_identity_get_connector': ['ArkIdentityGetConnector'],
+    },
+)
@@ -1,13 +1,20 @@
-from ark_sdk_python.models.services.identity.directories.ark_identity_directory import ArkIdentityDirectory
-from ark_sdk_python.models.services.identity.directories.ark_identity_entity import (
-    ArkIdentityEntity,
-    ArkIdentityEntityType,
-    ArkIdentityGroupEntity,
-    ArkIdentityRoleEntity,
-    ArkIdentityUserEntity,
-)
-from ark_sdk_python.models.services.identity.directories.ark_identity_list_directories import ArkIdentityListDirectories
-from ark_sdk_python.models.services.identity.directories.ark_identity_list_directories_entities import ArkIdentityListDirectoriesEntities
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.identity.directories.ark_identity_directory import ArkIdentityDirectory
+    from ark_sdk_python.models.services.identity.directories.ark_identity_entity import (
+        ArkIdentityEntity,
+        ArkIdentityEntityType,
+        ArkIdentityGroupEntity,
+        ArkIdentityRoleEntity,
+        ArkIdentityUserEntity,
+    )
+    from ark_sdk_python.models.services.identity.directories.ark_identity_list_directories import ArkIdentityListDirectories
+    from ark_sdk_python.models.services.identity.directories.ark_identity_list_directories_entities import (
+        ArkIdentityListDirectoriesEntities,
+    )
 
 __all__ = [
     'ArkIdentityListDirectoriesEntities',
@@ -19,3 +26,21 @@ __all__ = [
     'ArkIdentityListDirectories',
     'ArkIdentityDirectory',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.identity.directories.ark_identity_directory': ['ArkIdentityDirectory'],
+        'ark_sdk_python.models.services.identity.directories.ark_identity_entity': [
+            'ArkIdentityEntity',
+            'ArkIdentityEntityType',
+            'ArkIdentityGroupEntity',
+            'ArkIdentityRoleEntity',
+            'ArkIdentityUserEntity',
+        ],
+        'ark_sdk_python.models.services.identity.directories.ark_identity_list_directories': ['ArkIdentityListDirectories'],
+        'ark_sdk_python.models.services.identity.directories.ark_identity_list_directories_entities': [
+            'ArkIdentityListDirectoriesEntities'
+        ],
+    },
+)
@@ -1,18 +1,23 @@
-from ark_sdk_python.models.services.identity.policies.ark_identity_add_authentication_profile import ArkIdentityAddAuthenticationProfile
-from ark_sdk_python.models.services.identity.policies.ark_identity_add_policy import ArkIdentityAddPolicy
-from ark_sdk_python.models.services.identity.policies.ark_identity_authentication_profile import ArkIdentityAuthenticationProfile
-from ark_sdk_python.models.services.identity.policies.ark_identity_disable_policy import ArkIdentityDisablePolicy
-from ark_sdk_python.models.services.identity.policies.ark_identity_enable_policy import ArkIdentityEnablePolicy
-from ark_sdk_python.models.services.identity.policies.ark_identity_get_authentication_profile import ArkIdentityGetAuthenticationProfile
-from ark_sdk_python.models.services.identity.policies.ark_identity_get_policy import ArkIdentityGetPolicy
-from ark_sdk_python.models.services.identity.policies.ark_identity_policy import ArkIdentityPolicy
-from ark_sdk_python.models.services.identity.policies.ark_identity_policy_info import ArkIdentityPolicyInfo
-from ark_sdk_python.models.services.identity.policies.ark_identity_policy_operation import ArkIdentityPolicyOperation
-from ark_sdk_python.models.services.identity.policies.ark_identity_policy_operation_type import ArkIdentityPolicyOperationType
-from ark_sdk_python.models.services.identity.policies.ark_identity_remove_authentication_profile import (
-    ArkIdentityRemoveAuthenticationProfile,
-)
-from ark_sdk_python.models.services.identity.policies.ark_identity_remove_policy import ArkIdentityRemovePolicy
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.identity.policies.ark_identity_add_authentication_profile import ArkIdentityAddAuthenticationProfile
+    from ark_sdk_python.models.services.identity.policies.ark_identity_add_policy import ArkIdentityAddPolicy
+    from ark_sdk_python.models.services.identity.policies.ark_identity_authentication_profile import ArkIdentityAuthenticationProfile
+    from ark_sdk_python.models.services.identity.policies.ark_identity_disable_policy import ArkIdentityDisablePolicy
+    from ark_sdk_python.models.services.identity.policies.ark_identity_enable_policy import ArkIdentityEnablePolicy
+    from ark_sdk_python.models.services.identity.policies.ark_identity_get_authentication_profile import ArkIdentityGetAuthenticationProfile
+    from ark_sdk_python.models.services.identity.policies.ark_identity_get_policy import ArkIdentityGetPolicy
+    from ark_sdk_python.models.services.identity.policies.ark_identity_policy import ArkIdentityPolicy
+    from ark_sdk_python.models.services.identity.policies.ark_identity_policy_info import ArkIdentityPolicyInfo
+    from ark_sdk_python.models.services.identity.policies.ark_identity_policy_operation import ArkIdentityPolicyOperation
+    from ark_sdk_python.models.services.identity.policies.ark_identity_policy_operation_type import ArkIdentityPolicyOperationType
+    from ark_sdk_python.models.services.identity.policies.ark_identity_remove_authentication_profile import (
+        ArkIdentityRemoveAuthenticationProfile,
+    )
+    from ark_sdk_python.models.services.identity.policies.ark_identity_remove_policy import ArkIdentityRemovePolicy
 
 __all__ = [
     'ArkIdentityPolicy',
@@ -29,3 +34,24 @@ __all__ = [
     'ArkIdentityGetAuthenticationProfile',
     'ArkIdentityRemoveAuthenticationProfile',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.identity.policies.ark_identity_add_authentication_profile': ['ArkIdentityAddAuthenticationProfile'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_add_policy': ['ArkIdentityAddPolicy'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_authentication_profile': ['ArkIdentityAuthenticationProfile'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_disable_policy': ['ArkIdentityDisablePolicy'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_enable_policy': ['ArkIdentityEnablePolicy'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_get_authentication_profile': ['ArkIdentityGetAuthenticationProfile'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_get_policy': ['ArkIdentityGetPolicy'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_policy': ['ArkIdentityPolicy'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_policy_info': ['ArkIdentityPolicyInfo'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_policy_operation': ['ArkIdentityPolicyOperation'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_policy_operation_type': ['ArkIdentityPolicyOperationType'],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_remove_authentication_profile': [
+            'ArkIdentityRemoveAuthenticationProfile'
+        ],
+        'ark_sdk_python.models.services.identity.policies.ark_identity_remove_policy': ['ArkIdentityRemovePolicy'],
+    },
+)
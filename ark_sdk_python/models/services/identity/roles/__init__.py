@@ -1,18 +1,23 @@
-from ark_sdk_python.models.services.identity.roles.ark_identity_add_admin_right_to_role import ArkIdentityAddAdminRightsToRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_add_group_to_role import ArkIdentityAddGroupToRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_add_role_to_role import ArkIdentityAddRoleToRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_add_user_to_role import ArkIdentityAddUserToRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_admin_right import ArkIdentityAdminRights
-from ark_sdk_python.models.services.identity.roles.ark_identity_create_role import ArkIdentityCreateRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_delete_role import ArkIdentityDeleteRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_list_role_members import ArkIdentityListRoleMembers
-from ark_sdk_python.models.services.identity.roles.ark_identity_remove_group_from_role import ArkIdentityRemoveGroupFromRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_remove_role_from_role import ArkIdentityRemoveRoleFromRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_remove_user_from_role import ArkIdentityRemoveUserFromRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_role import ArkIdentityRole
-from ark_sdk_python.models.services.identity.roles.ark_identity_role_id_by_name import ArkIdentityRoleIdByName
-from ark_sdk_python.models.services.identity.roles.ark_identity_role_member import ArkIdentityRoleMember
-from ark_sdk_python.models.services.identity.roles.ark_identity_update_role import ArkIdentityUpdateRole
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.identity.roles.ark_identity_add_admin_right_to_role import ArkIdentityAddAdminRightsToRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_add_group_to_role import ArkIdentityAddGroupToRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_add_role_to_role import ArkIdentityAddRoleToRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_add_user_to_role import ArkIdentityAddUserToRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_admin_right import ArkIdentityAdminRights
+    from ark_sdk_python.models.services.identity.roles.ark_identity_create_role import ArkIdentityCreateRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_delete_role import ArkIdentityDeleteRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_list_role_members import ArkIdentityListRoleMembers
+    from ark_sdk_python.models.services.identity.roles.ark_identity_remove_group_from_role import ArkIdentityRemoveGroupFromRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_remove_role_from_role import ArkIdentityRemoveRoleFromRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_remove_user_from_role import ArkIdentityRemoveUserFromRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_role import ArkIdentityRole
+    from ark_sdk_python.models.services.identity.roles.ark_identity_role_id_by_name import ArkIdentityRoleIdByName
+    from ark_sdk_python.models.services.identity.roles.ark_identity_role_member import ArkIdentityRoleMember
+    from ark_sdk_python.models.services.identity.roles.ark_identity_update_role import ArkIdentityUpdateRole
 
 __all__ = [
     'ArkIdentityAddAdminRightsToRole',
@@ -31,3 +36,24 @@ __all__ = [
     'ArkIdentityListRoleMembers',
     'ArkIdentityRoleMember',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.identity.roles.ark_identity_add_admin_right_to_role': ['ArkIdentityAddAdminRightsToRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_add_group_to_role': ['ArkIdentityAddGroupToRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_add_role_to_role': ['ArkIdentityAddRoleToRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_add_user_to_role': ['ArkIdentityAddUserToRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_admin_right': ['ArkIdentityAdminRights'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_create_role': ['ArkIdentityCreateRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_delete_role': ['ArkIdentityDeleteRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_list_role_members': ['ArkIdentityListRoleMembers'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_remove_group_from_role': ['ArkIdentityRemoveGroupFromRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_remove_role_from_role': ['ArkIdentityRemoveRoleFromRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_remove_user_from_role': ['ArkIdentityRemoveUserFromRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_role': ['ArkIdentityRole'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_role_id_by_name': ['ArkIdentityRoleIdByName'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_role_member': ['ArkIdentityRoleMember'],
+        'ark_sdk_python.models.services.identity.roles.ark_identity_update_role': ['ArkIdentityUpdateRole'],
+    },
+)
@@ -1,13 +1,18 @@
-from ark_sdk_python.models.services.identity.users.ark_identity_create_user import ArkIdentityCreateUser
-from ark_sdk_python.models.services.identity.users.ark_identity_delete_user import ArkIdentityDeleteUser
-from ark_sdk_python.models.services.identity.users.ark_identity_delete_users import ArkIdentityDeleteUsers
-from ark_sdk_python.models.services.identity.users.ark_identity_reset_user_password import ArkIdentityResetUserPassword
-from ark_sdk_python.models.services.identity.users.ark_identity_update_user import ArkIdentityUpdateUser
-from ark_sdk_python.models.services.identity.users.ark_identity_user import ArkIdentityUser
-from ark_sdk_python.models.services.identity.users.ark_identity_user_by_id import ArkIdentityUserById
-from ark_sdk_python.models.services.identity.users.ark_identity_user_by_name import ArkIdentityUserByName
-from ark_sdk_python.models.services.identity.users.ark_identity_user_id_by_name import ArkIdentityUserIdByName
-from ark_sdk_python.models.services.identity.users.ark_identity_user_info import ArkIdentityUserInfo
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.identity.users.ark_identity_create_user import ArkIdentityCreateUser
+    from ark_sdk_python.models.services.identity.users.ark_identity_delete_user import ArkIdentityDeleteUser
+    from ark_sdk_python.models.services.identity.users.ark_identity_delete_users import ArkIdentityDeleteUsers
+    from ark_sdk_python.models.services.identity.users.ark_identity_reset_user_password import ArkIdentityResetUserPassword
+    from ark_sdk_python.models.services.identity.users.ark_identity_update_user import ArkIdentityUpdateUser
+    from ark_sdk_python.models.services.identity.users.ark_identity_user import ArkIdentityUser
+    from ark_sdk_python.models.services.identity.users.ark_identity_user_by_id import ArkIdentityUserById
+    from ark_sdk_python.models.services.identity.users.ark_identity_user_by_name import ArkIdentityUserByName
+    from ark_sdk_python.models.services.identity.users.ark_identity_user_id_by_name import ArkIdentityUserIdByName
+    from ark_sdk_python.models.services.identity.users.ark_identity_user_info import ArkIdentityUserInfo
 
 __all__ = [
     'ArkIdentityCreateUser',
@@ -21,3 +26,19 @@ __all__ = [
     'ArkIdentityUpdateUser',
     'ArkIdentityUserInfo',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.identity.users.ark_identity_create_user': ['ArkIdentityCreateUser'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_delete_user': ['ArkIdentityDeleteUser'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_delete_users': ['ArkIdentityDeleteUsers'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_reset_user_password': ['ArkIdentityResetUserPassword'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_update_user': ['ArkIdentityUpdateUser'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_user': ['ArkIdentityUser'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_user_by_id': ['ArkIdentityUserById'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_user_by_name': ['ArkIdentityUserByName'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_user_id_by_name': ['ArkIdentityUserIdByName'],
+        'ark_sdk_python.models.services.identity.users.ark_identity_user_info': ['ArkIdentityUserInfo'],
+    },
+)
@@ -1,30 +1,35 @@
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account import (
-    ArkPCloudAccount,
-    ArkPCloudAccountRemoteMachinesAccess,
-    ArkPCloudAccountSecretManagement,
-    ArkPCloudAccountSecretType,
-    ArkPCloudBaseAccount,
-)
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account_credentials import ArkPCloudAccountCredentials
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account_secret_version import ArkPCloudAccountSecretVersion
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_accounts_filter import ArkPCloudAccountsFilter
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_accounts_stats import ArkPCloudAccountsStats
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_add_account import ArkPCloudAddAccount
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_change_account_credentials import ArkPCloudChangeAccountCredentials
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_delete_account import ArkPCloudDeleteAccount
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_generate_account_credentials import ArkPCloudGenerateAccountCredentials
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_get_account import ArkPCloudGetAccount
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_get_account_credentials import ArkPCloudGetAccountCredentials
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_link_account import ArkPCloudLinkAccount
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_list_account_secret_versions import ArkPCloudListAccountSecretVersions
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_reconcile_account_credentials import ArkPCloudReconcileAccountCredentials
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_set_account_next_credentials import ArkPCloudSetAccountNextCredentials
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_unlink_account import ArkPCloudUnlinkAccount
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_update_account import ArkPCloudUpdateAccount
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_update_account_credentials_in_vault import (
-    ArkPCloudUpdateAccountCredentialsInVault,
-)
-from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_verify_account_credentias import ArkPCloudVerifyAccountCredentials
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account import (
+        ArkPCloudAccount,
+        ArkPCloudAccountRemoteMachinesAccess,
+        ArkPCloudAccountSecretManagement,
+        ArkPCloudAccountSecretType,
+        ArkPCloudBaseAccount,
+    )
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account_credentials import ArkPCloudAccountCredentials
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account_secret_version import ArkPCloudAccountSecretVersion
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_accounts_filter import ArkPCloudAccountsFilter
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_accounts_stats import ArkPCloudAccountsStats
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_add_account import ArkPCloudAddAccount
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_change_account_credentials import ArkPCloudChangeAccountCredentials
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_delete_account import ArkPCloudDeleteAccount
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_generate_account_credentials import ArkPCloudGenerateAccountCredentials
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_get_account import ArkPCloudGetAccount
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_get_account_credentials import ArkPCloudGetAccountCredentials
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_link_account import ArkPCloudLinkAccount
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_list_account_secret_versions import ArkPCloudListAccountSecretVersions
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_reconcile_account_credentials import ArkPCloudReconcileAccountCredentials
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_set_account_next_credentials import ArkPCloudSetAccountNextCredentials
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_unlink_account import ArkPCloudUnlinkAccount
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_update_account import ArkPCloudUpdateAccount
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_update_account_credentials_in_vault import (
+        ArkPCloudUpdateAccountCredentialsInVault,
+    )
+    from ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_verify_account_credentias import ArkPCloudVerifyAccountCredentials
 
 __all__ = [
     'ArkPCloudBaseAccount',
@@ -51,3 +56,36 @@ __all__ = [
     'ArkPCloudLinkAccount',
     'ArkPCloudUnlinkAccount',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account': [
+            'ArkPCloudAccount',
+            'ArkPCloudAccountRemoteMachinesAccess',
+            'ArkPCloudAccountSecretManagement',
+            'ArkPCloudAccountSecretType',
+            'ArkPCloudBaseAccount',
+        ],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account_credentials': ['ArkPCloudAccountCredentials'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_account_secret_version': ['ArkPCloudAccountSecretVersion'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_accounts_filter': ['ArkPCloudAccountsFilter'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_accounts_stats': ['ArkPCloudAccountsStats'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_add_account': ['ArkPCloudAddAccount'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_change_account_credentials': ['ArkPCloudChangeAccountCredentials'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_delete_account': ['ArkPCloudDeleteAccount'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_generate_account_credentials': ['ArkPCloudGenerateAccountCredentials'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_get_account': ['ArkPCloudGetAccount'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_get_account_credentials': ['ArkPCloudGetAccountCredentials'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_link_account': ['ArkPCloudLinkAccount'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_list_account_secret_versions': ['ArkPCloudListAccountSecretVersions'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_reconcile_account_credentials': ['ArkPCloudReconcileAccountCredentials'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_set_account_next_credentials': ['ArkPCloudSetAccountNextCredentials'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_unlink_account': ['ArkPCloudUnlinkAccount'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_update_account': ['ArkPCloudUpdateAccount'],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_update_account_credentials_in_vault': [
+            'ArkPCloudUpdateAccountCredentialsInVault'
+        ],
+        'ark_sdk_python.models.services.pcloud.accounts.ark_pcloud_verify_account_credentias': ['ArkPCloudVerifyAccountCredentials'],
+    },
+)
@@ -1,23 +1,30 @@
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_add_application import ArkPCloudAddApplication
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_add_application_auth_method import ArkPCloudAddApplicationAuthMethod
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application import ArkPCloudApplication
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application_auth_method import (
-    ArkPCloudApplicationAuthMethod,
-    ArkPCloudApplicationAuthMethodCertKeyVal,
-    ArkPCloudApplicationAuthMethodType,
-)
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application_auth_methods_filter import (
-    ArkPCloudApplicationAuthMethodsFilter,
-)
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_applications_filter import ArkPCloudApplicationsFilter
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_applications_stats import ArkPCloudAppicationsStats
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_delete_application import ArkPCloudDeleteApplication
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_delete_application_auth_method import (
-    ArkPCloudDeleteApplicationAuthMethod,
-)
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_get_application import ArkPCloudGetApplication
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_get_application_auth_method import ArkPCloudGetApplicationAuthMethod
-from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_list_application_auth_methods import ArkPCloudListApplicationAuthMethods
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_add_application import ArkPCloudAddApplication
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_add_application_auth_method import ArkPCloudAddApplicationAuthMethod
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application import ArkPCloudApplication
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application_auth_method import (
+        ArkPCloudApplicationAuthMethod,
+        ArkPCloudApplicationAuthMethodCertKeyVal,
+        ArkPCloudApplicationAuthMethodType,
+    )
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application_auth_methods_filter import (
+        ArkPCloudApplicationAuthMethodsFilter,
+    )
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_applications_filter import ArkPCloudApplicationsFilter
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_applications_stats import ArkPCloudAppicationsStats
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_delete_application import ArkPCloudDeleteApplication
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_delete_application_auth_method import (
+        ArkPCloudDeleteApplicationAuthMethod,
+    )
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_get_application import ArkPCloudGetApplication
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_get_application_auth_method import ArkPCloudGetApplicationAuthMethod
+    from ark_sdk_python.models.services.pcloud.applications.ark_pcloud_list_application_auth_methods import (
+        ArkPCloudListApplicationAuthMethods,
+    )
 
 __all__ = [
     'ArkPCloudAddApplication',
@@ -35,3 +42,31 @@ __all__ = [
     'ArkPCloudGetApplicationAuthMethod',
     'ArkPCloudListApplicationAuthMethods',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_add_application': ['ArkPCloudAddApplication'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_add_application_auth_method': ['ArkPCloudAddApplicationAuthMethod'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application': ['ArkPCloudApplication'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application_auth_method': [
+            'ArkPCloudApplicationAuthMethod',
+            'ArkPCloudApplicationAuthMethodCertKeyVal',
+            'ArkPCloudApplicationAuthMethodType',
+        ],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_application_auth_methods_filter': [
+            'ArkPCloudApplicationAuthMethodsFilter'
+        ],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_applications_filter': ['ArkPCloudApplicationsFilter'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_applications_stats': ['ArkPCloudAppicationsStats'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_delete_application': ['ArkPCloudDeleteApplication'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_delete_application_auth_method': [
+            'ArkPCloudDeleteApplicationAuthMethod'
+        ],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_get_application': ['ArkPCloudGetApplication'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_get_application_auth_method': ['ArkPCloudGetApplicationAuthMethod'],
+        'ark_sdk_python.models.services.pcloud.applications.ark_pcloud_list_application_auth_methods': [
+            'ArkPCloudListApplicationAuthMethods'
+        ],
+    },
+)
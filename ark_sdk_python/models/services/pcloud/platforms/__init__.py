@@ -1,38 +1,45 @@
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_activate_target_platform import ArkPCloudActivateTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_deactivate_target_platform import ArkPCloudDeactivateTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_delete_target_platform import ArkPCloudDeleteTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_duplicate_target_platform import ArkPCloudDuplicateTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_duplicated_target_platform_info import ArkPCloudDuplicatedTargetPlatformInfo
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_export_platform import ArkPCloudExportPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_export_target_platform import ArkPCloudExportTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_get_platform import ArkPCloudGetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_get_target_platform import ArkPCloudGetTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_import_platform import ArkPCloudImportPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_import_target_platform import ArkPCloudImportTargetPlatform
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platform import (
-    ArkPCloudCredentialsManagement,
-    ArkPCloudPlatform,
-    ArkPCloudPlatformGeneralDetails,
-    ArkPCloudPlatformProperties,
-    ArkPCloudPlatformProperty,
-    ArkPCloudPlatformType,
-    ArkPCloudPrivilegedAccessWorkflows,
-    ArkPCloudSessionManagement,
-)
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platforms_filter import ArkPCloudPlatformsFilter
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platforms_stats import ArkPCloudPlatformsStats
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platform import (
-    ArkPCloudTargetPlatform,
-    ArkPCloudTPCredentialsManagementPolicy,
-    ArkPCloudTPCredentialsManagementReconcilePolicy,
-    ArkPCloudTPCredentialsManagementSecretUpdateConfiguration,
-    ArkPCloudTPCredentialsManagementVerificationChangePolicy,
-    ArkPCloudTPPrivilegedAccessWorkflows,
-    ArkPCloudTPPrivilegedAccessWorkflowsActiveException,
-    ArkPCloudTPPrivilegedSessionManagement,
-)
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platforms_filter import ArkPCloudTargetPlatformsFilter
-from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platforms_stats import ArkPCloudTargetPlatformsStats
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_activate_target_platform import ArkPCloudActivateTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_deactivate_target_platform import ArkPCloudDeactivateTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_delete_target_platform import ArkPCloudDeleteTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_duplicate_target_platform import ArkPCloudDuplicateTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_duplicated_target_platform_info import (
+        ArkPCloudDuplicatedTargetPlatformInfo,
+    )
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_export_platform import ArkPCloudExportPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_export_target_platform import ArkPCloudExportTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_get_platform import ArkPCloudGetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_get_target_platform import ArkPCloudGetTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_import_platform import ArkPCloudImportPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_import_target_platform import ArkPCloudImportTargetPlatform
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platform import (
+        ArkPCloudCredentialsManagement,
+        ArkPCloudPlatform,
+        ArkPCloudPlatformGeneralDetails,
+        ArkPCloudPlatformProperties,
+        ArkPCloudPlatformProperty,
+        ArkPCloudPlatformType,
+        ArkPCloudPrivilegedAccessWorkflows,
+        ArkPCloudSessionManagement,
+    )
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platforms_filter import ArkPCloudPlatformsFilter
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platforms_stats import ArkPCloudPlatformsStats
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platform import (
+        ArkPCloudTargetPlatform,
+        ArkPCloudTPCredentialsManagementPolicy,
+        ArkPCloudTPCredentialsManagementReconcilePolicy,
+        ArkPCloudTPCredentialsManagementSecretUpdateConfiguration,
+        ArkPCloudTPCredentialsManagementVerificationChangePolicy,
+        ArkPCloudTPPrivilegedAccessWorkflows,
+        ArkPCloudTPPrivilegedAccessWorkflowsActiveException,
+        ArkPCloudTPPrivilegedSessionManagement,
+    )
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platforms_filter import ArkPCloudTargetPlatformsFilter
+    from ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platforms_stats import ArkPCloudTargetPlatformsStats
 
 __all__ = [
     'ArkPCloudExportPlatform',
@@ -67,3 +74,46 @@ __all__ = [
     'ArkPCloudTargetPlatformsStats',
     'ArkPCloudDuplicatedTargetPlatformInfo',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_activate_target_platform': ['ArkPCloudActivateTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_deactivate_target_platform': ['ArkPCloudDeactivateTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_delete_target_platform': ['ArkPCloudDeleteTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_duplicate_target_platform': ['ArkPCloudDuplicateTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_duplicated_target_platform_info': [
+            'ArkPCloudDuplicatedTargetPlatformInfo'
+        ],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_export_platform': ['ArkPCloudExportPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_export_target_platform': ['ArkPCloudExportTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_get_platform': ['ArkPCloudGetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_get_target_platform': ['ArkPCloudGetTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_import_platform': ['ArkPCloudImportPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_import_target_platform': ['ArkPCloudImportTargetPlatform'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platform': [
+            'ArkPCloudCredentialsManagement',
+            'ArkPCloudPlatform',
+            'ArkPCloudPlatformGeneralDetails',
+            'ArkPCloudPlatformProperties',
+            'ArkPCloudPlatformProperty',
+            'ArkPCloudPlatformType',
+            'ArkPCloudPrivilegedAccessWorkflows',
+            'ArkPCloudSessionManagement',
+        ],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platforms_filter': ['ArkPCloudPlatformsFilter'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_platforms_stats': ['ArkPCloudPlatformsStats'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platform': [
+            'ArkPCloudTargetPlatform',
+            'ArkPCloudTPCredentialsManagementPolicy',
+            'ArkPCloudTPCredentialsManagementReconcilePolicy',
+            'ArkPCloudTPCredentialsManagementSecretUpdateConfiguration',
+            'ArkPCloudTPCredentialsManagementVerificationChangePolicy',
+            'ArkPCloudTPPrivilegedAccessWorkflows',
+            'ArkPCloudTPPrivilegedAccessWorkflowsActiveException',
+            'ArkPCloudTPPrivilegedSessionManagement',
+        ],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platforms_filter': ['ArkPCloudTargetPlatformsFilter'],
+        'ark_sdk_python.models.services.pcloud.platforms.ark_pcloud_target_platforms_stats': ['ArkPCloudTargetPlatformsStats'],
+    },
+)
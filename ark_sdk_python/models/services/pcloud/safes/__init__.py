@@ -1,24 +1,32 @@
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_add_safe import ArkPCloudAddSafe
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_add_safe_member import ArkPCloudAddSafeMember
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_delete_safe import ArkPCloudDeleteSafe
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_delete_safe_member import ArkPCloudDeleteSafeMember
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe import ArkPCloudGetSafe
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe_member import ArkPCloudGetSafeMember
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe_members_stats import ArkPCloudGetSafeMembersStats
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_list_safe_members import ArkPCloudListSafeMembers
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe import ArkPCloudBaseSafe, ArkPCloudSafe, ArkPCloudSafeCreator
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe_member import (
-    ArkPCloudSafeMember,
-    ArkPCloudSafeMemberPermissions,
-    ArkPCloudSafeMemberPermissionSet,
-    ArkPCloudSafeMemberType,
-)
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe_members_filter import ArkPCloudSafeMembersFilters
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_filters import ArkPCloudSafesFilters
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_members_stats import ArkPCloudSafeMembersStats, ArkPCloudSafesMembersStats
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_stats import ArkPCloudSafesStats
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_update_safe import ArkPCloudUpdateSafe
-from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_update_safe_member import ArkPCloudUpdateSafeMember
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_add_safe import ArkPCloudAddSafe
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_add_safe_member import ArkPCloudAddSafeMember
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_delete_safe import ArkPCloudDeleteSafe
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_delete_safe_member import ArkPCloudDeleteSafeMember
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe import ArkPCloudGetSafe
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe_member import ArkPCloudGetSafeMember
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe_members_stats import ArkPCloudGetSafeMembersStats
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_list_safe_members import ArkPCloudListSafeMembers
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe import ArkPCloudBaseSafe, ArkPCloudSafe, ArkPCloudSafeCreator
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe_member import (
+        ArkPCloudSafeMember,
+        ArkPCloudSafeMemberPermissions,
+        ArkPCloudSafeMemberPermissionSet,
+        ArkPCloudSafeMemberType,
+    )
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe_members_filter import ArkPCloudSafeMembersFilters
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_filters import ArkPCloudSafesFilters
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_members_stats import (
+        ArkPCloudSafeMembersStats,
+        ArkPCloudSafesMembersStats,
+    )
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_stats import ArkPCloudSafesStats
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_update_safe import ArkPCloudUpdateSafe
+    from ark_sdk_python.models.services.pcloud.safes.ark_pcloud_update_safe_member import ArkPCloudUpdateSafeMember
 
 __all__ = [
     'ArkPCloudAddSafeMember',
@@ -44,3 +52,33 @@ __all__ = [
     'ArkPCloudUpdateSafe',
     'ArkPCloudGetSafeMembersStats',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_add_safe': ['ArkPCloudAddSafe'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_add_safe_member': ['ArkPCloudAddSafeMember'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_delete_safe': ['ArkPCloudDeleteSafe'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_delete_safe_member': ['ArkPCloudDeleteSafeMember'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe': ['ArkPCloudGetSafe'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe_member': ['ArkPCloudGetSafeMember'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_get_safe_members_stats': ['ArkPCloudGetSafeMembersStats'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_list_safe_members': ['ArkPCloudListSafeMembers'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe': ['ArkPCloudBaseSafe', 'ArkPCloudSafe', 'ArkPCloudSafeCreator'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe_member': [
+            'ArkPCloudSafeMember',
+            'ArkPCloudSafeMemberPermissions',
+            'ArkPCloudSafeMemberPermissionSet',
+            'ArkPCloudSafeMemberType',
+        ],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safe_members_filter': ['ArkPCloudSafeMembersFilters'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_filters': ['ArkPCloudSafesFilters'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_members_stats': [
+            'ArkPCloudSafeMembersStats',
+            'ArkPCloudSafesMembersStats',
+        ],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_safes_stats': ['ArkPCloudSafesStats'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_update_safe': ['ArkPCloudUpdateSafe'],
+        'ark_sdk_python.models.services.pcloud.safes.ark_pcloud_update_safe_member': ['ArkPCloudUpdateSafeMember'],
+    },
+)
@@ -1,8 +1,13 @@
-from ark_sdk_python.models.services.sia.access.ark_sia_access_workspace_type_serializer import serialize_access_workspace_type
-from ark_sdk_python.models.services.sia.access.ark_sia_connector_setup_script import ArkSIAConnectorSetupScript
-from ark_sdk_python.models.services.sia.access.ark_sia_get_connector_setup_script import ArkSIAGetConnectorSetupScript
-from ark_sdk_python.models.services.sia.access.ark_sia_install_connector import ArkSIAInstallConnector
-from ark_sdk_python.models.services.sia.access.ark_sia_uninstall_connector import ArkSIAUninstallConnector
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.access.ark_sia_access_workspace_type_serializer import serialize_access_workspace_type
+    from ark_sdk_python.models.services.sia.access.ark_sia_connector_setup_script import ArkSIAConnectorSetupScript
+    from ark_sdk_python.models.services.sia.access.ark_sia_get_connector_setup_script import ArkSIAGetConnectorSetupScript
+    from ark_sdk_python.models.services.sia.access.ark_sia_install_connector import ArkSIAInstallConnector
+    from ark_sdk_python.models.services.sia.access.ark_sia_uninstall_connector import ArkSIAUninstallConnector
 
 __all__ = [
     'ArkSIAGetConnectorSetupScript',
@@ -11,3 +16,14 @@ __all__ = [
     'ArkSIAUninstallConnector',
     'serialize_access_workspace_type',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.access.ark_sia_access_workspace_type_serializer': ['serialize_access_workspace_type'],
+        'ark_sdk_python.models.services.sia.access.ark_sia_connector_setup_script': ['ArkSIAConnectorSetupScript'],
+        'ark_sdk_python.models.services.sia.access.ark_sia_get_connector_setup_script': ['ArkSIAGetConnectorSetupScript'],
+        'ark_sdk_python.models.services.sia.access.ark_sia_install_connector': ['ArkSIAInstallConnector'],
+        'ark_sdk_python.models.services.sia.access.ark_sia_uninstall_connector': ['ArkSIAUninstallConnector'],
+    },
+)
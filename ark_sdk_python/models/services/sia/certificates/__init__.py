@@ -1,16 +1,21 @@
-from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_certificate import (
-    ArkSIACertificate,
-    ArkSIACreateCertificate,
-    ArkSIACreateCertificateRequest,
-    ArkSIAShortCertificate,
-)
-from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_delete_certificate import ArkSIADeleteCertificate
-from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_filter import ArkSIACertificatesFilter
-from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_get_certificate import ArkSIAGetCertificate
-from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_update_certificate import (
-    ArkSIAUpdateCertificate,
-    ArkSIAUpdateCertificateRequest,
-)
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_certificate import (
+        ArkSIACertificate,
+        ArkSIACreateCertificate,
+        ArkSIACreateCertificateRequest,
+        ArkSIAShortCertificate,
+    )
+    from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_delete_certificate import ArkSIADeleteCertificate
+    from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_filter import ArkSIACertificatesFilter
+    from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_get_certificate import ArkSIAGetCertificate
+    from ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_update_certificate import (
+        ArkSIAUpdateCertificate,
+        ArkSIAUpdateCertificateRequest,
+    )
 
 __all__ = [
     "ArkSIACreateCertificate",
@@ -23,3 +28,22 @@ __all__ = [
     "ArkSIACertificatesFilter",
     "ArkSIAShortCertificate",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_certificate': [
+            'ArkSIACertificate',
+            'ArkSIACreateCertificate',
+            'ArkSIACreateCertificateRequest',
+            'ArkSIAShortCertificate',
+        ],
+        'ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_delete_certificate': ['ArkSIADeleteCertificate'],
+        'ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_filter': ['ArkSIACertificatesFilter'],
+        'ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_get_certificate': ['ArkSIAGetCertificate'],
+        'ark_sdk_python.models.services.sia.certificates.ark_sia_certificates_update_certificate': [
+            'ArkSIAUpdateCertificate',
+            'ArkSIAUpdateCertificateRequest',
+        ],
+    },
+)
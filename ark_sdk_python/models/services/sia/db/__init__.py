@@ -1,11 +1,19 @@
-from ark_sdk_python.models.services.sia.db.ark_sia_db_assets_type import ArkSIADBAssetsType
-from ark_sdk_python.models.services.sia.db.ark_sia_db_base_execution import ArkSIADBBaseExecution
-from ark_sdk_python.models.services.sia.db.ark_sia_db_base_generate_assets import ArkSIADBAssetsResponseFormat, ArkSIADBBaseGenerateAssets
-from ark_sdk_python.models.services.sia.db.ark_sia_db_generated_assets import ArkSIADBGeneratedAssets
-from ark_sdk_python.models.services.sia.db.ark_sia_db_mysql_execution import ArkSIADBMysqlExecution
-from ark_sdk_python.models.services.sia.db.ark_sia_db_oracle_generate_assets import ArkSIADBOracleGenerateAssets
-from ark_sdk_python.models.services.sia.db.ark_sia_db_proxy_fullchain_generate_assets import ArkSIADBProxyFullchainGenerateAssets
-from ark_sdk_python.models.services.sia.db.ark_sia_db_psql_execution import ArkSIADBPsqlExecution
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_assets_type import ArkSIADBAssetsType
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_base_execution import ArkSIADBBaseExecution
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_base_generate_assets import (
+        ArkSIADBAssetsResponseFormat,
+        ArkSIADBBaseGenerateAssets,
+    )
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_generated_assets import ArkSIADBGeneratedAssets
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_mysql_execution import ArkSIADBMysqlExecution
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_oracle_generate_assets import ArkSIADBOracleGenerateAssets
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_proxy_fullchain_generate_assets import ArkSIADBProxyFullchainGenerateAssets
+    from ark_sdk_python.models.services.sia.db.ark_sia_db_psql_execution import ArkSIADBPsqlExecution
 
 __all__ = [
     'ArkSIADBBaseExecution',
@@ -18,3 +26,20 @@ __all__ = [
     'ArkSIADBProxyFullchainGenerateAssets',
     'ArkSIADBAssetsType',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_assets_type': ['ArkSIADBAssetsType'],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_base_execution': ['ArkSIADBBaseExecution'],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_base_generate_assets': [
+            'ArkSIADBAssetsResponseFormat',
+            'ArkSIADBBaseGenerateAssets',
+        ],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_generated_assets': ['ArkSIADBGeneratedAssets'],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_mysql_execution': ['ArkSIADBMysqlExecution'],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_oracle_generate_assets': ['ArkSIADBOracleGenerateAssets'],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_proxy_fullchain_generate_assets': ['ArkSIADBProxyFullchainGenerateAssets'],
+        'ark_sdk_python.models.services.sia.db.ark_sia_db_psql_execution': ['ArkSIADBPsqlExecution'],
+    },
+)
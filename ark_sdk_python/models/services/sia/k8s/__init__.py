@@ -1,3 +1,15 @@
-from ark_sdk_python.models.services.sia.k8s.ark_sia_k8s_generate_kubeconfig import ArkSIAK8SGenerateKubeConfig
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.k8s.ark_sia_k8s_generate_kubeconfig import ArkSIAK8SGenerateKubeConfig
 
 __all__ = ['ArkSIAK8SGenerateKubeConfig']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.k8s.ark_sia_k8s_generate_kubeconfig': ['ArkSIAK8SGenerateKubeConfig'],
+    },
+)
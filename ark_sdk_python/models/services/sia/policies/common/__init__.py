@@ -1,19 +1,24 @@
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_add_policy import ArkSIABaseAddPolicy
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_authorization_rule import ArkSIABaseAuthorizationRule
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_connection_information import (
-    ArkSIABaseConnectionInformation,
-    ArkSIADaysOfWeek,
-)
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policies_filter import ArkSIABasePoliciesFilter
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policies_stats import ArkSIABasePoliciesStats
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy import ArkSIABasePolicy
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy_list_item import ArkSIABasePolicyListItem
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_update_policy import ArkSIABaseUpdatePolicy
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_delete_policy import ArkSIADeletePolicy
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_get_policy import ArkSIAGetPolicy
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_rule_status import ArkSIARuleStatus
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_update_policy_status import ArkSIAUpdatePolicyStatus
-from ark_sdk_python.models.services.sia.policies.common.ark_sia_user_data import ArkSIAUserData, ArkSIAUserDataAttribute
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_add_policy import ArkSIABaseAddPolicy
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_authorization_rule import ArkSIABaseAuthorizationRule
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_connection_information import (
+        ArkSIABaseConnectionInformation,
+        ArkSIADaysOfWeek,
+    )
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policies_filter import ArkSIABasePoliciesFilter
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policies_stats import ArkSIABasePoliciesStats
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy import ArkSIABasePolicy
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy_list_item import ArkSIABasePolicyListItem
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_base_update_policy import ArkSIABaseUpdatePolicy
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_delete_policy import ArkSIADeletePolicy
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_get_policy import ArkSIAGetPolicy
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_rule_status import ArkSIARuleStatus
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_update_policy_status import ArkSIAUpdatePolicyStatus
+    from ark_sdk_python.models.services.sia.policies.common.ark_sia_user_data import ArkSIAUserData, ArkSIAUserDataAttribute
 
 __all__ = [
     'ArkSIABaseAddPolicy',
@@ -32,3 +37,25 @@ __all__ = [
     'ArkSIAUserData',
     'ArkSIAUserDataAttribute',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_add_policy': ['ArkSIABaseAddPolicy'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_authorization_rule': ['ArkSIABaseAuthorizationRule'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_connection_information': [
+            'ArkSIABaseConnectionInformation',
+            'ArkSIADaysOfWeek',
+        ],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policies_filter': ['ArkSIABasePoliciesFilter'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policies_stats': ['ArkSIABasePoliciesStats'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy': ['ArkSIABasePolicy'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_policy_list_item': ['ArkSIABasePolicyListItem'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_base_update_policy': ['ArkSIABaseUpdatePolicy'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_delete_policy': ['ArkSIADeletePolicy'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_get_policy': ['ArkSIAGetPolicy'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_rule_status': ['ArkSIARuleStatus'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_update_policy_status': ['ArkSIAUpdatePolicyStatus'],
+        'ark_sdk_python.models.services.sia.policies.common.ark_sia_user_data': ['ArkSIAUserData', 'ArkSIAUserDataAttribute'],
+    },
+)
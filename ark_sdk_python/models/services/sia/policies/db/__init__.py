@@ -1,45 +1,50 @@
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_add_policy import ArkSIADBAddPolicy
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_authorization_rule import (
-    ArkSIADBAuthorizationRule,
-    ArkSIADBConnectionInformation,
-)
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_connection_data import (
-    ArkSIADBAppliedTo,
-    ArkSIADBBaseAuth,
-    ArkSIADBConnectAs,
-    ArkSIADBLDAPAuth,
-    ArkSIADBLocalDBAuth,
-    ArkSIADBMongoDBAuth,
-    ArkSIADBOracleDBAuth,
-    ArkSIADBResourceIdentifierType,
-)
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_enums import (
-    ArkSIADBMongoDatabaseBuiltinRole,
-    ArkSIADBMongoGlobalBuiltinRole,
-    ArkSIADBSqlServerDatabaseBuiltinRole,
-    ArkSIADBSqlServerGlobalBuiltinRole,
-)
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_filter import ArkSIADBPoliciesFilter
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_stats import ArkSIADBPoliciesStats
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_workspace_type_serializer import (
-    serialize_sia_db_policies_workspace_type,
-)
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policy import ArkSIADBPolicy
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policy_list_item import ArkSIADBPolicyListItem
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_providers import (
-    ArkSIADB,
-    ArkSIADBDb2,
-    ArkSIADBIdentifiers,
-    ArkSIADBMariaDB,
-    ArkSIADBMongo,
-    ArkSIADBMSSQL,
-    ArkSIADBMySQL,
-    ArkSIADBOracle,
-    ArkSIADBOracleResource,
-    ArkSIADBPostgres,
-    ArkSIADBProvidersData,
-)
-from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_update_policy import ArkSIADBUpdatePolicy
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_add_policy import ArkSIADBAddPolicy
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_authorization_rule import (
+        ArkSIADBAuthorizationRule,
+        ArkSIADBConnectionInformation,
+    )
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_connection_data import (
+        ArkSIADBAppliedTo,
+        ArkSIADBBaseAuth,
+        ArkSIADBConnectAs,
+        ArkSIADBLDAPAuth,
+        ArkSIADBLocalDBAuth,
+        ArkSIADBMongoDBAuth,
+        ArkSIADBOracleDBAuth,
+        ArkSIADBResourceIdentifierType,
+    )
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_enums import (
+        ArkSIADBMongoDatabaseBuiltinRole,
+        ArkSIADBMongoGlobalBuiltinRole,
+        ArkSIADBSqlServerDatabaseBuiltinRole,
+        ArkSIADBSqlServerGlobalBuiltinRole,
+    )
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_filter import ArkSIADBPoliciesFilter
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_stats import ArkSIADBPoliciesStats
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_workspace_type_serializer import (
+        serialize_sia_db_policies_workspace_type,
+    )
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policy import ArkSIADBPolicy
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policy_list_item import ArkSIADBPolicyListItem
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_providers import (
+        ArkSIADB,
+        ArkSIADBDb2,
+        ArkSIADBIdentifiers,
+        ArkSIADBMariaDB,
+        ArkSIADBMongo,
+        ArkSIADBMSSQL,
+        ArkSIADBMySQL,
+        ArkSIADBOracle,
+        ArkSIADBOracleResource,
+        ArkSIADBPostgres,
+        ArkSIADBProvidersData,
+    )
+    from ark_sdk_python.models.services.sia.policies.db.ark_sia_db_update_policy import ArkSIADBUpdatePolicy
 
 __all__ = [
     'ArkSIADBAddPolicy',
@@ -75,3 +80,51 @@ __all__ = [
     'ArkSIADBSqlServerDatabaseBuiltinRole',
     'ArkSIADBSqlServerGlobalBuiltinRole',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_add_policy': ['ArkSIADBAddPolicy'],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_authorization_rule': [
+            'ArkSIADBAuthorizationRule',
+            'ArkSIADBConnectionInformation',
+        ],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_connection_data': [
+            'ArkSIADBAppliedTo',
+            'ArkSIADBBaseAuth',
+            'ArkSIADBConnectAs',
+            'ArkSIADBLDAPAuth',
+            'ArkSIADBLocalDBAuth',
+            'ArkSIADBMongoDBAuth',
+            'ArkSIADBOracleDBAuth',
+            'ArkSIADBResourceIdentifierType',
+        ],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_enums': [
+            'ArkSIADBMongoDatabaseBuiltinRole',
+            'ArkSIADBMongoGlobalBuiltinRole',
+            'ArkSIADBSqlServerDatabaseBuiltinRole',
+            'ArkSIADBSqlServerGlobalBuiltinRole',
+        ],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_filter': ['ArkSIADBPoliciesFilter'],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_stats': ['ArkSIADBPoliciesStats'],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policies_workspace_type_serializer': [
+            'serialize_sia_db_policies_workspace_type'
+        ],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policy': ['ArkSIADBPolicy'],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_policy_list_item': ['ArkSIADBPolicyListItem'],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_providers': [
+            'ArkSIADB',
+            'ArkSIADBDb2',
+            'ArkSIADBIdentifiers',
+            'ArkSIADBMariaDB',
+            'ArkSIADBMongo',
+            'ArkSIADBMSSQL',
+            'ArkSIADBMySQL',
+            'ArkSIADBOracle',
+            'ArkSIADBOracleResource',
+            'ArkSIADBPostgres',
+            'ArkSIADBProvidersData',
+        ],
+        'ark_sdk_python.models.services.sia.policies.db.ark_sia_db_update_policy': ['ArkSIADBUpdatePolicy'],
+    },
+)
@@ -1,38 +1,43 @@
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_add_policy import ArkSIAVMAddPolicy
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_authorization_rule import (
-    ArkSIAVMAuthorizationRule,
-    ArkSIAVMConnectionInformation,
-)
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_connection_data import (
-    ArkSIAVMConnectionDataType,
-    ArkSIAVMConnectionMethodData,
-    ArkSIAVMConnectionProtocolDict,
-    ArkSIAVMLocalEphemeralUserConnectionMethodData,
-    ArkSIAVMProvidersConnectionDict,
-    ArkSIAVMRDPLocalEphemeralUserConnectionData,
-)
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_filter import ArkSIAVMPoliciesFilter
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_protocol_type_serializer import (
-    serialize_sia_vm_policies_protocol_type,
-)
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_stats import ArkSIAVMPoliciesStats
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_workspace_type_serializer import (
-    serialize_sia_vm_policies_workspace_type,
-)
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policy import ArkSIAVMPolicy
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policy_list_item import ArkSIAVMPolicyListItem
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_providers import (
-    ArkSIAVMAWSProviderData,
-    ArkSIAVMAzureProviderData,
-    ArkSIAVMFQDNOperator,
-    ArkSIAVMFQDNRule,
-    ArkSIAVMGCPProviderData,
-    ArkSIAVMKeyValTag,
-    ArkSIAVMOnPremProviderData,
-    ArkSIAVMProvider,
-    ArkSIAVMProvidersDict,
-)
-from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_update_policy import ArkSIAVMUpdatePolicy
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_add_policy import ArkSIAVMAddPolicy
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_authorization_rule import (
+        ArkSIAVMAuthorizationRule,
+        ArkSIAVMConnectionInformation,
+    )
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_connection_data import (
+        ArkSIAVMConnectionDataType,
+        ArkSIAVMConnectionMethodData,
+        ArkSIAVMConnectionProtocolDict,
+        ArkSIAVMLocalEphemeralUserConnectionMethodData,
+        ArkSIAVMProvidersConnectionDict,
+        ArkSIAVMRDPLocalEphemeralUserConnectionData,
+    )
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_filter import ArkSIAVMPoliciesFilter
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_protocol_type_serializer import (
+        serialize_sia_vm_policies_protocol_type,
+    )
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_stats import ArkSIAVMPoliciesStats
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_workspace_type_serializer import (
+        serialize_sia_vm_policies_workspace_type,
+    )
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policy import ArkSIAVMPolicy
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policy_list_item import ArkSIAVMPolicyListItem
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_providers import (
+        ArkSIAVMAWSProviderData,
+        ArkSIAVMAzureProviderData,
+        ArkSIAVMFQDNOperator,
+        ArkSIAVMFQDNRule,
+        ArkSIAVMGCPProviderData,
+        ArkSIAVMKeyValTag,
+        ArkSIAVMOnPremProviderData,
+        ArkSIAVMProvider,
+        ArkSIAVMProvidersDict,
+    )
+    from ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_update_policy import ArkSIAVMUpdatePolicy
 
 __all__ = [
     'ArkSIAVMAddPolicy',
@@ -61,3 +66,44 @@ __all__ = [
     'serialize_sia_vm_policies_protocol_type',
     'serialize_sia_vm_policies_workspace_type',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_add_policy': ['ArkSIAVMAddPolicy'],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_authorization_rule': [
+            'ArkSIAVMAuthorizationRule',
+            'ArkSIAVMConnectionInformation',
+        ],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_connection_data': [
+            'ArkSIAVMConnectionDataType',
+            'ArkSIAVMConnectionMethodData',
+            'ArkSIAVMConnectionProtocolDict',
+            'ArkSIAVMLocalEphemeralUserConnectionMethodData',
+            'ArkSIAVMProvidersConnectionDict',
+            'ArkSIAVMRDPLocalEphemeralUserConnectionData',
+        ],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_filter': ['ArkSIAVMPoliciesFilter'],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_protocol_type_serializer': [
+            'serialize_sia_vm_policies_protocol_type'
+        ],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_stats': ['ArkSIAVMPoliciesStats'],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policies_workspace_type_serializer': [
+            'serialize_sia_vm_policies_workspace_type'
+        ],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policy': ['ArkSIAVMPolicy'],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_policy_list_item': ['ArkSIAVMPolicyListItem'],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_providers': [
+            'ArkSIAVMAWSProviderData',
+            'ArkSIAVMAzureProviderData',
+            'ArkSIAVMFQDNOperator',
+            'ArkSIAVMFQDNRule',
+            'ArkSIAVMGCPProviderData',
+            'ArkSIAVMKeyValTag',
+            'ArkSIAVMOnPremProviderData',
+            'ArkSIAVMProvider',
+            'ArkSIAVMProvidersDict',
+        ],
+        'ark_sdk_python.models.services.sia.policies.vm.ark_sia_vm_update_policy': ['ArkSIAVMUpdatePolicy'],
+    },
+)
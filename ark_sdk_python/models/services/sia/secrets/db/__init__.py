@@ -1,15 +1,20 @@
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_add_secret import ArkSIADBAddSecret
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_delete_secret import ArkSIADBDeleteSecret
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_disable_secret import ArkSIADBDisableSecret
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_enable_secret import ArkSIADBEnableSecret
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_get_secret import ArkSIADBGetSecret
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secret_metadata import ArkSIADBSecretMetadata, ArkSIADBSecretMetadataList
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secret_type import ArkSIADBSecretType
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secrets_filter import ArkSIADBSecretsFilter
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secrets_stats import ArkSIADBSecretsStats
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_store_descriptor import ArkSIADBStoreDescriptor
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_store_type import SECRET_TYPE_TO_STORE_DICT, ArkSIADBStoreType
-from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_update_secret import ArkSIADBUpdateSecret
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_add_secret import ArkSIADBAddSecret
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_delete_secret import ArkSIADBDeleteSecret
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_disable_secret import ArkSIADBDisableSecret
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_enable_secret import ArkSIADBEnableSecret
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_get_secret import ArkSIADBGetSecret
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secret_metadata import ArkSIADBSecretMetadata, ArkSIADBSecretMetadataList
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secret_type import ArkSIADBSecretType
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secrets_filter import ArkSIADBSecretsFilter
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secrets_stats import ArkSIADBSecretsStats
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_store_descriptor import ArkSIADBStoreDescriptor
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_store_type import SECRET_TYPE_TO_STORE_DICT, ArkSIADBStoreType
+    from ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_update_secret import ArkSIADBUpdateSecret
 
 __all__ = [
     'ArkSIADBAddSecret',
@@ -27,3 +32,24 @@ __all__ = [
     'SECRET_TYPE_TO_STORE_DICT',
     'ArkSIADBUpdateSecret',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_add_secret': ['ArkSIADBAddSecret'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_delete_secret': ['ArkSIADBDeleteSecret'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_disable_secret': ['ArkSIADBDisableSecret'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_enable_secret': ['ArkSIADBEnableSecret'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_get_secret': ['ArkSIADBGetSecret'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secret_metadata': [
+            'ArkSIADBSecretMetadata',
+            'ArkSIADBSecretMetadataList',
+        ],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secret_type': ['ArkSIADBSecretType'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secrets_filter': ['ArkSIADBSecretsFilter'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_secrets_stats': ['ArkSIADBSecretsStats'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_store_descriptor': ['ArkSIADBStoreDescriptor'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_store_type': ['SECRET_TYPE_TO_STORE_DICT', 'ArkSIADBStoreType'],
+        'ark_sdk_python.models.services.sia.secrets.db.ark_sia_db_update_secret': ['ArkSIADBUpdateSecret'],
+    },
+)
@@ -1,13 +1,18 @@
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_add_secret import ArkSIAVMAddSecret
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_change_secret import ArkSIAVMChangeSecret
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_delete_secret import ArkSIAVMDeleteSecret
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_get_secret import ArkSIAVMGetSecret
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret import ArkSIAVMSecret
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_error import ArkSIAVMSecretError
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_info import ArkSIAVMSecretInfo
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_type import ArkSIAVMSecretType
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secrets_filter import ArkSIAVMSecretsFilter
-from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secrets_stats import ArkSIAVMSecretsStats
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_add_secret import ArkSIAVMAddSecret
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_change_secret import ArkSIAVMChangeSecret
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_delete_secret import ArkSIAVMDeleteSecret
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_get_secret import ArkSIAVMGetSecret
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret import ArkSIAVMSecret
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_error import ArkSIAVMSecretError
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_info import ArkSIAVMSecretInfo
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_type import ArkSIAVMSecretType
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secrets_filter import ArkSIAVMSecretsFilter
+    from ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secrets_stats import ArkSIAVMSecretsStats
 
 __all__ = [
     'ArkSIAVMAddSecret',
@@ -21,3 +26,19 @@ __all__ = [
     'ArkSIAVMSecretsStats',
     'ArkSIAVMSecretError',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_add_secret': ['ArkSIAVMAddSecret'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_change_secret': ['ArkSIAVMChangeSecret'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_delete_secret': ['ArkSIAVMDeleteSecret'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_get_secret': ['ArkSIAVMGetSecret'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret': ['ArkSIAVMSecret'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_error': ['ArkSIAVMSecretError'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_info': ['ArkSIAVMSecretInfo'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secret_type': ['ArkSIAVMSecretType'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secrets_filter': ['ArkSIAVMSecretsFilter'],
+        'ark_sdk_python.models.services.sia.secrets.vm.ark_sia_vm_secrets_stats': ['ArkSIAVMSecretsStats'],
+    },
+)
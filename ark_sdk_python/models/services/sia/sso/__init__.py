@@ -1,18 +1,23 @@
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_acquire_token_response import ArkSIASSOAcquireTokenResponse
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_client_certificate import (
-    ArkSIASSOGetShortLivedClientCertificate,
-    ArkSIASSOShortLiveClientCertificateFormat,
-)
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_oracle_wallet import (
-    ArkSIASSOGetShortLivedOracleWallet,
-    ArkSIASSOShortLivedOracleWalletType,
-)
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_password import ArkSIASSOGetShortLivedPassword
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_rdp_file import ArkSIASSOGetShortLivedRDPFile
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_ssh_key import ArkSIASSOGetSSHKey
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_token_info import ArkSIASSOGetTokenInfo
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_token_info import ArkSIASSOTokenInfo
-from ark_sdk_python.models.services.sia.sso.ark_sia_sso_token_type import ArkSIASSOTokenType
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_acquire_token_response import ArkSIASSOAcquireTokenResponse
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_client_certificate import (
+        ArkSIASSOGetShortLivedClientCertificate,
+        ArkSIASSOShortLiveClientCertificateFormat,
+    )
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_oracle_wallet import (
+        ArkSIASSOGetShortLivedOracleWallet,
+        ArkSIASSOShortLivedOracleWalletType,
+    )
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_password import ArkSIASSOGetShortLivedPassword
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_rdp_file import ArkSIASSOGetShortLivedRDPFile
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_ssh_key import ArkSIASSOGetSSHKey
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_token_info import ArkSIASSOGetTokenInfo
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_token_info import ArkSIASSOTokenInfo
+    from ark_sdk_python.models.services.sia.sso.ark_sia_sso_token_type import ArkSIASSOTokenType
 
 __all__ = [
     'ArkSIASSOGetShortLivedClientCertificate',
@@ -27,3 +32,24 @@ __all__ = [
     'ArkSIASSOTokenInfo',
     'ArkSIASSOGetSSHKey',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_acquire_token_response': ['ArkSIASSOAcquireTokenResponse'],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_client_certificate': [
+            'ArkSIASSOGetShortLivedClientCertificate',
+            'ArkSIASSOShortLiveClientCertificateFormat',
+        ],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_oracle_wallet': [
+            'ArkSIASSOGetShortLivedOracleWallet',
+            'ArkSIASSOShortLivedOracleWalletType',
+        ],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_password': ['ArkSIASSOGetShortLivedPassword'],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_short_lived_rdp_file': ['ArkSIASSOGetShortLivedRDPFile'],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_ssh_key': ['ArkSIASSOGetSSHKey'],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_get_token_info': ['ArkSIASSOGetTokenInfo'],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_token_info': ['ArkSIASSOTokenInfo'],
+        'ark_sdk_python.models.services.sia.sso.ark_sia_sso_token_type': ['ArkSIASSOTokenType'],
+    },
+)
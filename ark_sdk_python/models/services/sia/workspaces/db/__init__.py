@@ -1,29 +1,34 @@
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_add_database import ArkSIADBAddDatabase
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_auth_method import (
-    ArkSIADBAuthMethod,
-    ArkSIADBAuthMethodType,
-    ArkSIADBDatabaseAuthMethod,
-    ArkSIADBDatabaseTargetConfiguredAuthMethod,
-)
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database import ArkSIADBDatabase
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database_info import ArkSIADBDatabaseInfo, ArkSIADBDatabaseInfoList
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database_target_service import ArkSIADBDatabaseTargetService
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_databases_filter import ArkSIADBDatabasesFilter
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_databases_stats import ArkSIADBDatabasesStats
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_delete_database import ArkSIADBDeleteDatabase
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_get_database import ArkSIADBGetDatabase
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_platform_type_serializer import serialize_db_platform_type
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_provider import (
-    DATABASE_FAMILIES_DEFAULT_PORTS,
-    DATABASES_ENGINES_TO_FAMILY,
-    ArkSIADBDatabaseEngineType,
-    ArkSIADBDatabaseFamilyType,
-    ArkSIADBDatabaseProvider,
-    ArkSIADBDatabaseWorkspaceType,
-)
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_tag import ArkSIADBTag, ArkSIADBTagList
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_update_database import ArkSIADBUpdateDatabase
-from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_warning import ArkSIADBWarning
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_add_database import ArkSIADBAddDatabase
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_auth_method import (
+        ArkSIADBAuthMethod,
+        ArkSIADBAuthMethodType,
+        ArkSIADBDatabaseAuthMethod,
+        ArkSIADBDatabaseTargetConfiguredAuthMethod,
+    )
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database import ArkSIADBDatabase
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database_info import ArkSIADBDatabaseInfo, ArkSIADBDatabaseInfoList
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database_target_service import ArkSIADBDatabaseTargetService
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_databases_filter import ArkSIADBDatabasesFilter
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_databases_stats import ArkSIADBDatabasesStats
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_delete_database import ArkSIADBDeleteDatabase
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_get_database import ArkSIADBGetDatabase
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_platform_type_serializer import serialize_db_platform_type
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_provider import (
+        DATABASE_FAMILIES_DEFAULT_PORTS,
+        DATABASES_ENGINES_TO_FAMILY,
+        ArkSIADBDatabaseEngineType,
+        ArkSIADBDatabaseFamilyType,
+        ArkSIADBDatabaseProvider,
+        ArkSIADBDatabaseWorkspaceType,
+    )
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_tag import ArkSIADBTag, ArkSIADBTagList
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_update_database import ArkSIADBUpdateDatabase
+    from ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_warning import ArkSIADBWarning
 
 __all__ = [
     'ArkSIADBAddDatabase',
@@ -51,3 +56,35 @@ __all__ = [
     'ArkSIADBDatabaseAuthMethod',
     'ArkSIADBDatabaseTargetConfiguredAuthMethod',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_add_database': ['ArkSIADBAddDatabase'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_auth_method': [
+            'ArkSIADBAuthMethod',
+            'ArkSIADBAuthMethodType',
+            'ArkSIADBDatabaseAuthMethod',
+            'ArkSIADBDatabaseTargetConfiguredAuthMethod',
+        ],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database': ['ArkSIADBDatabase'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database_info': ['ArkSIADBDatabaseInfo', 'ArkSIADBDatabaseInfoList'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_database_target_service': ['ArkSIADBDatabaseTargetService'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_databases_filter': ['ArkSIADBDatabasesFilter'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_databases_stats': ['ArkSIADBDatabasesStats'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_delete_database': ['ArkSIADBDeleteDatabase'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_get_database': ['ArkSIADBGetDatabase'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_platform_type_serializer': ['serialize_db_platform_type'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_provider': [
+            'DATABASE_FAMILIES_DEFAULT_PORTS',
+            'DATABASES_ENGINES_TO_FAMILY',
+            'ArkSIADBDatabaseEngineType',
+            'ArkSIADBDatabaseFamilyType',
+            'ArkSIADBDatabaseProvider',
+            'ArkSIADBDatabaseWorkspaceType',
+        ],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_tag': ['ArkSIADBTag', 'ArkSIADBTagList'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_update_database': ['ArkSIADBUpdateDatabase'],
+        'ark_sdk_python.models.services.sia.workspaces.db.ark_sia_db_warning': ['ArkSIADBWarning'],
+    },
+)
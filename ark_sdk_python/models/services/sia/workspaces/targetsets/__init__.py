@@ -1,20 +1,25 @@
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_add_target_set import ArkSIAAddTargetSet
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_add_target_sets import (
-    ArkSIABulkAddTargetSets,
-    ArkSIABulkAddTargetSetsItem,
-)
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_delete_target_sets import ArkSIABulkDeleteTargetSets
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_target_set_response import (
-    ArkSIABulkTargetSetItemResult,
-    ArkSIABulkTargetSetResponse,
-)
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_delete_target_set import ArkSIADeleteTargetSet
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_get_target_set import ArkSIAGetTargetSet
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_set import ArkSIATargetSet
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_set_type import ArkSIATargetSetType
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_sets_filter import ArkSIATargetSetsFilter
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_sets_stats import ArkSIATargetSetsStats
-from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_update_target_set import ArkSIAUpdateTargetSet
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_add_target_set import ArkSIAAddTargetSet
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_add_target_sets import (
+        ArkSIABulkAddTargetSets,
+        ArkSIABulkAddTargetSetsItem,
+    )
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_delete_target_sets import ArkSIABulkDeleteTargetSets
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_target_set_response import (
+        ArkSIABulkTargetSetItemResult,
+        ArkSIABulkTargetSetResponse,
+    )
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_delete_target_set import ArkSIADeleteTargetSet
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_get_target_set import ArkSIAGetTargetSet
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_set import ArkSIATargetSet
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_set_type import ArkSIATargetSetType
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_sets_filter import ArkSIATargetSetsFilter
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_sets_stats import ArkSIATargetSetsStats
+    from ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_update_target_set import ArkSIAUpdateTargetSet
 
 __all__ = [
     'ArkSIATargetSetType',
@@ -31,3 +36,26 @@ __all__ = [
     'ArkSIABulkTargetSetItemResult',
     'ArkSIABulkTargetSetResponse',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_add_target_set': ['ArkSIAAddTargetSet'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_add_target_sets': [
+            'ArkSIABulkAddTargetSets',
+            'ArkSIABulkAddTargetSetsItem',
+        ],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_delete_target_sets': ['ArkSIABulkDeleteTargetSets'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_bulk_target_set_response': [
+            'ArkSIABulkTargetSetItemResult',
+            'ArkSIABulkTargetSetResponse',
+        ],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_delete_target_set': ['ArkSIADeleteTargetSet'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_get_target_set': ['ArkSIAGetTargetSet'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_set': ['ArkSIATargetSet'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_set_type': ['ArkSIATargetSetType'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_sets_filter': ['ArkSIATargetSetsFilter'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_target_sets_stats': ['ArkSIATargetSetsStats'],
+        'ark_sdk_python.models.services.sia.workspaces.targetsets.ark_sia_update_target_set': ['ArkSIAUpdateTargetSet'],
+    },
+)
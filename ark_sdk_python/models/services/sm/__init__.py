@@ -1,12 +1,17 @@
-from ark_sdk_python.models.services.sm.ark_sm_get_session import ArkSMGetSession
-from ark_sdk_python.models.services.sm.ark_sm_get_session_activities import ArkSMGetSessionActivities
-from ark_sdk_python.models.services.sm.ark_sm_protocol_type_serializer import serialize_sm_protocol_type
-from ark_sdk_python.models.services.sm.ark_sm_session import ArkSMSession, ArkSMSessions, ArkSMSessionStatus
-from ark_sdk_python.models.services.sm.ark_sm_session_activity import ArkSMSessionActivities, ArkSMSessionActivity
-from ark_sdk_python.models.services.sm.ark_sm_session_activity_filter import ArkSMSessionActivitiesFilter
-from ark_sdk_python.models.services.sm.ark_sm_sessions_filter import ArkSMSessionsFilter
-from ark_sdk_python.models.services.sm.ark_sm_sessions_stats import ArkSMSessionsStats
-from ark_sdk_python.models.services.sm.ark_sm_workspace_type_serializer import serialize_sm_workspace_type
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.models.services.sm.ark_sm_get_session import ArkSMGetSession
+    from ark_sdk_python.models.services.sm.ark_sm_get_session_activities import ArkSMGetSessionActivities
+    from ark_sdk_python.models.services.sm.ark_sm_protocol_type_serializer import serialize_sm_protocol_type
+    from ark_sdk_python.models.services.sm.ark_sm_session import ArkSMSession, ArkSMSessions, ArkSMSessionStatus
+    from ark_sdk_python.models.services.sm.ark_sm_session_activity import ArkSMSessionActivities, ArkSMSessionActivity
+    from ark_sdk_python.models.services.sm.ark_sm_session_activity_filter import ArkSMSessionActivitiesFilter
+    from ark_sdk_python.models.services.sm.ark_sm_sessions_filter import ArkSMSessionsFilter
+    from ark_sdk_python.models.services.sm.ark_sm_sessions_stats import ArkSMSessionsStats
+    from ark_sdk_python.models.services.sm.ark_sm_workspace_type_serializer import serialize_sm_workspace_type
 
 __all__ = [
     'ArkSMSession',
@@ -22,3 +27,18 @@ __all__ = [
     'serialize_sm_workspace_type',
     'serialize_sm_protocol_type',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.models.services.sm.ark_sm_get_session': ['ArkSMGetSession'],
+        'ark_sdk_python.models.services.sm.ark_sm_get_session_activities': ['ArkSMGetSessionActivities'],
+        'ark_sdk_python.models.services.sm.ark_sm_protocol_type_serializer': ['serialize_sm_protocol_type'],
+        'ark_sdk_python.models.services.sm.ark_sm_session': ['ArkSMSession', 'ArkSMSessions', 'ArkSMSessionStatus'],
+        'ark_sdk_python.models.services.sm.ark_sm_session_activity': ['ArkSMSessionActivities', 'ArkSMSessionActivity'],
+        'ark_sdk_python.models.services.sm.ark_sm_session_activity_filter': ['ArkSMSessionActivitiesFilter'],
+        'ark_sdk_python.models.services.sm.ark_sm_sessions_filter': ['ArkSMSessionsFilter'],
+        'ark_sdk_python.models.services.sm.ark_sm_sessions_stats': ['ArkSMSessionsStats'],
+        'ark_sdk_python.models.services.sm.ark_sm_workspace_type_serializer': ['serialize_sm_workspace_type'],
+    },
+)
@@ -1,13 +1,26 @@
+import inspect
 from abc import ABC, abstractmethod
 from typing import Any, List
 
 from ark_sdk_python.auth.ark_auth import ArkAuth
-from ark_sdk_python.common import get_logger
+from ark_sdk_python.common import ArkClient, get_logger
+from ark_sdk_python.common.ark_profiler import PHASE_SERVICE_INIT, ArkProfiler
+from ark_sdk_python.common.ark_tracing import ArkTracer
 from ark_sdk_python.models import ArkNotFoundException, ArkValidationException
 from ark_sdk_python.models.services import ArkServiceConfig
 
 
 class ArkService(ABC):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Public service methods are traced, which costs a single flag check while tracing is disabled
+        for name, value in list(vars(cls).items()):
+            if not name.startswith('_') and inspect.isfunction(value):
+                setattr(cls, name, ArkTracer.traced(f'{cls.__name__}.{name}')(value))
+        if '__init__' in vars(cls):
+            setattr(cls, '__init__', ArkProfiler.phased(PHASE_SERVICE_INIT)(vars(cls)['__init__']))
+
+    @ArkProfiler.phased(PHASE_SERVICE_INIT)
     def __init__(self, *authenticators: Any) -> None:
         self._logger = get_logger(self.__class__.__name__)
         self._authenticators = [auth for auth in authenticators if issubclass(type(auth), ArkAuth)]
@@ -25,6 +38,20 @@ class ArkService(ABC):
         """
         return self._authenticators
 
+    @property
+    def clients(self) -> List[ArkClient]:
+        """
+        Returns all the HTTP clients held by the service.
+
+        Returns:
+            List[ArkClient]: _description_
+        """
+        clients: List[ArkClient] = []
+        for value in vars(self).values():
+            if isinstance(value, ArkClient) and all(value is not c for c in clients):
+                clients.append(value)
+        return clients
+
     def authenticator(self, auth_name: str) -> ArkAuth:
         """
         Finds the appropriate Ark authenticator class for the specified authenticator.
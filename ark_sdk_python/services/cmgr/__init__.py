@@ -1,3 +1,15 @@
-from ark_sdk_python.services.cmgr.ark_cmgr_service import ArkCmgrService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.cmgr.ark_cmgr_service import ArkCmgrService
 
 __all__ = ['ArkCmgrService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.cmgr.ark_cmgr_service': ['ArkCmgrService'],
+    },
+)
@@ -122,13 +122,13 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding new network [{add_network}]')
+        self._logger.info('Adding new network [%s]', add_network)
         resp: Response = self.__client.post(NETWORKS_API, json=add_network.model_dump())
         if resp.status_code == HTTPStatus.CREATED:
             try:
                 return ArkCmgrNetwork.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add network response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add network response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add network response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add network [{resp.text}] - [{resp.status_code}]')
 
@@ -145,7 +145,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Updating network [{update_network}]')
+        self._logger.info('Updating network [%s]', update_network)
         if not update_network.name:
             self._logger.info('Nothing to update')
             return self.network(ArkCmgrGetNetwork(network_id=update_network.network_id))
@@ -156,7 +156,7 @@ class ArkCmgrService(ArkService):
             try:
                 return ArkCmgrNetwork.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse update network response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update network response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update network response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update network [{resp.text}] - [{resp.status_code}]')
 
@@ -170,7 +170,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting network [{delete_network}]')
+        self._logger.info('Deleting network [%s]', delete_network)
         resp: Response = self.__client.delete(NETWORK_API.format(network_id=delete_network.network_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete network [{resp.text}] - [{resp.status_code}]')
@@ -199,7 +199,7 @@ class ArkCmgrService(ArkService):
         Yields:
             Iterator[ArkCmgrNetworkPage]: _description_
         """
-        self._logger.info(f'Listing networks by filters [{networks_filter}]')
+        self._logger.info('Listing networks by filters [%s]', networks_filter)
         yield from self.__list_common_pools(
             'networks',
             NETWORKS_API,
@@ -220,13 +220,13 @@ class ArkCmgrService(ArkService):
         Returns:
             ArkCmgrNetwork: _description_
         """
-        self._logger.info(f'Retrieving network [{get_network}]')
+        self._logger.info('Retrieving network [%s]', get_network)
         resp: Response = self.__client.get(NETWORK_API.format(network_id=get_network.network_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkCmgrNetwork.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse network response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse network response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse network response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve network [{get_network.network_id}] [{resp.text}] - [{resp.status_code}]')
 
@@ -257,13 +257,13 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding new pool [{add_pool}]')
+        self._logger.info('Adding new pool [%s]', add_pool)
         resp: Response = self.__client.post(POOLS_API, json=add_pool.model_dump())
         if resp.status_code == HTTPStatus.CREATED:
             try:
                 return ArkCmgrPool.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add pool response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add pool response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add pool response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add pool [{resp.text}] - [{resp.status_code}]')
 
@@ -280,7 +280,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Updating pool [{update_pool}]')
+        self._logger.info('Updating pool [%s]', update_pool)
         if not update_pool.name and not update_pool.assigned_network_ids and not update_pool.description:
             self._logger.info('Nothing to update')
             return self.pool(ArkCmgrGetPool(pool_id=update_pool.pool_id))
@@ -289,7 +289,7 @@ class ArkCmgrService(ArkService):
             try:
                 return ArkCmgrPool.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse update pool response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update pool response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update pool response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update pool [{resp.text}] - [{resp.status_code}]')
 
@@ -303,7 +303,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting pool [{delete_pool}]')
+        self._logger.info('Deleting pool [%s]', delete_pool)
         resp: Response = self.__client.delete(POOL_API.format(pool_id=delete_pool.pool_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete pool [{resp.text}] - [{resp.status_code}]')
@@ -332,7 +332,7 @@ class ArkCmgrService(ArkService):
         Yields:
             Iterator[ArkCmgrNetworkPage]: _description_
         """
-        self._logger.info(f'Listing pools by filters [{pools_filter}]')
+        self._logger.info('Listing pools by filters [%s]', pools_filter)
         yield from self.__list_common_pools(
             'pools',
             POOLS_API,
@@ -353,13 +353,13 @@ class ArkCmgrService(ArkService):
         Returns:
             ArkCmgrPool: _description_
         """
-        self._logger.info(f'Retrieving pool [{get_pool}]')
+        self._logger.info('Retrieving pool [%s]', get_pool)
         resp: Response = self.__client.get(POOL_API.format(pool_id=get_pool.pool_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkCmgrPool.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse pool response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse pool response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse pool response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve pool [{get_pool.pool_id}] [{resp.text}] - [{resp.status_code}]')
 
@@ -392,7 +392,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding new pool identifier [{add_identifier}]')
+        self._logger.info('Adding new pool identifier [%s]', add_identifier)
         resp: Response = self.__client.post(
             POOL_IDENTIFIERS_API.format(pool_id=add_identifier.pool_id), json=add_identifier.model_dump(exclude={'pool_id'})
         )
@@ -400,7 +400,7 @@ class ArkCmgrService(ArkService):
             try:
                 return ArkCmgrPoolIdentifier.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add pool identifier response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add pool identifier response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add pool identifier response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add pool identifier [{resp.text}] - [{resp.status_code}]')
 
@@ -417,7 +417,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: In case the response is not MULTI_STATUS, or if one of the responses is not CREATED.
         """
-        self._logger.info(f'Adding new pool identifiers bulk [{add_identifiers}]')
+        self._logger.info('Adding new pool identifiers bulk [%s]', add_identifiers)
         response: Response = self.__client.post(
             POOL_IDENTIFIERS_BULK_API.format(pool_id=add_identifiers.pool_id),
             json={
@@ -428,7 +428,7 @@ class ArkCmgrService(ArkService):
             try:
                 return self.__identifiers_by_add_pool_identifies_response(response=response)
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add pool identifiers bulk response [{str(ex)}] - [{response.text}]')
+                self._logger.exception('Failed to parse add pool identifiers bulk response [%s] - [%s]', ex, response.text)
                 raise ArkServiceException(f'Failed to parse add pool identifiers bulk response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add pool identifiers bulk [{response.text}] - [{response.status_code}]')
 
@@ -442,7 +442,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting pool identifier [{delete_identifier}]')
+        self._logger.info('Deleting pool identifier [%s]', delete_identifier)
         resp: Response = self.__client.delete(
             POOL_IDENTIFIER_API.format(pool_id=delete_identifier.pool_id, identifier_id=delete_identifier.identifier_id)
         )
@@ -459,7 +459,7 @@ class ArkCmgrService(ArkService):
         Raises:
             ArkServiceException: In case the response is not MULTI_STATUS, or if one of the responses is not NO_CONTENT.
         """
-        self._logger.info(f'Deleting pool identifiers bulk [{delete_identifiers}]')
+        self._logger.info('Deleting pool identifiers bulk [%s]', delete_identifiers)
         resp: Response = self.__client.delete(
             POOL_IDENTIFIERS_BULK_API.format(pool_id=delete_identifiers.pool_id),
             json={'requests': {str(index): {'id': i.identifier_id} for index, i in enumerate(delete_identifiers.identifiers, start=1)}},
@@ -482,7 +482,7 @@ class ArkCmgrService(ArkService):
         Yields:
             Iterator[ArmCmgrPoolIdentifierPage]: _description_
         """
-        self._logger.info(f'Listing all pool [{list_identifiers}] identifiers')
+        self._logger.info('Listing all pool [%s] identifiers', list_identifiers)
         yield from self.__list_common_pools(
             'pool identifiers',
             POOL_IDENTIFIERS_API.format(pool_id=list_identifiers.pool_id),
@@ -499,7 +499,7 @@ class ArkCmgrService(ArkService):
         Yields:
             Iterator[ArmCmgrPoolIdentifierPage]: _description_
         """
-        self._logger.info(f'Listing pool identifiers with filters [{identifiers_filter}]')
+        self._logger.info('Listing pool identifiers with filters [%s]', identifiers_filter)
         yield from self.__list_common_pools(
             'pool identifiers',
             POOL_IDENTIFIERS_API.format(pool_id=identifiers_filter.pool_id),
@@ -531,7 +531,7 @@ class ArkCmgrService(ArkService):
         Yields:
             Iterator[ArkCmgrPoolComponentPage]: _description_
         """
-        self._logger.info(f'Listing pool components with filters [{components_filter}]')
+        self._logger.info('Listing pool components with filters [%s]', components_filter)
         yield from self.__list_common_pools(
             'pools components',
             POOLS_COMPONENTS_API,
@@ -552,7 +552,7 @@ class ArkCmgrService(ArkService):
         Returns:
             ArkCmgrPoolComponent: _description_
         """
-        self._logger.info(f'Retrieving pool component [{get_pool_component}]')
+        self._logger.info('Retrieving pool component [%s]', get_pool_component)
         resp: Response = self.__client.get(
             POOL_COMPONENT_API.format(pool_id=get_pool_component.pool_id, component_id=get_pool_component.component_id)
         )
@@ -560,7 +560,7 @@ class ArkCmgrService(ArkService):
             try:
                 return ArkCmgrPoolComponent.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse pool component response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse pool component response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse pool component  response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve pool component [{get_pool_component}] [{resp.text}] - [{resp.status_code}]')
 
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.identity.common.ark_identity_base_service import ArkIdentityBaseService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.identity.common.ark_identity_base_service import ArkIdentityBaseService
 
 __all__ = ['ArkIdentityBaseService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.identity.common.ark_identity_base_service': ['ArkIdentityBaseService'],
+    },
+)
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.identity.connectors.ark_identity_connectors_service import ArkIdentityConnectorsService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.identity.connectors.ark_identity_connectors_service import ArkIdentityConnectorsService
 
 __all__ = ['ArkIdentityConnectorsService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.identity.connectors.ark_identity_connectors_service': ['ArkIdentityConnectorsService'],
+    },
+)
@@ -46,7 +46,7 @@ class ArkIdentityConnectorsService(ArkIdentityBaseService):
                 return []
             return TypeAdapter(List[ArkIdentityConnectorInfo]).validate_python([r['Row'] for r in query_result['Result']["Results"]])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to retrieve identity connectors [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to retrieve identity connectors [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to retrieve identity connectors [{str(ex)}]') from ex
 
     def list_connectors_by(self, connectors_filter: ArkIdentityConnectorsFilter) -> List[ArkIdentityConnectorInfo]:
@@ -59,7 +59,7 @@ class ArkIdentityConnectorsService(ArkIdentityBaseService):
         Returns:
             List[ArkIdentityConnectorInfo]: _description_
         """
-        self._logger.info(f'Listing identity connectors by filters [{connectors_filter}]')
+        self._logger.info('Listing identity connectors by filters [%s]', connectors_filter)
         connectors = self.list_connectors()
 
         # Filter by connector online / offline
@@ -98,7 +98,7 @@ class ArkIdentityConnectorsService(ArkIdentityBaseService):
         Returns:
             ArkIdentityConnectorInfo: _description_
         """
-        self._logger.info(f'Retrieving identity connector by id [{get_connector.connector_id}]')
+        self._logger.info('Retrieving identity connector by id [%s]', get_connector.connector_id)
         response: Response = self._client.post(
             f'{self._url_prefix}{REDROCK_QUERY}',
             json={"Script": f"Select * from Proxy WHERE ID='{get_connector.connector_id}'"},
@@ -111,7 +111,7 @@ class ArkIdentityConnectorsService(ArkIdentityBaseService):
                 raise ArkServiceException('Failed to retrieve identity connector by id')
             return ArkIdentityConnectorInfo.model_validate(query_result['Result']["Results"][0]['Row'])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to retrieve identity connector by id [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to retrieve identity connector by id [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to retrieve identity connector by id [{str(ex)}]') from ex
 
     @staticmethod
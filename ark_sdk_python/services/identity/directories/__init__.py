@@ -1,3 +1,15 @@
-from ark_sdk_python.services.identity.directories.ark_identity_directories_service import ArkIdentityDirectoriesService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.identity.directories.ark_identity_directories_service import ArkIdentityDirectoriesService
 
 __all__ = ['ArkIdentityDirectoriesService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.identity.directories.ark_identity_directories_service': ['ArkIdentityDirectoriesService'],
+    },
+)
@@ -57,7 +57,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
         """
         if not list_directories.directories:
             list_directories.directories = [d for d in DirectoryService]
-        self._logger.info(f'Retrieving directory services for directories [{list_directories}] [{self._url_prefix}]')
+        self._logger.info('Retrieving directory services for directories [%s] [%s]', list_directories, self._url_prefix)
         response: Response = self._client.get(f'{self._url_prefix}{GET_DIRECTORY_SERVICES_URL}', data={})
         try:
             directory_services_result = GetDirectoryServicesResponse.model_validate_json(response.text)
@@ -77,7 +77,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
             )
             return directories
         except (ValidationError, JSONDecodeError) as ex:
-            self._logger.exception(f'Failed to parse directory services response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse directory services response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse directory services response [{str(ex)}]') from ex
 
     def list_directories_entities(self, list_directories_entities: ArkIdentityListDirectoriesEntities) -> Iterator[ArkIdentityEntitiesPage]:
@@ -174,7 +174,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
                     entities = entities[list_directories_entities.page_size :]
                     yield ArkIdentityEntitiesPage(page)
         except (ValidationError, JSONDecodeError) as ex:
-            self._logger.exception(f'Failed to parse list directories entities response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse list directories entities response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse list directories entities response [{str(ex)}]') from ex
 
     def tenant_default_suffix(self) -> str:
@@ -207,7 +207,7 @@ class ArkIdentityDirectoriesService(ArkIdentityBaseService):
                 return filtered_urls[0]
             return tenant_suffixes_list[0]
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse tenant default suffix response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse tenant default suffix response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse tenant default suffix response [{str(ex)}]') from ex
 
     @staticmethod
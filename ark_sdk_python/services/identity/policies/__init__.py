@@ -1,3 +1,15 @@
-from ark_sdk_python.services.identity.policies.ark_identity_policies_service import ArkIdentityPoliciesService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.identity.policies.ark_identity_policies_service import ArkIdentityPoliciesService
 
 __all__ = ['ArkIdentityPoliciesService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.identity.policies.ark_identity_policies_service': ['ArkIdentityPoliciesService'],
+    },
+)
@@ -53,7 +53,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
         Returns:
             ArkIdentityAuthenticationProfile: _description_
         """
-        self._logger.info(f'Adding authentication profile [{add_authentication_profile.auth_profile_name}]')
+        self._logger.info('Adding authentication profile [%s]', add_authentication_profile.auth_profile_name)
         data = {
             'settings': {
                 'Name': add_authentication_profile.auth_profile_name,
@@ -72,7 +72,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to add authentication profile [{response.text}] - [{response.status_code}]')
             return ArkIdentityAuthenticationProfile.model_validate(result['Result'])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse add authentication profile response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse add authentication profile response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse add authentication profile response [{str(ex)}]') from ex
 
     def remove_authentication_profile(self, remove_authentication_profile: ArkIdentityRemoveAuthenticationProfile) -> None:
@@ -86,7 +86,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             remove_authentication_profile.auth_profile_id = self.authentication_profile(
                 ArkIdentityGetAuthenticationProfile(auth_profile_name=remove_authentication_profile.auth_profile_name)
             ).uuid
-        self._logger.info(f'Removing authentication profile [{remove_authentication_profile.auth_profile_id}]')
+        self._logger.info('Removing authentication profile [%s]', remove_authentication_profile.auth_profile_id)
         response: Response = self._client.post(
             f'{self._url_prefix}{DELETE_PROFILE_URL}', json={'uuid': remove_authentication_profile.auth_profile_id}
         )
@@ -94,7 +94,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to remove authentication profile [{response.text}] - [{response.status_code}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse remove authentication profile response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse remove authentication profile response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse remove authentication profile response [{str(ex)}]') from ex
 
     def list_authentication_profiles(self) -> List[ArkIdentityAuthenticationProfile]:
@@ -115,7 +115,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to list authentication profiles [{response.text}] - [{response.status_code}]')
             return TypeAdapter(List[ArkIdentityAuthenticationProfile]).validate_python([r['Row'] for r in result['Result']['Results']])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse list authentication profiles response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse list authentication profiles response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse list authentication profiles response [{str(ex)}]') from ex
 
     def authentication_profile(self, get_authentication_profile: ArkIdentityGetAuthenticationProfile) -> ArkIdentityAuthenticationProfile:
@@ -151,7 +151,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
         Returns:
             ArkIdentityPolicy: _description_
         """
-        self._logger.info(f'Adding policy [{add_policy.policy_name}]')
+        self._logger.info('Adding policy [%s]', add_policy.policy_name)
         roles_service = ArkIdentityRolesService(self._isp_auth)
         policies_list = [p.model_dump(by_alias=True) for p in self.list_policies()]
         policy_name = f'/Policy/{add_policy.policy_name}'
@@ -204,7 +204,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to add policy [{response.text}] - [{response.status_code}]')
             return self.policy(ArkIdentityGetPolicy(policy_name=add_policy.policy_name))
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse add policy response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse add policy response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse add policy response [{str(ex)}]') from ex
 
     def disable_default_policy(self) -> None:
@@ -260,7 +260,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to add policy [{response.text}] - [{response.status_code}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse perform policy action response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse perform policy action response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse perform policy action response [{str(ex)}]') from ex
 
     def enable_policy(self, enable_policy: ArkIdentityEnablePolicy) -> None:
@@ -271,7 +271,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             enable_policy (ArkIdentityEnablePolicy): _description_
 
         """
-        self._logger.info(f'Making Policy [{enable_policy.policy_name}] active')
+        self._logger.info('Making Policy [%s] active', enable_policy.policy_name)
         self.perform_action_on_policy(
             policy_operation=ArkIdentityPolicyOperation(
                 policy_name=enable_policy.policy_name,
@@ -287,7 +287,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             disable_policy (ArkIdentityDisablePolicy): _description_
 
         """
-        self._logger.info(f'Making Policy [{disable_policy.policy_name}] inactive')
+        self._logger.info('Making Policy [%s] inactive', disable_policy.policy_name)
         self.perform_action_on_policy(
             policy_operation=ArkIdentityPolicyOperation(
                 policy_name=disable_policy.policy_name,
@@ -305,7 +305,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Removing policy [{remove_policy.policy_name}]')
+        self._logger.info('Removing policy [%s]', remove_policy.policy_name)
         policy_name = remove_policy.policy_name
         if not policy_name.startswith('/Policy/'):
             policy_name = f'/Policy/{policy_name}'
@@ -314,7 +314,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to remove policy [{response.text}] - [{response.status_code}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse remove policy response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse remove policy response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse remove policy response [{str(ex)}]') from ex
 
     def list_policies(self) -> List[ArkIdentityPolicyInfo]:
@@ -332,7 +332,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to list policies [{response.text}] - [{response.status_code}]')
             return TypeAdapter(List[ArkIdentityPolicyInfo]).validate_python([p['Row'] for p in result['Result']['Results']])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse list policies response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse list policies response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse list policies response [{str(ex)}]') from ex
 
     def policy(self, get_policy: ArkIdentityGetPolicy) -> ArkIdentityPolicy:
@@ -345,7 +345,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
         Returns:
             ArkIdentityPolicy: _description_
         """
-        self._logger.info(f'Retrieving policy [{get_policy.policy_name}]')
+        self._logger.info('Retrieving policy [%s]', get_policy.policy_name)
         policy_name = get_policy.policy_name
         if not policy_name.startswith('/Policy/'):
             policy_name = f'/Policy/{policy_name}'
@@ -356,7 +356,7 @@ class ArkIdentityPoliciesService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to list policies [{response.text}] - [{response.status_code}]')
             return ArkIdentityPolicy.model_validate(result['Result'])
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse policy response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse policy response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse policy response [{str(ex)}]') from ex
 
     @staticmethod
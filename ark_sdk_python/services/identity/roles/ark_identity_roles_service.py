@@ -65,12 +65,12 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             ArkIdentityRole: _description_
         """
         role_details = None
-        self._logger.info(f'Trying to create role [{create_role.role_name}]')
+        self._logger.info('Trying to create role [%s]', create_role.role_name)
         try:
             # Role exists
             role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=create_role.role_name))
             role_details = ArkIdentityRole(role_name=create_role.role_name, role_id=role_id)
-            self._logger.info(f'Role already exists with id [{role_id}]')
+            self._logger.info('Role already exists with id [%s]', role_id)
         except (ValidationError, Exception) as ex:
             # Create the role
             create_dict = {'Name': create_role.role_name}
@@ -83,9 +83,9 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
                     raise ArkServiceException(f'Failed to create role [{response.text}]') from ex
                 role_id = result['Result']['_RowKey']
                 role_details = ArkIdentityRole(role_name=create_role.role_name, role_id=role_id)
-                self._logger.info(f'Role created with id [{role_id}]')
+                self._logger.info('Role created with id [%s]', role_id)
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse create role response [{str(ex)}] - [{response.text}]')
+                self._logger.exception('Failed to parse create role response [%s] - [%s]', ex, response.text)
                 raise ArkServiceException(f'Failed to parse create role response [{str(ex)}]') from ex
         # Add admin rights
         if create_role.admin_rights:
@@ -106,7 +106,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         """
         if update_role.role_name and not update_role.role_id:
             update_role.role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=update_role.role_name))
-        self._logger.info(f'Updating identity role [{update_role.role_id}]')
+        self._logger.info('Updating identity role [%s]', update_role.role_id)
         update_dict = {'Name': update_role.role_id}
         if update_role.new_role_name:
             update_dict['NewName'] = update_role.new_role_name
@@ -119,7 +119,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to update role [{response.text}]')
             self._logger.info('Role updated successfully')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse update role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse update role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse update role response [{str(ex)}]') from ex
 
     def list_role_members(self, list_role_members: ArkIdentityListRoleMembers) -> List[ArkIdentityRoleMember]:
@@ -137,7 +137,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         """
         if list_role_members.role_name and not list_role_members.role_id:
             list_role_members.role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=list_role_members.role_name))
-        self._logger.info(f'Listing identity role [{list_role_members.role_id}] members')
+        self._logger.info('Listing identity role [%s] members', list_role_members.role_id)
         response: Response = self._client.post(f'{self._url_prefix}{ROLE_MEMBERS_URL}', json={'Name': list_role_members.role_id})
         try:
             result = response.json()
@@ -156,7 +156,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             self._logger.info('Listed role members successfully successfully')
             return members
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse list role members response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse list role members response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse list role members response [{str(ex)}]') from ex
 
     def add_admin_rights_to_role(self, add_admin_rights_to_role: ArkIdentityAddAdminRightsToRole) -> None:
@@ -169,7 +169,9 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding admin rights [{add_admin_rights_to_role.admin_rights}] to role [{add_admin_rights_to_role.role_name}]')
+        self._logger.info(
+            'Adding admin rights [%s] to role [%s]', add_admin_rights_to_role.admin_rights, add_admin_rights_to_role.role_name
+        )
         if not add_admin_rights_to_role.role_id and not add_admin_rights_to_role.role_name:
             raise ArkServiceException('Either role id or role name must be given')
         if add_admin_rights_to_role.role_id:
@@ -184,7 +186,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to add admin rights to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse add admin rights to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse add admin rights to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse add admin rights to role response [{str(ex)}]') from ex
 
     def role_id_by_name(self, role_id_by_name: ArkIdentityRoleIdByName) -> str:
@@ -200,7 +202,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Returns:
             str: _description_
         """
-        self._logger.info(f'Retrieving role id for name [{role_id_by_name.role_name}]')
+        self._logger.info('Retrieving role id for name [%s]', role_id_by_name.role_name)
         directories_service = ArkIdentityDirectoriesService(self._isp_auth)
         directories = [
             d.directory_service_uuid
@@ -221,7 +223,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
                 raise ArkServiceException('No role found for given name')
             return all_roles[0].row.id
         except (ValidationError, JSONDecodeError) as ex:
-            self._logger.exception(f'Failed to parse role id by name response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse role id by name response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse role id by name response [{str(ex)}]') from ex
 
     def add_user_to_role(self, add_user_to_role: ArkIdentityAddUserToRole) -> None:
@@ -234,7 +236,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding user [{add_user_to_role.username}] to role [{add_user_to_role.role_name}]')
+        self._logger.info('Adding user [%s] to role [%s]', add_user_to_role.username, add_user_to_role.role_name)
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=add_user_to_role.role_name))
         response: Response = self._client.post(
             f'{self._url_prefix}{ADD_USER_TO_ROLE_URL}',
@@ -248,7 +250,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to add user to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse add user to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse add user to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse add user to role response [{str(ex)}]') from ex
 
     def add_group_to_role(self, add_group_to_role: ArkIdentityAddGroupToRole) -> None:
@@ -261,7 +263,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding group [{add_group_to_role.group_name}] to role [{add_group_to_role.role_name}]')
+        self._logger.info('Adding group [%s] to role [%s]', add_group_to_role.group_name, add_group_to_role.role_name)
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=add_group_to_role.role_name))
         response: Response = self._client.post(
             f'{self._url_prefix}{ADD_USER_TO_ROLE_URL}',
@@ -275,7 +277,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to add group to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse add group to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse add group to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse add group to role response [{str(ex)}]') from ex
 
     def add_role_to_role(self, add_role_to_role: ArkIdentityAddRoleToRole) -> None:
@@ -288,7 +290,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Adding role [{add_role_to_role.role_name_to_add}] to role [{add_role_to_role.role_name}]')
+        self._logger.info('Adding role [%s] to role [%s]', add_role_to_role.role_name_to_add, add_role_to_role.role_name)
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=add_role_to_role.role_name))
         response: Response = self._client.post(
             f'{self._url_prefix}{ADD_USER_TO_ROLE_URL}',
@@ -302,7 +304,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to add role to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse add role to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse add role to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse add role to role response [{str(ex)}]') from ex
 
     def remove_user_from_role(self, remove_user_from_role: ArkIdentityRemoveUserFromRole) -> None:
@@ -315,7 +317,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Removing user [{remove_user_from_role.username}] from role [{remove_user_from_role.role_name}]')
+        self._logger.info('Removing user [%s] from role [%s]', remove_user_from_role.username, remove_user_from_role.role_name)
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=remove_user_from_role.role_name))
         response: Response = self._client.post(
             f'{self._url_prefix}{REMOVE_USER_FROM_ROLE_URL}', json={'Name': role_id, 'Users': [remove_user_from_role.username]}
@@ -325,7 +327,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to remove user to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse remove user to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse remove user to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse remove user to role response [{str(ex)}]') from ex
 
     def remove_group_from_role(self, remove_group_from_role: ArkIdentityRemoveGroupFromRole) -> None:
@@ -338,7 +340,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Removing group [{remove_group_from_role.group_name}] from role [{remove_group_from_role.role_name}]')
+        self._logger.info('Removing group [%s] from role [%s]', remove_group_from_role.group_name, remove_group_from_role.role_name)
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=remove_group_from_role.role_name))
         response: Response = self._client.post(
             f'{self._url_prefix}{REMOVE_USER_FROM_ROLE_URL}', json={'Name': role_id, 'Groups': [remove_group_from_role.group_name]}
@@ -348,7 +350,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to remove group to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse remove group to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse remove group to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse remove group to role response [{str(ex)}]') from ex
 
     def remove_role_from_role(self, remove_role_from_role: ArkIdentityRemoveRoleFromRole) -> None:
@@ -361,7 +363,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Removing group [{remove_role_from_role.role_name}] from role [{remove_role_from_role.role_name_to_remove}]')
+        self._logger.info('Removing group [%s] from role [%s]', remove_role_from_role.role_name, remove_role_from_role.role_name_to_remove)
         role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=remove_role_from_role.role_name))
         response: Response = self._client.post(
             f'{self._url_prefix}{REMOVE_USER_FROM_ROLE_URL}', json={'Name': role_id, 'Roles': [remove_role_from_role.role_name_to_remove]}
@@ -371,7 +373,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to remove role to role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse remove role to role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse remove role to role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse remove role to role response [{str(ex)}]') from ex
 
     def delete_role(self, delete_role: ArkIdentityDeleteRole) -> None:
@@ -384,7 +386,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting role [{delete_role.role_name}]')
+        self._logger.info('Deleting role [%s]', delete_role.role_name)
         if delete_role.role_name and not delete_role.role_id:
             delete_role.role_id = self.role_id_by_name(ArkIdentityRoleIdByName(role_name=delete_role.role_name))
         response: Response = self._client.post(f'{self._url_prefix}{DELETE_ROLE_URL}', json={'Name': delete_role.role_id})
@@ -393,7 +395,7 @@ class ArkIdentityRolesService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to delete role [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse delete role response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse delete role response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse delete role response [{str(ex)}]') from ex
 
     @staticmethod
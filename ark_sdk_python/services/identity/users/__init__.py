@@ -1,3 +1,15 @@
-from ark_sdk_python.services.identity.users.ark_identity_users_service import ArkIdentityUsersService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.identity.users.ark_identity_users_service import ArkIdentityUsersService
 
 __all__ = ['ArkIdentityUsersService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.identity.users.ark_identity_users_service': ['ArkIdentityUsersService'],
+    },
+)
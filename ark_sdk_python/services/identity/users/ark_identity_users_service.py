@@ -54,7 +54,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         Returns:
             ArkIdentityUser: _description_
         """
-        self._logger.info(f'Creating identity user [{create_user.username}]')
+        self._logger.info('Creating identity user [%s]', create_user.username)
         directories_service = ArkIdentityDirectoriesService(self._isp_auth)
         tenant_suffix = create_user.suffix or directories_service.tenant_default_suffix()
         response: Response = self._client.post(
@@ -82,7 +82,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                     roles_service.add_user_to_role(
                         ArkIdentityAddUserToRole(username=f'{create_user.username}@{tenant_suffix}', role_name=role)
                     )
-            self._logger.info(f'User created successfully with id [{result["Result"]}]')
+            self._logger.info('User created successfully with id [%s]', result["Result"])
             return ArkIdentityUser(
                 user_id=result['Result'],
                 username=f'{create_user.username}@{tenant_suffix}',
@@ -92,7 +92,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                 roles=create_user.roles,
             )
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse create user response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse create user response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse create user response [{str(ex)}]') from ex
 
     def update_user(self, update_user: ArkIdentityUpdateUser) -> None:
@@ -107,7 +107,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         """
         if update_user.username and not update_user.user_id:
             update_user.user_id = self.user_id_by_name(ArkIdentityUserIdByName(username=update_user.username))
-        self._logger.info(f'Updating identity user [{update_user.user_id}]')
+        self._logger.info('Updating identity user [%s]', update_user.user_id)
         update_dict = {}
         if update_user.new_username:
             if '@' not in update_user.new_username:
@@ -128,7 +128,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to update user [{response.text}]')
             self._logger.info('User updated successfully')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse update user response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse update user response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse update user response [{str(ex)}]') from ex
 
     def delete_user(self, delete_user: ArkIdentityDeleteUser) -> None:
@@ -141,7 +141,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting user [{delete_user.user_id}]')
+        self._logger.info('Deleting user [%s]', delete_user.user_id)
         response: Response = self._client.post(
             f'{self._url_prefix}{DELETE_USER_URL}', json={'ID': delete_user.user_id or delete_user.username}
         )
@@ -149,7 +149,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to delete user [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse delete user response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse delete user response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse delete user response [{str(ex)}]') from ex
 
     def delete_users(self, delete_users: ArkIdentityDeleteUsers) -> None:
@@ -162,13 +162,13 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Removing users [{",".join(delete_users.user_ids)}]')
+        self._logger.info('Removing users [%s]', ",".join(delete_users.user_ids))
         response: Response = self._client.post(f'{self._url_prefix}{REMOVE_USERS_URL}', json={'Users': [delete_users.user_ids]})
         try:
             if response.status_code != HTTPStatus.OK or not response.json()['success']:
                 raise ArkServiceException(f'Failed to remove users [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse remove users response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse remove users response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse remove users response [{str(ex)}]') from ex
 
     def user_id_by_name(self, user_id_by_name: ArkIdentityUserIdByName) -> str:
@@ -193,7 +193,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                 raise ArkServiceException('Failed to retrieve user id by name')
             return query_result['Result']["Results"][0]["Row"]["ID"]
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse user id by name response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse user id by name response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse user id by name response [{str(ex)}]') from ex
 
     def user_by_name(self, user_id_by_name: ArkIdentityUserByName) -> ArkIdentityUser:
@@ -226,7 +226,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                     last_login = f'{last_login[:10]}.{last_login[10:]}'  # for milliseconds
                     last_login = datetime.fromtimestamp(float(last_login), timezone.utc)
                 except Exception as ex:
-                    self._logger.debug(f'Failed to parse last login [{user_row.get("LastLogin")}] [{str(ex)}]')
+                    self._logger.debug('Failed to parse last login [%s] [%s]', user_row.get("LastLogin"), ex)
 
             return ArkIdentityUser(
                 user_id=user_row["ID"],
@@ -237,7 +237,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                 last_login=last_login,
             )
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse user id by name response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse user id by name response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse user id by name response [{str(ex)}]') from ex
 
     def user_by_id(self, user_by_id: ArkIdentityUserById) -> ArkIdentityUser:
@@ -268,7 +268,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                     last_login = f'{last_login[:10]}.{last_login[10:]}'  # for milliseconds
                     last_login = datetime.fromtimestamp(float(last_login), timezone.utc)
                 except Exception as ex:
-                    self._logger.debug(f'Failed to parse last login [{user_row.get("LastLogin")}] [{str(ex)}]')
+                    self._logger.debug('Failed to parse last login [%s] [%s]', user_row.get("LastLogin"), ex)
 
             return ArkIdentityUser(
                 user_id=user_row["ID"],
@@ -279,7 +279,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                 last_login=last_login,
             )
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse user id by id response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse user id by id response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse user id by id response [{str(ex)}]') from ex
 
     def reset_user_password(self, reset_user_password: ArkIdentityResetUserPassword) -> None:
@@ -302,7 +302,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
             if response.status_code != HTTPStatus.OK or not result['success']:
                 raise ArkServiceException(f'Failed to reset user password [{response.text}]')
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse reset user password response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse reset user password response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse reset user password response [{str(ex)}]') from ex
 
     def user_info(self) -> ArkIdentityUserInfo:
@@ -325,7 +325,7 @@ class ArkIdentityUsersService(ArkIdentityBaseService):
                 raise ArkServiceException(f'Failed to get user info [{response.text}]')
             return ArkIdentityUserInfo.model_validate(result)
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to get user info [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to get user info [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to get user info [{str(ex)}]') from ex
 
     @staticmethod
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.pcloud.accounts.ark_pcloud_accounts_service import ArkPCloudAccountsService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.pcloud.accounts.ark_pcloud_accounts_service import ArkPCloudAccountsService
 
 __all__ = ['ArkPCloudAccountsService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.pcloud.accounts.ark_pcloud_accounts_service': ['ArkPCloudAccountsService'],
+    },
+)
@@ -88,7 +88,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
                     else:
                         break
                 except (ValidationError, JSONDecodeError, KeyError) as ex:
-                    self._logger.exception(f'Failed to parse list accounts response [{str(ex)}] - [{resp.text}]')
+                    self._logger.exception('Failed to parse list accounts response [%s] - [%s]', ex, resp.text)
                     raise ArkServiceException(f'Failed to parse list accounts response [{str(ex)}]') from ex
             else:
                 raise ArkServiceException(f'Failed to list accounts [{resp.text}] - [{resp.status_code}]')
@@ -115,7 +115,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Yields:
             Iterator[ArkPCloudAccountsPage]: _description_
         """
-        self._logger.info(f'Listing accounts by filters [{accounts_filter}]')
+        self._logger.info('Listing accounts by filters [%s]', accounts_filter)
         yield from self.__list_accounts_with_filters(
             accounts_filter.search,
             accounts_filter.search_type,
@@ -141,13 +141,13 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Returns:
             List[ArkPCloudAccountSecretVersion]: _description_
         """
-        self._logger.info(f'Listing account [{list_account_secret_versions.account_id}] secret versions')
+        self._logger.info('Listing account [%s] secret versions', list_account_secret_versions.account_id)
         resp: Response = self._client.get(ACCOUNT_SECRET_VERSIONS.format(account_id=list_account_secret_versions.account_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return TypeAdapter(List[ArkPCloudAccountSecretVersion]).validate_python(resp.json()['versions'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse list account secret versions response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list account secret versions response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list account secret versions response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list account secret versions [{resp.text}] - [{resp.status_code}]')
 
@@ -167,13 +167,13 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudAccountCredentials: _description_
         """
-        self._logger.info(f'Generating new password for account [{generate_account_credentials.account_id}]')
+        self._logger.info('Generating new password for account [%s]', generate_account_credentials.account_id)
         resp: Response = self._client.post(GENERATE_ACCOUNT_CREDENTIALS.format(account_id=generate_account_credentials.account_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkPCloudAccountCredentials(account_id=generate_account_credentials.account_id, password=resp.json()['password'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse genereate account credentials response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse genereate account credentials response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse genereate account credentials response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to generate password for account [{resp.text}] - [{resp.status_code}]')
 
@@ -188,7 +188,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Marking account [{verify_account_credentials.account_id}] for verification')
+        self._logger.info('Marking account [%s] for verification', verify_account_credentials.account_id)
         resp: Response = self._client.post(VERIFY_ACCOUNT_CREDENTIALS.format(account_id=verify_account_credentials.account_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to mark account for password verification [{resp.text}] - [{resp.status_code}]')
@@ -204,7 +204,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Marking account [{change_account_credentials.account_id}] for changing credentials immediately')
+        self._logger.info('Marking account [%s] for changing credentials immediately', change_account_credentials.account_id)
         resp: Response = self._client.post(CHANGE_ACCOUNT_CREDENTIALS.format(account_id=change_account_credentials.account_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to mark account for changing credentials immediately [{resp.text}] - [{resp.status_code}]')
@@ -220,7 +220,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Marking account [{set_account_next_credentials.account_id}] for changing credentials for the given password')
+        self._logger.info('Marking account [%s] for changing credentials for the given password', set_account_next_credentials.account_id)
         resp: Response = self._client.post(
             SET_ACCOUNT_NEXT_CREDENTIALS.format(account_id=set_account_next_credentials.account_id),
             json=set_account_next_credentials.model_dump(exclude={'account_id'}, by_alias=True),
@@ -239,7 +239,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Updates account [{update_account_credentials_in_vault.account_id}] vault credentials')
+        self._logger.info('Updates account [%s] vault credentials', update_account_credentials_in_vault.account_id)
         resp: Response = self._client.post(
             UPDATE_ACCOUNT_CREDENTIALS_IN_VAULT.format(account_id=update_account_credentials_in_vault.account_id),
             json=update_account_credentials_in_vault.model_dump(exclude={'account_id'}, by_alias=True),
@@ -258,7 +258,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Marking account [{reconcile_account_credentials.account_id}] for reconcilation')
+        self._logger.info('Marking account [%s] for reconcilation', reconcile_account_credentials.account_id)
         resp: Response = self._client.post(RECONCILE_ACCOUNT_CREDENTIALS.format(account_id=reconcile_account_credentials.account_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to reconcile account credentials [{resp.text}] - [{resp.status_code}]')
@@ -277,13 +277,13 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudAccount: _description_
         """
-        self._logger.info(f'Retrieving account by id [{get_account.account_id}]')
+        self._logger.info('Retrieving account by id [%s]', get_account.account_id)
         resp: Response = self._client.get(ACCOUNT_URL.format(account_id=get_account.account_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkPCloudAccount.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse account response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse account response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse account response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve account [{resp.text}] - [{resp.status_code}]')
 
@@ -301,7 +301,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudAccountCredentials: _description_
         """
-        self._logger.info(f'Retrieving account password for details [{get_account_credentials}]')
+        self._logger.info('Retrieving account password for details [%s]', get_account_credentials)
         body = {
             k.replace('_', '').title(): v
             for k, v in get_account_credentials.model_dump(exclude={'account_id', 'reason'}, exclude_none=True).items()
@@ -349,7 +349,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
             try:
                 return ArkPCloudAccount.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse add account response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add account response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add account response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add account [{resp.text}] - [{resp.status_code}]')
 
@@ -367,7 +367,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudAccount: _description_
         """
-        self._logger.info(f'Updating account [{update_account.account_id}]')
+        self._logger.info('Updating account [%s]', update_account.account_id)
         if update_account.remote_machines_access and not update_account.remote_machines_access.remote_machines:
             update_account.remote_machines_access = None
         operations = []
@@ -378,7 +378,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
             try:
                 return ArkPCloudAccount.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse update account response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update account response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update account response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update account [{resp.text}] - [{resp.status_code}]')
 
@@ -393,7 +393,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting account [{delete_account.account_id}]')
+        self._logger.info('Deleting account [%s]', delete_account.account_id)
         resp: Response = self._client.delete(ACCOUNT_URL.format(account_id=delete_account.account_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete account [{resp.text}] - [{resp.status_code}]')
@@ -410,9 +410,12 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
             ArkServiceException: _description_
         """
         self._logger.info(
-            f'Linking account [{link_account.account_id}] '
-            f'to name [{link_account.name}] in safe [{link_account.safe}] in folder [{link_account.folder}] '
-            f'by idx [{link_account.extra_password_index}]'
+            'Linking account [%s] to name [%s] in safe [%s] in folder [%s] by idx [%s]',
+            link_account.account_id,
+            link_account.name,
+            link_account.safe,
+            link_account.folder,
+            link_account.extra_password_index,
         )
         resp: Response = self._client.post(
             LINK_ACCOUNT.format(account_id=link_account.account_id), json=link_account.model_dump(exclude={'account_id'}, by_alias=True)
@@ -431,7 +434,7 @@ class ArkPCloudAccountsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Unlinking account [{unlink_account.account_id}] by idx [{unlink_account.extra_password_index}]')
+        self._logger.info('Unlinking account [%s] by idx [%s]', unlink_account.account_id, unlink_account.extra_password_index)
         resp: Response = self._client.delete(
             UNLINK_ACCOUNT.format(account_id=unlink_account.account_id, extra_password_index=unlink_account.extra_password_index)
         )
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.pcloud.applications.ark_pcloud_applications_service import ArkPCloudApplicationsService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.pcloud.applications.ark_pcloud_applications_service import ArkPCloudApplicationsService
 
 __all__ = ['ArkPCloudApplicationsService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.pcloud.applications.ark_pcloud_applications_service': ['ArkPCloudApplicationsService'],
+    },
+)
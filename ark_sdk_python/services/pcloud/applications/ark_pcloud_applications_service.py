@@ -54,7 +54,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudApplication: _description_
         """
-        self._logger.info(f'Adding new application with id [{add_application.app_id}]')
+        self._logger.info('Adding new application with id [%s]', add_application.app_id)
         try:
             parse(add_application.expiration_date)
         except Exception as ex:
@@ -77,7 +77,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting application with id [{delete_application.app_id}]')
+        self._logger.info('Deleting application with id [%s]', delete_application.app_id)
         resp: Response = self._client.delete(BASE_APPLICATION_URL.format(app_id=delete_application.app_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to delete application [{resp.text}] - [{resp.status_code}]')
@@ -107,7 +107,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         Returns:
             List[ArkPCloudApplication]: _description_
         """
-        self._logger.info(f'Listing applications by filters [{applications_filter}]')
+        self._logger.info('Listing applications by filters [%s]', applications_filter)
         applications = self.list_applications()
         if applications_filter.location:
             applications = [a for a in applications if fnmatch(a.location, applications_filter.location)]
@@ -135,7 +135,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudApplication: _description_
         """
-        self._logger.info(f'Retrieving application by id [{get_application.app_id}]')
+        self._logger.info('Retrieving application by id [%s]', get_application.app_id)
         resp: Response = self._client.get(BASE_APPLICATION_URL.format(app_id=get_application.app_id))
         if resp.status_code == HTTPStatus.OK:
             return ArkPCloudApplication.model_validate(resp.json()['application'])
@@ -178,7 +178,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
             ArkPCloudApplicationAuthMethod: _description_
         """
         self._logger.info(
-            f'Adding a new auth method [{add_application_auth_method.auth_type}] for app [{add_application_auth_method.app_id}]'
+            'Adding a new auth method [%s] for app [%s]', add_application_auth_method.auth_type, add_application_auth_method.app_id
         )
         auth_method_dict = None
         if add_application_auth_method.auth_type in [
@@ -244,7 +244,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
             delete_application_auth_method (ArkPCloudDeleteApplicationAuthMethod): _description_
         """
         self._logger.info(
-            f'Deleting auth method from app [{delete_application_auth_method.app_id}] with id [{delete_application_auth_method.auth_id}]'
+            'Deleting auth method from app [%s] with id [%s]', delete_application_auth_method.app_id, delete_application_auth_method.auth_id
         )
         resp: Response = self._client.delete(
             BASE_AUTH_METHOD_URL.format(app_id=delete_application_auth_method.app_id, auth_id=delete_application_auth_method.auth_id)
@@ -265,7 +265,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         Returns:
             List[ArkPCloudApplicationAuthMethod]: _description_
         """
-        self._logger.info(f'Listing all application [{list_application_auth_methods.app_id}]] auth methods')
+        self._logger.info('Listing all application [%s]] auth methods', list_application_auth_methods.app_id)
         resp: Response = self._client.get(BASE_AUTH_METHODS_URL.format(app_id=list_application_auth_methods.app_id))
         if resp.status_code == HTTPStatus.OK:
             return TypeAdapter(List[ArkPCloudApplicationAuthMethod]).validate_python(resp.json()['authentication'])
@@ -284,7 +284,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
         Returns:
             List[ArkPCloudApplicationAuthMethod]: _description_
         """
-        self._logger.info(f'Listing auth methods of app filtered [{application_auth_methods_filter}]')
+        self._logger.info('Listing auth methods of app filtered [%s]', application_auth_methods_filter)
         auth_methods = self.list_application_auth_methods(
             ArkPCloudListApplicationAuthMethods(app_id=application_auth_methods_filter.app_id)
         )
@@ -303,7 +303,7 @@ class ArkPCloudApplicationsService(ArkPCloudBaseService):
             ArkPCloudApplicationAuthMethod: _description_
         """
         self._logger.info(
-            f'Retrieving auth method of app [{get_application_auth_method.app_id}] and id [{get_application_auth_method.auth_id}]'
+            'Retrieving auth method of app [%s] and id [%s]', get_application_auth_method.app_id, get_application_auth_method.auth_id
         )
         auth_methods = [
             a
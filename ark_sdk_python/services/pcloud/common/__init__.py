@@ -1,3 +1,15 @@
-from ark_sdk_python.services.pcloud.common.ark_pcloud_base_service import ArkPCloudBaseService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.pcloud.common.ark_pcloud_base_service import ArkPCloudBaseService
 
 __all__ = ['ArkPCloudBaseService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.pcloud.common.ark_pcloud_base_service': ['ArkPCloudBaseService'],
+    },
+)
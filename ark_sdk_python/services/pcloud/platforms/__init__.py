@@ -1,3 +1,15 @@
-from ark_sdk_python.services.pcloud.platforms.ark_pcloud_platforms_service import ArkPCloudPlatformsService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.pcloud.platforms.ark_pcloud_platforms_service import ArkPCloudPlatformsService
 
 __all__ = ['ArkPCloudPlatformsService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.pcloud.platforms.ark_pcloud_platforms_service': ['ArkPCloudPlatformsService'],
+    },
+)
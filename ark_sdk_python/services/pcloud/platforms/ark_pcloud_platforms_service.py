@@ -68,7 +68,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
                     p['general']['platformType'] = p['general']['platformType'].lower()
                 return TypeAdapter(List[ArkPCloudPlatform]).validate_python(data['Platforms'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse list platforms response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list platforms response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list platforms response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list platforms [{resp.text}] - [{resp.status_code}]')
 
@@ -94,7 +94,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Returns:
             List[ArkPCloudPlatform]: _description_
         """
-        self._logger.info(f'Listing platforms by filter [{platforms_filter}]')
+        self._logger.info('Listing platforms by filter [%s]', platforms_filter)
         return self.__list_platforms_by_filters(
             active=platforms_filter.active, platform_type=platforms_filter.platform_type, platform_name=platforms_filter.platform_name
         )
@@ -113,13 +113,13 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Returns:
             ArkPCloudPlatform: _description_
         """
-        self._logger.info(f'Retrieving platform [{get_platform.platform_id}]')
+        self._logger.info('Retrieving platform [%s]', get_platform.platform_id)
         resp: Response = self._client.get(PLATFORM_URL.format(platform_id=get_platform.platform_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkPCloudPlatform.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse platform response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse platform response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse platform response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve platform [{resp.text}] - [{resp.status_code}]')
 
@@ -148,7 +148,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
                 platform_id = resp.json()['PlatformID']
                 return self.platform(ArkPCloudGetPlatform(platform_id=platform_id))
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse import platform response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse import platform response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse import platform response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to import platform [{resp.text}] - [{resp.status_code}]')
 
@@ -181,7 +181,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
                 raise ArkServiceException('Failed to find target platform after importing it')
 
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse import platform response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse import platform response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse import platform response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to import platform [{resp.text}] - [{resp.status_code}]')
 
@@ -196,7 +196,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Exporting platform [{export_platform.platform_id}] to folder [{export_platform.output_folder}]')
+        self._logger.info('Exporting platform [%s] to folder [%s]', export_platform.platform_id, export_platform.output_folder)
         output_folder = Path(export_platform.output_folder)
         output_folder.mkdir(exist_ok=True, parents=True)
         resp: Response = self._client.post(EXPORT_PLATFORM_URL.format(platform_id=export_platform.platform_id))
@@ -215,7 +215,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Exporting platform [{export_platform.target_platform_id}] to folder [{export_platform.output_folder}]')
+        self._logger.info('Exporting platform [%s] to folder [%s]', export_platform.target_platform_id, export_platform.output_folder)
         output_folder = Path(export_platform.output_folder)
         output_folder.mkdir(exist_ok=True, parents=True)
         target_platform: ArkPCloudTargetPlatform = self.target_platform(
@@ -280,7 +280,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
             try:
                 return TypeAdapter(List[ArkPCloudTargetPlatform]).validate_python(resp.json()['Platforms'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse list target platforms response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list target platforms response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list target platforms response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list target platforms [{resp.text}] - [{resp.status_code}]')
 
@@ -306,7 +306,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Returns:
             List[ArkPCloudTargetPlatform]: _description_
         """
-        self._logger.info(f'Listing target platforms by filter [{target_platforms_filter}]')
+        self._logger.info('Listing target platforms by filter [%s]', target_platforms_filter)
         target_platforms = self.__list_target_platforms_by_filters(
             active=target_platforms_filter.active,
             system_type=target_platforms_filter.system_type,
@@ -346,7 +346,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Retrieving target platform [{get_target_platform.target_platform_id}]')
+        self._logger.info('Retrieving target platform [%s]', get_target_platform.target_platform_id)
         target_platform = [p for p in self.list_target_platforms() if p.id == get_target_platform.target_platform_id]
         if len(target_platform) != 1:
             raise ArkServiceException('Failed to get target platform')
@@ -363,7 +363,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Activating target platform [{activate_target_platform.target_platform_id}]')
+        self._logger.info('Activating target platform [%s]', activate_target_platform.target_platform_id)
         resp: Response = self._client.post(
             ACTIVATE_TARGET_PLATFORM_URL.format(target_platform_id=activate_target_platform.target_platform_id)
         )
@@ -381,7 +381,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deactivating target platform [{deactivate_target_platform.target_platform_id}]')
+        self._logger.info('Deactivating target platform [%s]', deactivate_target_platform.target_platform_id)
         resp: Response = self._client.post(
             DEACTIVATE_TARGET_PLATFORM_URL.format(target_platform_id=deactivate_target_platform.target_platform_id)
         )
@@ -405,7 +405,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
             ArkServiceException: _description_
         """
         self._logger.info(
-            f'Duplicates target platform [{duplicate_target_platform.target_platform_id}] to name [{duplicate_target_platform.name}]'
+            'Duplicates target platform [%s] to name [%s]', duplicate_target_platform.target_platform_id, duplicate_target_platform.name
         )
         resp: Response = self._client.post(
             DUPLICATE_TARGET_PLATFORM_URL.format(target_platform_id=duplicate_target_platform.target_platform_id),
@@ -415,7 +415,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
             try:
                 return ArkPCloudDuplicatedTargetPlatformInfo.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse duplicate target platform response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse duplicate target platform response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse duplicate target platform response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to duplicate target platform [{resp.text}] - [{resp.status_code}]')
 
@@ -430,7 +430,7 @@ class ArkPCloudPlatformsService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting target platform [{delete_target_platform.target_platform_id}]')
+        self._logger.info('Deleting target platform [%s]', delete_target_platform.target_platform_id)
         resp: Response = self._client.delete(TARGET_PLATFORM_URL.format(target_platform_id=delete_target_platform.target_platform_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete target platform [{resp.text}] - [{resp.status_code}]')
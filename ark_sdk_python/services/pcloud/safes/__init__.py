@@ -1,3 +1,15 @@
-from ark_sdk_python.services.pcloud.safes.ark_pcloud_safes_service import ArkPCloudSafesService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.pcloud.safes.ark_pcloud_safes_service import ArkPCloudSafesService
 
 __all__ = ['ArkPCloudSafesService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.pcloud.safes.ark_pcloud_safes_service': ['ArkPCloudSafesService'],
+    },
+)
@@ -9,7 +9,7 @@ from pydantic import TypeAdapter, ValidationError
 from requests import Response
 from requests.exceptions import JSONDecodeError
 
-from ark_sdk_python.common import ArkPage
+from ark_sdk_python.common import ArkDeadline, ArkPage
 from ark_sdk_python.models import ArkServiceException
 from ark_sdk_python.models.common import ArkCountedValues
 from ark_sdk_python.models.services import ArkServiceConfig
@@ -131,7 +131,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
                     else:
                         break
                 except (ValidationError, JSONDecodeError, KeyError) as ex:
-                    self._logger.exception(f'Failed to parse list safes response [{str(ex)}] - [{resp.text}]')
+                    self._logger.exception('Failed to parse list safes response [%s] - [%s]', ex, resp.text)
                     raise ArkServiceException(f'Failed to parse list safes response [{str(ex)}]') from ex
             else:
                 raise ArkServiceException(f'Failed to list safes [{resp.text}] - [{resp.status_code}]')
@@ -173,7 +173,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
                     else:
                         break
                 except (ValidationError, JSONDecodeError, KeyError) as ex:
-                    self._logger.exception(f'Failed to parse list safe members response [{str(ex)}] - [{resp.text}]')
+                    self._logger.exception('Failed to parse list safe members response [%s] - [%s]', ex, resp.text)
                     raise ArkServiceException(f'Failed to parse list safe members response [{str(ex)}]') from ex
             else:
                 raise ArkServiceException(f'Failed to list safe members [{resp.text}] - [{resp.status_code}]')
@@ -197,7 +197,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Yields:
             Iterator[ArkPCloudSafesPage]: _description_
         """
-        self._logger.info(f'Listing safes by filter [{safes_filter}]')
+        self._logger.info('Listing safes by filter [%s]', safes_filter)
         yield from self.__list_safes_with_filters(safes_filter.search, safes_filter.sort, safes_filter.offset, safes_filter.limit)
 
     def list_safe_members(self, list_safe_members: ArkPCloudListSafeMembers) -> Iterator[ArkPCloudSafeMembersPage]:
@@ -225,7 +225,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Yields:
             Iterator[ArkPCloudSafeMembersPage]: _description_
         """
-        self._logger.info(f'Listing safe members by filter [{safe_members_filter}]')
+        self._logger.info('Listing safe members by filter [%s]', safe_members_filter)
         yield from self.__list_safe_members_with_filters(
             safe_members_filter.safe_id,
             safe_members_filter.search,
@@ -249,13 +249,13 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Returns:
             ArkPCloudSafe: _description_
         """
-        self._logger.info(f'Retrieving safe by id [{get_safe.safe_id}]')
+        self._logger.info('Retrieving safe by id [%s]', get_safe.safe_id)
         resp: Response = self._client.get(SAFE_URL.format(safe_id=get_safe.safe_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkPCloudSafe.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse safe response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse safe response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse safe response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve safe [{resp.text}] - [{resp.status_code}]')
 
@@ -273,7 +273,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Returns:
             ArkPCloudSafeMember: _description_
         """
-        self._logger.info(f'Retrieving safe member by safe [{get_safe_member.safe_id}] and member name [{get_safe_member.member_name}]')
+        self._logger.info('Retrieving safe member by safe [%s] and member name [%s]', get_safe_member.safe_id, get_safe_member.member_name)
         resp: Response = self._client.get(SAFE_MEMBER_URL.format(safe_id=get_safe_member.safe_id, member_name=get_safe_member.member_name))
         if resp.status_code == HTTPStatus.OK:
             try:
@@ -284,7 +284,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
                 )[0]
                 return safe_member
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse safe member response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse safe member response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse safe member response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve safe member [{resp.text}] - [{resp.status_code}]')
 
@@ -308,7 +308,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             try:
                 return ArkPCloudSafe.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse add safe response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add safe response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add safe response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add safe [{resp.text}] - [{resp.status_code}]')
 
@@ -326,7 +326,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Returns:
             ArkPCloudSafeMember: _description_
         """
-        self._logger.info(f'Adding new safe member for safe [{add_safe_member.safe_id}] and name [{add_safe_member.member_name}]')
+        self._logger.info('Adding new safe member for safe [%s] and name [%s]', add_safe_member.safe_id, add_safe_member.member_name)
         if (
             add_safe_member.permission_set
             and add_safe_member.permission_set == ArkPCloudSafeMemberPermissionSet.Custom
@@ -343,7 +343,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             try:
                 return ArkPCloudSafeMember.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse add safe member response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add safe member response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add safe member response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add safe member [{resp.text}] - [{resp.status_code}]')
 
@@ -358,7 +358,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting safe [{delete_safe.safe_id}]')
+        self._logger.info('Deleting safe [%s]', delete_safe.safe_id)
         resp: Response = self._client.delete(SAFE_URL.format(safe_id=delete_safe.safe_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete safe [{resp.text}] - [{resp.status_code}]')
@@ -374,7 +374,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting safe member from safe [{delete_safe_member.safe_id}] with name [{delete_safe_member.member_name}]')
+        self._logger.info('Deleting safe member from safe [%s] with name [%s]', delete_safe_member.safe_id, delete_safe_member.member_name)
         resp: Response = self._client.delete(
             f'{SAFE_MEMBER_URL.format(safe_id=delete_safe_member.safe_id, member_name=delete_safe_member.member_name)}/'
         )
@@ -395,7 +395,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Returns:
             ArkPCloudSafe: _description_
         """
-        self._logger.info(f'Updating safe [{update_safe.safe_id}]')
+        self._logger.info('Updating safe [%s]', update_safe.safe_id)
         resp: Response = self._client.put(
             SAFE_URL.format(safe_id=update_safe.safe_id), json=update_safe.model_dump(by_alias=True, exclude={'safe_id'}, exclude_none=True)
         )
@@ -403,7 +403,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             try:
                 return ArkPCloudSafe.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse update safe response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update safe response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update safe response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update safe [{resp.text}] - [{resp.status_code}]')
 
@@ -421,7 +421,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Returns:
             ArkPCloudSafeMember: _description_
         """
-        self._logger.info(f'Updating safe member of safe [{update_safe_member.safe_id}] and name [{update_safe_member.member_name}]')
+        self._logger.info('Updating safe member of safe [%s] and name [%s]', update_safe_member.safe_id, update_safe_member.member_name)
         if (
             update_safe_member.permission_set
             and update_safe_member.permission_set == ArkPCloudSafeMemberPermissionSet.Custom
@@ -438,7 +438,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
             try:
                 return ArkPCloudSafeMember.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse update safe member response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update safe member response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update safe member response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update safe member [{resp.text}] - [{resp.status_code}]')
 
@@ -474,7 +474,7 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         Returns:
             ArkPCloudSafeMembersStats: _description_
         """
-        self._logger.info(f'Calculating safe members statistics for safe [{get_safe_members_stats.safe_id}]')
+        self._logger.info('Calculating safe members statistics for safe [%s]', get_safe_members_stats.safe_id)
         safe_members = list(
             itertools.chain.from_iterable(
                 [p.items for p in list(self.list_safe_members(ArkPCloudListSafeMembers(safe_id=get_safe_members_stats.safe_id)))]
@@ -511,7 +511,8 @@ class ArkPCloudSafesService(ArkPCloudBaseService):
         safes_members_stats = ArkPCloudSafesMembersStats.model_construct()
         with ThreadPoolExecutor() as executor:
             safe_members_stats_tuples = executor.map(
-                lambda s: (s.safe_name, self.safe_members_stats(ArkPCloudGetSafeMembersStats(safe_id=s.safe_id))), safes
+                ArkDeadline.bind(lambda s: (s.safe_name, self.safe_members_stats(ArkPCloudGetSafeMembersStats(safe_id=s.safe_id)))),
+                safes,
             )
             safes_members_stats.safe_members_stats = dict((a, b) for a, b in safe_members_stats_tuples)
         return safes_members_stats
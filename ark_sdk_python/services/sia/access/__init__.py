@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.access.ark_sia_access_service import ArkSIAAccessService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.access.ark_sia_access_service import ArkSIAAccessService
 
 __all__ = ['ArkSIAAccessService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.access.ark_sia_access_service': ['ArkSIAAccessService'],
+    },
+)
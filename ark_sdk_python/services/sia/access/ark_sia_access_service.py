@@ -149,12 +149,13 @@ class ArkSIAAccessService(ArkService):
                 connection.run_command(ArkConnectionCommand(command=cmdset['connector-active']))
                 break
             except ArkException as ex:
-                self._logger.exception(f'Failed to check whether a connector is active [{str(ex)}]')
+                self._logger.exception('Failed to check whether a connector is active [%s]', ex)
                 if retry_count > 0:
                     retry_count = retry_count - 1
                     self._logger.info(
-                        f'Retrying to check if connector is active, sleeping for '
-                        f'[{CONNECTOR_RETRY_TICK_SECONDS}] and retrying, retries left [{retry_count}]'
+                        'Retrying to check if connector is active, sleeping for [%s] and retrying, retries left [%s]',
+                        CONNECTOR_RETRY_TICK_SECONDS,
+                        retry_count,
                     )
                     time.sleep(CONNECTOR_RETRY_TICK_SECONDS)
                     continue
@@ -198,7 +199,7 @@ class ArkSIAAccessService(ArkService):
             try:
                 return ArkSIAConnectorSetupScript.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse connector setup script response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse connector setup script response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse connector setup script response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve connector setup script [{resp.text}] - [{resp.status_code}]')
 
@@ -216,7 +217,7 @@ class ArkSIAAccessService(ArkService):
             str: _description_
         """
         self._logger.info(
-            f'Installing connector on machine [{install_connector.target_machine}] of type [{install_connector.connector_os}]'
+            'Installing connector on machine [%s] of type [%s]', install_connector.target_machine, install_connector.connector_os
         )
         installation_script = self.connector_setup_script(
             ArkSIAGetConnectorSetupScript(
@@ -246,7 +247,7 @@ class ArkSIAAccessService(ArkService):
         Args:
             uninstall_connector (ArkSIAUninstallConnector): _description_
         """
-        self._logger.info(f'Uninstalling connector [{uninstall_connector.connector_id}] from machine')
+        self._logger.info('Uninstalling connector [%s] from machine', uninstall_connector.connector_id)
         self.__uninstall_connector_on_machine(
             uninstall_connector.connector_os,
             uninstall_connector.target_machine,
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.certificates.ark_sia_certificates_service import ArkSIACertificatesService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.certificates.ark_sia_certificates_service import ArkSIACertificatesService
 
 __all__ = ["ArkSIACertificatesService"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.certificates.ark_sia_certificates_service': ['ArkSIACertificatesService'],
+    },
+)
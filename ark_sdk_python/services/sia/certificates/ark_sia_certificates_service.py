@@ -78,7 +78,7 @@ class ArkSIACertificatesService(ArkService):
                 cert_id = resp.json()['certificate_id']
                 return self.certificate(ArkSIAGetCertificate(certificate_id=cert_id))
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f"Failed to parse response from create certificate [{str(ex)}]")
+                self._logger.exception('Failed to parse response from create certificate [%s]', ex)
                 raise ArkServiceException(f"Failed to parse response from create certificate [{str(ex)}]") from ex
         raise ArkServiceException(f'Failed to add a new certificate [{resp.text}] - [{resp.status_code}]')
 
@@ -95,14 +95,14 @@ class ArkSIACertificatesService(ArkService):
         Returns:
             ArkSIACertificate: The retrieved certificate
         """
-        self._logger.info(f'Retrieving certificate [{get_certificate.certificate_id}]')
+        self._logger.info('Retrieving certificate [%s]', get_certificate.certificate_id)
         resp = self.__client.get(CERTIFICATE_API.format(certificate_id=get_certificate.certificate_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to retrieve certificate [{get_certificate.certificate_id}] [{resp.text}]')
         try:
             return ArkSIACertificate.model_validate(resp.json())
         except (ValidationError, JSONDecodeError) as ex:
-            self._logger.exception(f'Failed to parse certificate response [{str(ex)}] - [{resp.text}]')
+            self._logger.exception('Failed to parse certificate response [%s] - [%s]', ex, resp.text)
             raise ArkServiceException(f'Failed to parse policy response [{str(ex)}]') from ex
 
     def delete_certificate(self, cert: ArkSIADeleteCertificate) -> None:
@@ -115,7 +115,7 @@ class ArkSIACertificatesService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f"Deleting certificate [{cert.certificate_id}]")
+        self._logger.info('Deleting certificate [%s]', cert.certificate_id)
         resp: Response = self.__client.delete(CERTIFICATE_API.format(certificate_id=cert.certificate_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete certificate [{cert.certificate_id}] [{resp.status_code}]')
@@ -130,7 +130,7 @@ class ArkSIACertificatesService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f"Updating certificate [{update_certificate.certificate_id}]")
+        self._logger.info('Updating certificate [%s]', update_certificate.certificate_id)
         try:
             with open(update_certificate.file, 'r', encoding='utf-8') as f:
                 cert_body = f.read()
@@ -160,7 +160,7 @@ class ArkSIACertificatesService(ArkService):
         try:
             return [ArkSIAShortCertificate.model_validate(cert) for cert in resp.json()['certificates']['items']]
         except (ValidationError, JSONDecodeError) as ex:
-            self._logger.exception(f'Failed to parse certificate response [{str(ex)}] - [{resp.text}]')
+            self._logger.exception('Failed to parse certificate response [%s] - [%s]', ex, resp.text)
             raise ArkServiceException(f'Failed to parse certificate response [{str(ex)}]') from ex
 
     def list_certificates_by(self, certificates_filter: ArkSIACertificatesFilter) -> List[ArkSIAShortCertificate]:
@@ -173,7 +173,7 @@ class ArkSIACertificatesService(ArkService):
         Returns:
             List[ArkSIAShortCertificate]: _description_
         """
-        self._logger.info(f'Retrieving certificates by filter [{certificates_filter}]')
+        self._logger.info('Retrieving certificates by filter [%s]', certificates_filter)
         certs = self.list_certificates()
 
         if certificates_filter.domain_name:
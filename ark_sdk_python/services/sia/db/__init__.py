@@ -1,5 +1,17 @@
-from ark_sdk_python.services.sia.db.ark_sia_db_service import ArkSIADBService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.db.ark_sia_db_service import ArkSIADBService
 
 __all__ = [
     'ArkSIADBService',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.db.ark_sia_db_service': ['ArkSIADBService'],
+    },
+)
@@ -182,7 +182,7 @@ class ArkSIADBService(ArkService):
                     return resp.text
                 return ArkSIADBGeneratedAssets.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to generate assets [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to generate assets [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to generate assets [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to generate assets [{resp.text}] - [{resp.status_code}]')
 
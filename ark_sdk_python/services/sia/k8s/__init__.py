@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.k8s.ark_sia_k8s_service import ArkSIAK8SService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.k8s.ark_sia_k8s_service import ArkSIAK8SService
 
 __all__ = ['ArkSIAK8SService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.k8s.ark_sia_k8s_service': ['ArkSIAK8SService'],
+    },
+)
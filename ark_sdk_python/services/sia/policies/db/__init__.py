@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.policies.db.ark_sia_db_policies_service import ArkSIADBPoliciesService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.policies.db.ark_sia_db_policies_service import ArkSIADBPoliciesService
 
 __all__ = ['ArkSIADBPoliciesService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.policies.db.ark_sia_db_policies_service': ['ArkSIADBPoliciesService'],
+    },
+)
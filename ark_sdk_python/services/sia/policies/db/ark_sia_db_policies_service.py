@@ -72,7 +72,7 @@ class ArkSIADBPoliciesService(ArkService):
         Returns:
             ArkSIADBPolicy: _description_
         """
-        self._logger.info(f'Adding new db policy [{add_policy.policy_name}]')
+        self._logger.info('Adding new db policy [%s]', add_policy.policy_name)
         add_policy_dict = add_policy.model_dump(by_alias=True, exclude_none=True)
         resp: Response = self.__client.post(DB_POLICIES_API, json=add_policy_dict)
         if resp.status_code == HTTPStatus.CREATED:
@@ -80,7 +80,7 @@ class ArkSIADBPoliciesService(ArkService):
                 policy_id = resp.json()['policyId']
                 return self.policy(ArkSIAGetPolicy(policy_id=policy_id))
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add db policy response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add db policy response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add sb policy response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add db policy [{resp.text}] - [{resp.status_code}]')
 
@@ -96,7 +96,7 @@ class ArkSIADBPoliciesService(ArkService):
         """
         if delete_policy.policy_name and not delete_policy.policy_id:
             delete_policy.policy_id = self.__policy_id_by_name(delete_policy.policy_name)
-        self._logger.info(f'Deleting db policy [{delete_policy.policy_id}]')
+        self._logger.info('Deleting db policy [%s]', delete_policy.policy_id)
         resp: Response = self.__client.delete(DB_POLICY_API.format(policy_id=delete_policy.policy_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete db policy [{resp.text}] - [{resp.status_code}]')
@@ -116,7 +116,7 @@ class ArkSIADBPoliciesService(ArkService):
         """
         if update_policy.policy_name and not update_policy.policy_id:
             update_policy.policy_id = self.__policy_id_by_name(update_policy.policy_name)
-        self._logger.info(f'Updating db policy [{update_policy.policy_id}]')
+        self._logger.info('Updating db policy [%s]', update_policy.policy_id)
         update_dict = json.loads(
             update_policy.model_dump_json(by_alias=True, exclude_none=True, exclude={'new_policy_name', 'policy_name'})
         )
@@ -129,7 +129,7 @@ class ArkSIADBPoliciesService(ArkService):
             try:
                 return ArkSIADBPolicy.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse update db policy response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update db policy response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update db policy response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update db policy [{resp.text}] - [{resp.status_code}]')
 
@@ -148,7 +148,7 @@ class ArkSIADBPoliciesService(ArkService):
         """
         if update_policy_status.policy_name and not update_policy_status.policy_id:
             update_policy_status.policy_id = self.__policy_id_by_name(update_policy_status.policy_name)
-        self._logger.info(f'Updating db policy status [{update_policy_status.policy_id}]')
+        self._logger.info('Updating db policy status [%s]', update_policy_status.policy_id)
         resp: Response = self.__client.put(
             DB_UPDATE_POLICY_STATUS_API.format(policy_id=update_policy_status.policy_id),
             json=update_policy_status.model_dump(exclude={'policy_id'}),
@@ -173,7 +173,7 @@ class ArkSIADBPoliciesService(ArkService):
             try:
                 return TypeAdapter(List[ArkSIADBPolicyListItem]).validate_python(resp.json()['items'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse list db policies response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list db policies response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list db policies response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list db policies [{resp.text}] - [{resp.status_code}]')
 
@@ -187,7 +187,7 @@ class ArkSIADBPoliciesService(ArkService):
         Returns:
             List[ArkSIADBPolicyListItem]: _description_
         """
-        self._logger.info(f'Retrieving db policies by filter [{policies_filter}]')
+        self._logger.info('Retrieving db policies by filter [%s]', policies_filter)
         policies = self.list_policies()
 
         # Filter by statuses
@@ -219,13 +219,13 @@ class ArkSIADBPoliciesService(ArkService):
         """
         if get_policy.policy_name and not get_policy.policy_id:
             get_policy.policy_id = self.__policy_id_by_name(get_policy.policy_name)
-        self._logger.info(f'Retrieving db policy [{get_policy.policy_id}]')
+        self._logger.info('Retrieving db policy [%s]', get_policy.policy_id)
         resp: Response = self.__client.get(DB_POLICY_API.format(policy_id=get_policy.policy_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkSIADBPolicy.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse db policy response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse db policy response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse db policy response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve db policy [{get_policy.policy_id}] [{resp.text}] - [{resp.status_code}]')
 
@@ -108,7 +108,7 @@ class ArkSIAVMPoliciesService(ArkService):
         Returns:
             ArkSIAVMPolicy: _description_
         """
-        self._logger.info(f'Adding new vm policy [{add_policy.policy_name}]')
+        self._logger.info('Adding new vm policy [%s]', add_policy.policy_name)
         add_policy_dict = add_policy.model_dump(by_alias=True)
         add_policy_dict['providersData'] = self.__serialize_providers_dict(add_policy.providers_data)
         self.__serialize_authorization_rules_dict(add_policy_dict['userAccessRules'])
@@ -118,7 +118,7 @@ class ArkSIAVMPoliciesService(ArkService):
                 policy_id = resp.json()['policyId']
                 return self.policy(ArkSIAGetPolicy(policy_id=policy_id))
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add vm policy response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add vm policy response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add vm policy response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add vm policy [{resp.text}] - [{resp.status_code}]')
 
@@ -134,7 +134,7 @@ class ArkSIAVMPoliciesService(ArkService):
         """
         if delete_policy.policy_name and not delete_policy.policy_id:
             delete_policy.policy_id = self.__policy_id_by_name(delete_policy.policy_name)
-        self._logger.info(f'Deleting vm policy [{delete_policy.policy_id}]')
+        self._logger.info('Deleting vm policy [%s]', delete_policy.policy_id)
         resp: Response = self.__client.delete(VM_POLICY_API.format(policy_id=delete_policy.policy_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete vm policy [{resp.text}] - [{resp.status_code}]')
@@ -154,7 +154,7 @@ class ArkSIAVMPoliciesService(ArkService):
         """
         if update_policy.policy_name and not update_policy.policy_id:
             update_policy.policy_id = self.__policy_id_by_name(update_policy.policy_name)
-        self._logger.info(f'Updating vm policy [{update_policy.policy_id}]')
+        self._logger.info('Updating vm policy [%s]', update_policy.policy_id)
         update_dict = json.loads(
             update_policy.model_dump_json(by_alias=True, exclude_none=True, exclude={'new_policy_name', 'policy_name'})
         )
@@ -171,7 +171,7 @@ class ArkSIAVMPoliciesService(ArkService):
             try:
                 return ArkSIAVMPolicy.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse update vm policy response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update vm policy response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update vm policy response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update vm policy [{resp.text}] - [{resp.status_code}]')
 
@@ -190,7 +190,7 @@ class ArkSIAVMPoliciesService(ArkService):
         """
         if update_policy_status.policy_name and not update_policy_status.policy_id:
             update_policy_status.policy_id = self.__policy_id_by_name(update_policy_status.policy_name)
-        self._logger.info(f'Updating vm policy status [{update_policy_status.policy_id}]')
+        self._logger.info('Updating vm policy status [%s]', update_policy_status.policy_id)
         resp: Response = self.__client.put(
             VM_UPDATE_POLICY_STATUS_API.format(policy_id=update_policy_status.policy_id),
             json=update_policy_status.model_dump(exclude={'policy_id'}),
@@ -206,7 +206,7 @@ class ArkSIAVMPoliciesService(ArkService):
         try:
             return self.__parse_policies(resp, params.get('extended', False)), json.loads(resp.text)['totalCount']
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse list vm policies response [{str(ex)}] - [{resp.text}]')
+            self._logger.exception('Failed to parse list vm policies response [%s] - [%s]', ex, resp.text)
             raise ArkServiceException(f'Failed to parse list vm policies response [{str(ex)}]') from ex
 
     def query_policies(self, policies_filter: ArkSIAVMQueryPolicies = None) -> Iterator[ArkPolicyListItemPage]:
@@ -222,7 +222,7 @@ class ArkSIAVMPoliciesService(ArkService):
         if policies_filter is not None and not isinstance(policies_filter, ArkSIAVMQueryPolicies):
             raise TypeError('policies_filter must be an instance of ArkSIAVMPoliciesFilterByQuery')
 
-        self._logger.info(f'Retrieving all vm policies that comply to the filter: {policies_filter=}')
+        self._logger.info('Retrieving all vm policies that comply to the filter: policies_filter=%r', policies_filter)
         params = self.__build_url_params(policies_filter=policies_filter)
         offset = params.get('offset', 0)
 
@@ -295,7 +295,7 @@ class ArkSIAVMPoliciesService(ArkService):
         Returns:
             Iterator[ArkPolicyListItemPage]: _description_
         """
-        self._logger.info(f'Retrieving vm policies by filter [{policies_filter}]')
+        self._logger.info('Retrieving vm policies by filter [%s]', policies_filter)
         filter_pairs = []
 
         # Filter by statuses
@@ -341,13 +341,13 @@ class ArkSIAVMPoliciesService(ArkService):
         """
         if get_policy.policy_name and not get_policy.policy_id:
             get_policy.policy_id = self.__policy_id_by_name(get_policy.policy_name)
-        self._logger.info(f'Retrieving vm policy [{get_policy.policy_id}]')
+        self._logger.info('Retrieving vm policy [%s]', get_policy.policy_id)
         resp: Response = self.__client.get(VM_POLICY_API.format(policy_id=get_policy.policy_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkSIAVMPolicy.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse vm policy response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse vm policy response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse vm policy response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve vm policy [{get_policy.policy_id}] [{resp.text}] - [{resp.status_code}]')
 
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.secrets.db.ark_sia_db_secrets_service import ArkSIADBSecretsService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.secrets.db.ark_sia_db_secrets_service import ArkSIADBSecretsService
 
 __all__ = ['ArkSIADBSecretsService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.secrets.db.ark_sia_db_secrets_service': ['ArkSIADBSecretsService'],
+    },
+)
@@ -66,7 +66,7 @@ class ArkSIADBSecretsService(ArkService):
             try:
                 return ArkSIADBSecretMetadataList.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse list secrets response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list secrets response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list secrets response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list secrets [{resp.text}] - [{resp.status_code}]')
 
@@ -154,7 +154,7 @@ class ArkSIADBSecretsService(ArkService):
             try:
                 return ArkSIADBSecretMetadata.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse add db secret response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add db secret response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add db secret response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add db secret [{resp.text}] - [{resp.status_code}]')
 
@@ -179,7 +179,7 @@ class ArkSIADBSecretsService(ArkService):
                 .secrets[0]
                 .secret_id
             )
-        self._logger.info(f'Updating existing db secret with id [{update_secret.secret_id}]')
+        self._logger.info('Updating existing db secret with id [%s]', update_secret.secret_id)
         update_secret_dict = update_secret.model_dump(
             exclude_none=True,
             exclude={
@@ -251,7 +251,7 @@ class ArkSIADBSecretsService(ArkService):
             try:
                 return ArkSIADBSecretMetadata.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse db secret response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse db secret response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse db secret response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update db secret [{resp.text}] - [{resp.status_code}]')
 
@@ -273,7 +273,7 @@ class ArkSIADBSecretsService(ArkService):
                 .secrets[0]
                 .secret_id
             )
-        self._logger.info(f'Deleting db secret by id [{delete_secret.secret_id}]')
+        self._logger.info('Deleting db secret by id [%s]', delete_secret.secret_id)
         resp: Response = self.__client.delete(SECRET_ROUTE.format(secret_id=delete_secret.secret_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete db secret [{resp.text}] - [{resp.status_code}]')
@@ -298,7 +298,7 @@ class ArkSIADBSecretsService(ArkService):
         Returns:
             ArkSIADBSecretMetadataList: _description_
         """
-        self._logger.info(f'Listing db secrets by filters [{secrets_filter}]')
+        self._logger.info('Listing db secrets by filters [%s]', secrets_filter)
         secrets = self.__list_secrets_with_filters(secrets_filter.secret_type, secrets_filter.tags)
 
         # Filter by secret types
@@ -337,7 +337,7 @@ class ArkSIADBSecretsService(ArkService):
                 .secrets[0]
                 .secret_id
             )
-        self._logger.info(f'Enabling db secret by id [{enable_secret.secret_id}]')
+        self._logger.info('Enabling db secret by id [%s]', enable_secret.secret_id)
         resp: Response = self.__client.post(ENABLE_SECRET_ROUTE.format(secret_id=enable_secret.secret_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to enable db secret [{resp.text}] - [{resp.status_code}]')
@@ -363,7 +363,7 @@ class ArkSIADBSecretsService(ArkService):
                 .secrets[0]
                 .secret_id
             )
-        self._logger.info(f'Disabling db secret by id [{disable_secret.secret_id}]')
+        self._logger.info('Disabling db secret by id [%s]', disable_secret.secret_id)
         resp: Response = self.__client.post(DISABLE_SECRET_ROUTE.format(secret_id=disable_secret.secret_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to disable db secret [{resp.text}] - [{resp.status_code}]')
@@ -389,13 +389,13 @@ class ArkSIADBSecretsService(ArkService):
                 .secrets[0]
                 .secret_id
             )
-        self._logger.info(f'Retrieving db secret by id [{get_secret.secret_id}]')
+        self._logger.info('Retrieving db secret by id [%s]', get_secret.secret_id)
         resp: Response = self.__client.get(SECRET_ROUTE.format(secret_id=get_secret.secret_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkSIADBSecretMetadata.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse db secret response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse db secret response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse db secret response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve db secret [{resp.text}] - [{resp.status_code}]')
 
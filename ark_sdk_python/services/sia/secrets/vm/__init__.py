@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.secrets.vm.ark_sia_vm_secrets_service import ArkSIAVMSecretsService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.secrets.vm.ark_sia_vm_secrets_service import ArkSIAVMSecretsService
 
 __all__ = ['ArkSIAVMSecretsService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.secrets.vm.ark_sia_vm_secrets_service': ['ArkSIAVMSecretsService'],
+    },
+)
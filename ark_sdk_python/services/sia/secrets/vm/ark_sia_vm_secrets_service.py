@@ -75,7 +75,7 @@ class ArkSIAVMSecretsService(ArkService):
             try:
                 return TypeAdapter(List[ArkSIAVMSecretInfo]).validate_python(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse list secrets response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list secrets response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list secrets response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list secrets [{resp.text}] - [{resp.status_code}]')
 
@@ -107,7 +107,7 @@ class ArkSIAVMSecretsService(ArkService):
             try:
                 return ArkSIAVMSecret.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse add vm secret response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add vm secret response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add vm secret response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add vm secret [{resp.text}] - [{resp.status_code}]')
 
@@ -124,7 +124,7 @@ class ArkSIAVMSecretsService(ArkService):
         Returns:
             ArkSIAVMSecret: _description_
         """
-        self._logger.info(f'Changing existing vm secret with id [{change_secret.secret_id}]')
+        self._logger.info('Changing existing vm secret with id [%s]', change_secret.secret_id)
         secret_data = None
         try:
             secret_data = self.__deduce_secret_data(change_secret)
@@ -155,7 +155,7 @@ class ArkSIAVMSecretsService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting vm secret by id [{delete_secret.secret_id}]')
+        self._logger.info('Deleting vm secret by id [%s]', delete_secret.secret_id)
         resp: Response = self.__client.delete(SECRET_ROUTE.format(secret_id=delete_secret.secret_id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete vm secret [{resp.text}] - [{resp.status_code}]')
@@ -180,7 +180,7 @@ class ArkSIAVMSecretsService(ArkService):
         Returns:
             List[ArkSIASecretInfo]: _description_
         """
-        self._logger.info(f'Listing vm secrets by filters [{secrets_filter}]')
+        self._logger.info('Listing vm secrets by filters [%s]', secrets_filter)
         secret_type = None
         secret_details = secrets_filter.secret_details
         if secrets_filter.secret_types and len(secrets_filter.secret_types) == 1:
@@ -214,13 +214,13 @@ class ArkSIAVMSecretsService(ArkService):
         Returns:
             ArkSIAVMSecret: _description_
         """
-        self._logger.info(f'Retrieving vm secret by id [{get_secret.secret_id}]')
+        self._logger.info('Retrieving vm secret by id [%s]', get_secret.secret_id)
         resp: Response = self.__client.get(SECRET_ROUTE.format(secret_id=get_secret.secret_id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkSIAVMSecret.model_validate(resp.json())
             except (ValidationError, JSONDecodeError) as ex:
-                self._logger.exception(f'Failed to parse vm secret response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse vm secret response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse vm secret response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to retrieve vm secret [{resp.text}] - [{resp.status_code}]')
 
@@ -1,5 +1,17 @@
-from ark_sdk_python.services.sia.sso.ark_sia_sso_service import ArkSIASSOService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.sso.ark_sia_sso_service import ArkSIASSOService
 
 __all__ = [
     'ArkSIASSOService',
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.sso.ark_sia_sso_service': ['ArkSIASSOService'],
+    },
+)
@@ -349,7 +349,7 @@ class ArkSIASSOService(ArkService):
         try:
             return ArkSIASSOTokenInfo.model_validate_json(response.text)
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse get short lived token info response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse get short lived token info response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse get short lived token info response [{str(ex)}]') from ex
 
     def short_lived_ssh_key(self, get_ssh_key: ArkSIASSOGetSSHKey) -> str:
@@ -383,7 +383,7 @@ class ArkSIASSOService(ArkService):
                 file_handle.write(response.text)
             return full_path
         except (ValidationError, JSONDecodeError, KeyError) as ex:
-            self._logger.exception(f'Failed to parse get short lived token info response [{str(ex)}] - [{response.text}]')
+            self._logger.exception('Failed to parse get short lived token info response [%s] - [%s]', ex, response.text)
             raise ArkServiceException(f'Failed to parse get short lived token info response [{str(ex)}]') from ex
 
     @staticmethod
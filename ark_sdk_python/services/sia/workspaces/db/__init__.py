@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.workspaces.db.ark_sia_db_workspace_service import ArkSIADBWorkspaceService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.workspaces.db.ark_sia_db_workspace_service import ArkSIADBWorkspaceService
 
 __all__ = ['ArkSIADBWorkspaceService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.workspaces.db.ark_sia_db_workspace_service': ['ArkSIADBWorkspaceService'],
+    },
+)
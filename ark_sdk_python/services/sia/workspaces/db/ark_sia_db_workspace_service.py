@@ -66,7 +66,7 @@ class ArkSIADBWorkspaceService(ArkService):
             try:
                 return ArkSIADBDatabaseInfoList.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse list databases response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list databases response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list databases response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list databases [{resp.text}] - [{resp.status_code}]')
 
@@ -83,7 +83,7 @@ class ArkSIADBWorkspaceService(ArkService):
         Returns:
             ArkSIADBDatabase: _description_
         """
-        self._logger.info(f'Adding database [{add_database.name}]')
+        self._logger.info('Adding database [%s]', add_database.name)
         if not add_database.port:
             add_database.port = DATABASE_FAMILIES_DEFAULT_PORTS[DATABASES_ENGINES_TO_FAMILY[add_database.provider_engine]]
         add_database_dict = add_database.model_dump(exclude_none=True)
@@ -94,7 +94,7 @@ class ArkSIADBWorkspaceService(ArkService):
                 database_id = resp.json()['target_id']
                 return self.database(ArkSIADBGetDatabase(id=database_id))
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add database response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add database response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add database response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add database [{resp.text}] - [{resp.status_code}]')
 
@@ -113,7 +113,7 @@ class ArkSIADBWorkspaceService(ArkService):
             if not databases.items or len(databases.items) != 1:
                 raise ArkServiceException(f'Failed to delete database - name [{delete_database.name}] not found')
             delete_database.id = databases.items[0].id
-        self._logger.info(f'Deleting database [{delete_database.id}]')
+        self._logger.info('Deleting database [%s]', delete_database.id)
         resp: Response = self.__client.delete(RESOURCE_API.format(resource_id=delete_database.id))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete database [{resp.text}] - [{resp.status_code}]')
@@ -138,7 +138,7 @@ class ArkSIADBWorkspaceService(ArkService):
             update_database.id = databases.items[0].id
 
         existing_database = self.database(ArkSIADBGetDatabase(id=update_database.id))
-        self._logger.info(f'Updating database [{update_database.id}]')
+        self._logger.info('Updating database [%s]', update_database.id)
         update_database_dict = update_database.model_dump(exclude={'name', 'new_name'}, exclude_none=True)
         if update_database.new_name:
             update_database_dict["name"] = update_database.new_name
@@ -151,7 +151,7 @@ class ArkSIADBWorkspaceService(ArkService):
             try:
                 return self.database(ArkSIADBGetDatabase(id=update_database.id))
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse update database response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update database response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update database response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update database [{resp.text}] - [{resp.status_code}]')
 
@@ -178,7 +178,7 @@ class ArkSIADBWorkspaceService(ArkService):
         Returns:
             ArkSIADBDatabaseInfoList: _description_
         """
-        self._logger.info(f'Listing databases by filters [{databases_filter}]')
+        self._logger.info('Listing databases by filters [%s]', databases_filter)
         databases = self.__list_databases_with_filters(databases_filter.provider_family, databases_filter.tags)
         if databases_filter.name:
             databases.items = [d for d in databases.items if fnmatch(d.name, databases_filter.name)]
@@ -220,13 +220,13 @@ class ArkSIADBWorkspaceService(ArkService):
             if not databases.items or len(databases.items) != 1:
                 raise ArkServiceException(f'Failed to get database - name [{get_database.name}] not found')
             get_database.id = databases.items[0].id
-        self._logger.info(f'Getting database [{get_database.id}]')
+        self._logger.info('Getting database [%s]', get_database.id)
         resp: Response = self.__client.get(RESOURCE_API.format(resource_id=get_database.id))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkSIADBDatabase.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse database response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse database response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse database response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to get database [{resp.text}] - [{resp.status_code}]')
 
@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sia.workspaces.targetsets.ark_sia_target_sets_workspace_service import ArkSIATargetSetsWorkspaceService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sia.workspaces.targetsets.ark_sia_target_sets_workspace_service import ArkSIATargetSetsWorkspaceService
 
 __all__ = ['ArkSIATargetSetsWorkspaceService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sia.workspaces.targetsets.ark_sia_target_sets_workspace_service': ['ArkSIATargetSetsWorkspaceService'],
+    },
+)
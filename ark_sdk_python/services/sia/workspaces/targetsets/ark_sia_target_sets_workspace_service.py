@@ -60,7 +60,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Returns:
             ArkSIATargetSet: _description_
         """
-        self._logger.info(f'Adding target set [{add_target_set.name}]')
+        self._logger.info('Adding target set [%s]', add_target_set.name)
         add_target_set_dict = add_target_set.model_dump()
         resp: Response = self.__client.post(TARGET_SETS_API, json=add_target_set_dict)
         if resp.status_code == HTTPStatus.CREATED:
@@ -68,7 +68,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
                 add_target_set_dict.update(resp.json()['target_set'])
                 return ArkSIATargetSet(**add_target_set_dict)
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse add target set response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse add target set response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse add target set response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to add target set [{resp.text}] - [{resp.status_code}]')
 
@@ -85,13 +85,13 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Returns:
             ArkSIABulkTargetSetResponse: _description_
         """
-        self._logger.info(f'Bulk adding target sets [{bulk_add_target_sets}]')
+        self._logger.info('Bulk adding target sets [%s]', bulk_add_target_sets)
         resp: Response = self.__client.post(BULK_TARGET_SETS_API, json=bulk_add_target_sets.model_dump())
         if resp.status_code == HTTPStatus.MULTI_STATUS:
             try:
                 return ArkSIABulkTargetSetResponse.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse bulk add target set response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse bulk add target set response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse bulk add target set response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to bulk add target sets [{resp.text}] - [{resp.status_code}]')
 
@@ -105,7 +105,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Raises:
             ArkServiceException: _description_
         """
-        self._logger.info(f'Deleting target set [{delete_target_set.name}]')
+        self._logger.info('Deleting target set [%s]', delete_target_set.name)
         resp: Response = self.__client.delete(TARGET_SET_API.format(target_name=delete_target_set.name))
         if resp.status_code != HTTPStatus.NO_CONTENT:
             raise ArkServiceException(f'Failed to delete target set [{resp.text}] - [{resp.status_code}]')
@@ -123,13 +123,13 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Returns:
             ArkSIABulkTargetSetResponse: _description_
         """
-        self._logger.info(f'Bulk deleting target sets [{bulk_delete_target_sets}]')
+        self._logger.info('Bulk deleting target sets [%s]', bulk_delete_target_sets)
         resp: Response = self.__client.delete(BULK_TARGET_SETS_API, json=bulk_delete_target_sets.target_sets)
         if resp.status_code == HTTPStatus.MULTI_STATUS:
             try:
                 return ArkSIABulkTargetSetResponse.model_validate(resp.json())
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse bulk delete target set response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse bulk delete target set response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse bulk delete target set response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to bulk delete target sets [{resp.text}] - [{resp.status_code}]')
 
@@ -146,7 +146,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Returns:
             ArkSIATargetSet: _description_
         """
-        self._logger.info(f'Updating target set [{update_target_set.name}]')
+        self._logger.info('Updating target set [%s]', update_target_set.name)
         update_target_set_dict = update_target_set.model_dump(exclude={'name', 'new_name'}, exclude_none=True)
         if update_target_set.new_name:
             update_target_set_dict["name"] = update_target_set.new_name
@@ -156,7 +156,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
                 update_target_set_dict.update(resp.json()['target_set'])
                 return ArkSIATargetSet(**update_target_set_dict)
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse update target set response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse update target set response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse update target set response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to update target set [{resp.text}] - [{resp.status_code}]')
 
@@ -176,7 +176,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
             try:
                 return [ArkSIATargetSet.model_validate(ts) for ts in resp.json()['target_sets']]
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse list target sets response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse list target sets response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse list target sets response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to list target sets [{resp.text}] - [{resp.status_code}]')
 
@@ -190,7 +190,7 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Returns:
             List[ArkSIATargetSet]: _description_
         """
-        self._logger.info(f'Listing target sets by filters [{target_sets_filter}]')
+        self._logger.info('Listing target sets by filters [%s]', target_sets_filter)
         target_sets = self.list_target_sets()
         if target_sets_filter.name:
             target_sets = [t for t in target_sets if fnmatch(t.name, target_sets_filter.name)]
@@ -211,13 +211,13 @@ class ArkSIATargetSetsWorkspaceService(ArkService):
         Returns:
             ArkSIATargetSet: _description_
         """
-        self._logger.info(f'Getting target set [{get_target_set.name}]')
+        self._logger.info('Getting target set [%s]', get_target_set.name)
         resp: Response = self.__client.get(TARGET_SET_API.format(target_name=get_target_set.name))
         if resp.status_code == HTTPStatus.OK:
             try:
                 return ArkSIATargetSet(**resp.json()['target_set'])
             except (ValidationError, JSONDecodeError, KeyError) as ex:
-                self._logger.exception(f'Failed to parse target set response [{str(ex)}] - [{resp.text}]')
+                self._logger.exception('Failed to parse target set response [%s] - [%s]', ex, resp.text)
                 raise ArkServiceException(f'Failed to parse target set response [{str(ex)}]') from ex
         raise ArkServiceException(f'Failed to get target set [{resp.text}] - [{resp.status_code}]')
 
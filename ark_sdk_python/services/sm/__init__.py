@@ -1,3 +1,15 @@
-from ark_sdk_python.services.sm.ark_sm_service import ArkSMService
+from typing import TYPE_CHECKING
+
+from ark_sdk_python.common.ark_lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ark_sdk_python.services.sm.ark_sm_service import ArkSMService
 
 __all__ = ['ArkSMService']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'ark_sdk_python.services.sm.ark_sm_service': ['ArkSMService'],
+    },
+)
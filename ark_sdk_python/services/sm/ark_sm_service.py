@@ -131,7 +131,7 @@ class ArkSMService(ArkService):
         Yields:
             Iterator[ArkSMPage]: _description_
         """
-        self._logger.info(f'Listing sessions by filter: {sessions_filter.search}')
+        self._logger.info('Listing sessions by filter: %s', sessions_filter.search)
         yield from self.__list_sessions(self.__search_params_from_filter(sessions_filter))
 
     def count_sessions_by(self, sessions_filter: ArkSMSessionsFilter) -> int:
@@ -165,7 +165,7 @@ class ArkSMService(ArkService):
         Returns:
             ArkSMSession: _description_
         """
-        self._logger.info(f'Retrieving session by id [{get_session.session_id}]')
+        self._logger.info('Retrieving session by id [%s]', get_session.session_id)
         resp = self.__client.get(SESSION_API_URL.format(session_id=get_session.session_id))
         if resp.status_code != HTTPStatus.OK:
             raise ArkServiceException(f'Failed to list sessions [{resp.text}]')
@@ -184,7 +184,7 @@ class ArkSMService(ArkService):
         Yields:
             Iterator[ArkSMActivitiesPage]: _description_
         """
-        self._logger.info(f'Retrieving session activities by id [{get_session_activities.session_id}]')
+        self._logger.info('Retrieving session activities by id [%s]', get_session_activities.session_id)
         yield from self.__list_activities(session_id=get_session_activities.session_id)
 
     def count_session_activities(self, get_session_activities: ArkSMGetSessionActivities) -> int:
@@ -197,7 +197,7 @@ class ArkSMService(ArkService):
         Returns:
             int: _description_
         """
-        self._logger.info(f'Counting session activities by id [{get_session_activities.session_id}]')
+        self._logger.info('Counting session activities by id [%s]', get_session_activities.session_id)
         return self.__call_activities_api(session_id=get_session_activities.session_id).filtered_count
 
     def list_session_activities_by(self, session_activities_filter: ArkSMSessionActivitiesFilter) -> Iterator[ArkSMActivitiesPage]:
@@ -210,7 +210,7 @@ class ArkSMService(ArkService):
         Yields:
             Iterator[ArkSMActivitiesPage]: _description_
         """
-        self._logger.info(f'Retrieving session activities by id [{session_activities_filter.session_id}]')
+        self._logger.info('Retrieving session activities by id [%s]', session_activities_filter.session_id)
         for page in self.__list_activities(session_id=session_activities_filter.session_id):
             yield ArkSMActivitiesPage(
                 items=[activity for activity in page.items if session_activities_filter.command_contains in activity.command]
@@ -227,7 +227,7 @@ class ArkSMService(ArkService):
             int: _description_
         """
         count = 0
-        self._logger.info(f'Counting session activities by id [{session_activities_filter.session_id}] and filter')
+        self._logger.info('Counting session activities by id [%s] and filter', session_activities_filter.session_id)
         for page in self.list_session_activities_by(session_activities_filter):
             count += len(page.items)
         return count
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the identity security platform endpoints the services call, for benchmarks and local runs.
+
+Emulates:
+    - Identity tenant discovery and the service user OAuth2 token and authorize flow
+    - PCloud accounts, paginated by `nextLink`
+    - SM sessions, paginated by offset
+    - Cmgr pools, paginated by continuation token
+    - SIA databases, in a single response
+
+Every request can be delayed by a fixed latency and a requests per second limit, and every Nth request can be
+answered with 401, to exercise the token refresh, or with 429, to exercise throttling.
+The SDK calls the real https endpoints, which `ArkMockISPServer.redirect` routes to the server in process.
+
+Usage:
+    python benchmarks/ark_mock_isp_server.py [-p PORT] [--accounts COUNT] [--page-size SIZE] [--latency-ms MS]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Final, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse, urlunparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+MOCK_TENANT_SUBDOMAIN: Final[str] = 'mock'
+MOCK_PLATFORM_DOMAIN: Final[str] = 'cyberark.cloud'
+MOCK_USERNAME: Final[str] = f'bench@{MOCK_TENANT_SUBDOMAIN}.{MOCK_PLATFORM_DOMAIN}'
+MOCK_HOST_HEADER: Final[str] = 'X-Ark-Mock-Host'
+DEFAULT_PAGE_SIZE: Final[int] = 100
+PLATFORM_IDS: Final[List[str]] = ['WinDomain', 'UnixSSH', 'AWSAccessKeys', 'Oracle', 'MySQL']
+DATABASE_ENGINES: Final[List[Tuple[str, str]]] = [('postgres', 'Postgres'), ('mysql', 'MySQL'), ('oracle', 'Oracle'), ('mssql', 'MSSQL')]
+
+
+class ArkMockISPData:
+    def __init__(self, accounts_count: int, sessions_count: int, pools_count: int, databases_count: int) -> None:
+        self.accounts = [
+            {
+                'id': f'{index // 1000 + 1}_{index % 1000 + 1}',
+                'name': f'account-{index}',
+                'address': f'host-{index % 250}.example.com',
+                'userName': f'user-{index}',
+                'platformId': PLATFORM_IDS[index % len(PLATFORM_IDS)],
+                'safeName': f'safe-{index % 40}',
+                'secretType': 'password',
+                'platformAccountProperties': {'LogonDomain': 'example.com'},
+                'secretManagement': {'automaticManagementEnabled': index % 3 != 0, 'lastModifiedTime': 1700000000 + index},
+                'createdTime': 1700000000 + index,
+            }
+            for index in range(accounts_count)
+        ]
+        self.sessions = [
+            {
+                'tenantId': 'mock-tenant-id',
+                'sessionId': f'session-{index}',
+                'sessionStatus': 'Ended',
+                'sessionDuration': '00:05:00',
+                'applicationCode': 'SIA',
+                'accessMethod': 'JIT',
+                'startTime': '2024-01-01T10:00:00Z',
+                'endTime': '2024-01-01T10:05:00Z',
+                'user': f'user-{index % 50}@{MOCK_TENANT_SUBDOMAIN}.{MOCK_PLATFORM_DOMAIN}',
+                'source': f'10.0.{index % 250}.1',
+                'target': f'target-{index % 100}.example.com',
+                'targetUsername': 'ec2-user',
+                'protocol': 'SSH',
+                'platform': 'AWS',
+                'isRecording': True,
+            }
+            for index in range(sessions_count)
+        ]
+        self.pools = [
+            {
+                'id': f'pool-{index}',
+                'name': f'pool-{index}',
+                'description': 'Benchmark pool',
+                'assignedNetworkIds': [f'network-{index % 10}'],
+                'identifiersCount': index % 20,
+                'componentsCount': {'PLATFORM_CONNECTOR': index % 5, 'ACCESS_CONNECTOR': index % 3},
+                'createdAt': '2024-01-01T10:00:00Z',
+                'updatedAt': '2024-01-01T10:00:00Z',
+            }
+            for index in range(pools_count)
+        ]
+        self.databases = [
+            {
+                'id': index + 1,
+                'name': f'database-{index}',
+                'platform': 'AWS',
+                'provider_info': {
+                    'id': index % len(DATABASE_ENGINES) + 1,
+                    'engine': DATABASE_ENGINES[index % len(DATABASE_ENGINES)][0],
+                    'workspace': 'self-hosted',
+                    'family': DATABASE_ENGINES[index % len(DATABASE_ENGINES)][1],
+                },
+            }
+            for index in range(databases_count)
+        ]
+
+
+class ArkMockISPAdapter(HTTPAdapter):
+    def __init__(self, server_netloc: str) -> None:
+        super().__init__()
+        self.__server_netloc = server_netloc
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        parsed_url = urlparse(request.url)
+        request.headers[MOCK_HOST_HEADER] = parsed_url.netloc
+        request.url = urlunparse(parsed_url._replace(scheme='http', netloc=self.__server_netloc))
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+
+class ArkMockISPRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: 'ArkMockISPHTTPServer'
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.server.mock.handle(self)
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        self.server.mock.handle(self)
+
+    def send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        content = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class ArkMockISPHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: 'ArkMockISPServer'
+
+
+class ArkMockISPServer:
+    def __init__(
+        self,
+        accounts_count: int = 1000,
+        sessions_count: int = 1000,
+        pools_count: int = 100,
+        databases_count: int = 100,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        latency_seconds: float = 0.0,
+        max_requests_per_second: float = 0.0,
+        unauthorized_every: int = 0,
+        throttle_every: int = 0,
+        port: int = 0,
+    ) -> None:
+        self.__data = ArkMockISPData(accounts_count, sessions_count, pools_count, databases_count)
+        self.__page_size = page_size
+        self.__latency_seconds = latency_seconds
+        self.__min_request_interval = 1.0 / max_requests_per_second if max_requests_per_second else 0.0
+        self.__unauthorized_every = unauthorized_every
+        self.__throttle_every = throttle_every
+        self.__port = port
+        self.__lock = threading.Lock()
+        self.__next_request_time = 0.0
+        self.__requests_count = 0
+        self.__requests_by_route: Dict[str, int] = {}
+        self.__server: Optional[ArkMockISPHTTPServer] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__routes: Dict[Tuple[str, str], Callable[[ArkMockISPRequestHandler, Dict[str, List[str]]], None]] = {
+            ('POST', '/Security/StartAuthentication'): self.__start_authentication,
+            ('GET', '/passwordvault/api/accounts'): self.__list_accounts,
+            ('GET', '/api/sessions'): self.__list_sessions,
+            ('GET', '/api/pool-service/pools'): self.__list_pools,
+            ('GET', '/api/adb/resources'): self.__list_databases,
+        }
+
+    @property
+    def netloc(self) -> str:
+        return f'127.0.0.1:{self.__server.server_address[1]}'
+
+    @property
+    def requests_count(self) -> int:
+        return self.__requests_count
+
+    @property
+    def requests_by_route(self) -> Dict[str, int]:
+        return dict(self.__requests_by_route)
+
+    def start(self) -> 'ArkMockISPServer':
+        """
+        Starts serving on a background thread, on a free port unless one was given.
+
+        Returns:
+            ArkMockISPServer: _description_
+        """
+        self.__server = ArkMockISPHTTPServer(('127.0.0.1', self.__port), ArkMockISPRequestHandler)
+        self.__server.mock = self
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops serving and closes the server socket.
+        """
+        if self.__server:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def __enter__(self) -> 'ArkMockISPServer':
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    @contextlib.contextmanager
+    def redirect(self) -> Iterator[None]:
+        """
+        Routes the https requests of every session created within the block to this server, with the requested host in a header.
+
+        Yields:
+            Iterator[None]: _description_
+        """
+        adapter = ArkMockISPAdapter(self.netloc)
+        original_session_init = requests.Session.__init__
+
+        def session_init(session: requests.Session, *args: Any, **kwargs: Any) -> None:
+            original_session_init(session, *args, **kwargs)
+            session.mount('https://', adapter)
+
+        requests.Session.__init__ = session_init
+        try:
+            yield
+        finally:
+            requests.Session.__init__ = original_session_init
+
+    @staticmethod
+    def id_token() -> str:
+        """
+        Returns the platform token the server issues, whose claims name the mock tenant.
+
+        Returns:
+            str: _description_
+        """
+        import jwt
+
+        claims = {
+            'unique_name': MOCK_USERNAME,
+            'subdomain': MOCK_TENANT_SUBDOMAIN,
+            'platform_domain': MOCK_PLATFORM_DOMAIN,
+            'tenant_id': 'mock-tenant-id',
+            'exp': int(time.time()) + 4 * 60 * 60,
+        }
+        return jwt.encode(claims, 'mock-identity-security-platform-signing-key', algorithm='HS256')
+
+    def handle(self, handler: ArkMockISPRequestHandler) -> None:
+        """
+        Answers a request, after the configured latency, rate limit and injected failures.
+
+        Args:
+            handler (ArkMockISPRequestHandler): _description_
+        """
+        content_length = int(handler.headers.get('Content-Length') or 0)
+        if content_length:
+            handler.rfile.read(content_length)
+        parsed_path = urlparse(handler.path)
+        route = parsed_path.path.rstrip('/')
+        with self.__lock:
+            self.__requests_count += 1
+            request_number = self.__requests_count
+            self.__requests_by_route[f'{handler.command} {route}'] = self.__requests_by_route.get(f'{handler.command} {route}', 0) + 1
+            delay = 0.0
+            if self.__min_request_interval:
+                now = time.monotonic()
+                self.__next_request_time = max(self.__next_request_time, now) + self.__min_request_interval
+                delay = self.__next_request_time - self.__min_request_interval - now
+        if delay + self.__latency_seconds > 0:
+            time.sleep(delay + self.__latency_seconds)
+        if self.__throttle_every and request_number % self.__throttle_every == 0:
+            handler.send_json(HTTPStatus.TOO_MANY_REQUESTS, {'message': 'Rate exceeded'}, {'Retry-After': '1'})
+            return
+        if route.startswith('/Oauth2/Token/'):
+            handler.send_json(HTTPStatus.OK, {'access_token': 'mock-access-token', 'token_type': 'Bearer', 'expires_in': 3600})
+            return
+        if route.startswith('/OAuth2/Authorize/'):
+            handler.send_json(
+                HTTPStatus.FOUND,
+                None,
+                {'Location': f'https://{MOCK_TENANT_SUBDOMAIN}.{MOCK_PLATFORM_DOMAIN}/redirect#id_token={self.id_token()}'},
+            )
+            return
+        route_handler = self.__routes.get((handler.command, route))
+        if not route_handler:
+            handler.send_json(HTTPStatus.NOT_FOUND, {'message': f'No mock for [{handler.command} {route}]'})
+            return
+        if self.__unauthorized_every and request_number % self.__unauthorized_every == 0 and route != '/Security/StartAuthentication':
+            handler.send_json(HTTPStatus.UNAUTHORIZED, {'message': 'Token expired'})
+            return
+        route_handler(handler, parse_qs(parsed_path.query))
+
+    def __page(self, query: Dict[str, List[str]], name: str) -> Tuple[int, int]:
+        offset = int(query.get(name, ['0'])[0])
+        limit = int(query.get('limit', [str(self.__page_size)])[0])
+        return offset, min(limit, self.__page_size)
+
+    def __start_authentication(self, handler: ArkMockISPRequestHandler, _: Dict[str, List[str]]) -> None:
+        handler.send_json(HTTPStatus.OK, {'success': True, 'Result': {'PodFqdn': f'{MOCK_TENANT_SUBDOMAIN}.id.{MOCK_PLATFORM_DOMAIN}'}})
+
+    def __list_accounts(self, handler: ArkMockISPRequestHandler, query: Dict[str, List[str]]) -> None:
+        offset, limit = self.__page(query, 'offset')
+        body: Dict[str, Any] = {'value': self.__data.accounts[offset : offset + limit], 'count': len(self.__data.accounts)}
+        if offset + limit < len(self.__data.accounts):
+            body['nextLink'] = f'api/accounts?offset={offset + limit}&limit={limit}'
+        handler.send_json(HTTPStatus.OK, body)
+
+    def __list_sessions(self, handler: ArkMockISPRequestHandler, query: Dict[str, List[str]]) -> None:
+        offset, limit = self.__page(query, 'offset')
+        sessions = self.__data.sessions[offset : offset + limit]
+        handler.send_json(HTTPStatus.OK, {'sessions': sessions, 'filteredCount': len(self.__data.sessions), 'returnedCount': len(sessions)})
+
+    def __list_pools(self, handler: ArkMockISPRequestHandler, query: Dict[str, List[str]]) -> None:
+        offset, limit = self.__page(query, 'continuation_token')
+        pools = self.__data.pools[offset : offset + limit]
+        page: Dict[str, Any] = {'page_size': len(pools), 'total_resources_count': len(self.__data.pools)}
+        if offset + limit < len(self.__data.pools):
+            page['continuation_token'] = str(offset + limit)
+        handler.send_json(HTTPStatus.OK, {'resources': pools, 'page': page})
+
+    def __list_databases(self, handler: ArkMockISPRequestHandler, _: Dict[str, List[str]]) -> None:
+        handler.send_json(HTTPStatus.OK, {'items': self.__data.databases, 'total_count': len(self.__data.databases)})
+
+    def isp_auth(self, cache_authentication: bool = False) -> Any:
+        """
+        Authenticates an ISP authenticator against the server with a service user, which must be done within `redirect`.
+
+        Args:
+            cache_authentication (bool, optional): _description_. Defaults to False.
+
+        Returns:
+            ArkISPAuth: _description_
+        """
+        from ark_sdk_python.auth import ArkISPAuth
+        from ark_sdk_python.models.ark_profile import ArkProfile
+        from ark_sdk_python.models.auth import ArkAuthMethod, ArkAuthProfile, ArkSecret, IdentityServiceUserArkAuthMethodSettings
+
+        auth_profile = ArkAuthProfile(
+            username=MOCK_USERNAME,
+            auth_method=ArkAuthMethod.IdentityServiceUser,
+            auth_method_settings=IdentityServiceUserArkAuthMethodSettings(),
+        )
+        isp_auth = ArkISPAuth(cache_authentication=cache_authentication)
+        isp_auth.authenticate(
+            ArkProfile(profile_name='mock', auth_profiles={'isp': auth_profile}), auth_profile, ArkSecret(secret='mock-secret'), force=True
+        )
+        return isp_auth
+
+
+def main() -> None:
+    server_parser = argparse.ArgumentParser()
+    server_parser.add_argument('-p', '--port', type=int, default=8443)
+    server_parser.add_argument('--accounts', type=int, default=1000)
+    server_parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    server_parser.add_argument('--latency-ms', type=float, default=0.0)
+    args = server_parser.parse_args()
+    server = ArkMockISPServer(
+        accounts_count=args.accounts, page_size=args.page_size, latency_seconds=args.latency_ms / 1000, port=args.port
+    )
+    server.start()
+    print(f'Serving the mock identity security platform on http://{server.netloc}, send requests with a [{MOCK_HOST_HEADER}] header')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
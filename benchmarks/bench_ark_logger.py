@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the per call overhead of service logging in a tight listing loop, with logging disabled (the default) and enabled.
+The eager run formats the message with an f-string before the call, as the services did before they passed lazy %-style arguments.
+
+Usage:
+    python benchmarks/bench_ark_logger.py [-n ITERATIONS]
+"""
+
+import argparse
+import io
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from ark_sdk_python.common import get_logger  # noqa: E402
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudAccountsFilter  # noqa: E402
+
+ACCOUNTS_FILTER = ArkPCloudAccountsFilter(search='account', search_type='contains', safe_name='safe', offset=0, limit=100)
+
+
+def main() -> None:
+    bench_parser = argparse.ArgumentParser()
+    bench_parser.add_argument('-n', '--iterations', type=int, default=100000)
+    iterations = bench_parser.parse_args().iterations
+    logger = get_logger('BenchArkLogger')
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(io.StringIO()))
+    results = {
+        'eager': lambda: logger.info(f'Listing accounts by filters [{ACCOUNTS_FILTER}]'),  # pylint: disable=logging-fstring-interpolation
+        'lazy': lambda: logger.info('Listing accounts by filters [%s]', ACCOUNTS_FILTER),
+    }
+    for level in [logging.CRITICAL, logging.INFO]:
+        logger.setLevel(level)
+        for name, bench in results.items():
+            seconds = min(timeit.repeat(bench, number=iterations, repeat=3))
+            print(f'{logging.getLevelName(level):>8} {name:>6}: {seconds / iterations * 1e9:10.1f} ns per log call')
+
+
+if __name__ == '__main__':
+    main()
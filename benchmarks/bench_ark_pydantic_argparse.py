@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the model schema to argparse conversions, in both directions.
+The uncached run regenerates the model JSON schema on every iteration, as every conversion did before schemas were compiled.
+
+Usage:
+    python benchmarks/bench_ark_pydantic_argparse.py [-n ITERATIONS]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from ark_sdk_python.args import ArkPydanticArgparse  # noqa: E402
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudAddAccount  # noqa: E402
+
+ADD_ACCOUNT_ARGS = ['--name', 'account', '--safe-name', 'safe', '--secret', 'secret', '--platform-account-properties', 'a=b']
+
+
+def schema_roundtrip(schema_factory) -> None:
+    schema = schema_factory()
+    parser = argparse.ArgumentParser()
+    ArkPydanticArgparse.schema_to_argparse(schema, parser)
+    args = parser.parse_args(ADD_ACCOUNT_ARGS)
+    ArkPCloudAddAccount.model_validate(ArkPydanticArgparse.argparse_to_schema(schema, args))
+
+
+def main() -> None:
+    bench_parser = argparse.ArgumentParser()
+    bench_parser.add_argument('-n', '--iterations', type=int, default=500)
+    iterations = bench_parser.parse_args().iterations
+    results = {
+        'uncached': lambda: schema_roundtrip(ArkPCloudAddAccount.model_json_schema),
+        'compiled': lambda: schema_roundtrip(lambda: ArkPydanticArgparse.model_json_schema(ArkPCloudAddAccount)),
+    }
+    for name, bench in results.items():
+        seconds = min(timeit.repeat(bench, number=iterations, repeat=3))
+        print(f'{name:>10}: {seconds / iterations * 1e6:10.1f} us per schema -> argparse -> model round trip')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite of the service layer against the offline mock identity security platform server.
+
+Measures:
+    - list_throughput: items per second of listing PCloud accounts, SM sessions, cmgr pools and SIA databases
+    - stats_cpu: CPU seconds of the calling thread to compute the accounts stats
+    - memory_peak: peak traced python memory while listing and computing the stats of all the accounts
+    - cli_startup: wall seconds of `ark --help` and `ark exec pcloud accounts -h` in a fresh interpreter
+    - auth_keyring: seconds to authenticate with a service user, and to save and load the token in the keyring
+
+Results are written as JSON, to compare between releases with --compare.
+Authentication, discovery and keyring data go to a temporary folder, never to the user ark cache.
+
+Usage:
+    python benchmarks/bench_ark_services.py [--accounts COUNT] [--page-size SIZE] [--latency-ms MS] [--throttle-every N]
+        [-o RESULTS] [--compare BASELINE]
+"""
+
+import argparse
+import atexit
+import datetime
+import functools
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Final, List, Optional
+
+BENCH_FOLDER: Final[str] = tempfile.mkdtemp(prefix='ark_bench_')
+atexit.register(shutil.rmtree, BENCH_FOLDER, ignore_errors=True)
+os.environ.update(
+    {
+        'ARK_CACHE_FOLDER': BENCH_FOLDER,
+        'ARK_KEYRING_FOLDER': BENCH_FOLDER,
+        'ARK_BASIC_KEYRING': 'true',
+        'DEPLOY_ENV': 'prod',
+    }
+)
+REPO_FOLDER: Final[str] = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, REPO_FOLDER)
+
+from ark_mock_isp_server import ArkMockISPServer  # noqa: E402
+
+RESULTS_VERSION: Final[int] = 1
+
+
+def timed(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    wall_seconds: List[float] = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        wall_seconds.append(time.perf_counter() - start_time)
+    return {'min_seconds': min(wall_seconds), 'median_seconds': statistics.median(wall_seconds)}
+
+
+def bench_list_throughput(isp_auth: Any, server: ArkMockISPServer, repeat: int) -> Dict[str, Any]:
+    from ark_sdk_python.services.cmgr import ArkCmgrService
+    from ark_sdk_python.services.pcloud.accounts import ArkPCloudAccountsService
+    from ark_sdk_python.services.sia.workspaces.db import ArkSIADBWorkspaceService
+    from ark_sdk_python.services.sm import ArkSMService
+
+    listings: Dict[str, Callable[[], int]] = {
+        'pcloud_accounts': lambda: sum(len(page.items) for page in ArkPCloudAccountsService(isp_auth).list_accounts()),
+        'sm_sessions': lambda: sum(len(page.items) for page in ArkSMService(isp_auth).list_sessions()),
+        'cmgr_pools': lambda: sum(len(page.items) for page in ArkCmgrService(isp_auth).list_pools()),
+        'sia_databases': lambda: len(ArkSIADBWorkspaceService(isp_auth).list_databases().items),
+    }
+    results: Dict[str, Any] = {}
+    for name, listing in listings.items():
+        items_count = listing()
+        requests_before = server.requests_count
+        timing = timed(listing, repeat)
+        results[name] = {
+            **timing,
+            'items': items_count,
+            'requests': (server.requests_count - requests_before) // repeat,
+            'items_per_second': items_count / timing['min_seconds'],
+        }
+    return results
+
+
+def bench_stats_cpu(isp_auth: Any, repeat: int) -> Dict[str, Any]:
+    from ark_sdk_python.services.pcloud.accounts import ArkPCloudAccountsService
+
+    service = ArkPCloudAccountsService(isp_auth)
+    cpu_seconds: List[float] = []
+    wall_seconds: List[float] = []
+    for _ in range(repeat):
+        start_cpu, start_wall = time.thread_time(), time.perf_counter()
+        service.accounts_stats()
+        cpu_seconds.append(time.thread_time() - start_cpu)
+        wall_seconds.append(time.perf_counter() - start_wall)
+    return {'min_cpu_seconds': min(cpu_seconds), 'median_cpu_seconds': statistics.median(cpu_seconds), 'min_seconds': min(wall_seconds)}
+
+
+def bench_memory_peak(isp_auth: Any) -> Dict[str, Any]:
+    from ark_sdk_python.services.pcloud.accounts import ArkPCloudAccountsService
+
+    service = ArkPCloudAccountsService(isp_auth)
+    results: Dict[str, Any] = {}
+    for name, func in {
+        'list_accounts_streamed': lambda: sum(len(page.items) for page in service.list_accounts()),
+        'list_accounts_materialized': lambda: [page.items for page in service.list_accounts()],
+        'accounts_stats': service.accounts_stats,
+    }.items():
+        tracemalloc.start()
+        func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {'peak_bytes': peak_bytes}
+    return results
+
+
+def run_cli(cli_args: List[str]) -> None:
+    subprocess.run(
+        [sys.executable, '-m', 'ark_sdk_python.ark', *cli_args],
+        cwd=REPO_FOLDER,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+def bench_cli_startup(repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, cli_args in {'help': ['--help'], 'exec_help': ['exec', 'pcloud', 'accounts', '-h']}.items():
+        # The first run fills the schema and discovery caches, which every later run starts from
+        run_cli(cli_args)
+        results[name] = timed(functools.partial(run_cli, cli_args), repeat)
+    return results
+
+
+def bench_auth_keyring(server: ArkMockISPServer, repeat: int) -> Dict[str, Any]:
+    from ark_sdk_python.common.ark_keyring import ArkKeyring
+    from ark_sdk_python.models.ark_profile import ArkProfile
+
+    isp_auth = server.isp_auth(cache_authentication=True)
+    keyring = ArkKeyring('bench')
+    profile = ArkProfile(profile_name='bench')
+    return {
+        'authenticate': timed(lambda: server.isp_auth(cache_authentication=True), repeat),
+        'load_authentication': timed(lambda: isp_auth.load_authentication(isp_auth.active_profile), repeat),
+        'keyring_save_token': timed(lambda: keyring.save_token(profile, isp_auth.token, 'bench'), repeat),
+        'keyring_load_token': timed(lambda: keyring.load_token(profile, 'bench'), repeat),
+    }
+
+
+def flatten(results: Dict[str, Any], prefix: str = '') -> Dict[str, float]:
+    flattened: Dict[str, float] = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flattened.update(flatten(value, f'{prefix}{key}.'))
+        elif isinstance(value, (int, float)):
+            flattened[f'{prefix}{key}'] = value
+    return flattened
+
+
+def compare(results: Dict[str, Any], baseline_path: str) -> None:
+    with open(baseline_path, 'r', encoding='utf-8') as baseline_file:
+        baseline = flatten(json.load(baseline_file)['results'])
+    current = flatten(results['results'])
+    print(f'{"metric":<60} {"baseline":>14} {"current":>14} {"ratio":>8}')
+    for metric, value in current.items():
+        if metric in baseline and baseline[metric]:
+            print(f'{metric:<60} {baseline[metric]:>14.6g} {value:>14.6g} {value / baseline[metric]:>8.2f}')
+
+
+def sdk_version() -> Optional[str]:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version('ark-sdk-python')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def main() -> None:
+    bench_parser = argparse.ArgumentParser()
+    bench_parser.add_argument('--accounts', type=int, default=10000)
+    bench_parser.add_argument('--sessions', type=int, default=5000)
+    bench_parser.add_argument('--pools', type=int, default=1000)
+    bench_parser.add_argument('--databases', type=int, default=500)
+    bench_parser.add_argument('--page-size', type=int, default=1000)
+    bench_parser.add_argument('--latency-ms', type=float, default=0.0, help='Latency added to every mock response')
+    bench_parser.add_argument('--max-rps', type=float, default=0.0, help='Requests per second the mock serves, unlimited by default')
+    bench_parser.add_argument('--unauthorized-every', type=int, default=0, help='Answer every Nth request with 401 to exercise refresh')
+    bench_parser.add_argument('--throttle-every', type=int, default=0, help='Answer every Nth request with 429, which services do not retry')
+    bench_parser.add_argument('-r', '--repeat', type=int, default=3)
+    bench_parser.add_argument(
+        '-b', '--benchmarks', nargs='+', default=['list_throughput', 'stats_cpu', 'memory_peak', 'cli_startup', 'auth_keyring']
+    )
+    bench_parser.add_argument('-o', '--output', help='File to write the JSON results to, stdout by default')
+    bench_parser.add_argument('--compare', help='Results file of a previous run to compare with')
+    args = bench_parser.parse_args()
+
+    from ark_sdk_python.common import ArkSystemConfig
+
+    ArkSystemConfig.disable_verbose_logging()
+    server = ArkMockISPServer(
+        accounts_count=args.accounts,
+        sessions_count=args.sessions,
+        pools_count=args.pools,
+        databases_count=args.databases,
+        page_size=args.page_size,
+        latency_seconds=args.latency_ms / 1000,
+        max_requests_per_second=args.max_rps,
+        unauthorized_every=args.unauthorized_every,
+        throttle_every=args.throttle_every,
+    )
+    bench_results: Dict[str, Any] = {}
+    with server, server.redirect():
+        isp_auth = server.isp_auth(cache_authentication=True)
+        benchmarks: Dict[str, Callable[[], Dict[str, Any]]] = {
+            'list_throughput': lambda: bench_list_throughput(isp_auth, server, args.repeat),
+            'stats_cpu': lambda: bench_stats_cpu(isp_auth, args.repeat),
+            'memory_peak': lambda: bench_memory_peak(isp_auth),
+            'cli_startup': lambda: bench_cli_startup(args.repeat),
+            'auth_keyring': lambda: bench_auth_keyring(server, args.repeat),
+        }
+        for name in args.benchmarks:
+            print(f'Running {name}', file=sys.stderr)
+            bench_results[name] = benchmarks[name]()
+
+    results: Dict[str, Any] = {
+        'version': RESULTS_VERSION,
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'sdk_version': sdk_version(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'results': bench_results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(results, output_file, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
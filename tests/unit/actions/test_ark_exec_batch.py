@@ -0,0 +1,73 @@
+import argparse
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.actions import ArkServiceExecAction
+from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudGetAccount
+
+
+class TestArkExecBatch:
+    def __args(self, tmp_path, lines, concurrency=2):
+        batch_path = tmp_path / 'requests.jsonl'
+        batch_path.write_text('\n'.join(lines) + '\n')
+        return argparse.Namespace(
+            batch=str(batch_path), batch_concurrency=concurrency, output_path=str(tmp_path / 'out' / 'results.jsonl'), retry_count=1
+        )
+
+    def __run_batch(self, api, args):
+        # The batch runner is called with a mocked API directly, as run_action would load a profile and its authenticators
+        ArkServiceExecAction()._run_batch(api, args)  # pylint: disable=protected-access
+
+    def __results(self, tmp_path):
+        return sorted((json.loads(line) for line in (tmp_path / 'out' / 'results.jsonl').read_text().splitlines()), key=lambda r: r['line'])
+
+    def test_batch_runs_all_lines_with_shared_api(self, mocker: MockerFixture, tmp_path):
+        api = mocker.Mock()
+        api.pcloud_accounts.account.side_effect = lambda model: {'id': model.account_id}
+        api.pcloud_accounts.list_accounts.return_value = None
+        args = self.__args(
+            tmp_path,
+            [
+                json.dumps({'id': 'first', 'service': 'pcloud accounts', 'action': 'account', 'args': {'account_id': '1'}}),
+                '',
+                json.dumps({'service': ['pcloud', 'accounts'], 'action': 'list_accounts'}),
+                json.dumps({'service': 'pcloud accounts', 'action': 'account', 'args': {'account_id': '2'}}),
+            ],
+        )
+        self.__run_batch(api, args)
+        results = self.__results(tmp_path)
+        assert [r['line'] for r in results] == [1, 3, 4]
+        assert results[0] == {
+            'line': 1,
+            'id': 'first',
+            'service': 'pcloud accounts',
+            'action': 'account',
+            'status': 'succeeded',
+            'output': {'id': '1'},
+        }
+        assert results[1]['status'] == 'succeeded' and results[1]['output'] is None
+        assert results[2]['output'] == {'id': '2'}
+        assert isinstance(api.pcloud_accounts.account.call_args_list[0].args[0], ArkPCloudGetAccount)
+
+    def test_failed_lines_do_not_stop_the_batch(self, mocker: MockerFixture, tmp_path):
+        api = mocker.Mock()
+        api.pcloud_accounts.account.return_value = {'id': '1'}
+        args = self.__args(
+            tmp_path,
+            [
+                'not json',
+                json.dumps({'service': 'pcloud nothing', 'action': 'account'}),
+                json.dumps({'service': 'pcloud accounts', 'action': 'account', 'args': {}}),
+                json.dumps({'service': 'pcloud accounts', 'action': 'account', 'args': {'account_id': '1'}}),
+            ],
+            concurrency=1,
+        )
+        with pytest.raises(ArkException, match='3 out of 4'):
+            self.__run_batch(api, args)
+        results = self.__results(tmp_path)
+        assert [r['status'] for r in results] == ['failed', 'failed', 'failed', 'succeeded']
+        assert 'Unknown service' in results[1]['error']
+        assert api.pcloud_accounts.account.call_count == 1
@@ -0,0 +1,92 @@
+import argparse
+import io
+import os
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.actions import ArkServeAction, ArkServiceExecAction
+from ark_sdk_python.auth.ark_auth_agent import ArkAuthAgent
+from ark_sdk_python.common.ark_server_client import ArkServerClient
+from ark_sdk_python.models import ArkNotSupportedException
+
+
+class TestArkServeAction:
+    @pytest.fixture
+    def socket_path(self, tmp_path):
+        socket_path = str(tmp_path / 'ark.sock')
+        server = ArkServeAction.create_server(socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield socket_path
+        server.shutdown()
+        server.server_close()
+
+    def __run(self, socket_path, argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = ArkServerClient(socket_path).run_command(argv, stdout, stderr)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_socket_is_private(self, socket_path):
+        assert os.stat(socket_path).st_mode & 0o077 == 0
+
+    def test_connections_of_other_users_are_rejected(self, mocker: MockerFixture, socket_path):
+        mocker.patch.object(ArkAuthAgent, 'peer_uid', return_value=os.getuid() + 1)
+        run_action = mocker.patch.object(ArkServiceExecAction, 'run_action')
+        assert self.__run(socket_path, ['exec', 'pcloud', 'accounts', 'account', '--account-id', '1234'])[0] == 1
+        run_action.assert_not_called()
+
+    def test_running_servers_are_not_replaced(self, socket_path, tmp_path):
+        with pytest.raises(ArkNotSupportedException):
+            ArkServeAction.create_server(socket_path)
+        left_over_socket_path = str(tmp_path / 'left_over.sock')
+        ArkServeAction.create_server(left_over_socket_path).server_close()
+        ArkServeAction.create_server(left_over_socket_path).server_close()
+
+    def test_command_output_is_streamed_back(self, mocker: MockerFixture, socket_path):
+        def run_action(_, args: argparse.Namespace):
+            print(f'{args.pcloud_accounts_action} {args.account_id} {os.getcwd()}')
+
+        mocker.patch.object(ArkServiceExecAction, 'run_action', run_action)
+        exit_code, stdout, _ = self.__run(socket_path, ['exec', 'pcloud', 'accounts', 'account', '--account-id', '1234'])
+        assert exit_code == 0
+        assert stdout == f'account 1234 {os.getcwd()}\n'
+
+    def test_commands_run_with_the_forwarded_client_environment(self, mocker: MockerFixture):
+        def run_action(*_):
+            print(os.environ.get('ARK_PROFILE'), os.environ.get('ARK_HTTP_CACHE'), os.environ.get('DEPLOY_ENV'))
+
+        mocker.patch.object(ArkServiceExecAction, 'run_action', run_action)
+        mocker.patch.dict(os.environ, {'ARK_PROFILE': 'server', 'ARK_HTTP_CACHE': 'true', 'DEPLOY_ENV': 'prod'})
+        stdout = io.StringIO()
+        exit_code = ArkServeAction.run_command(
+            ['exec', 'pcloud', 'accounts', 'account', '--account-id', '1234'],
+            os.getcwd(),
+            stdout,
+            io.StringIO(),
+            {'ARK_PROFILE': 'client', 'DEPLOY_ENV': 'dev', 'HOME': '/client'},
+        )
+        assert exit_code == 0
+        assert stdout.getvalue() == 'client None dev\n'
+        assert (os.environ['ARK_PROFILE'], os.environ['ARK_HTTP_CACHE'], os.environ['DEPLOY_ENV']) == ('server', 'true', 'prod')
+        assert os.environ['HOME'] != '/client'
+
+    def test_failures_are_returned_as_exit_codes(self, mocker: MockerFixture, socket_path):
+        mocker.patch.object(ArkServiceExecAction, 'run_action', side_effect=RuntimeError('boom'))
+        exit_code, _, stderr = self.__run(socket_path, ['exec', 'pcloud', 'accounts', 'account', '--account-id', '1234'])
+        assert exit_code == 1 and 'RuntimeError: boom' in stderr
+        exit_code, _, stderr = self.__run(socket_path, ['exec', 'pcloud', 'accounts', 'account'])
+        assert exit_code == 2 and '--account-id' in stderr
+        exit_code, _, stderr = self.__run(socket_path, ['login'])
+        assert exit_code == 1 and 'exec' in stderr
+
+    def test_system_exits_are_returned_as_exit_codes(self, mocker: MockerFixture, socket_path):
+        argv = ['exec', 'pcloud', 'accounts', 'account', '--account-id', '1234']
+        for code, exit_code in [(None, 0), (0, 0), (3, 3), ('failed', 1)]:
+            mocker.patch.object(ArkServiceExecAction, 'run_action', side_effect=SystemExit(code))
+            assert self.__run(socket_path, argv)[0] == exit_code
+
+    def test_unreachable_server(self, tmp_path):
+        exit_code, _, stderr = self.__run(str(tmp_path / 'missing.sock'), ['exec'])
+        assert exit_code == 1 and 'ark serve' in stderr
@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.actions import ArkServiceExecAction
+from ark_sdk_python.actions.ark_exec_action import ArkExecAction
+from ark_sdk_python.common import ArkPage
+from ark_sdk_python.common.ark_disk_cache import ARK_CACHE_FOLDER_ENV_VAR, ARK_DISABLE_DISK_CACHE_ENV_VAR, ArkDiskCache
+
+
+class TestArkServiceExecAction:
+    @pytest.fixture(autouse=True)
+    def clean_state(self, mocker: MockerFixture, tmp_path):
+        mocker.patch.dict(os.environ, {ARK_CACHE_FOLDER_ENV_VAR: str(tmp_path)})
+        for env_var in ['_ARGCOMPLETE', ARK_DISABLE_DISK_CACHE_ENV_VAR]:
+            os.environ.pop(env_var, None)
+        mocker.patch.object(ArkExecAction, '_ArkExecAction__MODEL_SCHEMAS', {})
+        mocker.patch.object(ArkExecAction, '_ArkExecAction__MODEL_SCHEMAS_LOADED', False)
+        mocker.patch.object(ArkExecAction, '_ArkExecAction__MODEL_SCHEMAS_MODIFIED', False)
+
+    def __parser(self, mocker: MockerFixture, argv):
+        mocker.patch.object(sys, 'argv', ['ark'] + argv)
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest='action')
+        ArkServiceExecAction().define_action(subparsers)
+        return parser
+
+    def test_only_selected_action_is_defined(self, mocker: MockerFixture):
+        argv = ['exec', 'pcloud', 'accounts', 'account', '--account-id', '1234']
+        parser = self.__parser(mocker, argv)
+        args = parser.parse_args(argv)
+        assert args.pcloud_accounts_action == 'account'
+        assert args.account_id == '1234'
+        with pytest.raises(SystemExit):
+            parser.parse_args(['exec', 'pcloud', 'accounts', 'delete-account', '--account-id', '1234'])
+
+    def test_argcomplete_defines_all_actions(self, mocker: MockerFixture):
+        mocker.patch.dict(os.environ, {'_ARGCOMPLETE': '1'})
+        parser = self.__parser(mocker, [])
+        args = parser.parse_args(['exec', 'pcloud', 'accounts', 'delete-account', '--account-id', '1234'])
+        assert args.account_id == '1234'
+
+    def test_schemas_are_cached_per_version(self, mocker: MockerFixture):
+        mocker.patch('ark_sdk_python.actions.ark_exec_action.importlib.metadata.version', return_value='0.0.1')
+        self.__parser(mocker, ['exec', 'pcloud', 'accounts', 'account'])
+        schemas, fresh = ArkDiskCache('cli_schemas_0.0.1', 60).get('schemas')
+        assert fresh
+        assert any(key.endswith('ArkPCloudGetAccount') for key in schemas)
+
+    def test_failed_stream_is_not_retried_nor_left_in_the_output_file(self, mocker: MockerFixture, tmp_path):
+        output_path = tmp_path / 'out' / 'accounts.json'
+        (tmp_path / 'out').mkdir()
+        output_path.write_text('previous')
+
+        def list_accounts():
+            yield ArkPage(items=[{'id': '1'}])
+            raise ConnectionError('reset')
+
+        service = mocker.Mock(list_accounts=mocker.Mock(side_effect=list_accounts))
+        argv = ['exec', '--output-path', str(output_path), '--retry-count', '3', 'pcloud', 'accounts', 'list-accounts']
+        args = self.__parser(mocker, argv).parse_args(argv)
+        with pytest.raises(ConnectionError):
+            ArkServiceExecAction().run_exec_action(mocker.Mock(pcloud_accounts=service), args)
+        service.list_accounts.assert_called_once()
+        assert output_path.read_text() == 'previous'
+        assert os.listdir(tmp_path / 'out') == ['accounts.json']
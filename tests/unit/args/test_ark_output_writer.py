@@ -0,0 +1,56 @@
+import io
+import json
+
+import pytest
+
+from ark_sdk_python.args import ArkOutputWriter
+from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudAccount
+
+
+def accounts(start: int, count: int):
+    return [
+        ArkPCloudAccount(id=str(i), name=f'account{i}', safe_name='safe', platform_account_properties={'a': i}) for i in range(start, count)
+    ]
+
+
+class TestArkOutputWriter:
+    def test_json_matches_whole_list_serialization(self):
+        stream = io.StringIO()
+        writer = ArkOutputWriter('json', [stream])
+        writer.write_items(accounts(0, 2))
+        writer.write_items(accounts(2, 3))
+        writer.close()
+        expected = json.dumps([ArkOutputWriter.to_jsonable(a) for a in accounts(0, 3)], indent=4)
+        assert stream.getvalue() == expected + '\n'
+        assert writer.items_count == 3
+
+    def test_empty_json(self):
+        stream = io.StringIO()
+        writer = ArkOutputWriter('json', [stream])
+        writer.close()
+        assert json.loads(stream.getvalue()) == []
+
+    def test_ndjson_is_flushed_per_chunk(self):
+        stream = io.StringIO()
+        writer = ArkOutputWriter('ndjson', [stream])
+        writer.write_items(accounts(0, 2))
+        assert len(stream.getvalue().splitlines()) == 2
+        writer.write_items(accounts(2, 3))
+        writer.close()
+        assert [json.loads(line)['id'] for line in stream.getvalue().splitlines()] == ['0', '1', '2']
+
+    def test_csv_flattens_nested_fields(self):
+        stream = io.StringIO()
+        writer = ArkOutputWriter('csv', [stream])
+        writer.write_items(accounts(0, 2))
+        writer.write_items(accounts(2, 3))
+        lines = stream.getvalue().splitlines()
+        columns = lines[0].split(',')
+        assert 'platform_account_properties.a' in columns
+        assert len(lines) == 4
+        assert lines[3].split(',')[columns.index('name')] == 'account2'
+
+    def test_unsupported_format(self):
+        with pytest.raises(ArkException):
+            ArkOutputWriter('xml', [])
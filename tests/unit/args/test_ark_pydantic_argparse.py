@@ -0,0 +1,33 @@
+import argparse
+
+from ark_sdk_python.args import ArkPydanticArgparse
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudAddAccount
+
+
+class TestArkPydanticArgparse:
+    def test_model_json_schema_is_generated_once(self):
+        schema = ArkPydanticArgparse.model_json_schema(ArkPCloudAddAccount)
+        assert ArkPydanticArgparse.model_json_schema(ArkPCloudAddAccount) is schema
+        assert ArkPydanticArgparse.compile_schema(schema) is ArkPydanticArgparse.compile_schema(schema)
+
+    def test_compiled_schema_round_trip(self):
+        schema = ArkPydanticArgparse.model_json_schema(ArkPCloudAddAccount)
+        for _ in range(2):
+            parser = argparse.ArgumentParser()
+            ArkPydanticArgparse.schema_to_argparse(schema, parser)
+            args = parser.parse_args(['--name', 'account', '--safe-name', 'safe', '--secret', 'secret'])
+            model = ArkPCloudAddAccount.model_validate(ArkPydanticArgparse.argparse_to_schema(schema, args))
+            assert model.name == 'account'
+            assert model.safe_name == 'safe'
+            assert model.secret.get_secret_value() == 'secret'
+        assert ArkPydanticArgparse.compile_schema(schema).arg_types['safe_name'] == 'string'
+
+    def test_compiled_schema_arguments_match_uncompiled(self):
+        schema = ArkPCloudAddAccount.model_json_schema()
+        compiled_parser = argparse.ArgumentParser()
+        ArkPydanticArgparse.schema_to_argparse(schema, compiled_parser)
+        ArkPydanticArgparse.schema_to_argparse(schema, compiled_parser, key_prefix='other')
+        parser = argparse.ArgumentParser()
+        ArkPydanticArgparse.schema_to_argparse(ArkPCloudAddAccount.model_json_schema(), parser)
+        ArkPydanticArgparse.schema_to_argparse(ArkPCloudAddAccount.model_json_schema(), parser, key_prefix='other')
+        assert compiled_parser.format_help() == parser.format_help()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.auth import ArkISPAuth
+from ark_sdk_python.auth.ark_auth_agent import ARK_AUTH_AGENT_SOCKET_ENV_VAR, ArkAuthAgent, ArkAuthAgentClient, default_agent_socket_path
+from ark_sdk_python.models import ArkNotSupportedException
+from ark_sdk_python.models.auth import ArkAuthMethod, ArkToken
+from tests.unit.helpers import generate_profile_for
+
+
+class TestArkAuthAgent:
+    @pytest.fixture
+    def agent(self):
+        with tempfile.TemporaryDirectory() as folder:
+            agent = ArkAuthAgent(os.path.join(folder, 'agent', 'agent.sock'))
+            thread = threading.Thread(target=agent.serve_forever, daemon=True)
+            thread.start()
+            client = ArkAuthAgentClient(agent.socket_path)
+            for _ in range(100):
+                if client.status() is not None:
+                    break
+                time.sleep(0.01)
+            yield agent
+            agent.shutdown()
+            thread.join(timeout=5)
+
+    def test_save_and_load_token(self, agent: ArkAuthAgent):
+        client = ArkAuthAgentClient(agent.socket_path)
+        profile = generate_profile_for('isp', ArkAuthMethod.Identity)
+        token = ArkToken(token='agent_token', auth_method=ArkAuthMethod.Identity, expires_in=datetime.now() + timedelta(hours=1))
+        assert client.load_token('isp', profile, 'user@user.com') is None
+        assert client.save_token('isp', profile, token, 'user@user.com')
+        loaded_token = client.load_token('isp', profile, 'user@user.com')
+        assert loaded_token
+        assert loaded_token.token.get_secret_value() == 'agent_token'
+        assert client.status()['tokens'] == 1
+        assert client.delete_token('isp', profile, 'user@user.com')
+        assert client.load_token('isp', profile, 'user@user.com') is None
+
+    def test_unreachable_agent(self):
+        client = ArkAuthAgentClient(os.path.join(tempfile.gettempdir(), 'ark-missing-agent.sock'))
+        assert client.status() is None
+        assert client.load_token('isp', generate_profile_for('isp', ArkAuthMethod.Identity), 'user@user.com') is None
+
+    def test_load_authentication_consults_agent_first(self, mocker: MockerFixture, agent: ArkAuthAgent):
+        mocker.patch.dict(os.environ, {ARK_AUTH_AGENT_SOCKET_ENV_VAR: agent.socket_path})
+        keyring_load_mock = mocker.patch('ark_sdk_python.common.ark_keyring.ArkKeyring.load_token')
+        profile = generate_profile_for('isp', ArkAuthMethod.Identity)
+        token = ArkToken(token='agent_token', auth_method=ArkAuthMethod.Identity, expires_in=datetime.now() + timedelta(hours=1))
+        ArkAuthAgentClient(agent.socket_path).save_token('isp', profile, token, 'user@user.com')
+        auth = ArkISPAuth(cache_authentication=True)
+        loaded_token = auth.load_authentication(profile)
+        assert loaded_token
+        assert loaded_token.token.get_secret_value() == 'agent_token'
+        keyring_load_mock.assert_not_called()
+
+    def test_load_authentication_seeds_agent(self, mocker: MockerFixture, agent: ArkAuthAgent):
+        mocker.patch.dict(os.environ, {ARK_AUTH_AGENT_SOCKET_ENV_VAR: agent.socket_path})
+        keyring_load_mock = mocker.patch('ark_sdk_python.common.ark_keyring.ArkKeyring.load_token')
+        keyring_load_mock.return_value = ArkToken(
+            token='keyring_token', auth_method=ArkAuthMethod.Identity, expires_in=datetime.now() + timedelta(hours=1)
+        )
+        profile = generate_profile_for('isp', ArkAuthMethod.Identity)
+        auth = ArkISPAuth(cache_authentication=True)
+        assert auth.load_authentication(profile).token.get_secret_value() == 'keyring_token'
+        keyring_load_mock.assert_called_once()
+        agent_token = ArkAuthAgentClient(agent.socket_path).load_token('isp', profile, 'user@user.com')
+        assert agent_token
+        assert agent_token.token.get_secret_value() == 'keyring_token'
+
+    def test_refresh_drops_expired_tokens(self, agent: ArkAuthAgent):
+        client = ArkAuthAgentClient(agent.socket_path)
+        profile = generate_profile_for('isp', ArkAuthMethod.Identity)
+        token = ArkToken(token='expired', auth_method=ArkAuthMethod.Identity, expires_in=datetime.now() - timedelta(minutes=1))
+        client.save_token('isp', profile, token, 'user@user.com')
+        agent.refresh_tokens()
+        assert client.load_token('isp', profile, 'user@user.com') is None
+
+    def test_only_created_socket_folders_are_made_private(self, agent: ArkAuthAgent, tmp_path):
+        assert os.stat(os.path.dirname(agent.socket_path)).st_mode & 0o777 == 0o700
+        assert os.stat(agent.socket_path).st_mode & 0o077 == 0
+        tmp_path.chmod(0o755)
+        shared_folder_agent = ArkAuthAgent(str(tmp_path / 'agent.sock'))
+        thread = threading.Thread(target=shared_folder_agent.serve_forever, daemon=True)
+        thread.start()
+        for _ in range(100):
+            if ArkAuthAgentClient(shared_folder_agent.socket_path).status() is not None:
+                break
+            time.sleep(0.01)
+        shared_folder_agent.shutdown()
+        thread.join(timeout=5)
+        assert tmp_path.stat().st_mode & 0o777 == 0o755
+
+    def test_default_socket_folder_must_be_private(self, mocker: MockerFixture, tmp_path):
+        mocker.patch('tempfile.gettempdir', return_value=str(tmp_path))
+        os.makedirs(os.path.dirname(default_agent_socket_path()), mode=0o755)
+        os.chmod(os.path.dirname(default_agent_socket_path()), 0o755)
+        with pytest.raises(ArkNotSupportedException):
+            ArkAuthAgent().serve_forever()
+
+    def test_default_socket_path_is_not_supported_without_unix_users(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delattr(os, 'getuid')
+        with pytest.raises(ArkNotSupportedException):
+            default_agent_socket_path()
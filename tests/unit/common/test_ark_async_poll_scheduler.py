@@ -0,0 +1,70 @@
+import time
+from typing import Callable, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkAsyncPollScheduler, ArkAsyncRequest, ArkClient
+from ark_sdk_python.models import ArkNotSupportedException
+from ark_sdk_python.models.common import ArkAsyncRequestSettings, ArkAsyncStatus, ArkAsyncTask, ArkStatus
+
+
+class FakeAsyncTask(ArkAsyncTask):
+    def task_status(self) -> ArkStatus:
+        return ArkStatus.Active
+
+
+class FakeAsyncRequest(ArkAsyncRequest):
+    def __init__(self, task_id: str, finish_after_seconds: float, fail: bool = False) -> None:
+        super().__init__(ArkClient(), FakeAsyncTask(task_id=task_id), ArkAsyncRequestSettings(poll_sleep_time=0, progress_tick_count=0))
+        self.__finish_at = time.monotonic() + finish_after_seconds
+        self.__fail = fail
+        self.poll_count = 0
+
+    def is_finished(self) -> bool:
+        return time.monotonic() >= self.__finish_at
+
+    def poll_once(self) -> bool:
+        self.poll_count += 1
+        return self.is_finished()
+
+    def task_failed(self) -> bool:
+        return self.__fail
+
+    def task_timeout(self) -> bool:
+        return False
+
+    def poll(self, timeout_seconds: int, progress_callback: Callable[[ArkAsyncTask, int, ArkAsyncStatus], None]) -> bool:
+        raise NotImplementedError()
+
+
+class TestArkAsyncPollScheduler:
+    def test_polls_requests_concurrently(self):
+        requests: List[FakeAsyncRequest] = [FakeAsyncRequest(str(i), 0.3) for i in range(5)]
+        start = time.monotonic()
+        statuses = ArkAsyncPollScheduler.poll_requests(requests, timeout_seconds=10)
+        assert time.monotonic() - start < 1.0
+        assert statuses == [ArkAsyncStatus.Successful] * 5
+
+    def test_yields_by_completion_with_final_statuses(self):
+        scheduler = ArkAsyncPollScheduler(max_poll_interval_seconds=0.1)
+        slow, failing, timeout = FakeAsyncRequest('slow', 0.4), FakeAsyncRequest('failing', 0.1, fail=True), FakeAsyncRequest('t', 60)
+        scheduler.add(slow, 10)
+        scheduler.add(failing, 10)
+        scheduler.add(timeout, 1)
+        completed = [(r.async_task.task_id, s) for r, s in scheduler.as_completed()]
+        assert completed == [('failing', ArkAsyncStatus.Failed), ('slow', ArkAsyncStatus.Successful), ('t', ArkAsyncStatus.Timeout)]
+
+    def test_progress_callbacks(self):
+        notifications = []
+        ArkAsyncPollScheduler.poll_requests(
+            [FakeAsyncRequest('task', 0.2)], timeout_seconds=10, progress_callback=lambda t, _, s: notifications.append((t.task_id, s))
+        )
+        assert notifications[0] == ('task', ArkAsyncStatus.StartedPolling)
+        assert ('task', ArkAsyncStatus.StillPolling) in notifications
+        assert notifications[-1] == ('task', ArkAsyncStatus.Successful)
+
+    def test_requests_without_poll_once_are_not_supported(self, mocker: MockerFixture):
+        mocker.patch.object(FakeAsyncRequest, 'poll_once', ArkAsyncRequest.poll_once)
+        with pytest.raises(ArkNotSupportedException):
+            ArkAsyncPollScheduler().add(FakeAsyncRequest('1', 0), 1)
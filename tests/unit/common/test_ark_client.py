@@ -0,0 +1,69 @@
+import io
+import json
+import logging
+import os
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient
+from ark_sdk_python.common.ark_logger import LOG_LEVEL, LOGGER_STYLE, ArkJsonLogFormatter
+from tests.unit.helpers import fake_response
+
+
+class TestArkClient:
+    @pytest.fixture
+    def json_records(self, mocker: MockerFixture):
+        mocker.patch.dict(os.environ, {LOGGER_STYLE: 'json', LOG_LEVEL: 'INFO'})
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(ArkJsonLogFormatter())
+        yield stream, handler
+        logging.getLogger('ArkClient').removeHandler(handler)
+        logging.getLogger('ArkClient').setLevel(logging.CRITICAL)
+
+    def test_route_template(self):
+        assert ArkClient.route_template('https://t.com/api/accounts/12_34/secret/versions?a=1') == '/api/accounts/{id}/secret/versions'
+        assert ArkClient.route_template('https://t.com/api/safes/7/members/admin') == '/api/safes/{id}/members/admin'
+        assert ArkClient.route_template('https://t.com/v1/users/1b4e28ba-2fa1-11d2-883f-0016d3cca427') == '/v1/users/{id}'
+
+    def test_json_record_per_request(self, mocker: MockerFixture, json_records):
+        stream, handler = json_records
+        logging.getLogger('ArkClient').addHandler(handler)
+        refresh = mocker.Mock()
+        client = ArkClient('tenant.example.com', token='token', service_name='pcloud', tenant='tenant', refresh_connection_callback=refresh)
+        url = 'https://tenant.example.com/api/accounts/12_34'
+        mocker.patch.object(
+            client.session,
+            'post',
+            side_effect=[
+                fake_response(url, 401, method='POST', body='{}'),
+                fake_response(url, 201, b'{"id": 1}', method='POST', body='{}'),
+            ],
+        )
+        assert client.post('api/accounts/12_34', data='{}').status_code == 201
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(records) == 2
+        assert records[1]['level'] == 'INFO'
+        assert {k: records[1][k] for k in ['service', 'tenant', 'method', 'route', 'status', 'request_bytes', 'response_bytes']} == {
+            'service': 'pcloud',
+            'tenant': 'tenant',
+            'method': 'POST',
+            'route': '/api/accounts/{id}',
+            'status': 201,
+            'request_bytes': 2,
+            'response_bytes': 9,
+        }
+        assert [r['retry_count'] for r in records] == [0, 1]
+        assert records[0]['latency_ms'] >= 0
+        assert '\x1b' not in records[0]['message']
+        refresh.assert_called_once()
+
+    def test_disabled_level_skips_the_record(self, mocker: MockerFixture):
+        client = ArkClient('tenant.example.com')
+        client_logger = logging.getLogger('ArkClient')
+        client_logger.setLevel(logging.CRITICAL)
+        log_spy = mocker.spy(client_logger, 'info')
+        mocker.patch.object(client.session, 'get', return_value=fake_response('https://tenant.example.com/api', 200))
+        client.get('api')
+        log_spy.assert_not_called()
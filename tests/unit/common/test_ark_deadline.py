@@ -0,0 +1,48 @@
+import time
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient, ArkDeadline, ArkSystemConfig
+from ark_sdk_python.models import ArkDeadlineExceededException
+from tests.unit.helpers import fake_response
+
+
+class TestArkDeadline:
+    def test_requests_are_sent_with_timeouts_bounded_by_the_deadline(self, mocker: MockerFixture):
+        client = ArkClient('tenant.example.com', read_timeout=60)
+        session_get = mocker.patch.object(client.session, 'get', side_effect=lambda url, **_: fake_response(url, content=b'{}'))
+        client.get('api/accounts')
+        assert session_get.call_args.kwargs['timeout'] == (ArkSystemConfig.http_timeouts()[0], 60)
+        with ArkDeadline.within(5):
+            with ArkDeadline.within(30):
+                client.get('api/accounts')
+        connect_timeout, read_timeout = session_get.call_args.kwargs['timeout']
+        assert 0 < connect_timeout <= 5 and 0 < read_timeout <= 5
+
+    def test_refresh_retries_stop_once_the_deadline_passed(self, mocker: MockerFixture):
+        def refresh(_):
+            time.sleep(0.05)
+
+        client = ArkClient('tenant.example.com', refresh_connection_callback=refresh)
+        session_get = mocker.patch.object(client.session, 'get', side_effect=lambda url, **_: fake_response(url, 401))
+        with pytest.raises(ArkDeadlineExceededException):
+            with ArkDeadline.within(0.03):
+                client.get('api/accounts')
+        assert session_get.call_count == 1
+
+    def test_timeouts_past_the_deadline_raise_deadline_exceeded(self, mocker: MockerFixture):
+        client = ArkClient('tenant.example.com')
+
+        def get(_, timeout, **__):
+            time.sleep(timeout[1])
+            raise requests.exceptions.ReadTimeout()
+
+        mocker.patch.object(client.session, 'get', side_effect=get)
+        with pytest.raises(ArkDeadlineExceededException):
+            with ArkDeadline.within(0.01):
+                client.get('api/accounts')
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            mocker.patch.object(client.session, 'get', side_effect=requests.exceptions.ReadTimeout())
+            client.get('api/accounts')
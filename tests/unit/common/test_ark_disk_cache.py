@@ -0,0 +1,47 @@
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common.ark_disk_cache import ARK_CACHE_FOLDER_ENV_VAR, ARK_DISABLE_DISK_CACHE_ENV_VAR, ArkDiskCache
+
+
+class TestArkDiskCache:
+    @pytest.fixture(autouse=True)
+    def cache_folder(self, mocker: MockerFixture, tmp_path):
+        mocker.patch.dict(os.environ, {ARK_CACHE_FOLDER_ENV_VAR: str(tmp_path)})
+        os.environ.pop(ARK_DISABLE_DISK_CACHE_ENV_VAR, None)
+        return tmp_path
+
+    def test_persists_across_instances(self):
+        compute = MagicMock(return_value='https://tenant.id.cyberark.cloud')
+        assert ArkDiskCache('test', ttl_seconds=60).get_or_compute('key', compute) == 'https://tenant.id.cyberark.cloud'
+        assert ArkDiskCache('test', ttl_seconds=60).get_or_compute('key', compute) == 'https://tenant.id.cyberark.cloud'
+        compute.assert_called_once()
+
+    def test_expired_entries_are_recomputed(self, mocker: MockerFixture):
+        cache = ArkDiskCache('test', ttl_seconds=60)
+        cache.set('key', 'old')
+        mocker.patch('ark_sdk_python.common.ark_disk_cache.time.time', return_value=time.time() + 120)
+        assert cache.get('key') == (None, False)
+        assert cache.get_or_compute('key', lambda: 'new') == 'new'
+
+    def test_stale_entries_are_refreshed_or_served_when_refreshing_fails(self, mocker: MockerFixture):
+        cache = ArkDiskCache('test', ttl_seconds=60, stale_ttl_seconds=600)
+        cache.set('key', 'old')
+        mocker.patch('ark_sdk_python.common.ark_disk_cache.time.time', return_value=time.time() + 120)
+        assert cache.get('key') == ('old', False)
+        assert cache.get_or_compute('key', MagicMock(side_effect=ConnectionError())) == 'old'
+        assert cache.get_or_compute('key', lambda: 'new') == 'new'
+        assert cache.get('key') == ('new', True)
+
+    def test_disabled_and_cleared(self, mocker: MockerFixture, cache_folder):
+        cache = ArkDiskCache('test', ttl_seconds=60)
+        cache.set('key', 'value')
+        ArkDiskCache.clear_all()
+        assert not os.listdir(cache_folder)
+        mocker.patch.dict(os.environ, {ARK_DISABLE_DISK_CACHE_ENV_VAR: '1'})
+        cache.set('key', 'value')
+        assert cache.get('key') == (None, False)
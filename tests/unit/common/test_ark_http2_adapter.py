@@ -0,0 +1,40 @@
+import sys
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient
+from ark_sdk_python.common.ark_http2_adapter import ArkHTTP2Adapter
+from ark_sdk_python.models import ArkNotSupportedException
+
+
+class TestArkHTTP2Adapter:
+    def test_http2_without_httpx_is_not_supported(self, mocker: MockerFixture):
+        mocker.patch.dict(sys.modules, {'httpx': None})
+        with pytest.raises(ArkNotSupportedException):
+            ArkClient('tenant.example.com', http2=True)
+
+    def test_requests_are_sent_through_the_shared_http2_client(self, mocker: MockerFixture):
+        httpx = pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(
+                200,
+                headers=[('Set-Cookie', 'a=1; Path=/'), ('Set-Cookie', 'b=2; Path=/'), ('Content-Type', 'application/json')],
+                json={'accounts': []},
+            )
+
+        mocker.patch.object(ArkHTTP2Adapter, '_ArkHTTP2Adapter__client', return_value=httpx.Client(transport=httpx.MockTransport(handler)))
+        client = ArkClient('tenant.example.com', token='token', http2=True)
+        response = client.get('api/accounts', params={'limit': 10})
+        assert response.json() == {'accounts': []}
+        assert client.session.cookies.get('a') == '1' and client.session.cookies.get('b') == '2'
+        assert str(sent[0].url) == 'https://tenant.example.com/api/accounts?limit=10'
+        assert sent[0].headers['Authorization'] == 'Bearer token'
+        assert 'connection' not in sent[0].headers
+        assert sent[0].extensions['timeout']['connect'] == client.timeout[0]
+        client.get('api/accounts')
+        assert sent[1].headers['Cookie'] == 'a=1; b=2'
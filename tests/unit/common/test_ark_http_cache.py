@@ -0,0 +1,77 @@
+import sqlite3
+
+import requests
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient, ArkHTTPCache
+from ark_sdk_python.common.ark_http_cache import ArkHTTPCacheEntry
+from ark_sdk_python.common.ark_sqlite_http_cache_store import ArkSQLiteHTTPCacheStore
+from tests.unit.helpers import fake_response
+
+
+def response(status_code: int, body: bytes = b'', **headers: str) -> requests.Response:
+    return fake_response(status_code=status_code, content=body, headers={name.replace('_', '-'): value for name, value in headers.items()})
+
+
+class TestArkHTTPCache:
+    def test_conditional_requests_route_ttls_and_mutations(self, mocker: MockerFixture):
+        client = ArkClient('tenant.example.com', http_cache=ArkHTTPCache({'GET */api/certificates': 300}))
+        get = mocker.patch.object(
+            client.session,
+            'get',
+            side_effect=[
+                response(200, b'{"platforms": [1]}', ETag='"v1"'),
+                response(304, ETag='"v1"'),
+                response(200, b'{"certificates": []}'),
+                response(200, b'{"certificates": [1]}'),
+            ],
+        )
+        post = mocker.patch.object(client.session, 'post', return_value=response(201))
+
+        assert client.get('api/platforms', params={'search': 'a'}).json() == {'platforms': [1]}
+        revalidated = client.get('api/platforms', params={'search': 'a'})
+        assert revalidated.status_code == 200 and revalidated.json() == {'platforms': [1]}
+        assert get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+        # Without validators, the route rule keeps the response fresh without requests until a mutation
+        assert client.get('api/certificates').json() == {'certificates': []}
+        assert client.get('api/certificates').json() == {'certificates': []}
+        assert get.call_count == 3
+        client.post('api/certificates', json={'name': 'cert'})
+        assert client.get('api/certificates').json() == {'certificates': [1]}
+        assert post.call_count == 1
+        assert (client.http_cache.hits_count, client.http_cache.revalidations_count) == (1, 1)
+
+    def test_disabled_by_default(self):
+        assert ArkClient('tenant.example.com').http_cache is None
+
+    def test_sqlite_store_is_shared_encrypted_and_bounded(self, mocker: MockerFixture, tmp_path):
+        db_path = str(tmp_path / 'http_cache.sqlite')
+        key = bytes(32)
+        first_client = ArkClient(
+            'tenant.example.com', http_cache=ArkHTTPCache({'GET */api/*': 300}, store=ArkSQLiteHTTPCacheStore(db_path, key=key))
+        )
+        mocker.patch.object(first_client.session, 'get', return_value=response(200, b'{"secret_value": "plain"}'))
+        first_client.get('api/certificates', params={'limit': 1})
+
+        # A new process starts with a new client, which reads what the previous one cached
+        second_client = ArkClient(
+            'tenant.example.com', http_cache=ArkHTTPCache({'GET */api/*': 300}, store=ArkSQLiteHTTPCacheStore(db_path, key=key))
+        )
+        get = mocker.patch.object(second_client.session, 'get')
+        assert second_client.get('api/certificates', params={'limit': 1}).json() == {'secret_value': 'plain'}
+        assert not get.called
+        with sqlite3.connect(db_path) as connection:
+            payloads = [row[0] for row in connection.execute('SELECT payload FROM responses')]
+        assert len(payloads) == 1 and b'plain' not in payloads[0]
+        assert ArkSQLiteHTTPCacheStore(db_path, key=bytes([1] * 32)).get('any') is None
+
+        mocker.patch.object(second_client.session, 'delete', return_value=response(204))
+        second_client.delete('api/certificates/1')
+        get.return_value = response(200, b'{"secret_value": "new"}')
+        assert second_client.get('api/certificates', params={'limit': 1}).json() == {'secret_value': 'new'}
+
+        bounded_store = ArkSQLiteHTTPCacheStore(str(tmp_path / 'bounded.sqlite'), max_bytes=1000, key=key)
+        for index in range(5):
+            bounded_store.set(str(index), 'scope', ArkHTTPCacheEntry(200, {}, b'x' * 300, 'utf-8', 0))
+        assert [index for index in range(5) if bounded_store.get(str(index))] == [3, 4]
@@ -0,0 +1,63 @@
+import gzip
+import json
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient
+from ark_sdk_python.common.ark_http_compression import ArkHTTPCompression
+from tests.unit.helpers import fake_response
+
+BULK_ROUTE = 'api/targetsets/bulk'
+
+
+class TestArkHTTPCompression:
+    def test_large_bulk_bodies_are_gzipped_and_sent_as_is_once_refused(self, mocker: MockerFixture):
+        compression = ArkHTTPCompression(min_bytes=1024)
+        client = ArkClient('tenant.example.com', request_compression=compression)
+        statuses = [415, 200, 200]
+        sent = []
+
+        def post(url, **kwargs):
+            sent.append(kwargs)
+            return fake_response(url, statuses[len(sent) - 1], b'{}', method='POST')
+
+        mocker.patch.object(client.session, 'post', side_effect=post)
+        target_sets = {'target_sets': [{'name': f'target{i}.example.com', 'type': 'Domain'} for i in range(100)]}
+        assert client.post(BULK_ROUTE, json=target_sets).status_code == 200
+        assert sent[0]['headers']['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(sent[0]['data'])) == target_sets
+        assert sent[1]['json'] == target_sets and 'headers' not in sent[1]
+        assert compression.compressed_count == 1
+        assert not compression.is_compressing('POST', '/api/targetsets/bulk')
+        client.post('api/targetsets', json=target_sets)
+        assert sent[2]['json'] == target_sets
+
+    def test_only_bad_requests_about_the_encoding_are_sent_again(self, mocker: MockerFixture):
+        compression = ArkHTTPCompression(min_bytes=1024)
+        client = ArkClient('tenant.example.com', request_compression=compression)
+        responses = [
+            (400, b'{"message": "Invalid target set name"}'),
+            (400, b'{"message": "Unsupported Content-Encoding: gzip"}'),
+            (201, b'{}'),
+        ]
+        sent = []
+
+        def post(url, **kwargs):
+            sent.append(kwargs)
+            return fake_response(url, *responses[len(sent) - 1], method='POST')
+
+        mocker.patch.object(client.session, 'post', side_effect=post)
+        target_sets = {'target_sets': [{'name': f'target{i}.example.com', 'type': 'Domain'} for i in range(100)]}
+        assert client.post(BULK_ROUTE, json=target_sets).status_code == 400
+        assert len(sent) == 1 and compression.is_compressing('POST', '/api/targetsets/bulk')
+        assert client.post(BULK_ROUTE, json=target_sets).status_code == 201
+        assert sent[1]['headers']['Content-Encoding'] == 'gzip'
+        assert sent[2]['json'] == target_sets
+        assert not compression.is_compressing('POST', '/api/targetsets/bulk')
+
+    def test_small_and_unmatched_bodies_are_not_compressed(self):
+        compression = ArkHTTPCompression(min_bytes=1024)
+        assert compression.compress('POST', '/api/targetsets/bulk', {'json': {'target_sets': []}}) is None
+        assert compression.compress('POST', '/api/targetsets', {'data': 'x' * 2048}) is None
+        assert compression.compress('POST', '/PasswordVault/API/platforms/import', {'data': 'x' * 2048}) is not None
+        assert 'gzip' in ArkHTTPCompression.accept_encoding()
@@ -0,0 +1,60 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient, ArkInstrumentation, ArkInstrumentations, ArkMetricsCollector, ArkPage
+from ark_sdk_python.common.ark_retry import ArkRetry
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudGetAccount
+from tests.unit.helpers import fake_response
+
+
+class TestArkInstrumentation:
+    @pytest.fixture
+    def collector(self):
+        collector = ArkMetricsCollector()
+        yield collector
+        ArkInstrumentations.unregister(collector)
+
+    def test_client_requests_refresh_and_retry(self, mocker: MockerFixture, collector):
+        client = ArkClient('tenant.example.com', service_name='pcloud', refresh_connection_callback=mocker.Mock())
+        client.add_instrumentation(collector)
+        url = 'https://tenant.example.com/api/accounts/12_34'
+        mocker.patch.object(client.session, 'get', side_effect=[fake_response(url, 401), fake_response(url, 200)])
+        client.get('api/accounts/12_34')
+        labels = {'service': 'pcloud', 'method': 'GET', 'route': '/api/accounts/{id}'}
+        assert collector.histogram('ark_http_request_duration_seconds', **labels).count == 2
+        assert collector.counter('ark_http_requests_total', **labels, status=401) == 1
+        assert collector.counter('ark_http_requests_total', **labels, status=200) == 1
+        assert collector.counter('ark_http_refreshes_total', service='pcloud', route='/api/accounts/{id}') == 1
+        assert collector.counter('ark_retries_total', operation='GET /api/accounts/{id}') == 1
+
+    def test_global_pages_validation_and_retries(self, mocker: MockerFixture, collector):
+        ArkInstrumentations.register(collector)
+        ArkPage([ArkPCloudGetAccount(account_id='1'), ArkPCloudGetAccount(account_id='2')])
+        ArkPCloudGetAccount.model_validate({'account_id': '1'})
+        mocker.patch('ark_sdk_python.common.ark_retry.time.sleep')
+        flaky = mocker.Mock(side_effect=[ValueError('flaky'), 'done'], __name__='flaky')
+        assert ArkRetry.retry_call(flaky, tries=2) == 'done'
+        assert collector.counter('ark_pages_total', item_type='ArkPCloudGetAccount') == 1
+        assert collector.counter('ark_page_items_total', item_type='ArkPCloudGetAccount') == 2
+        assert collector.histogram('ark_model_validation_duration_seconds', model='ArkPCloudGetAccount').count == 1
+        assert collector.counter('ark_retries_total', operation='flaky') == 1
+
+    def test_failing_instrumentation_does_not_fail_requests(self, mocker: MockerFixture):
+        failing = mocker.Mock(spec=ArkInstrumentation)
+        failing.on_request_end.side_effect = RuntimeError('broken')
+        client = ArkClient('tenant.example.com')
+        client.add_instrumentation(failing)
+        mocker.patch.object(client.session, 'get', return_value=fake_response('https://tenant.example.com/api', 200))
+        assert client.get('api').status_code == 200
+        failing.on_request_start.assert_called_once_with(None, 'GET', '/api')
+
+    def test_prometheus_text(self, collector):
+        for latency in [0.003, 0.02, 0.04, 0.3]:
+            collector.on_request_end('pcloud', 'GET', '/api/"x"', 200, latency)
+        text = collector.to_prometheus_text()
+        assert '# TYPE ark_http_request_duration_seconds histogram' in text
+        assert 'ark_http_request_duration_seconds_bucket{service="pcloud",method="GET",route="/api/\\"x\\"",le="0.025"} 2' in text
+        assert 'ark_http_request_duration_seconds_bucket{service="pcloud",method="GET",route="/api/\\"x\\"",le="+Inf"} 4' in text
+        assert 'ark_http_request_duration_seconds_count{service="pcloud",method="GET",route="/api/\\"x\\""} 4' in text
+        histogram = collector.histogram('ark_http_request_duration_seconds', service='pcloud', method='GET', route='/api/"x"')
+        assert histogram.quantile(0.5) == pytest.approx(0.025)
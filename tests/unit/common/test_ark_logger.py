@@ -0,0 +1,47 @@
+import logging
+import sys
+
+import pytest
+
+from ark_sdk_python.common import get_logger
+
+
+class CountingFormat:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __str__(self) -> str:
+        self.count += 1
+        return 'formatted'
+
+
+class TestArkLogger:
+    @pytest.fixture
+    def logger(self):
+        logger = get_logger('TestArkLogger', log_level=logging.CRITICAL)
+        yield logger
+        logger.setLevel(logging.CRITICAL)
+
+    @pytest.mark.parametrize('method', ['notice', 'info', 'warning', 'error', 'exception'])
+    def test_disabled_levels_do_not_format(self, logger, method, mocker):
+        argument = CountingFormat()
+        # Importing the colors at all would fail the call
+        mocker.patch.dict(sys.modules, {'colorama': None})
+        getattr(logger, method)('Listing [%s]', argument)
+        assert argument.count == 0
+
+    def test_enabled_levels_format_lazy_arguments(self, logger, caplog):
+        logger.setLevel(logging.INFO)
+        with caplog.at_level(logging.INFO, logger='TestArkLogger'):
+            logger.info('Listing [%s] at 100%%', CountingFormat())
+        assert 'Listing [formatted] at 100%' in caplog.text
+
+    def test_silenced_logger_does_not_format(self, logger):
+        logger.setLevel(logging.INFO)
+        logger.verbose = False
+        argument = CountingFormat()
+        try:
+            logger.info('Listing [%s]', argument)
+        finally:
+            logger.verbose = True
+        assert argument.count == 0
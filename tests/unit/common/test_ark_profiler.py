@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from ark_sdk_python.common.ark_profiler import PHASE_NETWORK, PHASE_SERVICE_INIT, ArkProfiler
+from ark_sdk_python.models import ArkException
+
+
+@ArkProfiler.phased(PHASE_SERVICE_INIT)
+def init_service() -> None:
+    time.sleep(0.02)
+    with ArkProfiler.phase(PHASE_NETWORK):
+        time.sleep(0.05)
+
+
+class TestArkProfiler:
+    def test_phases_are_exclusive_and_reported(self, tmp_path):
+        assert ArkProfiler.start()
+        try:
+            assert not ArkProfiler.start()
+            init_service()
+            phase_seconds = ArkProfiler.phase_seconds()
+        finally:
+            report = ArkProfiler.stop(str(tmp_path / 'profile.txt'))
+        assert phase_seconds[PHASE_NETWORK] >= 0.05
+        assert phase_seconds[PHASE_SERVICE_INIT] >= 0.02
+        # Service init excludes the nested network phase, else it would outlast it
+        assert phase_seconds[PHASE_SERVICE_INIT] < phase_seconds[PHASE_NETWORK]
+        assert (tmp_path / 'profile.txt').read_text() == report
+        assert 'Peak traced memory' in report
+        assert 'init_service' in report
+        assert not ArkProfiler.is_running()
+        with ArkProfiler.phase(PHASE_NETWORK):
+            pass
+        with pytest.raises(ArkException):
+            ArkProfiler.stop()
@@ -0,0 +1,40 @@
+import threading
+
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient
+from ark_sdk_python.common.ark_request_hedger import ArkRequestHedger
+from tests.unit.helpers import fake_response
+
+
+class TestArkRequestHedger:
+    def test_slow_gets_are_hedged_and_the_first_response_is_taken(self, mocker: MockerFixture):
+        hedger = ArkRequestHedger(min_delay=0.01, max_delay=0.05, budget_burst=1.0, min_samples=3)
+        client = ArkClient('tenant.example.com', request_hedger=hedger)
+        release = threading.Event()
+        calls = []
+
+        def get(url, **_):
+            calls.append(url)
+            resp = fake_response(url, content=str(len(calls)).encode())
+            if len(calls) == 4:
+                release.wait(5)
+            return resp
+
+        session_get = mocker.patch.object(client.session, 'get', side_effect=get)
+        for _ in range(3):
+            client.get('api/accounts/12_34')
+        assert hedger.delay('tenant.example.com/api/accounts/{id}') == 0.01
+        assert client.get('api/accounts/56_78').text == '5'
+        assert hedger.hedged_count == 1
+        assert hedger.hedge_wins_count == 1
+        release.set()
+        # The budget is spent, so the next slow read waits for its only request
+        release.clear()
+        calls.clear()
+        calls.extend(['primed'] * 3)
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        assert client.get('api/accounts/56_78').text == '4'
+        assert hedger.hedged_count == 1
+        assert session_get.call_count == 6
@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient, ArkSystemConfig
+from ark_sdk_python.common.ark_single_flight import ArkSingleFlight
+from ark_sdk_python.common.ark_system_config import ARK_COALESCE_REQUESTS_ENV_VAR, ARK_DISABLE_REQUEST_COALESCING_ENV_VAR
+from tests.unit.helpers import fake_response
+
+WORKERS_COUNT = 8
+
+
+class TestArkSingleFlight:
+    def test_coalescing_is_opt_in(self, mocker: MockerFixture):
+        mocker.patch.dict(os.environ)
+        os.environ.pop(ARK_COALESCE_REQUESTS_ENV_VAR, None)
+        os.environ.pop(ARK_DISABLE_REQUEST_COALESCING_ENV_VAR, None)
+        assert ArkClient('tenant.example.com').single_flight is None
+        os.environ[ARK_COALESCE_REQUESTS_ENV_VAR] = 'true'
+        assert ArkClient('tenant.example.com').single_flight is not None
+        os.environ[ARK_DISABLE_REQUEST_COALESCING_ENV_VAR] = '1'
+        assert not ArkSystemConfig.is_coalescing_requests()
+
+    def test_identical_concurrent_gets_share_a_request(self, mocker: MockerFixture):
+        mocker.patch.dict(os.environ, {ARK_COALESCE_REQUESTS_ENV_VAR: 'true'})
+        client = ArkClient('tenant.example.com')
+        release = threading.Event()
+
+        def slow_get(url, **_):
+            release.wait(5)
+            return fake_response(url, content=b'{"platform_id": "WinDomain"}')
+
+        get = mocker.patch.object(client.session, 'get', side_effect=slow_get)
+        with ThreadPoolExecutor(WORKERS_COUNT) as executor:
+            futures = [executor.submit(client.get, 'api/platforms/WinDomain', params={'a': 1}) for _ in range(WORKERS_COUNT)]
+            other_futures = [
+                executor.submit(client.get, 'api/platforms/Unix'),
+                executor.submit(client.get, 'api/platforms/WinDomain', params={'a': 1}, timeout=1),
+                executor.submit(client.get, 'api/platforms/WinDomain', params={'a': 1}, allow_redirects=False),
+            ]
+            while client.single_flight.coalesced_count < WORKERS_COUNT - 1:
+                time.sleep(0.001)
+            release.set()
+            responses = [future.result() for future in futures]
+        for other_future in other_futures:
+            other_future.result()
+        assert get.call_count == 4
+        assert all(resp.json() == {'platform_id': 'WinDomain'} for resp in responses)
+        assert len({id(resp) for resp in responses}) == WORKERS_COUNT
+
+    def test_waiters_get_the_error_and_later_calls_run_again(self):
+        single_flight = ArkSingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise ValueError('boom')
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(single_flight.do, 'key', failing)
+            started.wait(5)
+            waiter = executor.submit(single_flight.do, 'key', failing)
+            while not single_flight.coalesced_count:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, waiter):
+                with pytest.raises(ValueError):
+                    future.result()
+        assert single_flight.do('key', lambda: 1) == (1, False)
+        assert single_flight.in_flight_count == 0
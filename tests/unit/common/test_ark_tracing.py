@@ -0,0 +1,90 @@
+import json
+from typing import Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ark_sdk_python.common import ArkClient, ArkPage, ArkTracer
+from ark_sdk_python.models import ArkException
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.models.services.pcloud.accounts import ArkPCloudGetAccount
+from ark_sdk_python.services.ark_service import ArkService
+from tests.unit.helpers import fake_response
+
+CLIENT = ArkClient('tenant.example.com', service_name='pcloud')
+
+
+class ArkTracedTestService(ArkService):
+    def list_accounts(self) -> Iterator[ArkPage[ArkPCloudGetAccount]]:
+        for page in range(2):
+            resp = CLIENT.get(f'api/accounts/{page}')
+            yield ArkPage([ArkPCloudGetAccount.model_validate(account) for account in resp.json()])
+
+    @staticmethod
+    def service_config() -> ArkServiceConfig:
+        return ArkServiceConfig(service_name='traced-test', required_authenticator_names=[], optional_authenticator_names=[])
+
+
+class TestArkTracing:
+    @pytest.fixture(autouse=True)
+    def tracer(self):
+        ArkTracer.clear()
+        ArkTracer.enable()
+        yield
+        ArkTracer.disable()
+        ArkTracer.clear()
+
+    def test_service_method_pages_requests_and_validation_are_nested(self, mocker: MockerFixture, tmp_path):
+        mocker.patch.object(
+            CLIENT.session,
+            'get',
+            side_effect=[
+                fake_response('https://tenant.example.com/api/accounts/0', content=b'[{"account_id": "1"}, {"account_id": "2"}]'),
+                fake_response('https://tenant.example.com/api/accounts/1', content=b'[{"account_id": "3"}]'),
+            ],
+        )
+        with ArkTracer.span('root'):
+            trace_id = ArkTracer.current_trace_id()
+            pages = list(ArkTracedTestService().list_accounts())
+        assert [len(page.items) for page in pages] == [2, 1]
+        spans = {span.span_id: span for span in ArkTracer.finished_spans()}
+        assert all(span.trace_id == trace_id for span in spans.values())
+
+        def parent_name(span):
+            return spans[span.parent_span_id].name
+
+        method_span = next(span for span in spans.values() if span.name == 'ArkTracedTestService.list_accounts')
+        assert parent_name(method_span) == 'root'
+        assert method_span.attributes['pages_count'] == 2
+        page_spans = [span for span in spans.values() if span.name == 'ArkTracedTestService.list_accounts page']
+        # The last page span covers the work done before the iteration ended
+        assert [span.attributes.get('items_count') for span in page_spans] == [2, 1, None]
+        http_spans = [span for span in spans.values() if span.kind == 'client']
+        assert [span.name for span in http_spans] == ['GET /api/accounts/{id}'] * 2
+        assert all(parent_name(span) == 'ArkTracedTestService.list_accounts page' for span in http_spans)
+        validate_spans = [span for span in spans.values() if span.name == 'validate ArkPCloudGetAccount']
+        assert len(validate_spans) == 3
+        assert all(parent_name(span) == 'ArkTracedTestService.list_accounts page' for span in validate_spans)
+
+        ArkTracer.export(str(tmp_path / 'trace.json'), 'otel')
+        otel_spans = json.loads((tmp_path / 'trace.json').read_text())['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert len(otel_spans) == len(spans)
+        assert {span['traceId'] for span in otel_spans} == {trace_id}
+        ArkTracer.export(str(tmp_path / 'trace.json'), 'chrome')
+        events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+        assert {event['ph'] for event in events} == {'X'}
+        assert next(event for event in events if event['cat'] == 'client')['args']['http.status_code'] == 200
+        with pytest.raises(ArkException):
+            ArkTracer.export(str(tmp_path / 'trace.json'), 'unknown')
+
+    def test_failed_span_and_disabled_tracer(self):
+        with pytest.raises(ValueError):
+            with ArkTracer.span('failing'):
+                raise ValueError('boom')
+        assert ArkTracer.finished_spans()[0].error == 'ValueError: boom'
+        ArkTracer.disable()
+        ArkTracer.clear()
+        with ArkTracer.span('ignored') as span:
+            assert span is None
+        ArkPCloudGetAccount.model_validate({'account_id': '1'})
+        assert not ArkTracer.finished_spans()
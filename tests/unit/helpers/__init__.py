@@ -1,3 +1,4 @@
+from tests.unit.helpers.http_responses import fake_response
 from tests.unit.helpers.identity_responses import (
     ADVANCE_AUTH_SUCCESS_RESPONSE,
     CYBR_TOKEN_SUCCESS_RESPONSE,
@@ -31,6 +32,7 @@ __all__ = [
     'HANDLE_APP_KEY_RESPONSE',
     'SAML_SSO_COMPLETE_SUCESS_RESPONSE',
     'MockResponse',
+    'fake_response',
     'generate_auth_profile_for',
     'generate_profile_for',
 ]
@@ -0,0 +1,24 @@
+import io
+from http import HTTPStatus
+from typing import Dict, Optional
+
+import requests
+
+
+def fake_response(
+    url: str = 'https://tenant.example.com/api',
+    status_code: int = HTTPStatus.OK,
+    content: bytes = b'',
+    *,
+    method: str = 'GET',
+    body: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    # Read by requests as the body of a received response, on first access to its content
+    resp.raw = io.BytesIO(content)
+    resp.request = requests.Request(method, url, data=body).prepare()
+    resp.url = url
+    return resp
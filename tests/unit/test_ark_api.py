@@ -0,0 +1,45 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from ark_sdk_python import ArkAPI
+from ark_sdk_python.common import ArkClient
+from ark_sdk_python.models import ArkProfile
+from ark_sdk_python.models.services import ArkServiceConfig
+from ark_sdk_python.services.ark_service import ArkService
+
+
+class SlowService(ArkService):
+    constructions = 0
+    constructions_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        super().__init__()
+        with SlowService.constructions_lock:
+            SlowService.constructions += 1
+        time.sleep(0.1)
+        self.client = MagicMock(spec=ArkClient)
+
+    @staticmethod
+    def service_config() -> ArkServiceConfig:
+        return ArkServiceConfig(service_name='slow', required_authenticator_names=[], optional_authenticator_names=[])
+
+
+class TestArkAPI:
+    def test_lazy_load_is_thread_safe(self):
+        SlowService.constructions = 0
+        api = ArkAPI([], ArkProfile())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            services = list(executor.map(lambda _: api.service(SlowService), range(8)))
+        assert SlowService.constructions == 1
+        assert all(s is services[0] for s in services)
+
+    def test_prewarm_builds_and_warms_services(self):
+        SlowService.constructions = 0
+        api = ArkAPI([], ArkProfile())
+        services = api.prewarm([SlowService])
+        assert SlowService.constructions == 1
+        assert services[0] is api.service(SlowService)
+        assert len(services[0].clients) == 1
+        services[0].clients[0].warm_up.assert_called_once()
@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+from ark_sdk_python import ArkAPI, ArkAPIPool
+
+
+def mock_api() -> MagicMock:
+    return MagicMock(spec=ArkAPI)
+
+
+class TestArkAPIPool:
+    def test_reuses_pooled_apis(self):
+        pool = ArkAPIPool(max_size=2)
+        factory = MagicMock(side_effect=mock_api)
+        first = pool.api('tenant-a', factory)
+        assert pool.api('tenant-a', factory) is first
+        factory.assert_called_once()
+
+    def test_evicts_least_recently_used(self):
+        pool = ArkAPIPool(max_size=2)
+        apis = {key: pool.api(key, mock_api) for key in ['tenant-a', 'tenant-b']}
+        pool.api('tenant-a', mock_api)
+        pool.api('tenant-c', mock_api)
+        assert pool.keys() == ['tenant-a', 'tenant-c']
+        apis['tenant-b'].close.assert_called_once()
+        apis['tenant-a'].close.assert_not_called()
+
+    def test_evicts_idle_apis(self):
+        pool = ArkAPIPool(max_size=2, idle_timeout_seconds=0)
+        api = pool.api('tenant-a', mock_api)
+        pool.evict_idle()
+        assert 'tenant-a' not in pool
+        api.close.assert_called_once()
+
+    def test_close_closes_all(self):
+        with ArkAPIPool() as pool:
+            api = pool.api('tenant-a', mock_api)
+        assert len(pool) == 0
+        api.close.assert_called_once()
@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous on purpose, the cold import of the api is about a third of a second on a developer machine
+IMPORT_TIME_BUDGET_SECONDS = float(os.environ.get('ARK_IMPORT_TIME_BUDGET_SECONDS', '1.5'))
+HEAVY_MODULES = ['inquirer', 'paramiko', 'winrm', 'pexpect', 'deepdiff']
+
+
+def cold_import(statement: str):
+    script = (
+        'import json, sys, time\n'
+        'start = time.perf_counter()\n'
+        f'{statement}\n'
+        'print(json.dumps({"seconds": time.perf_counter() - start, "modules": sorted(sys.modules)}))\n'
+    )
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestArkImportTime:
+    def test_package_import_is_lazy(self):
+        result = cold_import('import ark_sdk_python')
+        assert 'ark_sdk_python.ark_api' not in result['modules']
+        assert 'ark_sdk_python.models.ark_model' not in result['modules']
+        assert 'pydantic' not in result['modules']
+
+    @pytest.mark.parametrize(
+        'statement',
+        [
+            'from ark_sdk_python import ArkAPI',
+            'from ark_sdk_python.models import ArkModel',
+            'from ark_sdk_python.services.pcloud.accounts import ArkPCloudAccountsService',
+        ],
+    )
+    def test_import_time_budget(self, statement: str):
+        result = cold_import(statement)
+        assert not [m for m in result['modules'] if m.split('.')[0] in HEAVY_MODULES]
+        assert result['seconds'] < IMPORT_TIME_BUDGET_SECONDS
+
+    def test_services_are_not_imported_with_the_api(self):
+        result = cold_import('from ark_sdk_python import ArkAPI')
+        assert not [m for m in result['modules'] if m.startswith('ark_sdk_python.services.') and m.count('.') > 2]
+        assert not [m for m in result['modules'] if m.startswith('ark_sdk_python.models.services.') and m.count('.') > 3]